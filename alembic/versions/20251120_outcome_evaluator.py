@@ -0,0 +1,70 @@
+"""outcome_evaluator
+
+Revision ID: outcome_evaluator_001
+Revises: comprehensive_monitor_001
+Create Date: 2025-11-20 00:00:00.000000
+
+Schema for the durable outcome evaluator. Pending performance_outcomes rows
+(checked_at NULL, due_at set) replace the per-signal APScheduler jobs, and
+both outcome tables gain max favorable / adverse excursion columns computed
+from candles.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'outcome_evaluator_001'
+down_revision: Union[str, Sequence[str], None] = 'comprehensive_monitor_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INTERVALS = ('1h', '4h', '24h')
+
+
+def upgrade() -> None:
+    """
+    Upgrade database for the outcome evaluator.
+    Adds due_at/excursion columns and partial indexes on pending rows.
+    """
+    # 1. performance_outcomes: pending rows carry due_at and no checked_at yet
+    op.add_column('performance_outcomes', sa.Column('due_at', sa.DateTime(), nullable=True))
+    op.add_column('performance_outcomes', sa.Column('mfe_pct', sa.Numeric(precision=10, scale=4), nullable=True))
+    op.add_column('performance_outcomes', sa.Column('mae_pct', sa.Numeric(precision=10, scale=4), nullable=True))
+    op.alter_column('performance_outcomes', 'checked_at', existing_type=sa.DateTime(), nullable=True)
+    op.create_index(
+        'idx_performance_pending',
+        'performance_outcomes',
+        ['due_at'],
+        postgresql_where=sa.text('checked_at IS NULL')
+    )
+
+    # 2. signal_outcomes: excursion per interval + pending index per interval
+    for interval in INTERVALS:
+        op.add_column('signal_outcomes', sa.Column(f'mfe_{interval}', sa.Numeric(precision=10, scale=4), nullable=True))
+        op.add_column('signal_outcomes', sa.Column(f'mae_{interval}', sa.Numeric(precision=10, scale=4), nullable=True))
+        op.create_index(
+            f'idx_outcomes_pending_{interval}',
+            'signal_outcomes',
+            ['entry_timestamp'],
+            postgresql_where=sa.text(f'tracked_at_{interval} IS NULL')
+        )
+
+
+def downgrade() -> None:
+    """
+    Downgrade database by removing the outcome evaluator columns.
+    Pending performance rows are dropped so checked_at can be NOT NULL again.
+    """
+    for interval in INTERVALS:
+        op.drop_index(f'idx_outcomes_pending_{interval}', table_name='signal_outcomes')
+        op.drop_column('signal_outcomes', f'mae_{interval}')
+        op.drop_column('signal_outcomes', f'mfe_{interval}')
+
+    op.drop_index('idx_performance_pending', table_name='performance_outcomes')
+    op.execute('DELETE FROM performance_outcomes WHERE checked_at IS NULL')
+    op.alter_column('performance_outcomes', 'checked_at', existing_type=sa.DateTime(), nullable=False)
+    op.drop_column('performance_outcomes', 'mae_pct')
+    op.drop_column('performance_outcomes', 'mfe_pct')
+    op.drop_column('performance_outcomes', 'due_at')
@@ -0,0 +1,104 @@
+"""performance_rollups
+
+Revision ID: performance_rollups_001
+Revises: outcome_evaluator_001
+Create Date: 2025-11-21 00:00:00.000000
+
+Creates the daily win-rate rollup tables maintained incrementally by the
+outcome evaluator (app.services.performance_rollup) and backfills them from
+existing performance_outcomes rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'performance_rollups_001'
+down_revision: Union[str, Sequence[str], None] = 'outcome_evaluator_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _counter_columns(*names: str):
+    columns = []
+    for name in names:
+        column_type = sa.Float() if name.endswith('_sum') else sa.BigInteger()
+        columns.append(sa.Column(name, column_type, nullable=False, server_default='0'))
+    return columns
+
+
+def upgrade() -> None:
+    """
+    Upgrade database for performance rollups.
+    Creates performance_rollup_daily and performance_rollup_symbol_daily.
+    """
+    # 1. day x scanner x tier x interval x signal type
+    op.create_table(
+        'performance_rollup_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('scanner_type', sa.String(length=30), nullable=False, server_default=''),
+        sa.Column('tier', sa.String(length=30), nullable=False, server_default=''),
+        sa.Column('interval', sa.String(length=10), nullable=False),
+        sa.Column('signal_type', sa.String(length=10), nullable=False, server_default=''),
+        *_counter_columns(
+            'total', 'wins', 'losses', 'neutral', 'win_pnl_sum', 'loss_pnl_sum',
+            'pnl_sum', 'pnl_count', 'score_sum', 'score_count'
+        ),
+        sa.PrimaryKeyConstraint('day', 'scanner_type', 'tier', 'interval', 'signal_type')
+    )
+
+    # 2. day x symbol (best/worst symbols)
+    op.create_table(
+        'performance_rollup_symbol_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('symbol', sa.String(length=20), nullable=False),
+        *_counter_columns('total', 'wins', 'losses', 'pnl_sum', 'pnl_count', 'score_sum', 'score_count'),
+        sa.PrimaryKeyConstraint('day', 'symbol')
+    )
+
+    # Best/worst individual signals: ORDER BY pnl_pct within an outcome
+    op.create_index('idx_performance_outcome_pnl', 'performance_outcomes', ['outcome', 'pnl_pct'])
+
+    # 3. Backfill from existing outcomes
+    op.execute(
+        """
+        INSERT INTO performance_rollup_daily
+        SELECT CAST(checked_at AS DATE), COALESCE(scanner_type, ''), COALESCE(tier, ''), interval,
+               COALESCE(signal_type, ''),
+               COUNT(*),
+               SUM(CASE WHEN outcome = 'WIN' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN outcome = 'LOSS' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN outcome = 'NEUTRAL' THEN 1 ELSE 0 END),
+               COALESCE(SUM(CASE WHEN outcome = 'WIN' THEN pnl_pct END), 0),
+               COALESCE(SUM(CASE WHEN outcome = 'LOSS' THEN pnl_pct END), 0),
+               COALESCE(SUM(pnl_pct), 0), COUNT(pnl_pct),
+               COALESCE(SUM(unified_score), 0), COUNT(unified_score)
+        FROM performance_outcomes
+        WHERE checked_at IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO performance_rollup_symbol_daily
+        SELECT CAST(checked_at AS DATE), symbol,
+               COUNT(*),
+               SUM(CASE WHEN outcome = 'WIN' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN outcome = 'LOSS' THEN 1 ELSE 0 END),
+               COALESCE(SUM(pnl_pct), 0), COUNT(pnl_pct),
+               COALESCE(SUM(unified_score), 0), COUNT(unified_score)
+        FROM performance_outcomes
+        WHERE checked_at IS NOT NULL
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    """
+    Downgrade database by removing the rollup tables.
+    """
+    op.drop_index('idx_performance_outcome_pnl', table_name='performance_outcomes')
+    op.drop_table('performance_rollup_symbol_daily')
+    op.drop_table('performance_rollup_daily')
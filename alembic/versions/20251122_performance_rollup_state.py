@@ -0,0 +1,49 @@
+"""performance_rollup_state
+
+Revision ID: performance_rollups_002
+Revises: performance_rollups_001
+Create Date: 2025-11-22 00:00:00.000000
+
+Adds performance_rollup_state, which holds the 'built' marker of the one-time
+rollup backfill (app.services.performance_rollup.ensure_built). The rollups
+were already backfilled by performance_rollups_001, so the marker is recorded
+here.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'performance_rollups_002'
+down_revision: Union[str, Sequence[str], None] = 'performance_rollups_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Upgrade database for the rollup backfill marker.
+    Creates performance_rollup_state and marks the rollups as built.
+    """
+    op.create_table(
+        'performance_rollup_state',
+        sa.Column('name', sa.String(length=30), nullable=False),
+        sa.Column('built_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+    # 20251121 backfilled the rollups from existing outcomes
+    op.execute(
+        """
+        INSERT INTO performance_rollup_state (name, built_at)
+        VALUES ('built', NOW())
+        """
+    )
+
+
+def downgrade() -> None:
+    """
+    Downgrade database by removing the rollup state table.
+    """
+    op.drop_table('performance_rollup_state')
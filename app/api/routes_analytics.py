@@ -525,21 +525,21 @@ async def process_pending_outcomes():
     """
     **Manually Process Pending Outcomes**
     
-    Triggers immediate processing of all pending outcome tracking:
-    - Finds signals needing 1h/4h/24h price updates
-    - Fetches current prices
-    - Calculates P&L
-    - Updates outcomes in database
+    Triggers an immediate outcome evaluator tick:
+    - Selects every due 1h/4h/24h (and performance) outcome
+    - Fetches one candle window per symbol
+    - Calculates P&L and max favorable/adverse excursion
+    - Writes results back in batched updates
     
     Normally runs automatically in background
     """
     try:
-        await outcome_tracker.process_pending_outcomes()
+        summary = await outcome_tracker.process_pending_outcomes()
         
         return {
             "success": True,
             "message": "Pending outcomes processed successfully",
-            "note": "Check logs for detailed results"
+            "summary": summary
         }
     
     except Exception as e:
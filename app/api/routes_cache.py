@@ -73,6 +73,9 @@ async def invalidate_symbol_cache(symbol: str) -> Dict[str, Any]:
         symbol = symbol.upper()
         await cached_data_service.invalidate_symbol_cache(symbol)
         
+        from app.services.ai_verdict_cache import ai_verdict_cache
+        ai_verdict_cache.invalidate(symbol)
+        
         return {
             "ok": True,
             "symbol": symbol,
@@ -82,7 +85,8 @@ async def invalidate_symbol_cache(symbol: str) -> Dict[str, Any]:
                 "liquidations",
                 "social_sentiment",
                 "long_short_ratio",
-                "funding_rate"
+                "funding_rate",
+                "ai_verdict"
             ]
         }
     except Exception as e:
@@ -109,6 +113,96 @@ async def manual_cache_cleanup() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail="Failed to cleanup cache")
 
 
+@router.get("/cache/market-snapshot", summary="Get Market Snapshot Statistics")
+async def get_market_snapshot_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the shared coins-markets snapshot.
+    One Coinglass call per refresh serves every per-symbol market lookup.
+    """
+    try:
+        from app.services.market_snapshot_service import market_snapshot_service
+
+        return {
+            "ok": True,
+            "data": market_snapshot_service.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting market snapshot stats: {type(e).__name__}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve market snapshot statistics")
+
+
+@router.get("/cache/lunarcrush-universe", summary="Get LunarCrush Universe Snapshot Statistics")
+async def get_lunarcrush_universe_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the shared LunarCrush coins-list snapshot.
+    One LunarCrush call per refresh serves every per-symbol social lookup.
+    """
+    try:
+        from app.services.lunarcrush_universe_service import lunarcrush_universe
+
+        return {
+            "ok": True,
+            "data": lunarcrush_universe.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting LunarCrush universe stats: {type(e).__name__}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve LunarCrush universe statistics")
+
+
+@router.get("/cache/ai-verdicts", summary="Get AI Verdict Cache Statistics")
+async def get_ai_verdict_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the OpenAI V2 Signal Judge verdict cache.
+    Hits are verdicts reused while a signal's score/funding/OI/LS buckets were unchanged.
+    """
+    try:
+        from app.services.ai_verdict_cache import ai_verdict_cache
+
+        return {
+            "ok": True,
+            "data": ai_verdict_cache.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting AI verdict cache stats: {type(e).__name__}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve AI verdict cache statistics")
+
+
+@router.get("/cache/schemas", summary="Get OpenAPI Schema Cache Statistics")
+async def get_schema_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the precomputed OpenAPI / GPT Actions schemas.
+    Shows encoded sizes per schema and how many fetches were answered with 304.
+    """
+    try:
+        from app.utils.schema_cache import schema_cache
+
+        return {
+            "ok": True,
+            "data": schema_cache.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting schema cache stats: {type(e).__name__}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve schema cache statistics")
+
+
+@router.get("/cache/single-flight", summary="Get Request Coalescing Statistics")
+async def get_single_flight_stats() -> Dict[str, Any]:
+    """
+    Get single-flight statistics for upstream provider calls.
+    Shows how many identical concurrent calls were coalesced (upstream calls saved).
+    """
+    try:
+        from app.utils.single_flight import single_flight
+
+        return {
+            "ok": True,
+            "data": single_flight.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting single-flight stats: {type(e).__name__}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve single-flight statistics")
+
+
 def _get_performance_grade(hit_rate: float) -> str:
     """Calculate performance grade based on cache hit rate"""
     if hit_rate >= 90:
@@ -9,6 +9,7 @@ from fastapi import APIRouter, HTTPException, Request
 from typing import Optional
 from datetime import datetime
 from app.utils.gpt_schema_builder import build_gpt_actions_schema
+from app.utils.schema_cache import schema_cache
 from app.utils.telegram_formatters import format_mss_alert, format_smart_money_alert
 from app.utils.logger import logger
 
@@ -39,28 +40,22 @@ async def get_gpt_openapi_schema(request: Request):
     
     **RECOMMENDED FOR GPT ACTIONS:** Use this endpoint instead of /openapi.json
     """
-    from fastapi.openapi.utils import get_openapi
-    
-    # Get FastAPI app instance
     app = request.app
-    
-    # Generate OpenAPI schema
-    openapi_schema = get_openapi(
-        title=app.title,
-        version=app.version,
-        description=app.description,
-        routes=app.routes,
-    )
-    
+    return schema_cache.response(request, "gpt-openapi", lambda: build_gpt_openapi_schema(app))
+
+
+def build_gpt_openapi_schema(app) -> dict:
+    """Full OpenAPI schema with the production servers field"""
     # Add servers field for GPT Actions compatibility
-    openapi_schema["servers"] = [
-        {
-            "url": "https://guardiansofthetoken.org",
-            "description": "Production server"
-        }
-    ]
-    
-    return openapi_schema
+    return {
+        **app.openapi(),
+        "servers": [
+            {
+                "url": "https://guardiansofthetoken.org",
+                "description": "Production server"
+            }
+        ],
+    }
 
 
 @router.get("/gpt/complete-schema-v3")
@@ -77,8 +72,15 @@ async def get_complete_gpt_schema_v3(request: Request):
     - Smart Money, MSS, LunarCrush, Narratives, New Listings
     
     This endpoint provides the COMPLETE schema for GPT Actions integration.
-    Schema is auto-generated from app routes, so it's always up-to-date.
+    Schema is generated from app routes once per process (routes don't change
+    at runtime) and served pre-encoded with ETag + gzip/br.
     """
+    app = request.app
+    return schema_cache.response(request, "gpt-complete-v3", lambda: build_complete_gpt_schema_v3(app))
+
+
+def build_complete_gpt_schema_v3(app) -> dict:
+    """GPT Actions schema filtered to the data/signal tags"""
     # Get base URL
     base_url = os.getenv("BASE_URL", "https://guardiansofthetoken.org")
     
@@ -89,22 +91,9 @@ async def get_complete_gpt_schema_v3(request: Request):
     elif not base_url or base_url == "http://localhost:8000":
         base_url = "http://localhost:8000"
     
-    # Get full OpenAPI schema directly from app
-    # Force regeneration to get latest routes
-    app = request.app
-    
-    # Clear OpenAPI cache to force fresh generation
-    if hasattr(app, 'openapi_schema'):
-        app.openapi_schema = None
-    if hasattr(app, '_openapi'):
-        delattr(app, '_openapi')
-    
-    # Get fresh OpenAPI schema
+    # Full OpenAPI schema (built once by custom_openapi after all routes are registered)
     app_openapi = app.openapi()
     
-    logger.info(f"[DEBUG GPT SCHEMA] Generated fresh OpenAPI schema")
-    logger.info(f"[DEBUG GPT SCHEMA] OpenAPI has {len(app_openapi.get('paths', {}))} total paths")
-    
     # Build filtered GPT Actions schema with all relevant tags
     schema = build_gpt_actions_schema(
         app_openapi=app_openapi,
@@ -130,9 +119,11 @@ async def get_complete_gpt_schema_v3(request: Request):
         base_url=base_url
     )
     
-    logger.info(f"[DEBUG GPT SCHEMA] Built filtered schema with {len(schema.get('paths', {}))} paths")
     coinglass_count = len([p for p in schema.get('paths', {}) if 'coinglass' in p])
-    logger.info(f"[DEBUG GPT SCHEMA] Coinglass endpoints in filtered schema: {coinglass_count}")
+    logger.info(
+        f"GPT schema v3 built: {len(schema.get('paths', {}))} of {len(app_openapi.get('paths', {}))} paths "
+        f"({coinglass_count} Coinglass)"
+    )
     
     return schema
 
@@ -13,6 +13,10 @@ class GPTSignalRequest(BaseModel):
     """Flat structure for GPT Actions"""
     symbol: str = Field(..., description="Cryptocurrency symbol (BTC, ETH, SOL, etc.)")
     debug: Optional[bool] = Field(False, description="Enable debug mode")
+    defer_ai: Optional[bool] = Field(
+        None,
+        description="Return immediately with a provisional verdict; fetch the AI verdict from /signals/verdict/{signalId}"
+    )
 
 
 class GPTSmartMoneyRequest(BaseModel):
@@ -58,7 +62,8 @@ async def get_signal_gpt(request: GPTSignalRequest) -> Dict[str, Any]:
                     "socialScore": 65.5
                 },
                 "data_quality": {...},
-                "aiVerdictLayer": {...}  // Conditional field
+                "aiVerdictLayer": {...},  // Conditional field
+                "signalId": "...",  // With defer_ai=true: poll /signals/verdict/{signalId}
             },
             "operation": "signals.get"
         }
@@ -67,7 +72,7 @@ async def get_signal_gpt(request: GPTSignalRequest) -> Dict[str, Any]:
     
     try:
         debug = request.debug if request.debug is not None else False
-        result = await signal_engine.build_signal(request.symbol, debug=debug)
+        result = await signal_engine.build_signal(request.symbol, debug=debug, defer_ai_verdict=request.defer_ai)
         return {
             "ok": True,
             "data": result,
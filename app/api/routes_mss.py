@@ -296,11 +296,11 @@ async def scan_market(
                             alerts_sent += 1
                             logger.info(f"✅ Alert sent for {coin.get('symbol')} (MSS: {coin.get('mss_score'):.1f})")
                         
-                        # Save to database
+                        # Save to database (buffered - flushed in bulk with the rest of the scan)
                         try:
-                            signal_id = await mss_db.save_mss_signal(coin)
+                            await mss_db.save_mss_signal(coin, wait=False)
                             signals_saved += 1
-                            logger.info(f"✅ MSS signal saved: {coin.get('symbol')} (ID: {signal_id})")
+                            logger.info(f"✅ MSS signal queued for database: {coin.get('symbol')}")
                         except Exception as db_err:
                             logger.warning(f"Failed to save {coin.get('symbol')} to database: {db_err}")
                             
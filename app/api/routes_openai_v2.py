@@ -4,6 +4,7 @@ Development endpoints - separate from production
 
 Endpoints:
 - POST /openai/v2/validate/{symbol} - Signal Judge with verdict system
+  (verdicts cached per signal fingerprint, ?fresh=true bypasses the cache)
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
@@ -25,6 +26,9 @@ async def validate_signal_with_verdict_endpoint(
     include_comprehensive: bool = Query(
         True, description="Include comprehensive Coinglass metrics in validation"
     ),
+    fresh: bool = Query(
+        False, description="Bypass the verdict cache and force a new LLM call"
+    ),
     api_key: str = Depends(get_optional_api_key),
 ):
     """
@@ -102,6 +106,7 @@ async def validate_signal_with_verdict_endpoint(
             symbol.upper(),
             signal_data,
             comprehensive_metrics,
+            use_cache=not fresh,
         )
         
         elapsed = round((time.time() - start_time) * 1000)
@@ -158,6 +163,7 @@ async def health_check_v2():
         "endpoints": [
             "POST /openai/v2/validate/{symbol}",
             "GET /openai/v2/health",
+            "GET /cache/ai-verdicts",
         ],
         "phase": "Phase 1: Signal Judge",
     }
@@ -2,7 +2,7 @@
 Optimized GPT Actions Integration - Ultra-Slim Routing Layer
 All business logic delegated to services
 """
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Request
 import os
 import time
 
@@ -10,6 +10,7 @@ from app.core.signal_engine import signal_engine
 from app.middleware.auth import get_optional_api_key
 from app.utils.logger import default_logger, log_api_call
 from app.utils.gpt_schema_builder import build_maximal_gpt_schema
+from app.utils.schema_cache import schema_cache
 from app.services.risk_assessment_service import risk_assessment_service
 from app.services.gpt_orchestration_service import gpt_orchestration_service
 from app.utils.trading_strategies import WHALE_SCAN_COINS
@@ -17,9 +18,7 @@ from app.utils.trading_strategies import WHALE_SCAN_COINS
 router = APIRouter(prefix="/gpt", tags=["Optimized GPT Actions"])
 
 
-@router.get("/actions/maximal-schema")
-async def get_maximal_gpt_schema():
-    """🚀 MAXIMAL GPT Actions Schema - Ultimate API Capabilities"""
+def _build_maximal_schema() -> dict:
     base_url = os.getenv("BASE_URL", "https://guardiansofthetoken.org")
     replit_domain = os.getenv("REPLIT_DOMAINS")
     if replit_domain and "localhost" in base_url:
@@ -29,6 +28,15 @@ async def get_maximal_gpt_schema():
     return build_maximal_gpt_schema(base_url)
 
 
+schema_cache.register("gpt-maximal", _build_maximal_schema)
+
+
+@router.get("/actions/maximal-schema")
+async def get_maximal_gpt_schema(request: Request):
+    """🚀 MAXIMAL GPT Actions Schema - Ultimate API Capabilities"""
+    return schema_cache.response(request, "gpt-maximal")
+
+
 @router.get("/actions/ultimate-signal/{symbol}")
 async def get_ultimate_signal(
     symbol: str,
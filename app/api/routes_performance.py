@@ -12,12 +12,14 @@ Endpoints:
 - GET /performance/top-performers - Best and worst signals/symbols
 - POST /performance/track-signal - Manually track a signal
 - GET /performance/tracker-stats - Performance tracker statistics
+- POST /performance/rollups/refresh - Rebuild the daily win-rate rollups
 """
 
 from fastapi import APIRouter, HTTPException, Query
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 
+from app.services.performance_rollup import performance_rollup
 from app.services.performance_tracker import performance_tracker, track_signal
 from app.services.win_rate_analyzer import (
     win_rate_analyzer,
@@ -428,7 +430,7 @@ async def get_tracker_statistics() -> Dict[str, Any]:
     - Outcomes checked
     - Wins/losses/neutral counts
     - Win rate
-    - Scheduled jobs count
+    - Outcome evaluator stats (ticks, due, evaluated, kline requests)
 
     Example:
     ```
@@ -513,3 +515,39 @@ async def stop_performance_tracker() -> Dict[str, Any]:
             status_code=500,
             detail=f"Failed to stop tracker: {str(e)}"
         )
+
+
+@router.post("/rollups/refresh", summary="Refresh Performance Rollups")
+async def refresh_performance_rollups(
+    days: Optional[int] = Query(None, description="Rebuild only the last N days (omit for all)", ge=1, le=3650)
+) -> Dict[str, Any]:
+    """
+    Rebuild the daily win-rate rollups from performance_outcomes
+
+    Rollups are maintained incrementally as outcomes are evaluated; use this
+    after backfills, manual edits or to repair drift.
+
+    Example:
+    ```
+    POST /performance/rollups/refresh?days=7
+    ```
+    """
+    try:
+        logger.info(f"Refreshing performance rollups (days={days})")
+
+        result = await performance_rollup.refresh(days)
+
+        return {
+            "ok": True,
+            "data": {
+                **result,
+                "stats": performance_rollup.get_stats()
+            }
+        }
+
+    except Exception as e:
+        logger.error(f"Error refreshing rollups: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to refresh rollups: {str(e)}"
+        )
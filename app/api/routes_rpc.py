@@ -4,10 +4,19 @@ Supports both traditional nested args and flat parameters for GPT Actions
 """
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional, Any, Dict
 from pydantic import BaseModel
-from app.models.rpc_flat_models import FlatInvokeRequest, FlatRPCResponse
+from app.models.rpc_flat_models import (
+    FlatInvokeRequest,
+    FlatRPCResponse,
+    FlatBatchInvokeRequest,
+    FlatBatchRPCResponse,
+)
 from app.core.rpc_flat_dispatcher import flat_rpc_dispatcher
+from app.utils.single_flight import RequestDataContext
+import json
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -116,3 +125,75 @@ async def invoke_rpc(request: FlatInvokeRequest) -> FlatRPCResponse:
             error=str(e),
             meta={"error_type": type(e).__name__}
         )
+
+
+@router.post("/invoke/batch", summary="Batch RPC - run several operations concurrently", response_model=FlatBatchRPCResponse)
+async def invoke_rpc_batch(batch: FlatBatchInvokeRequest):
+    """
+    ✅ **Batch RPC Endpoint - several operations, one round-trip**
+
+    Runs all operations concurrently under one timeout budget. Operations share a
+    per-request data context, so overlapping provider calls (e.g. `signals.get` and
+    `smart_entry.analyze` for the same symbol) hit the upstream APIs once.
+
+    Example:
+    ```json
+    {
+        "symbol": "SOL",
+        "operations": [
+            {"operation": "signals.get"},
+            {"operation": "coinglass.funding_rate.history"},
+            {"operation": "coinglass.liquidations.symbol"},
+            {"operation": "smart_entry.analyze"}
+        ]
+    }
+    ```
+
+    **Parameters:**
+    - `operations` (required) - List of flat operations (same format as /invoke)
+    - `symbol` - Default symbol for operations without one
+    - `timeout_seconds` - Total budget for the batch (default 60s)
+    - `stream` - If true, respond with NDJSON lines as each operation completes
+
+    **Response:**
+    - `results` - Per-operation responses in request order (timed-out operations have ok=false)
+    - `meta.shared_calls` - Provider calls made vs reused across operations
+    """
+    max_ops = flat_rpc_dispatcher.BATCH_MAX_OPERATIONS
+    if len(batch.operations) > max_ops:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many operations in batch ({len(batch.operations)}). Maximum is {max_ops}."
+        )
+
+    requests = [
+        op.model_copy(update={"symbol": batch.symbol}) if batch.symbol and not op.symbol else op
+        for op in batch.operations
+    ]
+
+    if batch.stream:
+        return StreamingResponse(
+            _stream_batch(requests, batch.timeout_seconds),
+            media_type="application/x-ndjson"
+        )
+
+    responses, meta = await flat_rpc_dispatcher.dispatch_batch(requests, batch.timeout_seconds)
+    return FlatBatchRPCResponse(
+        ok=all(r.ok for r in responses),
+        results=responses,
+        meta=meta
+    )
+
+
+async def _stream_batch(requests, timeout_seconds):
+    """Yield one NDJSON line per completed operation, then a summary line"""
+    start_time = time.time()
+    context = RequestDataContext()
+    responses = [None] * len(requests)
+
+    async for index, response in flat_rpc_dispatcher.dispatch_batch_iter(requests, timeout_seconds, context):
+        responses[index] = response
+        yield json.dumps({"index": index, **response.model_dump()}, default=str) + "\n"
+
+    summary = flat_rpc_dispatcher.batch_meta(responses, context, start_time)
+    yield json.dumps({"done": True, "ok": all(r.ok for r in responses), "meta": summary}) + "\n"
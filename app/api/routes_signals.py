@@ -1,8 +1,12 @@
 """
 Signal and market data routes
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import json
 from app.core.signal_engine import signal_engine
+from app.services.ai_verdict_store import ai_verdict_store
 from app.services.coinapi_service import coinapi_service
 from app.services.coinglass_service import coinglass_service
 from app.services.coinglass_premium_service import coinglass_premium
@@ -12,6 +16,7 @@ from app.services.okx_service import okx_service
 # ADDED FOR CRYPTOSATX ENHANCEMENT - Signal history auto-save
 from app.storage.signal_history import signal_history
 import asyncio
+import os
 
 # ADDED FOR AI VALIDATION - OpenAI integration
 from app.services.openai_service import get_openai_service
@@ -36,6 +41,14 @@ async def persist_signal_with_tracking(signal: dict):
     4. Schedule background tracking at 1h, 4h, 24h intervals
     """
     try:
+        # Two-phase signal: persist with the final AI verdict, not the provisional one
+        pending_id = signal.get("signalId") if signal.get("aiVerdictPending") else None
+        if pending_id:
+            final = await ai_verdict_store.wait(pending_id, timeout=float(os.getenv("AI_JUDGE_TIMEOUT", "25")) * 2 + 5)
+            if final and final["status"] == "complete":
+                signal = {**signal, "aiVerdictLayer": final["aiVerdictLayer"]}
+            signal.pop("aiVerdictPending", None)
+        
         # Step 1: Save signal and get signal_id
         save_result = await signal_history.save_signal(signal)
 
@@ -86,18 +99,20 @@ async def persist_signal_with_tracking(signal: dict):
             logger.error("Failed to record outcome entry")
             return
 
-        logger.info(f"Outcome entry recorded: {outcome_id}")
-
-        # Step 4: Schedule background tracking
-        await outcome_tracker.schedule_outcome_tracking(outcome_id)
-        logger.info(f"Outcome tracking scheduled for {signal.get('symbol')}")
+        # The outcome evaluator picks the row up at 1h/4h/24h (durable across restarts)
+        logger.info(f"Outcome entry recorded: {outcome_id} ({signal.get('symbol')})")
 
     except Exception as e:
         logger.error(f"persist_signal_with_tracking failed: {e}", exc_info=True)
 
 
 @router.get("/signals/{symbol}")
-async def get_signal(symbol: str, debug: bool = False, include_ai_validation: bool = False):
+async def get_signal(
+    symbol: str,
+    debug: bool = False,
+    include_ai_validation: bool = False,
+    defer_ai: Optional[bool] = None,
+):
     """
     Get enhanced trading signal with premium data and weighted scoring.
     
@@ -105,6 +120,9 @@ async def get_signal(symbol: str, debug: bool = False, include_ai_validation: bo
         symbol: Cryptocurrency symbol (e.g., BTC, ETH, SOL)
         debug: Include detailed score breakdown and all raw metrics (default: False)
         include_ai_validation: Include OpenAI GPT-4 validation and reasoning (default: False)
+        defer_ai: Two-phase response - return immediately with a provisional rule-based
+            verdict and ATR trade plan; fetch the AI verdict from
+            /signals/verdict/{signalId} (default: AI_VERDICT_DEFERRED env)
         
     Returns:
         Enhanced signal with:
@@ -125,6 +143,10 @@ async def get_signal(symbol: str, debug: bool = False, include_ai_validation: bo
         With AI validation:
             GET /signals/SOL?include_ai_validation=true
             
+        Two-phase (sub-second score, AI verdict later):
+            GET /signals/BTC?defer_ai=true
+            GET /signals/verdict/{signalId}?wait=20   (or .../stream for SSE)
+            
     Response Structure (core fields always present):
         {
             "symbol": "BTC",
@@ -150,11 +172,12 @@ async def get_signal(symbol: str, debug: bool = False, include_ai_validation: bo
         - "comprehensiveMetrics": {...}  // When comprehensive Coinglass data available
         - "lunarCrushMetrics": {...}  // When LunarCrush data available
         - "coinAPIMetrics": {...}  // When CoinAPI data available
-        - "aiVerdictLayer": {...}  // When AI validation enabled
+        - "aiVerdictLayer": {...}  // When AI validation enabled (status "provisional" in two-phase mode)
+        - "signalId", "aiVerdictPending": {...}  // Two-phase mode: where to get the AI verdict
         - "debug": {...}  // When debug=true
     """
     try:
-        signal = await signal_engine.build_signal(symbol, debug=debug)
+        signal = await signal_engine.build_signal(symbol, debug=debug, defer_ai_verdict=defer_ai)
         
         # PHASE 2: Persist signal and initiate outcome tracking (non-blocking)
         # Only track actionable signals (LONG/SHORT) with AI verdict
@@ -192,6 +215,53 @@ async def get_signal(symbol: str, debug: bool = False, include_ai_validation: bo
         raise HTTPException(status_code=500, detail=f"Error generating signal: {str(e)}")
 
 
+@router.get("/signals/verdict/{signal_id}")
+async def get_signal_verdict(
+    signal_id: str,
+    wait: float = Query(0, ge=0, le=60, description="Long-poll up to this many seconds for the verdict"),
+):
+    """
+    Get the AI verdict of a two-phase signal (GET /signals/{symbol}?defer_ai=true)
+    
+    Returns:
+        {"signalId", "symbol", "status": "pending" | "complete" | "failed",
+         "aiVerdictLayer": {...} when complete, "error", "elapsedMs"}
+    """
+    state = await ai_verdict_store.wait(signal_id, timeout=wait)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired signal ID: {signal_id}")
+    return state
+
+
+@router.get("/signals/verdict/{signal_id}/stream")
+async def stream_signal_verdict(signal_id: str):
+    """
+    Server-sent events for a two-phase signal's AI verdict
+    
+    Emits `pending` keep-alive events every 5s, then one `verdict` event with
+    the final state and closes.
+    """
+    if ai_verdict_store.get(signal_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired signal ID: {signal_id}")
+    
+    async def events():
+        while True:
+            state = await ai_verdict_store.wait(signal_id, timeout=5)
+            if state is None:
+                yield f"event: verdict\ndata: {json.dumps({'signalId': signal_id, 'status': 'expired'})}\n\n"
+                return
+            if state["status"] != "pending":
+                yield f"event: verdict\ndata: {json.dumps(state, default=str)}\n\n"
+                return
+            yield f"event: pending\ndata: {json.dumps({'signalId': signal_id, 'elapsedMs': state['elapsedMs']})}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/debug/premium/{symbol}")
 async def debug_premium_endpoints(symbol: str):
     """Debug endpoint to test all premium endpoints individually"""
@@ -7,12 +7,20 @@ Cache Strategy:
 - Social sentiment: 60 seconds (medium-frequency updates)
 - Fear & Greed index: 300 seconds (low-frequency updates)
 - Signal data: 30 seconds (balanced updates)
+
+When the SmartCache L2 tier (Redis) is enabled, entries are written through to
+it and L1 misses read through from it, so every uvicorn worker shares warmed data.
 """
 
 import asyncio
+import heapq
+import inspect
 import logging
-from typing import Any, Optional, Callable, Dict
-from datetime import datetime, timedelta
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Callable, Dict, List, Tuple
+from datetime import datetime
 from functools import wraps
 import hashlib
 import json
@@ -20,24 +28,54 @@ import json
 logger = logging.getLogger(__name__)
 
 
+class _CacheEntry:
+    """
+    Single cache entry.
+
+    deadline is a time.monotonic() float (cheap comparisons, immune to wall-clock
+    jumps); created_at/fetched_at are time.time() floats, converted to datetimes
+    only when metadata is requested.
+    """
+
+    __slots__ = ("value", "deadline", "created_at", "fetched_at", "ttl")
+
+    def __init__(self, value: Any, deadline: float, created_at: float, fetched_at: float, ttl: float):
+        self.value = value
+        self.deadline = deadline
+        self.created_at = created_at
+        self.fetched_at = fetched_at
+        self.ttl = ttl
+
+
 class CacheService:
     """
     Async in-memory cache with TTL support.
-    Thread-safe, async-friendly caching layer for API data.
+
+    Designed for the single asyncio event loop: get/set never await while
+    touching the store, so no lock is needed and reads never contend.
+
+    - Entries live in an OrderedDict kept in LRU order (bounded by max_entries)
+    - Expiry uses a min-heap of (deadline, key): expired entries are popped
+      incrementally on writes instead of full scans
+    - Reads check the entry's own deadline, so an expired entry is never served
+      even before the heap reaches it
     """
-    
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self.max_entries = max_entries or int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
         self.stats = {
             "hits": 0,
             "misses": 0,
             "sets": 0,
             "evictions": 0,
+            "lru_evictions": 0,
+            "l2_hits": 0,
         }
-        self._start_time = datetime.now()
-        logger.info("🗄️  Cache service initialized (in-memory)")
-    
+        self._start_time = time.monotonic()
+        logger.info(f"🗄️  Cache service initialized (in-memory, max {self.max_entries} entries)")
+
     def _generate_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate deterministic cache key from function args"""
         key_data = {
@@ -48,7 +86,59 @@ class CacheService:
             json.dumps(key_data, sort_keys=True, default=str).encode()
         ).hexdigest()[:12]
         return f"{prefix}:{key_hash}"
-    
+
+    def _lookup(self, key: str) -> Optional[_CacheEntry]:
+        """Return live entry (refreshing its LRU position) or None"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry.deadline:
+            del self._cache[key]
+            self.stats["evictions"] += 1
+            logger.debug(f"⏱️  Cache expired: {key}")
+            return None
+
+        self._cache.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, value: Any, ttl_seconds: float, fetched_at: Optional[float] = None) -> None:
+        """Insert entry, push its deadline and enforce the entry cap"""
+        now_mono = time.monotonic()
+        now_wall = time.time()
+        deadline = now_mono + ttl_seconds
+
+        self._cache[key] = _CacheEntry(
+            value, deadline, now_wall, fetched_at if fetched_at is not None else now_wall, ttl_seconds
+        )
+        self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (deadline, key))
+
+        self._expire_due(now_mono)
+
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.stats["lru_evictions"] += 1
+
+        # Overwritten/evicted keys leave dead heap items behind - compact occasionally
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(e.deadline, k) for k, e in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _expire_due(self, now: float) -> int:
+        """Pop every heap item whose deadline has passed; O(k log n) for k expired"""
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            deadline, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap items superseded by a later set() of the same key
+            if entry is not None and entry.deadline == deadline:
+                del self._cache[key]
+                self.stats["evictions"] += 1
+                removed += 1
+        return removed
+
     async def get(self, key: str) -> Optional[Any]:
         """
         Retrieve value from cache with automatic expiration handling.
@@ -64,27 +154,46 @@ class CacheService:
             - Increments misses and evictions counters if expired
             - Automatically removes expired entries from cache
             
-        Thread Safety:
-            Uses async lock for safe concurrent access
+        Concurrency:
+            Lock-free - the lookup never awaits, so it is atomic on the event loop
         """
-        async with self._lock:
-            if key not in self._cache:
-                self.stats["misses"] += 1
-                return None
-            
-            entry = self._cache[key]
-            
-            if datetime.now() > entry["expires_at"]:
-                del self._cache[key]
-                self.stats["misses"] += 1
-                self.stats["evictions"] += 1
-                logger.debug(f"⏱️  Cache expired: {key}")
-                return None
-            
+        entry = self._lookup(key)
+        if entry is not None:
             self.stats["hits"] += 1
             logger.debug(f"✅ Cache hit: {key}")
-            return entry["value"]
-    
+            return entry.value
+
+        # L1 miss - try the shared L2 tier (another worker may have fetched it)
+        value = await self._l2_read_through(key)
+        if value is not None:
+            return value
+
+        self.stats["misses"] += 1
+        return None
+
+    @staticmethod
+    def _l2():
+        """SmartCache instance if its L2 tier is enabled, else None"""
+        from app.services.smart_cache import smart_cache
+        return smart_cache if smart_cache.l2_enabled else None
+
+    async def _l2_read_through(self, key: str) -> Optional[Any]:
+        """Load a still-fresh entry from L2 into L1"""
+        l2 = self._l2()
+        if l2 is None:
+            return None
+
+        entry = await l2.l2_get(f"core:{key}")
+        if entry is None or entry.is_expired():
+            return None
+
+        remaining = entry.ttl - (time.time() - entry.created_at)
+        self._store(key, entry.value, remaining, fetched_at=entry.created_at)
+        self.stats["hits"] += 1
+        self.stats["l2_hits"] += 1
+        logger.debug(f"✅ Cache L2 hit: {key}")
+        return entry.value
+
     async def set(self, key: str, value: Any, ttl_seconds: int, custom_timestamp: Optional[datetime] = None) -> None:
         """
         Store value in cache with time-to-live expiration.
@@ -95,32 +204,30 @@ class CacheService:
             ttl_seconds: Time-to-live in seconds before expiration
             custom_timestamp: Optional custom timestamp (for cache coherency groups)
 
-        Cache Entry Structure:
+        Cache Entry Structure (_CacheEntry, __slots__):
             - value: Stored data (as-is)
-            - expires_at: Calculated expiration timestamp
+            - deadline: Monotonic expiration time
             - created_at: Entry creation timestamp (for coherency tracking)
             - fetched_at: When data was actually fetched (for staleness detection)
 
         Side Effects:
             - Increments sets counter
             - Overwrites existing key if present
+            - Expires due entries and evicts LRU entries above max_entries
 
-        Thread Safety:
-            Uses async lock for safe concurrent writes
+        Concurrency:
+            Lock-free - the store update never awaits
         """
-        now = datetime.now()
-        fetched_timestamp = custom_timestamp if custom_timestamp else now
-
-        async with self._lock:
-            self._cache[key] = {
-                "value": value,
-                "expires_at": now + timedelta(seconds=ttl_seconds),
-                "created_at": now,
-                "fetched_at": fetched_timestamp,  # ✅ NEW: Track when data was fetched
-            }
-            self.stats["sets"] += 1
-            logger.debug(f"💾 Cache set: {key} (TTL: {ttl_seconds}s)")
-    
+        fetched_at = custom_timestamp.timestamp() if custom_timestamp else None
+        self._store(key, value, ttl_seconds, fetched_at=fetched_at)
+        self.stats["sets"] += 1
+        logger.debug(f"💾 Cache set: {key} (TTL: {ttl_seconds}s)")
+
+        # Write-through to the shared L2 tier (non-JSON values stay L1-only)
+        l2 = self._l2()
+        if l2 is not None:
+            await l2.l2_set(f"core:{key}", value, ttl_seconds, time.time())
+
     async def get_metadata(self, key: str) -> Optional[Dict[str, Any]]:
         """
         Get cache entry metadata without retrieving value.
@@ -130,41 +237,63 @@ class CacheService:
         Returns:
             Dict with fetched_at, created_at, expires_at, age_seconds
         """
-        async with self._lock:
-            if key not in self._cache:
-                return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
-            entry = self._cache[key]
-            now = datetime.now()
+        # Check if expired
+        ttl_remaining = entry.deadline - time.monotonic()
+        if ttl_remaining <= 0:
+            return None
 
-            # Check if expired
-            if now > entry["expires_at"]:
-                return None
+        now = time.time()
+        return {
+            "fetched_at": datetime.fromtimestamp(entry.fetched_at).isoformat(),
+            "created_at": datetime.fromtimestamp(entry.created_at).isoformat(),
+            "expires_at": datetime.fromtimestamp(now + ttl_remaining).isoformat(),
+            "age_seconds": round(now - entry.fetched_at, 2),
+            "ttl_remaining_seconds": round(ttl_remaining, 2)
+        }
 
-            age_seconds = (now - entry["fetched_at"]).total_seconds()
+    async def delete(self, key: str) -> None:
+        """Delete key from cache (and its L2 copy)"""
+        if self._cache.pop(key, None) is not None:
+            logger.debug(f"🗑️  Cache deleted: {key}")
 
-            return {
-                "fetched_at": entry["fetched_at"].isoformat(),
-                "created_at": entry["created_at"].isoformat(),
-                "expires_at": entry["expires_at"].isoformat(),
-                "age_seconds": round(age_seconds, 2),
-                "ttl_remaining_seconds": round((entry["expires_at"] - now).total_seconds(), 2)
-            }
+        l2 = self._l2()
+        if l2 is not None:
+            await l2.l2_delete(f"core:{key}")
+
+    async def delete_by_prefix(self, *prefixes: str) -> int:
+        """
+        Delete every key starting with one of the given prefixes.
+
+        Returns:
+            int: Number of entries removed
+        """
+        keys_to_delete = [k for k in self._cache if k.startswith(prefixes)]
+        for key in keys_to_delete:
+            del self._cache[key]
+        self.stats["evictions"] += len(keys_to_delete)
+
+        # L2 copies too, or the next get() reads them back through
+        l2 = self._l2()
+        if l2 is not None:
+            for prefix in prefixes:
+                await l2.l2_delete_prefix(f"core:{prefix}")
+        return len(keys_to_delete)
 
-    async def delete(self, key: str) -> None:
-        """Delete key from cache"""
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                logger.debug(f"🗑️  Cache deleted: {key}")
-    
     async def clear(self) -> None:
-        """Clear all cache entries"""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            logger.info(f"🧹 Cache cleared: {count} entries removed")
-    
+        """Clear all cache entries (and their L2 copies)"""
+        count = len(self._cache)
+        self._cache.clear()
+        self._expiry_heap.clear()
+
+        l2 = self._l2()
+        if l2 is not None:
+            await l2.l2_delete_prefix("core:")
+        logger.info(f"🧹 Cache cleared: {count} entries removed")
+
     async def cleanup_expired(self) -> int:
         """
         Remove all expired cache entries and free memory.
@@ -176,26 +305,14 @@ class CacheService:
             int: Number of expired entries removed
             
         Performance:
-            O(n) complexity where n = total cache entries
-            
-        Thread Safety:
-            Uses async lock to prevent concurrent modification
+            O(k log n) where k = expired entries (pops the expiry heap)
         """
-        async with self._lock:
-            now = datetime.now()
-            expired_keys = [
-                k for k, v in self._cache.items()
-                if now > v["expires_at"]
-            ]
-            
-            for key in expired_keys:
-                del self._cache[key]
-                self.stats["evictions"] += 1
-            
-            if expired_keys:
-                logger.info(f"🧹 Cleaned up {len(expired_keys)} expired cache entries")
-            
-            return len(expired_keys)
+        removed = self._expire_due(time.monotonic())
+
+        if removed:
+            logger.info(f"🧹 Cleaned up {removed} expired cache entries")
+
+        return removed
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -205,14 +322,18 @@ class CacheService:
             if total_requests > 0
             else 0.0
         )
-        uptime = (datetime.now() - self._start_time).total_seconds()
+        uptime = time.monotonic() - self._start_time
         
         return {
             "cache_size": len(self._cache),
+            "max_entries": self.max_entries,
             "hits": self.stats["hits"],
             "misses": self.stats["misses"],
             "sets": self.stats["sets"],
             "evictions": self.stats["evictions"],
+            "lru_evictions": self.stats["lru_evictions"],
+            "l2_hits": self.stats["l2_hits"],
+            "expiry_heap_size": len(self._expiry_heap),
             "hit_rate_percent": round(hit_rate, 2),
             "total_requests": total_requests,
             "uptime_seconds": round(uptime, 1),
@@ -232,9 +353,14 @@ class CacheService:
                 return await fetch_sentiment(symbol)
         """
         def decorator(func: Callable):
+            # Bound self/cls would embed a per-process repr in the key (and
+            # break sharing through L2) - the qualname identifies the method
+            parameters = list(inspect.signature(func).parameters)
+            skip = 1 if parameters and parameters[0] in ("self", "cls") else 0
+
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                cache_key = self._generate_key(key_prefix, *args, **kwargs)
+                cache_key = self._generate_key(key_prefix, func.__qualname__, *args[skip:], **kwargs)
                 
                 cached_value = await self.get(cache_key)
                 if cached_value is not None:
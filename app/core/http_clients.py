@@ -0,0 +1,244 @@
+"""
+Shared HTTP Client Registry
+One tuned httpx.AsyncClient (connection pool) per upstream provider/host
+
+Provider services used to build their own clients: some lazily with ad-hoc
+limits, some per call (`async with httpx.AsyncClient()`), and some per
+scored symbol. Every new client means new TCP + TLS handshakes. The
+registry owns one long-lived pool per upstream and hands out views of it:
+
+- Keep-alive pools sized per provider (HTTP_POOL_<PROVIDER>_MAX overrides
+  max connections, e.g. HTTP_POOL_COINAPI_MAX=80)
+- HTTP/2 when the optional `h2` package is installed (negotiated via ALPN,
+  HTTP/1.1 fallback per host); HTTP_CLIENT_HTTP2=false disables it
+- DNS answers cached for HTTP_DNS_CACHE_TTL seconds per host
+- Per-caller timeout/headers applied per request through a view, so
+  callers with different settings still share one pool
+
+Lifecycle: clients are created on first use; close_all() runs on app
+shutdown. Services must not close the clients they get from here.
+"""
+
+import asyncio
+import os
+import socket
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "true").lower() == "true" and HTTP2_AVAILABLE
+HTTP_DNS_CACHE_TTL = float(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "90"))
+
+
+@dataclass(frozen=True)
+class ProviderPool:
+    """Pool settings for one upstream"""
+
+    max_connections: int = 20
+    max_keepalive: int = 10
+    timeout: float = 15.0
+    http2: bool = True
+
+
+PROVIDER_POOLS: Dict[str, ProviderPool] = {
+    "coinglass": ProviderPool(max_connections=60, max_keepalive=30, timeout=15.0),
+    "coinapi": ProviderPool(max_connections=50, max_keepalive=25, timeout=15.0),
+    "binance": ProviderPool(max_connections=60, max_keepalive=30, timeout=15.0),
+    "okx": ProviderPool(max_connections=30, max_keepalive=15, timeout=10.0),
+    "lunarcrush": ProviderPool(max_connections=30, max_keepalive=15, timeout=15.0),
+    "coingecko": ProviderPool(max_connections=20, max_keepalive=10, timeout=15.0),
+    "openai": ProviderPool(max_connections=20, max_keepalive=10, timeout=60.0),
+    "telegram": ProviderPool(max_connections=10, max_keepalive=5, timeout=30.0),
+    "default": ProviderPool(),
+}
+
+# Upstream host -> provider pool (hosts not listed get their own default pool)
+PROVIDER_HOSTS: Dict[str, str] = {
+    "open-api-v4.coinglass.com": "coinglass",
+    "open-api-v3.coinglass.com": "coinglass",
+    "open-api.coinglass.com": "coinglass",
+    "rest.coinapi.io": "coinapi",
+    "fapi.binance.com": "binance",
+    "api.binance.com": "binance",
+    "www.okx.com": "okx",
+    "lunarcrush.com": "lunarcrush",
+    "api.coingecko.com": "coingecko",
+    "pro-api.coingecko.com": "coingecko",
+    "api.openai.com": "openai",
+    "api.telegram.org": "telegram",
+}
+
+
+class _CachingDNSBackend:
+    """httpcore network backend wrapper that caches host -> IP lookups"""
+
+    def __init__(self, inner: Any, ttl: float):
+        self._inner = inner
+        self._ttl = ttl
+        self._cache: Dict[Tuple[str, int], Tuple[str, float]] = {}
+
+    async def _resolve(self, host: str, port: int) -> str:
+        key = (host, port)
+        cached = self._cache.get(key)
+        now = time.monotonic()
+        if cached and cached[1] > now:
+            return cached[0]
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        self._cache[key] = (address, now + self._ttl)
+        return address
+
+    async def connect_tcp(self, host: str, port: int, *args, **kwargs):
+        try:
+            socket.inet_pton(socket.AF_INET6 if ":" in host else socket.AF_INET, host)
+            return await self._inner.connect_tcp(host, port, *args, **kwargs)
+        except OSError:
+            pass  # Not an IP literal
+
+        address = await self._resolve(host, port)
+        try:
+            return await self._inner.connect_tcp(address, port, *args, **kwargs)
+        except Exception:
+            self._cache.pop((host, port), None)  # Stale answer - re-resolve next time
+            raise
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+
+class ClientView:
+    """Shared client with per-caller default timeout and headers"""
+
+    _METHODS = ("get", "post", "put", "patch", "delete", "head", "options", "request", "stream")
+
+    def __init__(self, client: httpx.AsyncClient, timeout: Optional[float] = None,
+                 headers: Optional[Dict[str, str]] = None):
+        self._client = client
+        self._timeout = timeout
+        self._headers = headers
+
+    def _apply(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        if self._headers:
+            kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name in self._METHODS:
+            def call(*args, **kwargs):
+                return attr(*args, **self._apply(kwargs))
+            return call
+        return attr
+
+
+class HTTPClientRegistry:
+    """Process-wide pool of httpx clients keyed by provider"""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self.created = 0
+
+    def _settings(self, provider: str) -> ProviderPool:
+        pool = PROVIDER_POOLS.get(provider, PROVIDER_POOLS["default"])
+        override = os.getenv(f"HTTP_POOL_{provider.upper().replace('.', '_').replace('-', '_')}_MAX")
+        if override:
+            limit = int(override)
+            pool = ProviderPool(limit, max(1, limit // 2), pool.timeout, pool.http2)
+        return pool
+
+    def _create(self, provider: str) -> httpx.AsyncClient:
+        settings = self._settings(provider)
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+        http2 = HTTP_CLIENT_HTTP2 and settings.http2
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=1)
+
+        # httpx does not expose the network backend; wrap the pool's to cache DNS
+        pool = getattr(transport, "_pool", None)
+        backend = getattr(pool, "_network_backend", None)
+        if backend is not None and HTTP_DNS_CACHE_TTL > 0:
+            pool._network_backend = _CachingDNSBackend(backend, HTTP_DNS_CACHE_TTL)
+
+        self.created += 1
+        logger.debug(
+            f"HTTP pool '{provider}': {settings.max_connections} connections, "
+            f"http2={'on' if http2 else 'off'}"
+        )
+        return httpx.AsyncClient(transport=transport, timeout=settings.timeout)
+
+    def client(self, provider: str, timeout: Optional[float] = None,
+               headers: Optional[Dict[str, str]] = None):
+        """
+        Shared client for a provider
+
+        Args:
+            provider: Key of PROVIDER_POOLS (or an upstream host name)
+            timeout: Default per-request timeout for this caller
+            headers: Default headers merged into this caller's requests
+
+        Returns:
+            The shared httpx.AsyncClient, or a ClientView applying the defaults
+        """
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            client = self._create(provider)
+            self._clients[provider] = client
+        if timeout is None and not headers:
+            return client
+        return ClientView(client, timeout, headers)
+
+    def client_for_url(self, url: str, timeout: Optional[float] = None,
+                       headers: Optional[Dict[str, str]] = None):
+        """Shared client for the pool serving a URL's host"""
+        host = urlsplit(url).hostname or "default"
+        return self.client(PROVIDER_HOSTS.get(host, host), timeout, headers)
+
+    @asynccontextmanager
+    async def borrow(self, provider: str, timeout: Optional[float] = None,
+                     headers: Optional[Dict[str, str]] = None) -> AsyncIterator[Any]:
+        """Drop-in for `async with httpx.AsyncClient() as client` - never closes the pool"""
+        yield self.client(provider, timeout, headers)
+
+    async def close_all(self):
+        """Close every pool (app shutdown)"""
+        clients, self._clients = self._clients, {}
+        for provider, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP pool '{provider}': {e}")
+        if clients:
+            logger.info(f"🔌 Closed {len(clients)} shared HTTP pools")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pools": sorted(self._clients),
+            "created": self.created,
+            "http2": HTTP_CLIENT_HTTP2,
+            "dns_cache_ttl": HTTP_DNS_CACHE_TTL,
+        }
+
+
+# Global instance for easy import
+http_clients = HTTPClientRegistry()
@@ -1,22 +1,69 @@
 """
 Flat RPC Dispatcher - GPT Actions Compatible with Timeout Protection
 Maps flat parameters to existing service handlers
+
+Operations are resolved through a registry built once from OPERATION_CATALOG:
+operation name -> OperationSpec(handler, timeout, required params, arg adapters).
+Dispatch is a single dict lookup instead of a string-comparison chain.
 """
 import os
+import re
 import json
 import time
 import asyncio
 import traceback
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from typing import Dict, Any, AsyncIterator, Callable, Awaitable, List, Optional, Tuple
 from pydantic import BaseModel
 
 from app.models.rpc_flat_models import FlatRPCResponse
-from app.utils.operation_catalog import get_operation_metadata, OPERATION_CATALOG
+from app.utils.single_flight import RequestDataContext
+from app.utils.operation_catalog import OperationMetadata, OPERATION_CATALOG
 from app.utils.logger import logger
 from app.middleware.auto_optimizer import optimize_request
 from app.utils.telegram_report_sender import telegram_report_sender
 
 
+# (metadata flag, parameter, example value) checked in this order
+REQUIRED_PARAM_FLAGS = (
+    ("requires_symbol", "symbol", "BTC"),
+    ("requires_topic", "topic", "bitcoin"),
+    ("requires_asset", "asset", "BTC"),
+    ("requires_exchange", "exchange", "Binance"),
+)
+
+# System parameters that should only be included if explicitly set to non-default values
+SYSTEM_PARAMS = {'debug', 'include_raw'}
+
+# Parameters only needed for specific operations (not Coinglass/LunarCrush indicators)
+SIGNAL_SPECIFIC_PARAMS = {
+    'mode',           # Only for signals.get
+    'send_telegram',  # Only for smart entry/monitoring operations
+    'min_confluence', # Only for smart entry operations
+    'symbols',        # Only for batch operations
+    'duration_minutes', 'priority', 'check_interval_seconds'  # Only for monitoring
+}
+
+# Namespaces that never receive signal-specific params (except send_telegram=True)
+INDICATOR_NAMESPACES = {'coinglass', 'lunarcrush'}
+
+
+@dataclass
+class OperationSpec:
+    """Precompiled dispatch entry for one operation"""
+    name: str
+    metadata: OperationMetadata
+    handler: Callable[[Dict], Awaitable[Any]]
+    timeout: int
+    required: Tuple[Tuple[str, str], ...]  # (parameter, example value)
+    arg_adapters: Dict[type, Callable[[BaseModel], Dict[str, Any]]] = field(default_factory=dict)
+
+
+def handler_name_for(operation: str) -> str:
+    """Handler method name for an operation ("coinglass.indicators.rsi" -> "_op_coinglass_indicators_rsi")"""
+    return "_op_" + re.sub(r"[^0-9a-zA-Z]+", "_", operation)
+
+
 class FlatRPCDispatcher:
     """
     Unified RPC dispatcher with FLAT parameters for GPT Actions compatibility
@@ -76,6 +123,55 @@ class FlatRPCDispatcher:
         "backtest.run": 180,
     }
 
+    # Batch mode: total budget shared by all operations of one batch
+    BATCH_TIMEOUT = float(os.getenv("RPC_BATCH_TIMEOUT", "60"))
+    BATCH_MAX_TIMEOUT = float(os.getenv("RPC_BATCH_MAX_TIMEOUT", "120"))
+    BATCH_MAX_OPERATIONS = int(os.getenv("RPC_BATCH_MAX_OPERATIONS", "10"))
+
+    def __init__(self):
+        self._registry: Dict[str, OperationSpec] = self._build_registry()
+
+    def _build_registry(self) -> Dict[str, OperationSpec]:
+        """Build operation -> OperationSpec map once from OPERATION_CATALOG"""
+        registry = {}
+        missing = []
+
+        for name, metadata in OPERATION_CATALOG.items():
+            handler = getattr(self, handler_name_for(name), None)
+            if handler is None:
+                missing.append(name)
+                handler = self._not_implemented_handler(name)
+
+            registry[name] = OperationSpec(
+                name=name,
+                metadata=metadata,
+                handler=handler,
+                timeout=self.TIMEOUT_OVERRIDES.get(name, self.DEFAULT_TIMEOUT),
+                required=tuple(
+                    (param, example)
+                    for flag, param, example in REQUIRED_PARAM_FLAGS
+                    if getattr(metadata, flag, False)
+                ),
+            )
+
+        if missing:
+            logger.debug(f"RPC operations without handler ({len(missing)}): {missing}")
+
+        return registry
+
+    @staticmethod
+    def _not_implemented_handler(operation: str) -> Callable[[Dict], Awaitable[Any]]:
+        async def handler(args: Dict) -> Any:
+            raise NotImplementedError(
+                f"Operation '{operation}' is registered in catalog but handler not implemented yet. "
+                f"Please add handler method '{handler_name_for(operation)}'."
+            )
+        return handler
+
+    def get_spec(self, operation: str) -> Optional[OperationSpec]:
+        """Get registry entry for an operation (None if unknown)"""
+        return self._registry.get(operation)
+
     async def dispatch(self, request: BaseModel) -> FlatRPCResponse:
         """
         Dispatch operation with flat parameters, timeout protection, and error handling
@@ -93,8 +189,9 @@ class FlatRPCDispatcher:
         start_time = time.time()
         operation = request.operation
 
-        # Check if operation exists
-        if operation not in OPERATION_CATALOG:
+        # Check if operation exists (O(1) registry lookup)
+        spec = self._registry.get(operation)
+        if spec is None:
             available = list(OPERATION_CATALOG.keys())[:20]
             return FlatRPCResponse(
                 ok=False,
@@ -103,18 +200,10 @@ class FlatRPCDispatcher:
                 meta={"total_operations": len(OPERATION_CATALOG)}
             )
 
-        # Get metadata
-        try:
-            metadata = get_operation_metadata(operation)
-        except ValueError as e:
-            return FlatRPCResponse(
-                ok=False,
-                operation=operation,
-                error=str(e)
-            )
+        metadata = spec.metadata
 
         # Convert flat request to args dict
-        args = self._extract_args(request, metadata)
+        args = self._extract_args(request, spec)
         
         # Extract send_telegram parameter before optimization
         send_telegram = args.pop("send_telegram", False)
@@ -134,7 +223,7 @@ class FlatRPCDispatcher:
         args = optimized_args
 
         # Validate required arguments
-        validation_error = self._validate_args(metadata, args)
+        validation_error = self._validate_args(spec, args)
         if validation_error:
             return FlatRPCResponse(
                 ok=False,
@@ -143,13 +232,13 @@ class FlatRPCDispatcher:
             )
 
         # ✅ NEW: Get timeout for this operation
-        timeout = self.TIMEOUT_OVERRIDES.get(operation, self.DEFAULT_TIMEOUT)
+        timeout = spec.timeout
 
         # Execute operation with timeout protection
         try:
             # ✅ NEW: Wrap with asyncio.wait_for for timeout protection
             result = await asyncio.wait_for(
-                self._execute_operation(operation, args),
+                spec.handler(args),
                 timeout=timeout
             )
 
@@ -398,1321 +487,1561 @@ class FlatRPCDispatcher:
                 }
             )
 
-    def _extract_args(self, request: BaseModel, metadata) -> Dict[str, Any]:
-        """Extract arguments from flat request"""
-        args = {}
+    async def dispatch_batch_iter(
+        self,
+        requests: List[BaseModel],
+        timeout: Optional[float] = None,
+        context: Optional[RequestDataContext] = None
+    ) -> AsyncIterator[Tuple[int, FlatRPCResponse]]:
+        """
+        Run operations concurrently, yielding (index, response) as each completes
 
-        # System parameters that should only be included if explicitly set to non-default values
-        system_params = {'debug', 'include_raw'}
-        
-        # Parameters only needed for specific operations (not Coinglass/LunarCrush indicators)
-        signal_specific_params = {
-            'mode',           # Only for signals.get
-            'send_telegram',  # Only for smart entry/monitoring operations
-            'min_confluence', # Only for smart entry operations
-            'symbols',        # Only for batch operations
-            'duration_minutes', 'priority', 'check_interval_seconds'  # Only for monitoring
+        All operations share one RequestDataContext, so identical provider calls
+        made by different operations hit the upstream once. Operations still
+        running when the batch budget expires are cancelled and reported as
+        timed out.
+
+        Args:
+            requests: FlatInvokeRequest list
+            timeout: Total budget in seconds (default BATCH_TIMEOUT, capped at BATCH_MAX_TIMEOUT)
+            context: Optional data context (created if omitted)
+
+        Yields:
+            (request index, FlatRPCResponse)
+        """
+        budget = min(timeout or self.BATCH_TIMEOUT, self.BATCH_MAX_TIMEOUT)
+        context = context or RequestDataContext()
+        loop = asyncio.get_running_loop()
+
+        # Tasks copy the current contextvars at creation - activate around creation only
+        context.activate()
+        try:
+            tasks = {
+                asyncio.create_task(self.dispatch(request)): index
+                for index, request in enumerate(requests)
+            }
+        finally:
+            context.deactivate()
+
+        deadline = loop.time() + budget
+        pending = set(tasks)
+
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index = tasks[task]
+                    yield index, self._batch_task_response(task, requests[index])
+
+            for task in pending:
+                task.cancel()
+                index = tasks[task]
+                yield index, FlatRPCResponse(
+                    ok=False,
+                    operation=requests[index].operation,
+                    error=f"Batch timeout budget of {budget:.0f}s exceeded before operation completed",
+                    meta={"error_type": "TimeoutError", "batch_timeout_s": budget}
+                )
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def dispatch_batch(
+        self,
+        requests: List[BaseModel],
+        timeout: Optional[float] = None
+    ) -> Tuple[List[FlatRPCResponse], Dict[str, Any]]:
+        """
+        Run operations concurrently and collect results in request order
+
+        Returns:
+            (responses in request order, batch meta)
+        """
+        start_time = time.time()
+        context = RequestDataContext()
+        responses: List[Optional[FlatRPCResponse]] = [None] * len(requests)
+
+        async for index, response in self.dispatch_batch_iter(requests, timeout, context):
+            responses[index] = response
+
+        meta = self.batch_meta(responses, context, start_time)
+        return responses, meta
+
+    @staticmethod
+    def batch_meta(
+        responses: List[Optional[FlatRPCResponse]],
+        context: RequestDataContext,
+        start_time: float
+    ) -> Dict[str, Any]:
+        """Summary metadata for a batch run"""
+        completed = [r for r in responses if r is not None]
+        return {
+            "execution_time_ms": round((time.time() - start_time) * 1000, 2),
+            "operations": len(responses),
+            "succeeded": sum(1 for r in completed if r.ok),
+            "failed": sum(1 for r in completed if not r.ok),
+            "shared_calls": context.get_stats(),
         }
 
-        # Extract all non-None fields except 'operation'
-        for field_name in request.model_fields:
+    @staticmethod
+    def _batch_task_response(task: asyncio.Task, request: BaseModel) -> FlatRPCResponse:
+        """Convert a finished dispatch task into a response (dispatch rarely raises)"""
+        if task.cancelled():
+            return FlatRPCResponse(
+                ok=False,
+                operation=request.operation,
+                error="Operation cancelled",
+                meta={"error_type": "CancelledError"}
+            )
+        error = task.exception()
+        if error is not None:
+            return FlatRPCResponse(
+                ok=False,
+                operation=request.operation,
+                error=str(error),
+                meta={"error_type": type(error).__name__}
+            )
+        return task.result()
+
+    def _extract_args(self, request: BaseModel, spec: OperationSpec) -> Dict[str, Any]:
+        """Extract arguments from flat request using the operation's precompiled adapter"""
+        request_cls = type(request)
+        adapter = spec.arg_adapters.get(request_cls)
+        if adapter is None:
+            adapter = self._compile_arg_adapter(spec.metadata, request_cls)
+            spec.arg_adapters[request_cls] = adapter
+        return adapter(request)
+
+    @staticmethod
+    def _compile_arg_adapter(
+        metadata: OperationMetadata,
+        request_cls: type
+    ) -> Callable[[BaseModel], Dict[str, Any]]:
+        """
+        Precompute which request fields an operation receives and when
+
+        Rules (per field):
+        - 'operation' is never an argument
+        - System params (debug, include_raw) only when not None/False
+        - Signal-specific params are dropped for Coinglass/LunarCrush operations,
+          except send_telegram=True (GPT→Telegram Hybrid)
+        - mode is dropped when it is the default "aggressive"
+        - send_telegram is dropped when False
+        - None values are always dropped
+        """
+        indicator_namespace = metadata.namespace in INDICATOR_NAMESPACES
+        plan = []
+
+        for field_name in request_cls.model_fields:
             if field_name == 'operation':
                 continue
 
-            value = getattr(request, field_name, None)
-            
-            # Skip system parameters if they are default values (False/None)
-            if field_name in system_params:
-                if value in (None, False):
-                    continue
-            
-            # Skip signal-specific params for Coinglass/LunarCrush indicator operations
-            if field_name in signal_specific_params:
-                # ✅ EXCEPTION: Always allow send_telegram if True (GPT→Telegram Hybrid)
-                if field_name == 'send_telegram' and value is True:
-                    pass  # Don't skip, allow it through
-                # Skip for Coinglass and LunarCrush operations (unless they explicitly need them)
-                elif metadata.namespace in ['coinglass', 'lunarcrush']:
-                    # Skip all signal-specific params for these namespaces (except send_telegram)
-                    continue
-                    
-                # For other operations, only skip if it's a default value
-                elif field_name == 'mode' and value == "aggressive":
-                    continue
-                elif field_name == 'send_telegram' and value is False:
+            if field_name in SYSTEM_PARAMS:
+                keep = lambda value: value not in (None, False)
+            elif field_name == 'send_telegram':
+                if indicator_namespace:
+                    keep = lambda value: value is True
+                else:
+                    keep = lambda value: value is not None and value is not False
+            elif field_name in SIGNAL_SPECIFIC_PARAMS:
+                if indicator_namespace:
                     continue
-            
-            # Skip None values
-            if value is not None:
-                args[field_name] = value
+                if field_name == 'mode':
+                    keep = lambda value: value is not None and value != "aggressive"
+                else:
+                    keep = lambda value: value is not None
+            else:
+                keep = lambda value: value is not None
 
-        return args
+            plan.append((field_name, keep))
 
-    def _validate_args(self, metadata, args: Dict) -> str:
-        """Validate required arguments - returns error message or None"""
-        if metadata.requires_symbol and not args.get("symbol"):
-            return f"Missing required parameter 'symbol' for operation '{metadata.name}'. Example: {{\"operation\": \"{metadata.name}\", \"symbol\": \"BTC\"}}"
+        plan = tuple(plan)
 
-        if metadata.requires_topic and not args.get("topic"):
-            return f"Missing required parameter 'topic' for operation '{metadata.name}'. Example: {{\"operation\": \"{metadata.name}\", \"topic\": \"bitcoin\"}}"
+        def adapter(request: BaseModel) -> Dict[str, Any]:
+            args = {}
+            for field_name, keep in plan:
+                value = getattr(request, field_name, None)
+                if keep(value):
+                    args[field_name] = value
+            return args
 
-        if metadata.requires_asset and not args.get("asset"):
-            return f"Missing required parameter 'asset' for operation '{metadata.name}'. Example: {{\"operation\": \"{metadata.name}\", \"asset\": \"BTC\"}}"
+        return adapter
 
-        if metadata.requires_exchange and not args.get("exchange"):
-            return f"Missing required parameter 'exchange' for operation '{metadata.name}'. Example: {{\"operation\": \"{metadata.name}\", \"exchange\": \"Binance\"}}"
+    def _validate_args(self, spec: OperationSpec, args: Dict) -> Optional[str]:
+        """Validate required arguments - returns error message or None"""
+        for param, example in spec.required:
+            if not args.get(param):
+                return f"Missing required parameter '{param}' for operation '{spec.name}'. Example: {{\"operation\": \"{spec.name}\", \"{param}\": \"{example}\"}}"
 
         return None
 
     async def _execute_operation(self, operation: str, args: Dict) -> Any:
-        """Execute operation by routing to appropriate service"""
-
-        # ===================================================================
-        # SIGNALS & MARKET
-        # ===================================================================
-        if operation == "signals.get":
-            from app.core.signal_engine import signal_engine
-            symbol = args["symbol"]
-            debug = args.get("debug", False)
-            mode = args.get("mode", "aggressive")  # Support mode parameter (conservative/aggressive/ultra or 1/2/3)
-            return await signal_engine.build_signal(symbol, debug=debug, mode=mode)
-
-        elif operation == "signals.debug":
-            from app.core.signal_engine import signal_engine
-            symbol = args["symbol"]
-            mode = args.get("mode", "aggressive")
-            return await signal_engine.build_signal(symbol, debug=True, mode=mode)
-
-        elif operation == "market.get":
-            from app.core.signal_engine import signal_engine
-            symbol = args["symbol"]
-            return await signal_engine.build_signal(symbol, debug=True)
-        
-        elif operation == "market.summary":
-            from app.services.market_summary_service import market_summary_service
-            return await market_summary_service.get_market_summary()
-
-        # ===================================================================
-        # COINGLASS - LIQUIDATIONS
-        # ===================================================================
-        elif operation == "coinglass.liquidations.symbol":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            exchange = args.get("exchange", "Binance")
-            symbol = args.get("symbol", "BTC")
-            # Fixed: Call get_liquidation_coin_list (same as REST endpoint)
-            # This function was already fixed to use symbol.upper() instead of _normalize_symbol()
-            return await coinglass_comprehensive.get_liquidation_coin_list(
-                exchange=exchange,
-                symbol=symbol
+        """Execute operation by routing to its registered handler (O(1) lookup)"""
+        spec = self._registry.get(operation)
+        if spec is None:
+            raise NotImplementedError(
+                f"Operation '{operation}' is not registered in OPERATION_CATALOG."
             )
+        return await spec.handler(args)
+
+    # ===================================================================
+    # OPERATION HANDLERS
+    # Registered by name: operation "a.b_c" -> method "_op_a_b_c"
+    # ===================================================================
+
+    # ===================================================================
+    # SIGNALS & MARKET
+    # ===================================================================
+    async def _op_signals_get(self, args: Dict) -> Any:
+        """signals.get"""
+        from app.core.signal_engine import signal_engine
+        symbol = args["symbol"]
+        debug = args.get("debug", False)
+        mode = args.get("mode", "aggressive")  # Support mode parameter (conservative/aggressive/ultra or 1/2/3)
+        return await signal_engine.build_signal(symbol, debug=debug, mode=mode)
+
+    async def _op_signals_debug(self, args: Dict) -> Any:
+        """signals.debug"""
+        from app.core.signal_engine import signal_engine
+        symbol = args["symbol"]
+        mode = args.get("mode", "aggressive")
+        return await signal_engine.build_signal(symbol, debug=True, mode=mode)
+
+    async def _op_market_get(self, args: Dict) -> Any:
+        """market.get"""
+        from app.core.signal_engine import signal_engine
+        symbol = args["symbol"]
+        return await signal_engine.build_signal(symbol, debug=True)
+
+    async def _op_market_summary(self, args: Dict) -> Any:
+        """market.summary"""
+        from app.services.market_summary_service import market_summary_service
+        return await market_summary_service.get_market_summary()
+
+    # ===================================================================
+    # COINGLASS - LIQUIDATIONS
+    # ===================================================================
+    async def _op_coinglass_liquidations_symbol(self, args: Dict) -> Any:
+        """coinglass.liquidations.symbol"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        exchange = args.get("exchange", "Binance")
+        symbol = args.get("symbol", "BTC")
+        # Fixed: Call get_liquidation_coin_list (same as REST endpoint)
+        # This function was already fixed to use symbol.upper() instead of _normalize_symbol()
+        return await coinglass_comprehensive.get_liquidation_coin_list(
+            exchange=exchange,
+            symbol=symbol
+        )
+
+    async def _op_coinglass_liquidations_heatmap(self, args: Dict) -> Any:
+        """coinglass.liquidations.heatmap"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_liquidation_map(symbol=symbol)
+
+    async def _op_coinglass_liquidation_history(self, args: Dict) -> Any:
+        """coinglass.liquidation.history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # ✅ OPTIMIZATION: Apply default limit if not specified
+        if "limit" not in args:
+            args["limit"] = 20  # Prevent ResponseTooLargeError
+        return await coinglass_comprehensive.get_liquidation_history(**args)
+
+    async def _op_coinglass_liquidation_order(self, args: Dict) -> Any:
+        """coinglass.liquidation.order"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_liquidation_orders(**args)
+
+    async def _op_coinglass_liquidation_exchange_list(self, args: Dict) -> Any:
+        """coinglass.liquidation.exchange_list"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        range_param = args.get("range", "1h")
+        return await coinglass_comprehensive.get_liquidation_exchange_list(range=range_param)
+
+    async def _op_coinglass_liquidation_aggregated_history(self, args: Dict) -> Any:
+        """coinglass.liquidation.aggregated_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # ✅ OPTIMIZATION: Apply default limit if not specified
+        if "limit" not in args:
+            args["limit"] = 20
+        return await coinglass_comprehensive.get_liquidation_aggregated_history(**args)
+
+    # ===================================================================
+    # COINGLASS - FUNDING RATE
+    # ===================================================================
+    async def _op_coinglass_funding_rate_history(self, args: Dict) -> Any:
+        """coinglass.funding_rate.history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        exchange = args.get("exchange", "Binance")
+        symbol = args.get("symbol", "BTCUSDT")
+        interval = args.get("interval", "1d")
+        # ✅ OPTIMIZATION: Reduce default limit from 100 to 20
+        limit = args.get("limit", 20)
+        return await coinglass_comprehensive.get_funding_rate_history(
+            exchange=exchange, symbol=symbol, interval=interval, limit=limit
+        )
+
+    async def _op_coinglass_funding_rate_exchange_list(self, args: Dict) -> Any:
+        """coinglass.funding_rate.exchange_list"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_funding_rate_exchange_list(symbol)
+
+    async def _op_coinglass_funding_rate_accumulated_exchange_list(self, args: Dict) -> Any:
+        """coinglass.funding_rate.accumulated_exchange_list"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_accumulated_funding_rate_exchange_list(**args)
+
+    async def _op_coinglass_funding_rate_oi_weight_history(self, args: Dict) -> Any:
+        """coinglass.funding_rate.oi_weight_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # ✅ OPTIMIZATION: Apply default limit if not specified
+        if "limit" not in args:
+            args["limit"] = 20
+        return await coinglass_comprehensive.get_oi_weighted_funding_rate_history(**args)
+
+    async def _op_coinglass_funding_rate_vol_weight_history(self, args: Dict) -> Any:
+        """coinglass.funding_rate.vol_weight_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # ✅ OPTIMIZATION: Apply default limit if not specified
+        if "limit" not in args:
+            args["limit"] = 20
+        return await coinglass_comprehensive.get_volume_weighted_funding_rate_history(**args)
+
+    # ===================================================================
+    # COINGLASS - OPEN INTEREST
+    # ===================================================================
+    async def _op_coinglass_open_interest_history(self, args: Dict) -> Any:
+        """coinglass.open_interest.history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        exchange = args.get("exchange", "Binance")
+        symbol = args.get("symbol", "BTCUSDT")
+        interval = args.get("interval", "1d")
+        # ✅ OPTIMIZATION: Reduce default limit from 100 to 20
+        limit = args.get("limit", 20)
+        unit = args.get("unit", "usd")
+        return await coinglass_comprehensive.get_open_interest_history(
+            exchange=exchange, symbol=symbol, interval=interval, limit=limit, unit=unit
+        )
+
+    async def _op_coinglass_open_interest_exchange_list(self, args: Dict) -> Any:
+        """coinglass.open_interest.exchange_list"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_oi_exchange_list(symbol)
+
+    async def _op_coinglass_open_interest_aggregated_history(self, args: Dict) -> Any:
+        """coinglass.open_interest.aggregated_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # ✅ OPTIMIZATION: Apply default limit if not specified
+        if "limit" not in args:
+            args["limit"] = 20
+        return await coinglass_comprehensive.get_aggregated_oi_history(**args)
+
+    async def _op_coinglass_open_interest_aggregated_stablecoin_history(self, args: Dict) -> Any:
+        """coinglass.open_interest.aggregated_stablecoin_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # ✅ OPTIMIZATION: Apply default limit if not specified
+        if "limit" not in args:
+            args["limit"] = 20
+        return await coinglass_comprehensive.get_aggregated_stablecoin_oi_history(**args)
+
+    async def _op_coinglass_open_interest_aggregated_coin_margin_history(self, args: Dict) -> Any:
+        """coinglass.open_interest.aggregated_coin_margin_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # ✅ OPTIMIZATION: Apply default limit if not specified
+        if "limit" not in args:
+            args["limit"] = 20
+        return await coinglass_comprehensive.get_aggregated_coin_margin_oi_history(**args)
+
+    async def _op_coinglass_open_interest_exchange_history_chart(self, args: Dict) -> Any:
+        """coinglass.open_interest.exchange_history_chart"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # Filter to only accepted parameters
+        filtered_args = {k: v for k, v in args.items() if k in ['symbol', 'range', 'unit']}
+        return await coinglass_comprehensive.get_oi_exchange_history_chart(**filtered_args)
+
+    # ===================================================================
+    # COINGLASS - INDICATORS
+    # ===================================================================
+    async def _op_coinglass_indicators_fear_greed(self, args: Dict) -> Any:
+        """coinglass.indicators.fear_greed"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_fear_greed_index()
+
+    async def _op_coinglass_indicators_rsi_list(self, args: Dict) -> Any:
+        """coinglass.indicators.rsi_list"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        limit = args.get("limit", 20)
+        signal_filter = args.get("signal_filter")
+
+        # Validate signal_filter (Pydantic already validates, but double-check for safety)
+        if signal_filter and signal_filter.upper() not in ["OVERSOLD", "OVERBOUGHT", "NEUTRAL"]:
+            return {
+                "success": False,
+                "error": f"Invalid signal_filter '{signal_filter}'. Must be one of: OVERSOLD, OVERBOUGHT, NEUTRAL"
+            }
 
-        elif operation == "coinglass.liquidations.heatmap":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_liquidation_map(symbol=symbol)
-
-        elif operation == "coinglass.liquidation.history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # ✅ OPTIMIZATION: Apply default limit if not specified
-            if "limit" not in args:
-                args["limit"] = 20  # Prevent ResponseTooLargeError
-            return await coinglass_comprehensive.get_liquidation_history(**args)
-
-        elif operation == "coinglass.liquidation.order":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_liquidation_orders(**args)
-
-        elif operation == "coinglass.liquidation.exchange_list":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            range_param = args.get("range", "1h")
-            return await coinglass_comprehensive.get_liquidation_exchange_list(range=range_param)
-
-        elif operation == "coinglass.liquidation.aggregated_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # ✅ OPTIMIZATION: Apply default limit if not specified
-            if "limit" not in args:
-                args["limit"] = 20
-            return await coinglass_comprehensive.get_liquidation_aggregated_history(**args)
-
-        # ===================================================================
-        # COINGLASS - FUNDING RATE
-        # ===================================================================
-        elif operation == "coinglass.funding_rate.history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            exchange = args.get("exchange", "Binance")
-            symbol = args.get("symbol", "BTCUSDT")
-            interval = args.get("interval", "1d")
-            # ✅ OPTIMIZATION: Reduce default limit from 100 to 20
-            limit = args.get("limit", 20)
-            return await coinglass_comprehensive.get_funding_rate_history(
-                exchange=exchange, symbol=symbol, interval=interval, limit=limit
-            )
+        return await coinglass_comprehensive.get_rsi_list(
+            limit=limit,
+            signal_filter=signal_filter
+        )
+
+    async def _op_coinglass_indicators_rsi(self, args: Dict) -> Any:
+        """coinglass.indicators.rsi"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_rsi_indicator(**args)
+
+    async def _op_coinglass_indicators_ma(self, args: Dict) -> Any:
+        """coinglass.indicators.ma"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_ma_indicator(**args)
+
+    async def _op_coinglass_indicators_ema(self, args: Dict) -> Any:
+        """coinglass.indicators.ema"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_ema_indicator(**args)
+
+    async def _op_coinglass_indicators_bollinger(self, args: Dict) -> Any:
+        """coinglass.indicators.bollinger"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_bollinger_bands(**args)
+
+    async def _op_coinglass_indicators_macd(self, args: Dict) -> Any:
+        """coinglass.indicators.macd"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_macd_indicator(**args)
+
+    async def _op_coinglass_indicators_basis(self, args: Dict) -> Any:
+        """coinglass.indicators.basis"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_basis_history(**args)
+
+    async def _op_coinglass_indicators_whale_index(self, args: Dict) -> Any:
+        """coinglass.indicators.whale_index"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_whale_index(**args)
+
+    async def _op_coinglass_indicators_cgdi(self, args: Dict) -> Any:
+        """coinglass.indicators.cgdi"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_cgdi_index()
+
+    async def _op_coinglass_indicators_cdri(self, args: Dict) -> Any:
+        """coinglass.indicators.cdri"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_cdri_index()
+
+    async def _op_coinglass_indicators_golden_ratio(self, args: Dict) -> Any:
+        """coinglass.indicators.golden_ratio"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_golden_ratio_multiplier()
+
+    # ===================================================================
+    # COINGLASS - ORDERBOOK & WHALE
+    # ===================================================================
+    async def _op_coinglass_orderbook_whale_walls(self, args: Dict) -> Any:
+        """coinglass.orderbook.whale_walls"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        # Filter to only accepted parameters
+        filtered_args = {k: v for k, v in args.items() if k in ['exchange', 'symbol']}
+        return await coinglass_comprehensive.get_large_limit_orders(**filtered_args)
+
+    async def _op_coinglass_orderbook_whale_history(self, args: Dict) -> Any:
+        """coinglass.orderbook.whale_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_large_limit_order_history(**args)
+
+    async def _op_coinglass_orderbook_aggregated_history(self, args: Dict) -> Any:
+        """coinglass.orderbook.aggregated_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_orderbook_aggregated_history(**args)
+
+    async def _op_coinglass_orderbook_ask_bids_history(self, args: Dict) -> Any:
+        """coinglass.orderbook.ask_bids_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_orderbook_ask_bids_history(**args)
+
+    async def _op_coinglass_orderbook_detailed_history(self, args: Dict) -> Any:
+        """coinglass.orderbook.detailed_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_orderbook_detailed_history(**args)
+
+    async def _op_coinglass_chain_whale_transfers(self, args: Dict) -> Any:
+        """coinglass.chain.whale_transfers"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        limit = args.get("limit", 100)
+        return await coinglass_comprehensive.get_chain_whale_transfers(limit=limit)
+
+    async def _op_coinglass_chain_exchange_flows(self, args: Dict) -> Any:
+        """coinglass.chain.exchange_flows"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        limit = args.get("limit", 100)
+        return await coinglass_comprehensive.get_exchange_chain_transactions(limit=limit)
+
+    # ===================================================================
+    # COINGLASS - HYPERLIQUID
+    # ===================================================================
+    async def _op_coinglass_hyperliquid_whale_alerts(self, args: Dict) -> Any:
+        """coinglass.hyperliquid.whale_alerts"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_hyperliquid_whale_alerts()
+
+    async def _op_coinglass_hyperliquid_whale_positions(self, args: Dict) -> Any:
+        """coinglass.hyperliquid.whale_positions"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_hyperliquid_whale_positions()
+
+    async def _op_coinglass_hyperliquid_positions_symbol(self, args: Dict) -> Any:
+        """coinglass.hyperliquid.positions.symbol"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_hyperliquid_positions_by_symbol(symbol=symbol)
+
+    # ===================================================================
+    # COINGLASS - MARKET DATA
+    # ===================================================================
+    async def _op_coinglass_markets(self, args: Dict) -> Any:
+        """coinglass.markets"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_coins_markets()
+
+    async def _op_coinglass_markets_symbol(self, args: Dict) -> Any:
+        """coinglass.markets.symbol"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_coins_markets(symbol=symbol)
+
+    async def _op_coinglass_dashboard_symbol(self, args: Dict) -> Any:
+        """coinglass.dashboard.symbol"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_coins_markets(symbol=symbol)
+
+    async def _op_coinglass_supported_coins(self, args: Dict) -> Any:
+        """coinglass.supported_coins"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_supported_coins()
+
+    async def _op_coinglass_supported_exchanges(self, args: Dict) -> Any:
+        """coinglass.supported_exchanges"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_supported_exchanges()
+
+    async def _op_coinglass_exchanges(self, args: Dict) -> Any:
+        """coinglass.exchanges"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_supported_exchange_pairs()
+
+    # Removed: coinglass.perpetual_market.symbol (Deprecated - HTTP 404 from Coinglass API)
+    async def _op_coinglass_pairs_markets_symbol(self, args: Dict) -> Any:
+        """coinglass.pairs_markets.symbol"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_pairs_markets(symbol=symbol)
+
+    async def _op_coinglass_price_change(self, args: Dict) -> Any:
+        """coinglass.price_change"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_coins_price_change()
+
+    async def _op_coinglass_price_history(self, args: Dict) -> Any:
+        """coinglass.price_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_price_history(**args)
+
+    async def _op_coinglass_delisted_pairs(self, args: Dict) -> Any:
+        """coinglass.delisted_pairs"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_delisted_pairs()
+
+    # ===================================================================
+    # COINGLASS - ADVANCED METRICS
+    # ===================================================================
+    async def _op_coinglass_etf_flows(self, args: Dict) -> Any:
+        """coinglass.etf.flows"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        asset = args.get("asset", "BTC")
+        return await coinglass_comprehensive.get_etf_flows(asset)
+
+    async def _op_coinglass_onchain_reserves(self, args: Dict) -> Any:
+        """coinglass.onchain.reserves"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        symbol = args.get("symbol", "BTC")
+        return await coinglass_comprehensive.get_exchange_reserves(symbol)
+
+    async def _op_coinglass_long_short_ratio_account_history(self, args: Dict) -> Any:
+        """coinglass.long_short_ratio.account_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_top_long_short_account_ratio_history(**args)
+
+    async def _op_coinglass_long_short_ratio_position_history(self, args: Dict) -> Any:
+        """coinglass.long_short_ratio.position_history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_top_long_short_position_ratio_history(**args)
+
+    async def _op_coinglass_net_position_history(self, args: Dict) -> Any:
+        """coinglass.net_position.history"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_net_position_history(**args)
+
+    async def _op_coinglass_options_open_interest(self, args: Dict) -> Any:
+        """coinglass.options.open_interest"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_options_open_interest()
+
+    async def _op_coinglass_options_volume(self, args: Dict) -> Any:
+        """coinglass.options.volume"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_options_volume()
+
+    async def _op_coinglass_volume_taker_buy_sell(self, args: Dict) -> Any:
+        """coinglass.volume.taker_buy_sell"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_taker_buy_sell_volume(**args)
+
+    async def _op_coinglass_taker_buy_sell_exchange_list(self, args: Dict) -> Any:
+        """coinglass.taker_buy_sell.exchange_list"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_taker_buy_sell_volume_exchange_list(**args)
+
+    async def _op_coinglass_news_feed(self, args: Dict) -> Any:
+        """coinglass.news.feed"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        limit = int(args.get("limit", 10))
+        # Handle both boolean and string "true"/"false"
+        include_content_raw = args.get("include_content", False)
+        include_content = include_content_raw if isinstance(include_content_raw, bool) else str(include_content_raw).lower() == "true"
+        return await coinglass_comprehensive.get_news_feed(limit=limit, include_content=include_content)
+
+    async def _op_coinglass_calendar_economic(self, args: Dict) -> Any:
+        """coinglass.calendar.economic"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_economic_calendar()
+
+    async def _op_coinglass_index_bull_market_peak(self, args: Dict) -> Any:
+        """coinglass.index.bull_market_peak"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_bull_market_indicators()
+
+    async def _op_coinglass_index_rainbow_chart(self, args: Dict) -> Any:
+        """coinglass.index.rainbow_chart"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_rainbow_chart()
+
+    async def _op_coinglass_index_stock_to_flow(self, args: Dict) -> Any:
+        """coinglass.index.stock_to_flow"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_stock_to_flow()
+
+    async def _op_coinglass_borrow_interest_rate(self, args: Dict) -> Any:
+        """coinglass.borrow.interest_rate"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        return await coinglass_comprehensive.get_borrow_interest_rate(**args)
+
+    async def _op_coinglass_exchange_assets(self, args: Dict) -> Any:
+        """coinglass.exchange.assets"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        exchange = args.get("exchange", "Binance")
+        return await coinglass_comprehensive.get_exchange_assets(exchange=exchange)
+
+    # ===================================================================
+    # SMART MONEY
+    # ===================================================================
+    async def _op_smart_money_scan(self, args: Dict) -> Any:
+        """smart_money.scan"""
+        from app.services.smart_money_service import smart_money_service
+        min_acc = args.get("min_accumulation_score", 5)
+        min_dist = args.get("min_distribution_score", 5)
+        # OPTIMIZED: 30 coins with batch size 10 = 3 batches (~90-120s)
+        limit = args.get("limit", 30)  # Default 30 coins (optimized batch processing)
+        coins_str = args.get("coins")
+        coin_list = coins_str.split(",") if coins_str else None
+        return await smart_money_service.scan_smart_money(
+            min_accumulation_score=min_acc,
+            min_distribution_score=min_dist,
+            coins=coins_str,
+            limit=limit
+        )
+
+    async def _op_smart_money_scan_tiered(self, args: Dict) -> Any:
+        """smart_money.scan_tiered"""
+        from app.services.tiered_scanner import TieredScanner
+        scanner = TieredScanner()
+        total_coins = args.get("total_coins", 100)
+        tier1_enabled = args.get("tier1_enabled", True)
+        tier2_enabled = args.get("tier2_enabled", True)
+        tier3_enabled = args.get("tier3_enabled", True)
+        final_limit = args.get("final_limit", 10)
+        return await scanner.scan_tiered(
+            total_coins=total_coins,
+            tier1_enabled=tier1_enabled,
+            tier2_enabled=tier2_enabled,
+            tier3_enabled=tier3_enabled,
+            final_limit=final_limit
+        )
+
+    async def _op_smart_money_scan_accumulation(self, args: Dict) -> Any:
+        """smart_money.scan_accumulation"""
+        from app.services.smart_money_service import smart_money_service
+        min_score = args.get("min_accumulation_score", 7)
+        return await smart_money_service.scan_smart_money(
+            min_accumulation_score=min_score,
+            min_distribution_score=10  # High threshold to filter out distribution
+        )
+
+    async def _op_smart_money_analyze(self, args: Dict) -> Any:
+        """smart_money.analyze"""
+        from app.services.smart_money_service import smart_money_service
+        symbol = args["symbol"]
+        return await smart_money_service.analyze_any_coin(symbol)
+
+    # ===================================================================
+    # SMART ENTRY ENGINE
+    # ===================================================================
+    async def _op_smart_entry_analyze(self, args: Dict) -> Any:
+        """smart_entry.analyze"""
+        from app.services.smart_entry_engine import get_smart_entry_engine
+        engine = get_smart_entry_engine()
+        symbol = args["symbol"]
+        timeframe = args.get("timeframe", "1h")
+        send_telegram = args.get("send_telegram", False)
+
+        recommendation = await engine.analyze_entry(symbol.upper(), timeframe)
+
+        if not recommendation:
+            return {"success": False, "error": f"Could not analyze {symbol}"}
+
+        # Send Telegram alert if requested
+        if send_telegram:
+            try:
+                from app.services.telegram_notifier import TelegramNotifier
+                from app.services.pro_alert_formatter import get_pro_alert_formatter
 
-        elif operation == "coinglass.funding_rate.exchange_list":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_funding_rate_exchange_list(symbol)
-
-        elif operation == "coinglass.funding_rate.accumulated_exchange_list":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_accumulated_funding_rate_exchange_list(**args)
-
-        elif operation == "coinglass.funding_rate.oi_weight_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # ✅ OPTIMIZATION: Apply default limit if not specified
-            if "limit" not in args:
-                args["limit"] = 20
-            return await coinglass_comprehensive.get_oi_weighted_funding_rate_history(**args)
-
-        elif operation == "coinglass.funding_rate.vol_weight_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # ✅ OPTIMIZATION: Apply default limit if not specified
-            if "limit" not in args:
-                args["limit"] = 20
-            return await coinglass_comprehensive.get_volume_weighted_funding_rate_history(**args)
-
-        # ===================================================================
-        # COINGLASS - OPEN INTEREST
-        # ===================================================================
-        elif operation == "coinglass.open_interest.history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            exchange = args.get("exchange", "Binance")
-            symbol = args.get("symbol", "BTCUSDT")
-            interval = args.get("interval", "1d")
-            # ✅ OPTIMIZATION: Reduce default limit from 100 to 20
-            limit = args.get("limit", 20)
-            unit = args.get("unit", "usd")
-            return await coinglass_comprehensive.get_open_interest_history(
-                exchange=exchange, symbol=symbol, interval=interval, limit=limit, unit=unit
-            )
+                telegram = TelegramNotifier()
+                formatter = get_pro_alert_formatter()
+                alert_message = formatter.format_entry_alert(recommendation)
 
-        elif operation == "coinglass.open_interest.exchange_list":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_oi_exchange_list(symbol)
-
-        elif operation == "coinglass.open_interest.aggregated_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # ✅ OPTIMIZATION: Apply default limit if not specified
-            if "limit" not in args:
-                args["limit"] = 20
-            return await coinglass_comprehensive.get_aggregated_oi_history(**args)
-
-        elif operation == "coinglass.open_interest.aggregated_stablecoin_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # ✅ OPTIMIZATION: Apply default limit if not specified
-            if "limit" not in args:
-                args["limit"] = 20
-            return await coinglass_comprehensive.get_aggregated_stablecoin_oi_history(**args)
-
-        elif operation == "coinglass.open_interest.aggregated_coin_margin_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # ✅ OPTIMIZATION: Apply default limit if not specified
-            if "limit" not in args:
-                args["limit"] = 20
-            return await coinglass_comprehensive.get_aggregated_coin_margin_oi_history(**args)
-
-        elif operation == "coinglass.open_interest.exchange_history_chart":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # Filter to only accepted parameters
-            filtered_args = {k: v for k, v in args.items() if k in ['symbol', 'range', 'unit']}
-            return await coinglass_comprehensive.get_oi_exchange_history_chart(**filtered_args)
-
-        # ===================================================================
-        # COINGLASS - INDICATORS
-        # ===================================================================
-        elif operation == "coinglass.indicators.fear_greed":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_fear_greed_index()
-
-        elif operation == "coinglass.indicators.rsi_list":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            limit = args.get("limit", 20)
-            signal_filter = args.get("signal_filter")
-            
-            # Validate signal_filter (Pydantic already validates, but double-check for safety)
-            if signal_filter and signal_filter.upper() not in ["OVERSOLD", "OVERBOUGHT", "NEUTRAL"]:
-                return {
-                    "success": False,
-                    "error": f"Invalid signal_filter '{signal_filter}'. Must be one of: OVERSOLD, OVERBOUGHT, NEUTRAL"
-                }
-            
-            return await coinglass_comprehensive.get_rsi_list(
-                limit=limit,
-                signal_filter=signal_filter
-            )
+                await telegram.send_custom_alert(
+                    title=f"{symbol} Smart Entry Analysis",
+                    message=alert_message,
+                    emoji="🎯"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to send Telegram alert: {e}")
+
+        # Return formatted response
+        return {
+            "success": True,
+            "data": {
+                "symbol": recommendation.symbol,
+                "direction": recommendation.direction.value,
+                "confluence": {
+                    "score": recommendation.confluence_score.total_score,
+                    "strength": recommendation.confluence_score.strength.value,
+                    "signals_analyzed": recommendation.confluence_score.signals_analyzed,
+                    "signals_bullish": recommendation.confluence_score.signals_bullish,
+                    "signals_bearish": recommendation.confluence_score.signals_bearish,
+                    "breakdown": recommendation.confluence_score.breakdown
+                },
+                "entry": {
+                    "entry_zone_low": recommendation.entry_zone_low,
+                    "entry_zone_high": recommendation.entry_zone_high,
+                    "stop_loss": recommendation.stop_loss,
+                    "take_profit_1": recommendation.take_profit_1,
+                    "take_profit_2": recommendation.take_profit_2,
+                    "take_profit_3": recommendation.take_profit_3
+                },
+                "risk_management": {
+                    "risk_reward_ratio": recommendation.risk_reward_ratio,
+                    "position_size_pct": recommendation.position_size_pct,
+                    "urgency": recommendation.urgency
+                },
+                "reasoning": recommendation.reasoning
+            }
+        }
 
-        elif operation == "coinglass.indicators.rsi":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_rsi_indicator(**args)
-
-        elif operation == "coinglass.indicators.ma":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_ma_indicator(**args)
-
-        elif operation == "coinglass.indicators.ema":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_ema_indicator(**args)
-
-        elif operation == "coinglass.indicators.bollinger":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_bollinger_bands(**args)
-
-        elif operation == "coinglass.indicators.macd":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_macd_indicator(**args)
-
-        elif operation == "coinglass.indicators.basis":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_basis_history(**args)
-
-        elif operation == "coinglass.indicators.whale_index":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_whale_index(**args)
-
-        elif operation == "coinglass.indicators.cgdi":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_cgdi_index()
-
-        elif operation == "coinglass.indicators.cdri":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_cdri_index()
-
-        elif operation == "coinglass.indicators.golden_ratio":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_golden_ratio_multiplier()
-
-        # ===================================================================
-        # COINGLASS - ORDERBOOK & WHALE
-        # ===================================================================
-        elif operation == "coinglass.orderbook.whale_walls":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            # Filter to only accepted parameters
-            filtered_args = {k: v for k, v in args.items() if k in ['exchange', 'symbol']}
-            return await coinglass_comprehensive.get_large_limit_orders(**filtered_args)
-
-        elif operation == "coinglass.orderbook.whale_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_large_limit_order_history(**args)
-
-        elif operation == "coinglass.orderbook.aggregated_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_orderbook_aggregated_history(**args)
-
-        elif operation == "coinglass.orderbook.ask_bids_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_orderbook_ask_bids_history(**args)
-
-        elif operation == "coinglass.orderbook.detailed_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_orderbook_detailed_history(**args)
-
-        elif operation == "coinglass.chain.whale_transfers":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            limit = args.get("limit", 100)
-            return await coinglass_comprehensive.get_chain_whale_transfers(limit=limit)
-
-        elif operation == "coinglass.chain.exchange_flows":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            limit = args.get("limit", 100)
-            return await coinglass_comprehensive.get_exchange_chain_transactions(limit=limit)
-
-        # ===================================================================
-        # COINGLASS - HYPERLIQUID
-        # ===================================================================
-        elif operation == "coinglass.hyperliquid.whale_alerts":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_hyperliquid_whale_alerts()
-
-        elif operation == "coinglass.hyperliquid.whale_positions":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_hyperliquid_whale_positions()
-
-        elif operation == "coinglass.hyperliquid.positions.symbol":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_hyperliquid_positions_by_symbol(symbol=symbol)
-
-        # ===================================================================
-        # COINGLASS - MARKET DATA
-        # ===================================================================
-        elif operation == "coinglass.markets":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_coins_markets()
-
-        elif operation == "coinglass.markets.symbol":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_coins_markets(symbol=symbol)
-
-        elif operation == "coinglass.dashboard.symbol":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_coins_markets(symbol=symbol)
-
-        elif operation == "coinglass.supported_coins":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_supported_coins()
-
-        elif operation == "coinglass.supported_exchanges":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_supported_exchanges()
-
-        elif operation == "coinglass.exchanges":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_supported_exchange_pairs()
-
-        # Removed: coinglass.perpetual_market.symbol (Deprecated - HTTP 404 from Coinglass API)
-
-        elif operation == "coinglass.pairs_markets.symbol":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_pairs_markets(symbol=symbol)
-
-        elif operation == "coinglass.price_change":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_coins_price_change()
-
-        elif operation == "coinglass.price_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_price_history(**args)
-
-        elif operation == "coinglass.delisted_pairs":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_delisted_pairs()
-
-        # ===================================================================
-        # COINGLASS - ADVANCED METRICS
-        # ===================================================================
-        elif operation == "coinglass.etf.flows":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            asset = args.get("asset", "BTC")
-            return await coinglass_comprehensive.get_etf_flows(asset)
-
-        elif operation == "coinglass.onchain.reserves":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            symbol = args.get("symbol", "BTC")
-            return await coinglass_comprehensive.get_exchange_reserves(symbol)
-
-        elif operation == "coinglass.long_short_ratio.account_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_top_long_short_account_ratio_history(**args)
-
-        elif operation == "coinglass.long_short_ratio.position_history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_top_long_short_position_ratio_history(**args)
-
-        elif operation == "coinglass.net_position.history":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_net_position_history(**args)
-
-        elif operation == "coinglass.options.open_interest":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_options_open_interest()
-
-        elif operation == "coinglass.options.volume":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_options_volume()
-
-        elif operation == "coinglass.volume.taker_buy_sell":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_taker_buy_sell_volume(**args)
-
-        elif operation == "coinglass.taker_buy_sell.exchange_list":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_taker_buy_sell_volume_exchange_list(**args)
-
-        elif operation == "coinglass.news.feed":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            limit = int(args.get("limit", 10))
-            # Handle both boolean and string "true"/"false"
-            include_content_raw = args.get("include_content", False)
-            include_content = include_content_raw if isinstance(include_content_raw, bool) else str(include_content_raw).lower() == "true"
-            return await coinglass_comprehensive.get_news_feed(limit=limit, include_content=include_content)
-
-        elif operation == "coinglass.calendar.economic":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_economic_calendar()
-
-        elif operation == "coinglass.index.bull_market_peak":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_bull_market_indicators()
-
-        elif operation == "coinglass.index.rainbow_chart":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_rainbow_chart()
-
-        elif operation == "coinglass.index.stock_to_flow":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_stock_to_flow()
-
-        elif operation == "coinglass.borrow.interest_rate":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            return await coinglass_comprehensive.get_borrow_interest_rate(**args)
-
-        elif operation == "coinglass.exchange.assets":
-            from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-            exchange = args.get("exchange", "Binance")
-            return await coinglass_comprehensive.get_exchange_assets(exchange=exchange)
-
-        # ===================================================================
-        # SMART MONEY
-        # ===================================================================
-        elif operation == "smart_money.scan":
-            from app.services.smart_money_service import smart_money_service
-            min_acc = args.get("min_accumulation_score", 5)
-            min_dist = args.get("min_distribution_score", 5)
-            # OPTIMIZED: 30 coins with batch size 10 = 3 batches (~90-120s)
-            limit = args.get("limit", 30)  # Default 30 coins (optimized batch processing)
-            coins_str = args.get("coins")
-            coin_list = coins_str.split(",") if coins_str else None
-            return await smart_money_service.scan_smart_money(
-                min_accumulation_score=min_acc,
-                min_distribution_score=min_dist,
-                coins=coins_str,
-                limit=limit
-            )
+    async def _op_smart_entry_analyze_batch(self, args: Dict) -> Any:
+        """smart_entry.analyze_batch"""
+        from app.services.smart_entry_engine import get_smart_entry_engine
+        import asyncio
 
-        elif operation == "smart_money.scan_tiered":
-            from app.services.tiered_scanner import TieredScanner
-            scanner = TieredScanner()
-            total_coins = args.get("total_coins", 100)
-            tier1_enabled = args.get("tier1_enabled", True)
-            tier2_enabled = args.get("tier2_enabled", True)
-            tier3_enabled = args.get("tier3_enabled", True)
-            final_limit = args.get("final_limit", 10)
-            return await scanner.scan_tiered(
-                total_coins=total_coins,
-                tier1_enabled=tier1_enabled,
-                tier2_enabled=tier2_enabled,
-                tier3_enabled=tier3_enabled,
-                final_limit=final_limit
-            )
+        engine = get_smart_entry_engine()
+        symbols = args.get("symbols", [])
+        timeframe = args.get("timeframe", "1h")
+        min_confluence = args.get("min_confluence", 60)
+        send_telegram = args.get("send_telegram", False)
 
-        elif operation == "smart_money.scan_accumulation":
-            from app.services.smart_money_service import smart_money_service
-            min_score = args.get("min_accumulation_score", 7)
-            return await smart_money_service.scan_smart_money(
-                min_accumulation_score=min_score,
-                min_distribution_score=10  # High threshold to filter out distribution
-            )
+        if not symbols or len(symbols) > 20:
+            return {"success": False, "error": "Provide 1-20 symbols in symbols parameter"}
 
-        elif operation == "smart_money.analyze":
-            from app.services.smart_money_service import smart_money_service
-            symbol = args["symbol"]
-            return await smart_money_service.analyze_any_coin(symbol)
-
-        elif operation == "smart_money.scan_tiered":
-            from app.services.tiered_scanner import tiered_scanner
-            total_coins = args.get("total_coins", 100)
-            tier1_enabled = args.get("tier1_enabled", True)
-            tier2_enabled = args.get("tier2_enabled", True)
-            tier3_enabled = args.get("tier3_enabled", True)
-            final_limit = args.get("final_limit", 10)
-            min_acc = args.get("min_accumulation_score", 5)
-            min_dist = args.get("min_distribution_score", 5)
-            return await tiered_scanner.scan_tiered(
-                total_coins=total_coins,
-                tier1_enabled=tier1_enabled,
-                tier2_enabled=tier2_enabled,
-                tier3_enabled=tier3_enabled,
-                final_limit=final_limit,
-                min_accumulation_score=min_acc,
-                min_distribution_score=min_dist
-            )
+        # Analyze all symbols in parallel
+        tasks = [engine.analyze_entry(symbol.upper(), timeframe) for symbol in symbols]
+        recommendations = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # ===================================================================
-        # SMART ENTRY ENGINE
-        # ===================================================================
-        elif operation == "smart_entry.analyze":
-            from app.services.smart_entry_engine import get_smart_entry_engine
-            engine = get_smart_entry_engine()
-            symbol = args["symbol"]
-            timeframe = args.get("timeframe", "1h")
-            send_telegram = args.get("send_telegram", False)
-            
-            recommendation = await engine.analyze_entry(symbol.upper(), timeframe)
-            
-            if not recommendation:
-                return {"success": False, "error": f"Could not analyze {symbol}"}
-            
-            # Send Telegram alert if requested
-            if send_telegram:
-                try:
-                    from app.services.telegram_notifier import TelegramNotifier
-                    from app.services.pro_alert_formatter import get_pro_alert_formatter
-                    
+        # Filter and sort results
+        results = []
+        for symbol, rec in zip(symbols, recommendations):
+            if isinstance(rec, Exception) or not rec:
+                continue
+
+            # Filter by min confluence
+            if rec.confluence_score.total_score >= min_confluence:
+                results.append({
+                    "symbol": rec.symbol,
+                    "direction": rec.direction.value,
+                    "confluence_score": rec.confluence_score.total_score,
+                    "entry_zone_low": rec.entry_zone_low,
+                    "entry_zone_high": rec.entry_zone_high,
+                    "stop_loss": rec.stop_loss,
+                    "take_profit_1": rec.take_profit_1,
+                    "risk_reward_ratio": rec.risk_reward_ratio,
+                    "position_size_pct": rec.position_size_pct,
+                    "urgency": rec.urgency,
+                    "top_reasons": rec.reasoning[:3]
+                })
+
+        # Sort by confluence score
+        results.sort(key=lambda x: x['confluence_score'], reverse=True)
+
+        # Send best opportunity to Telegram if requested
+        if send_telegram and results:
+            try:
+                from app.services.telegram_notifier import TelegramNotifier
+                from app.services.pro_alert_formatter import get_pro_alert_formatter
+
+                best = results[0]
+                best_rec = await engine.analyze_entry(best['symbol'], timeframe)
+
+                if best_rec:
                     telegram = TelegramNotifier()
                     formatter = get_pro_alert_formatter()
-                    alert_message = formatter.format_entry_alert(recommendation)
-                    
+                    alert_message = formatter.format_entry_alert(best_rec)
+
                     await telegram.send_custom_alert(
-                        title=f"{symbol} Smart Entry Analysis",
+                        title=f"🏆 Best Entry: {best['symbol']}",
                         message=alert_message,
                         emoji="🎯"
                     )
-                except Exception as e:
-                    logger.warning(f"Failed to send Telegram alert: {e}")
-            
-            # Return formatted response
-            return {
-                "success": True,
-                "data": {
-                    "symbol": recommendation.symbol,
-                    "direction": recommendation.direction.value,
-                    "confluence": {
-                        "score": recommendation.confluence_score.total_score,
-                        "strength": recommendation.confluence_score.strength.value,
-                        "signals_analyzed": recommendation.confluence_score.signals_analyzed,
-                        "signals_bullish": recommendation.confluence_score.signals_bullish,
-                        "signals_bearish": recommendation.confluence_score.signals_bearish,
-                        "breakdown": recommendation.confluence_score.breakdown
-                    },
-                    "entry": {
-                        "entry_zone_low": recommendation.entry_zone_low,
-                        "entry_zone_high": recommendation.entry_zone_high,
-                        "stop_loss": recommendation.stop_loss,
-                        "take_profit_1": recommendation.take_profit_1,
-                        "take_profit_2": recommendation.take_profit_2,
-                        "take_profit_3": recommendation.take_profit_3
-                    },
-                    "risk_management": {
-                        "risk_reward_ratio": recommendation.risk_reward_ratio,
-                        "position_size_pct": recommendation.position_size_pct,
-                        "urgency": recommendation.urgency
-                    },
-                    "reasoning": recommendation.reasoning
-                }
+            except Exception as e:
+                logger.warning(f"Failed to send batch alert: {e}")
+
+        return {
+            "success": True,
+            "data": {
+                "analyzed": len(symbols),
+                "opportunities": len(results),
+                "min_confluence": min_confluence,
+                "results": results
             }
+        }
 
-        elif operation == "smart_entry.analyze_batch":
-            from app.services.smart_entry_engine import get_smart_entry_engine
-            import asyncio
-            
-            engine = get_smart_entry_engine()
-            symbols = args.get("symbols", [])
-            timeframe = args.get("timeframe", "1h")
-            min_confluence = args.get("min_confluence", 60)
-            send_telegram = args.get("send_telegram", False)
-            
-            if not symbols or len(symbols) > 20:
-                return {"success": False, "error": "Provide 1-20 symbols in symbols parameter"}
-            
-            # Analyze all symbols in parallel
-            tasks = [engine.analyze_entry(symbol.upper(), timeframe) for symbol in symbols]
-            recommendations = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Filter and sort results
-            results = []
-            for symbol, rec in zip(symbols, recommendations):
-                if isinstance(rec, Exception) or not rec:
-                    continue
-                
-                # Filter by min confluence
-                if rec.confluence_score.total_score >= min_confluence:
-                    results.append({
-                        "symbol": rec.symbol,
-                        "direction": rec.direction.value,
-                        "confluence_score": rec.confluence_score.total_score,
-                        "entry_zone_low": rec.entry_zone_low,
-                        "entry_zone_high": rec.entry_zone_high,
-                        "stop_loss": rec.stop_loss,
-                        "take_profit_1": rec.take_profit_1,
-                        "risk_reward_ratio": rec.risk_reward_ratio,
-                        "position_size_pct": rec.position_size_pct,
-                        "urgency": rec.urgency,
-                        "top_reasons": rec.reasoning[:3]
-                    })
-            
-            # Sort by confluence score
-            results.sort(key=lambda x: x['confluence_score'], reverse=True)
-            
-            # Send best opportunity to Telegram if requested
-            if send_telegram and results:
-                try:
-                    from app.services.telegram_notifier import TelegramNotifier
-                    from app.services.pro_alert_formatter import get_pro_alert_formatter
-                    
-                    best = results[0]
-                    best_rec = await engine.analyze_entry(best['symbol'], timeframe)
-                    
-                    if best_rec:
-                        telegram = TelegramNotifier()
-                        formatter = get_pro_alert_formatter()
-                        alert_message = formatter.format_entry_alert(best_rec)
-                        
-                        await telegram.send_custom_alert(
-                            title=f"🏆 Best Entry: {best['symbol']}",
-                            message=alert_message,
-                            emoji="🎯"
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to send batch alert: {e}")
-            
-            return {
-                "success": True,
-                "data": {
-                    "analyzed": len(symbols),
-                    "opportunities": len(results),
-                    "min_confluence": min_confluence,
-                    "results": results
+    async def _op_smart_entry_test(self, args: Dict) -> Any:
+        """smart_entry.test"""
+        from app.services.smart_entry_engine import get_smart_entry_engine
+        from app.services.pro_alert_formatter import get_pro_alert_formatter
+
+        engine = get_smart_entry_engine()
+        symbol = args["symbol"]
+
+        recommendation = await engine.analyze_entry(symbol.upper(), "1h")
+
+        if not recommendation:
+            return {"success": False, "error": f"Could not analyze {symbol}"}
+
+        formatter = get_pro_alert_formatter()
+        long_alert = formatter.format_entry_alert(recommendation)
+        short_alert = formatter.format_short_alert(recommendation)
+
+        return {
+            "success": True,
+            "data": {
+                "symbol": recommendation.symbol,
+                "direction": recommendation.direction.value,
+                "confluence_score": recommendation.confluence_score.total_score,
+                "telegram_preview": {
+                    "full": long_alert,
+                    "compact": short_alert
                 }
             }
+        }
 
-        elif operation == "smart_entry.test":
-            from app.services.smart_entry_engine import get_smart_entry_engine
-            from app.services.pro_alert_formatter import get_pro_alert_formatter
-            
+    async def _op_smart_entry_health(self, args: Dict) -> Any:
+        """smart_entry.health"""
+        from app.services.smart_entry_engine import get_smart_entry_engine
+
+        try:
             engine = get_smart_entry_engine()
-            symbol = args["symbol"]
-            
-            recommendation = await engine.analyze_entry(symbol.upper(), "1h")
-            
-            if not recommendation:
-                return {"success": False, "error": f"Could not analyze {symbol}"}
-            
-            formatter = get_pro_alert_formatter()
-            long_alert = formatter.format_entry_alert(recommendation)
-            short_alert = formatter.format_short_alert(recommendation)
-            
-            return {
-                "success": True,
-                "data": {
-                    "symbol": recommendation.symbol,
-                    "direction": recommendation.direction.value,
-                    "confluence_score": recommendation.confluence_score.total_score,
-                    "telegram_preview": {
-                        "full": long_alert,
-                        "compact": short_alert
-                    }
+            test_rec = await engine.analyze_entry("BTCUSDT", "1h")
+
+            if test_rec:
+                return {
+                    "success": True,
+                    "status": "healthy",
+                    "message": f"Smart Entry Engine operational (test: BTC confluence {test_rec.confluence_score.total_score}%)"
                 }
+            else:
+                return {
+                    "success": True,
+                    "status": "degraded",
+                    "message": "Engine running but test analysis failed"
+                }
+        except Exception as e:
+            return {
+                "success": False,
+                "status": "unhealthy",
+                "error": str(e)
             }
 
-        elif operation == "smart_entry.health":
-            from app.services.smart_entry_engine import get_smart_entry_engine
-            
-            try:
-                engine = get_smart_entry_engine()
-                test_rec = await engine.analyze_entry("BTCUSDT", "1h")
-                
-                if test_rec:
-                    return {
-                        "success": True,
-                        "status": "healthy",
-                        "message": f"Smart Entry Engine operational (test: BTC confluence {test_rec.confluence_score.total_score}%)"
-                    }
-                else:
-                    return {
-                        "success": True,
-                        "status": "degraded",
-                        "message": "Engine running but test analysis failed"
-                    }
-            except Exception as e:
+    # ===================================================================
+    # MSS
+    # ===================================================================
+    async def _op_mss_discover(self, args: Dict) -> Any:
+        """mss.discover"""
+        from app.services.mss_service import MSSService
+        mss = MSSService()
+        # Map GPT Action params to actual service params
+        # ✅ CRITICAL FIX: Use phase1_discovery (fast) not scan_and_rank (slow)
+        limit = args.get("max_results", 10)  # Increased back to 10 (Phase 1 is fast!)
+        max_fdv = args.get("max_fdv_usd", 50000000)
+        max_age = args.get("max_age_hours", 72)
+        min_vol = args.get("min_volume_24h", 100000.0)
+
+        # ✅ Phase 1 Discovery only (quick coin discovery from CoinGecko/Binance)
+        # Does NOT do full MSS analysis - just discovery filters
+        results = await mss.phase1_discovery(
+            limit=limit,
+            max_fdv_usd=max_fdv,
+            max_age_hours=max_age,
+            min_volume_24h=min_vol
+        )
+        return {"discovered_coins": results, "count": len(results)}
+
+    async def _op_mss_analyze(self, args: Dict) -> Any:
+        """mss.analyze"""
+        from app.services.mss_service import MSSService
+        mss = MSSService()
+        symbol = args["symbol"]
+        # Method calculate_mss_score is the correct method
+        return await mss.calculate_mss_score(symbol)
+
+    async def _op_mss_scan(self, args: Dict) -> Any:
+        """mss.scan"""
+        from app.services.mss_service import MSSService
+        mss = MSSService()
+        # Map GPT Action params to actual service params
+        # ✅ OPTIMIZED: Reduced default to 5 for faster response (batched processing)
+        limit = args.get("max_results", 5)  # Changed from 10 to 5
+        max_fdv = args.get("max_fdv_usd", 50000000)
+        max_age = args.get("max_age_hours", 72)
+        min_score = args.get("min_mss_score", 65.0)
+        # scan_and_rank returns List[Dict], wrap it
+        results = await mss.scan_and_rank(
+            limit=limit,
+            max_fdv_usd=max_fdv,
+            max_age_hours=max_age,
+            min_mss_score=min_score
+        )
+        return {"ranked_coins": results, "count": len(results)}
+
+    # ===================================================================
+    # LUNARCRUSH
+    # ===================================================================
+    async def _op_lunarcrush_coin(self, args: Dict) -> Any:
+        """lunarcrush.coin"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        return await lunarcrush_comprehensive.get_coin_metrics(symbol)
+
+    async def _op_lunarcrush_coin_momentum(self, args: Dict) -> Any:
+        """lunarcrush.coin_momentum"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        return await lunarcrush_comprehensive.analyze_social_momentum(symbol)
+
+    async def _op_lunarcrush_coin_change(self, args: Dict) -> Any:
+        """lunarcrush.coin_change"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        interval = args.get("interval", "1d")
+        return await lunarcrush_comprehensive.get_social_change(symbol, interval)
+
+    async def _op_lunarcrush_coins_discovery(self, args: Dict) -> Any:
+        """lunarcrush.coins_discovery"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        min_galaxy = args.get("min_galaxy_score", 60)
+        limit = args.get("limit", 20)
+        return await lunarcrush_comprehensive.discover_coins(
+            min_galaxy_score=min_galaxy,
+            limit=limit
+        )
+
+    async def _op_lunarcrush_topics_list(self, args: Dict) -> Any:
+        """lunarcrush.topics_list"""
+        from app.services.lunarcrush_service import lunarcrush_service
+        return await lunarcrush_service.get_topics_list()
+
+    async def _op_lunarcrush_coin_themes(self, args: Dict) -> Any:
+        """lunarcrush.coin_themes"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        return await lunarcrush_comprehensive.analyze_coin_themes(symbol)
+
+    async def _op_lunarcrush_news_feed(self, args: Dict) -> Any:
+        """lunarcrush.news_feed"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args.get("symbol")
+        limit = args.get("limit", 20)
+        # Symbol is optional for news feed - can return all news if None
+        return await lunarcrush_comprehensive.get_news_feed(symbol=symbol or "BTC", limit=limit)
+
+    async def _op_lunarcrush_community_activity(self, args: Dict) -> Any:
+        """lunarcrush.community_activity"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        return await lunarcrush_comprehensive.get_community_activity(symbol)
+
+    async def _op_lunarcrush_influencer_activity(self, args: Dict) -> Any:
+        """lunarcrush.influencer_activity"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        return await lunarcrush_comprehensive.get_influencer_activity(symbol)
+
+    async def _op_lunarcrush_coin_correlation(self, args: Dict) -> Any:
+        """lunarcrush.coin_correlation"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        return await lunarcrush_comprehensive.get_coin_correlation(symbol)
+
+    async def _op_lunarcrush_market_pair(self, args: Dict) -> Any:
+        """lunarcrush.market_pair"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args["symbol"]
+        pair = args.get("pair", "USDT")
+        return await lunarcrush_comprehensive.get_market_pair(symbol=symbol, pair=pair)
+
+    async def _op_lunarcrush_aggregates(self, args: Dict) -> Any:
+        """lunarcrush.aggregates"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args.get("symbol")
+        # Symbol is required for aggregates - use BTC as default
+        return await lunarcrush_comprehensive.get_aggregates(symbol=symbol or "BTC")
+
+    async def _op_lunarcrush_topic_trends(self, args: Dict) -> Any:
+        """lunarcrush.topic_trends"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        return await lunarcrush_comprehensive.get_topic_trends()
+
+    async def _op_lunarcrush_coins_rankings(self, args: Dict) -> Any:
+        """lunarcrush.coins_rankings"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        limit = args.get("limit", 100)
+        sort = args.get("sort", "galaxy_score")
+        return await lunarcrush_comprehensive.get_coins_rankings(limit=limit, sort=sort)
+
+    async def _op_lunarcrush_system_status(self, args: Dict) -> Any:
+        """lunarcrush.system_status"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        return await lunarcrush_comprehensive.get_system_status()
+
+    async def _op_lunarcrush_coin_time_series(self, args: Dict) -> Any:
+        """lunarcrush.coin_time_series"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args.get("symbol")
+        if not symbol:
+            raise ValueError("Parameter 'symbol' is required for lunarcrush.coin_time_series")
+        interval = args.get("interval", "1d")
+        days_back = args.get("days_back", 30)
+        return await lunarcrush_comprehensive.get_time_series(symbol=symbol, interval=interval, days_back=days_back)
+
+    async def _op_lunarcrush_topic(self, args: Dict) -> Any:
+        """lunarcrush.topic"""
+        from app.services.lunarcrush_service import lunarcrush_service
+        topic = args.get("topic")
+        if not topic:
+            raise ValueError("Parameter 'topic' is required for lunarcrush.topic")
+        return await lunarcrush_service.get_topic_details(topic)
+
+    async def _op_lunarcrush_coins_realtime(self, args: Dict) -> Any:
+        """lunarcrush.coins_realtime"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        limit = args.get("limit", 100)
+        sort = args.get("sort", "social_volume")
+        min_galaxy_score = args.get("min_galaxy_score")
+        return await lunarcrush_comprehensive.get_coins_realtime(limit=limit, sort=sort, min_galaxy_score=min_galaxy_score)
+
+    async def _op_lunarcrush_coin_comprehensive(self, args: Dict) -> Any:
+        """lunarcrush.coin_comprehensive"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+        symbol = args.get("symbol")
+        if not symbol:
+            raise ValueError("Parameter 'symbol' is required for lunarcrush.coin_comprehensive")
+        return await lunarcrush_comprehensive.get_coin_comprehensive(symbol)
+
+    # ===================================================================
+    # COINAPI
+    # ===================================================================
+    async def _op_coinapi_quote(self, args: Dict) -> Any:
+        """coinapi.quote"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+        exchange = args.get("exchange", "BINANCE")
+        return await coinapi_comprehensive.get_current_quote(symbol=symbol, exchange=exchange)
+
+    async def _op_coinapi_ohlcv_latest(self, args: Dict) -> Any:
+        """coinapi.ohlcv.latest"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+        period = args.get("period", "1HRS")
+        exchange = args.get("exchange", "BINANCE")
+        limit = args.get("limit", 100)
+        return await coinapi_comprehensive.get_ohlcv_latest(symbol=symbol, period=period, exchange=exchange, limit=limit)
+
+    async def _op_coinapi_ohlcv_historical(self, args: Dict) -> Any:
+        """coinapi.ohlcv.historical"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+        period = args.get("period", "1HRS")
+        days_back = args.get("days_back", 7)
+        exchange = args.get("exchange", "BINANCE")
+        return await coinapi_comprehensive.get_ohlcv_historical(symbol=symbol, period=period, days_back=days_back, exchange=exchange)
+
+    async def _op_coinapi_orderbook(self, args: Dict) -> Any:
+        """coinapi.orderbook"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+        exchange = args.get("exchange", "BINANCE")
+        limit = args.get("limit", 20)
+        return await coinapi_comprehensive.get_orderbook_depth(symbol=symbol, exchange=exchange, limit=limit)
+
+    async def _op_coinapi_trades(self, args: Dict) -> Any:
+        """coinapi.trades"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+        exchange = args.get("exchange", "BINANCE")
+        limit = args.get("limit", 100)
+        return await coinapi_comprehensive.get_recent_trades(symbol=symbol, exchange=exchange, limit=limit)
+
+    async def _op_coinapi_multi_exchange(self, args: Dict) -> Any:
+        """coinapi.multi_exchange"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+        exchanges = args.get("exchanges", ["BINANCE", "COINBASE", "KRAKEN"])
+        return await coinapi_comprehensive.get_multi_exchange_prices(symbol=symbol, exchanges=exchanges)
+
+    async def _op_coinapi_dashboard(self, args: Dict) -> Any:
+        """coinapi.dashboard"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+
+        # Dashboard aggregates multiple CoinAPI endpoints with individual error isolation
+        import asyncio
+
+        results = await asyncio.gather(
+            coinapi_comprehensive.get_ohlcv_latest(symbol=symbol, period="1HRS", limit=24),
+            coinapi_comprehensive.get_orderbook_depth(symbol=symbol, limit=20),
+            coinapi_comprehensive.get_recent_trades(symbol=symbol, limit=100),
+            coinapi_comprehensive.get_current_quote(symbol=symbol),
+            return_exceptions=True
+        )
+
+        ohlcv, orderbook, trades, quote = results
+
+        # Helper to check if a result is successful
+        # Returns True only if result is a dict with success=True or success is missing (default True)
+        # Returns False for all Exceptions and dicts with success=False
+        def is_successful(result):
+            if isinstance(result, Exception):
+                return False
+            if isinstance(result, dict):
+                # Explicit check: success must be True or missing
+                # If success=False, this is an API failure, return False
+                return result.get("success", True) is True
+            # Non-dict, non-Exception results default to True
+            return True
+
+        # Helper to format errors with metadata
+        def format_result(result, endpoint_name):
+            if isinstance(result, Exception):
+                # Transport/network error
                 return {
                     "success": False,
-                    "status": "unhealthy",
-                    "error": str(e)
+                    "error": str(result),
+                    "error_type": type(result).__name__,
+                    "failure_mode": "exception",
+                    "endpoint": endpoint_name
                 }
-
-        # ===================================================================
-        # MSS
-        # ===================================================================
-        elif operation == "mss.discover":
-            from app.services.mss_service import MSSService
-            mss = MSSService()
-            # Map GPT Action params to actual service params
-            # ✅ CRITICAL FIX: Use phase1_discovery (fast) not scan_and_rank (slow)
-            limit = args.get("max_results", 10)  # Increased back to 10 (Phase 1 is fast!)
-            max_fdv = args.get("max_fdv_usd", 50000000)
-            max_age = args.get("max_age_hours", 72)
-            min_vol = args.get("min_volume_24h", 100000.0)
-            
-            # ✅ Phase 1 Discovery only (quick coin discovery from CoinGecko/Binance)
-            # Does NOT do full MSS analysis - just discovery filters
-            results = await mss.phase1_discovery(
-                limit=limit,
-                max_fdv_usd=max_fdv,
-                max_age_hours=max_age,
-                min_volume_24h=min_vol
-            )
-            return {"discovered_coins": results, "count": len(results)}
-
-        elif operation == "mss.analyze":
-            from app.services.mss_service import MSSService
-            mss = MSSService()
-            symbol = args["symbol"]
-            # Method calculate_mss_score is the correct method
-            return await mss.calculate_mss_score(symbol)
-
-        elif operation == "mss.scan":
-            from app.services.mss_service import MSSService
-            mss = MSSService()
-            # Map GPT Action params to actual service params
-            # ✅ OPTIMIZED: Reduced default to 5 for faster response (batched processing)
-            limit = args.get("max_results", 5)  # Changed from 10 to 5
-            max_fdv = args.get("max_fdv_usd", 50000000)
-            max_age = args.get("max_age_hours", 72)
-            min_score = args.get("min_mss_score", 65.0)
-            # scan_and_rank returns List[Dict], wrap it
-            results = await mss.scan_and_rank(
-                limit=limit,
-                max_fdv_usd=max_fdv,
-                max_age_hours=max_age,
-                min_mss_score=min_score
-            )
-            return {"ranked_coins": results, "count": len(results)}
-
-        # ===================================================================
-        # LUNARCRUSH
-        # ===================================================================
-        elif operation == "lunarcrush.coin":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            return await lunarcrush_comprehensive.get_coin_metrics(symbol)
-
-        elif operation == "lunarcrush.coin_momentum":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            return await lunarcrush_comprehensive.analyze_social_momentum(symbol)
-
-        elif operation == "lunarcrush.coin_change":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            interval = args.get("interval", "1d")
-            return await lunarcrush_comprehensive.get_social_change(symbol, interval)
-
-        elif operation == "lunarcrush.coins_discovery":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            min_galaxy = args.get("min_galaxy_score", 60)
-            limit = args.get("limit", 20)
-            return await lunarcrush_comprehensive.discover_coins(
-                min_galaxy_score=min_galaxy,
-                limit=limit
-            )
-
-        elif operation == "lunarcrush.topics_list":
-            from app.services.lunarcrush_service import lunarcrush_service
-            return await lunarcrush_service.get_topics_list()
-        
-        elif operation == "lunarcrush.coin_themes":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            return await lunarcrush_comprehensive.analyze_coin_themes(symbol)
-        
-        elif operation == "lunarcrush.news_feed":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args.get("symbol")
-            limit = args.get("limit", 20)
-            # Symbol is optional for news feed - can return all news if None
-            return await lunarcrush_comprehensive.get_news_feed(symbol=symbol or "BTC", limit=limit)
-        
-        elif operation == "lunarcrush.community_activity":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            return await lunarcrush_comprehensive.get_community_activity(symbol)
-        
-        elif operation == "lunarcrush.influencer_activity":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            return await lunarcrush_comprehensive.get_influencer_activity(symbol)
-        
-        elif operation == "lunarcrush.coin_correlation":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            return await lunarcrush_comprehensive.get_coin_correlation(symbol)
-        
-        elif operation == "lunarcrush.market_pair":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args["symbol"]
-            pair = args.get("pair", "USDT")
-            return await lunarcrush_comprehensive.get_market_pair(symbol=symbol, pair=pair)
-        
-        elif operation == "lunarcrush.aggregates":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args.get("symbol")
-            # Symbol is required for aggregates - use BTC as default
-            return await lunarcrush_comprehensive.get_aggregates(symbol=symbol or "BTC")
-        
-        elif operation == "lunarcrush.topic_trends":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            return await lunarcrush_comprehensive.get_topic_trends()
-        
-        elif operation == "lunarcrush.coins_rankings":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            limit = args.get("limit", 100)
-            sort = args.get("sort", "galaxy_score")
-            return await lunarcrush_comprehensive.get_coins_rankings(limit=limit, sort=sort)
-        
-        elif operation == "lunarcrush.system_status":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            return await lunarcrush_comprehensive.get_system_status()
-        
-        elif operation == "lunarcrush.coin_time_series":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args.get("symbol")
-            if not symbol:
-                raise ValueError("Parameter 'symbol' is required for lunarcrush.coin_time_series")
-            interval = args.get("interval", "1d")
-            days_back = args.get("days_back", 30)
-            return await lunarcrush_comprehensive.get_time_series(symbol=symbol, interval=interval, days_back=days_back)
-        
-        elif operation == "lunarcrush.topic":
-            from app.services.lunarcrush_service import lunarcrush_service
-            topic = args.get("topic")
-            if not topic:
-                raise ValueError("Parameter 'topic' is required for lunarcrush.topic")
-            return await lunarcrush_service.get_topic_details(topic)
-        
-        elif operation == "lunarcrush.coins_realtime":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            limit = args.get("limit", 100)
-            sort = args.get("sort", "social_volume")
-            min_galaxy_score = args.get("min_galaxy_score")
-            return await lunarcrush_comprehensive.get_coins_realtime(limit=limit, sort=sort, min_galaxy_score=min_galaxy_score)
-        
-        elif operation == "lunarcrush.coin_comprehensive":
-            from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
-            symbol = args.get("symbol")
-            if not symbol:
-                raise ValueError("Parameter 'symbol' is required for lunarcrush.coin_comprehensive")
-            return await lunarcrush_comprehensive.get_coin_comprehensive(symbol)
-
-        # ===================================================================
-        # COINAPI
-        # ===================================================================
-        elif operation == "coinapi.quote":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            exchange = args.get("exchange", "BINANCE")
-            return await coinapi_comprehensive.get_current_quote(symbol=symbol, exchange=exchange)
-
-        elif operation == "coinapi.ohlcv.latest":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            period = args.get("period", "1HRS")
-            exchange = args.get("exchange", "BINANCE")
-            limit = args.get("limit", 100)
-            return await coinapi_comprehensive.get_ohlcv_latest(symbol=symbol, period=period, exchange=exchange, limit=limit)
-        
-        elif operation == "coinapi.ohlcv.historical":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            period = args.get("period", "1HRS")
-            days_back = args.get("days_back", 7)
-            exchange = args.get("exchange", "BINANCE")
-            return await coinapi_comprehensive.get_ohlcv_historical(symbol=symbol, period=period, days_back=days_back, exchange=exchange)
-
-        elif operation == "coinapi.orderbook":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            exchange = args.get("exchange", "BINANCE")
-            limit = args.get("limit", 20)
-            return await coinapi_comprehensive.get_orderbook_depth(symbol=symbol, exchange=exchange, limit=limit)
-
-        elif operation == "coinapi.trades":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            exchange = args.get("exchange", "BINANCE")
-            limit = args.get("limit", 100)
-            return await coinapi_comprehensive.get_recent_trades(symbol=symbol, exchange=exchange, limit=limit)
-        
-        elif operation == "coinapi.multi_exchange":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            exchanges = args.get("exchanges", ["BINANCE", "COINBASE", "KRAKEN"])
-            return await coinapi_comprehensive.get_multi_exchange_prices(symbol=symbol, exchanges=exchanges)
-        
-        elif operation == "coinapi.dashboard":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            
-            # Dashboard aggregates multiple CoinAPI endpoints with individual error isolation
-            import asyncio
-            
-            results = await asyncio.gather(
-                coinapi_comprehensive.get_ohlcv_latest(symbol=symbol, period="1HRS", limit=24),
-                coinapi_comprehensive.get_orderbook_depth(symbol=symbol, limit=20),
-                coinapi_comprehensive.get_recent_trades(symbol=symbol, limit=100),
-                coinapi_comprehensive.get_current_quote(symbol=symbol),
-                return_exceptions=True
-            )
-            
-            ohlcv, orderbook, trades, quote = results
-            
-            # Helper to check if a result is successful
-            # Returns True only if result is a dict with success=True or success is missing (default True)
-            # Returns False for all Exceptions and dicts with success=False
-            def is_successful(result):
-                if isinstance(result, Exception):
-                    return False
-                if isinstance(result, dict):
-                    # Explicit check: success must be True or missing
-                    # If success=False, this is an API failure, return False
-                    return result.get("success", True) is True
-                # Non-dict, non-Exception results default to True
-                return True
-            
-            # Helper to format errors with metadata
-            def format_result(result, endpoint_name):
-                if isinstance(result, Exception):
-                    # Transport/network error
-                    return {
-                        "success": False,
-                        "error": str(result),
-                        "error_type": type(result).__name__,
-                        "failure_mode": "exception",
-                        "endpoint": endpoint_name
-                    }
-                elif isinstance(result, dict) and result.get("success") is False:
-                    # API-level error (service returned success=False)
-                    return {
-                        **result,
-                        "failure_mode": "api_error",
-                        "endpoint": endpoint_name
-                    }
-                # Success case - preserve original result
-                return result
-            
-            # Count successful endpoints (both exception and API failures count as failures)
-            successful_count = sum(1 for r in results if is_successful(r))
-            
-            # CRITICAL: If ALL endpoints failed (either via exception OR success=False),
-            # raise exception to ensure RPC ok=false
-            # This handles both network outages AND API-level failures
-            if successful_count == 0:
-                error_details = {
-                    "ohlcv": format_result(ohlcv, 'ohlcv.latest'),
-                    "orderbook": format_result(orderbook, 'orderbook'),
-                    "trades": format_result(trades, 'trades'),
-                    "quote": format_result(quote, 'quote')
+            elif isinstance(result, dict) and result.get("success") is False:
+                # API-level error (service returned success=False)
+                return {
+                    **result,
+                    "failure_mode": "api_error",
+                    "endpoint": endpoint_name
                 }
-                raise RuntimeError(
-                    f"CoinAPI dashboard total failure for {symbol}: "
-                    f"All 4 endpoints failed (0/{len(results)} successful). "
-                    f"Error details: {json.dumps(error_details, indent=2)}"
-                )
-            
-            # Return aggregated data with success metrics
-            return {
-                "success": True,
-                "symbol": symbol,
-                "endpoints_total": 4,
-                "endpoints_successful": successful_count,
-                "dashboard": {
-                    "ohlcv": format_result(ohlcv, "ohlcv.latest"),
-                    "orderbook": format_result(orderbook, "orderbook"),
-                    "trades": format_result(trades, "trades"),
-                    "quote": format_result(quote, "quote")
-                },
-                "source": "coinapi_dashboard"
+            # Success case - preserve original result
+            return result
+
+        # Count successful endpoints (both exception and API failures count as failures)
+        successful_count = sum(1 for r in results if is_successful(r))
+
+        # CRITICAL: If ALL endpoints failed (either via exception OR success=False),
+        # raise exception to ensure RPC ok=false
+        # This handles both network outages AND API-level failures
+        if successful_count == 0:
+            error_details = {
+                "ohlcv": format_result(ohlcv, 'ohlcv.latest'),
+                "orderbook": format_result(orderbook, 'orderbook'),
+                "trades": format_result(trades, 'trades'),
+                "quote": format_result(quote, 'quote')
             }
-        
-        elif operation == "coinapi.symbols":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            exchange_id = args.get("exchange_id")
-            asset_id = args.get("asset_id")
-            symbol_type = args.get("symbol_type")
-            return await coinapi_comprehensive.get_symbols(
-                exchange_id=exchange_id,
-                asset_id=asset_id,
-                symbol_type=symbol_type
-            )
-        
-        elif operation == "coinapi.metrics":
-            from app.services.coinapi_comprehensive_service import coinapi_comprehensive
-            symbol = args["symbol"]
-            metric_id = args.get("metric_id", "DERIVATIVES_FUNDING_RATE_CURRENT")
-            exchange = args.get("exchange", "BINANCEFTSC")
-            historical = args.get("historical", False)
-            time_start = args.get("time_start")
-            time_end = args.get("time_end")
-            limit = args.get("limit", 100)
-            return await coinapi_comprehensive.get_metrics(
-                metric_id=metric_id,
-                symbol=symbol,
-                exchange=exchange,
-                historical=historical,
-                time_start=time_start,
-                time_end=time_end,
-                limit=limit
+            raise RuntimeError(
+                f"CoinAPI dashboard total failure for {symbol}: "
+                f"All 4 endpoints failed (0/{len(results)} successful). "
+                f"Error details: {json.dumps(error_details, indent=2)}"
             )
 
-        # ===================================================================
-        # NEW LISTINGS MONITOR
-        # ===================================================================
-        elif operation == "new_listings.binance":
-            from app.services.binance_listings_monitor import BinanceListingsMonitor
-            
-            hours = args.get("hours", 72)
-            include_stats = args.get("include_stats", True)
-            
-            monitor = BinanceListingsMonitor()
-            try:
-                if include_stats:
-                    result = await monitor.detect_new_listings_with_stats(hours=hours)
-                else:
-                    result = await monitor.get_new_listings(hours=hours)
-                
-                return result
-            finally:
-                await monitor.close()
-
-        # ===================================================================
-        # HEALTH
-        # ===================================================================
-        elif operation == "health.check":
-            return {
-                "status": "healthy",
-                "service": "CryptoSatX Flat RPC",
-                "version": "3.0.0-flat",
-                "operations_count": len(OPERATION_CATALOG),
-                "gpt_actions_compatible": True
-            }
+        # Return aggregated data with success metrics
+        return {
+            "success": True,
+            "symbol": symbol,
+            "endpoints_total": 4,
+            "endpoints_successful": successful_count,
+            "dashboard": {
+                "ohlcv": format_result(ohlcv, "ohlcv.latest"),
+                "orderbook": format_result(orderbook, "orderbook"),
+                "trades": format_result(trades, "trades"),
+                "quote": format_result(quote, "quote")
+            },
+            "source": "coinapi_dashboard"
+        }
 
-        # ===================================================================
-        # SPIKE DETECTION (PHASE 5)
-        # ===================================================================
-        elif operation == "spike.check_system":
-            from app.api.routes_spike_gpt import check_spike_system
-            return await check_spike_system()
-        
-        elif operation == "spike.recent_activity":
-            from app.api.routes_spike_gpt import get_recent_spike_activity
-            return await get_recent_spike_activity()
-        
-        elif operation == "spike.configuration":
-            from app.services.realtime_spike_detector import realtime_spike_detector
-            from app.services.liquidation_spike_detector import liquidation_spike_detector
-            from app.services.social_spike_monitor import social_spike_monitor
-            
-            price_status = await realtime_spike_detector.get_status()
-            liq_status = await liquidation_spike_detector.get_status()
-            social_status = await social_spike_monitor.get_status()
-            
-            return {
-                "success": True,
-                "configuration": {
-                    "price_spike_detector": {
-                        "threshold": f"{price_status.get('spike_threshold', 8.0)}% price change",
-                        "time_window": "5 minutes",
-                        "check_interval": f"{price_status.get('check_interval', 30)} seconds",
-                        "monitoring_scope": "Top 100 coins by market cap"
-                    },
-                    "liquidation_spike_detector": {
-                        "market_wide_threshold": "$50 Million in 1 hour",
-                        "per_coin_threshold": "$20 Million in 1 hour",
-                        "check_interval": f"{liq_status.get('check_interval', 60)} seconds"
-                    },
-                    "social_spike_detector": {
-                        "threshold": "100% social volume increase",
-                        "check_interval": f"{social_status.get('check_interval', 300)} seconds"
-                    }
-                },
-                "user_message": "✅ System configured for early entry opportunities with multi-signal correlation"
-            }
-        
-        elif operation == "spike.explain":
-            return {
-                "success": True,
-                "what_it_does": "Monitors the crypto market 24/7 to catch sudden price movements BEFORE retail traders react",
-                "how_it_works": {
-                    "step_1": "🔍 Monitors top 100 coins every 30 seconds for >8% price moves",
-                    "step_2": "💥 Tracks liquidations >$50M market-wide and >$20M per coin",
-                    "step_3": "📱 Detects viral social moments with >100% volume spike",
-                    "step_4": "🎯 Correlates multiple signals for high-confidence alerts",
-                    "step_5": "📲 Sends instant Telegram notifications with entry recommendations"
+    async def _op_coinapi_symbols(self, args: Dict) -> Any:
+        """coinapi.symbols"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        exchange_id = args.get("exchange_id")
+        asset_id = args.get("asset_id")
+        symbol_type = args.get("symbol_type")
+        return await coinapi_comprehensive.get_symbols(
+            exchange_id=exchange_id,
+            asset_id=asset_id,
+            symbol_type=symbol_type
+        )
+
+    async def _op_coinapi_metrics(self, args: Dict) -> Any:
+        """coinapi.metrics"""
+        from app.services.coinapi_comprehensive_service import coinapi_comprehensive
+        symbol = args["symbol"]
+        metric_id = args.get("metric_id", "DERIVATIVES_FUNDING_RATE_CURRENT")
+        exchange = args.get("exchange", "BINANCEFTSC")
+        historical = args.get("historical", False)
+        time_start = args.get("time_start")
+        time_end = args.get("time_end")
+        limit = args.get("limit", 100)
+        return await coinapi_comprehensive.get_metrics(
+            metric_id=metric_id,
+            symbol=symbol,
+            exchange=exchange,
+            historical=historical,
+            time_start=time_start,
+            time_end=time_end,
+            limit=limit
+        )
+
+    # ===================================================================
+    # NEW LISTINGS MONITOR
+    # ===================================================================
+    async def _op_new_listings_binance(self, args: Dict) -> Any:
+        """new_listings.binance"""
+        from app.services.binance_listings_monitor import BinanceListingsMonitor
+
+        hours = args.get("hours", 72)
+        include_stats = args.get("include_stats", True)
+
+        monitor = BinanceListingsMonitor()
+        try:
+            if include_stats:
+                result = await monitor.detect_new_listings_with_stats(hours=hours)
+            else:
+                result = await monitor.get_new_listings(hours=hours)
+
+            return result
+        finally:
+            await monitor.close()
+
+    # ===================================================================
+    # HEALTH
+    # ===================================================================
+    async def _op_health_check(self, args: Dict) -> Any:
+        """health.check"""
+        return {
+            "status": "healthy",
+            "service": "CryptoSatX Flat RPC",
+            "version": "3.0.0-flat",
+            "operations_count": len(OPERATION_CATALOG),
+            "gpt_actions_compatible": True
+        }
+
+    # ===================================================================
+    # SPIKE DETECTION (PHASE 5)
+    # ===================================================================
+    async def _op_spike_check_system(self, args: Dict) -> Any:
+        """spike.check_system"""
+        from app.api.routes_spike_gpt import check_spike_system
+        return await check_spike_system()
+
+    async def _op_spike_recent_activity(self, args: Dict) -> Any:
+        """spike.recent_activity"""
+        from app.api.routes_spike_gpt import get_recent_spike_activity
+        return await get_recent_spike_activity()
+
+    async def _op_spike_configuration(self, args: Dict) -> Any:
+        """spike.configuration"""
+        from app.services.realtime_spike_detector import realtime_spike_detector
+        from app.services.liquidation_spike_detector import liquidation_spike_detector
+        from app.services.social_spike_monitor import social_spike_monitor
+
+        price_status = await realtime_spike_detector.get_status()
+        liq_status = await liquidation_spike_detector.get_status()
+        social_status = await social_spike_monitor.get_status()
+
+        return {
+            "success": True,
+            "configuration": {
+                "price_spike_detector": {
+                    "threshold": f"{price_status.get('spike_threshold', 8.0)}% price change",
+                    "time_window": "5 minutes",
+                    "check_interval": f"{price_status.get('check_interval', 30)} seconds",
+                    "monitoring_scope": "Top 100 coins by market cap"
                 },
-                "signal_confidence_levels": {
-                    "EXTREME (3+ signals)": {
-                        "description": "Multiple spike types detected simultaneously",
-                        "expected_win_rate": "70-80%",
-                        "action": "Strong entry signal - consider immediate position"
-                    },
-                    "HIGH (2 signals)": {
-                        "description": "Two spike types correlate",
-                        "expected_win_rate": "60-70%",
-                        "action": "Good entry opportunity - monitor closely"
-                    },
-                    "MEDIUM (1 signal)": {
-                        "description": "Single spike detected",
-                        "expected_win_rate": "50-60%",
-                        "action": "Watch for confirmation from other signals"
-                    }
+                "liquidation_spike_detector": {
+                    "market_wide_threshold": "$50 Million in 1 hour",
+                    "per_coin_threshold": "$20 Million in 1 hour",
+                    "check_interval": f"{liq_status.get('check_interval', 60)} seconds"
                 },
-                "user_message": "🎯 You're 30-60 seconds ahead of retail traders with this system!"
-            }
-
-        elif operation == "spike.monitor_coin":
-            from app.api.routes_spike_gpt import monitor_coin_spikes
-            symbol = args.get("symbol", "BTC")
-            return await monitor_coin_spikes(symbol)
+                "social_spike_detector": {
+                    "threshold": "100% social volume increase",
+                    "check_interval": f"{social_status.get('check_interval', 300)} seconds"
+                }
+            },
+            "user_message": "✅ System configured for early entry opportunities with multi-signal correlation"
+        }
 
-        elif operation == "spike.status":
-            from app.services.realtime_spike_detector import realtime_spike_detector
-            from app.services.liquidation_spike_detector import liquidation_spike_detector
-            from app.services.social_spike_monitor import social_spike_monitor
-            from app.services.spike_coordinator import spike_coordinator
-            
-            return {
-                "success": True,
-                "price_detector": await realtime_spike_detector.get_status(),
-                "liquidation_detector": await liquidation_spike_detector.get_status(),
-                "social_monitor": await social_spike_monitor.get_status(),
-                "coordinator": await spike_coordinator.get_status()
-            }
-        
-        elif operation == "spike.health":
-            from app.services.realtime_spike_detector import realtime_spike_detector
-            from app.services.liquidation_spike_detector import liquidation_spike_detector
-            from app.services.social_spike_monitor import social_spike_monitor
-            
-            all_running = (
-                realtime_spike_detector.is_running and
-                liquidation_spike_detector.is_running and
-                social_spike_monitor.is_running
-            )
-            
-            return {
-                "success": True,
-                "system_status": "ACTIVE" if all_running else "DEGRADED",
-                "detectors_running": {
-                    "price": realtime_spike_detector.is_running,
-                    "liquidation": liquidation_spike_detector.is_running,
-                    "social": social_spike_monitor.is_running
+    async def _op_spike_explain(self, args: Dict) -> Any:
+        """spike.explain"""
+        return {
+            "success": True,
+            "what_it_does": "Monitors the crypto market 24/7 to catch sudden price movements BEFORE retail traders react",
+            "how_it_works": {
+                "step_1": "🔍 Monitors top 100 coins every 30 seconds for >8% price moves",
+                "step_2": "💥 Tracks liquidations >$50M market-wide and >$20M per coin",
+                "step_3": "📱 Detects viral social moments with >100% volume spike",
+                "step_4": "🎯 Correlates multiple signals for high-confidence alerts",
+                "step_5": "📲 Sends instant Telegram notifications with entry recommendations"
+            },
+            "signal_confidence_levels": {
+                "EXTREME (3+ signals)": {
+                    "description": "Multiple spike types detected simultaneously",
+                    "expected_win_rate": "70-80%",
+                    "action": "Strong entry signal - consider immediate position"
                 },
-                "message": "✅ All detectors active" if all_running else "⚠️ Some detectors offline"
-            }
-        
-        elif operation == "spike.price_detector_status":
-            from app.services.realtime_spike_detector import realtime_spike_detector
-            return await realtime_spike_detector.get_status()
-        
-        elif operation == "spike.liquidation_detector_status":
-            from app.services.liquidation_spike_detector import liquidation_spike_detector
-            return await liquidation_spike_detector.get_status()
-        
-        elif operation == "spike.social_monitor_status":
-            from app.services.social_spike_monitor import social_spike_monitor
-            return await social_spike_monitor.get_status()
-        
-        elif operation == "spike.coordinator_status":
-            from app.services.spike_coordinator import spike_coordinator
-            return await spike_coordinator.get_status()
-
-        # ===================================================================
-        # ANALYTICS (GPT-5.1 Self-Evaluation)
-        # ===================================================================
-        elif operation == "analytics.history.latest":
-            from app.services.analytics_service import analytics_service
-            symbol = args.get("symbol", "BTC").upper()
-            limit = args.get("limit", 5)
-            result = await analytics_service.get_latest_history(symbol=symbol, limit=limit)
-            if "error" in result:
-                return {"success": False, "error": result["error"], "symbol": symbol}
-            return {"success": True, **result}
-        
-        elif operation == "analytics.performance.symbol":
-            from app.services.analytics_service import analytics_service
-            symbol = args.get("symbol", "BTC").upper()
-            days = args.get("days", 30)
-            limit = args.get("limit", 50)
-            result = await analytics_service.get_symbol_performance(symbol=symbol, days_back=days, limit=limit)
-            if "error" in result:
-                return {"success": False, "error": result["error"], "symbol": symbol}
-            return {"success": True, **result}
-        
-        elif operation == "analytics.performance.summary":
-            from app.services.analytics_service import analytics_service
-            days = args.get("days", 30)
-            result = await analytics_service.get_overall_summary(days_back=days)
-            if "error" in result:
-                return {"success": False, "error": result["error"]}
-            return {"success": True, **result}
-        
-        elif operation == "analytics.summary":
-            from app.services.analytics_service import analytics_service
-            days = args.get("days", 30)
-            result = await analytics_service.get_overall_summary(days_back=days)
-            if "error" in result:
-                return {"success": False, "error": result["error"]}
-            return {"success": True, **result}
-        
-        elif operation == "monitoring.status":
-            from app.services.comprehensive_monitor import get_comprehensive_monitor
-            monitor = get_comprehensive_monitor()
-            result = await monitor.get_status()
-            return {"success": True, **result}
-
-        # ===================================================================
-        # SCALPING ANALYSIS - Real-time scalping opportunities
-        # ===================================================================
-        elif operation == "scalping.analyze":
-            from app.api.routes_scalping import ScalpingAnalysisRequest, analyze_for_scalping
-            symbol = args.get("symbol", "BTC").upper()
-            mode = args.get("mode", "aggressive")
-
-            request = ScalpingAnalysisRequest(
-                symbol=symbol,
-                mode=mode,
-                include_smart_money=args.get("include_smart_money", True),
-                include_whale_positions=args.get("include_whale_positions", True),
-                include_fear_greed=args.get("include_fear_greed", True),
-                include_coinapi=args.get("include_coinapi", True),
-                include_sentiment=args.get("include_sentiment", True),
-                gpt_mode=args.get("gpt_mode", True)  # Default True for GPT Actions
-            )
-
-            return await analyze_for_scalping(request)
+                "HIGH (2 signals)": {
+                    "description": "Two spike types correlate",
+                    "expected_win_rate": "60-70%",
+                    "action": "Good entry opportunity - monitor closely"
+                },
+                "MEDIUM (1 signal)": {
+                    "description": "Single spike detected",
+                    "expected_win_rate": "50-60%",
+                    "action": "Watch for confirmation from other signals"
+                }
+            },
+            "user_message": "🎯 You're 30-60 seconds ahead of retail traders with this system!"
+        }
 
-        elif operation == "scalping.quick":
-            from app.api.routes_scalping import quick_scalping_check
-            symbol = args.get("symbol", "BTC").upper()
-            return await quick_scalping_check(symbol)
+    async def _op_spike_monitor_coin(self, args: Dict) -> Any:
+        """spike.monitor_coin"""
+        from app.api.routes_spike_gpt import monitor_coin_spikes
+        symbol = args.get("symbol", "BTC")
+        return await monitor_coin_spikes(symbol)
+
+    async def _op_spike_status(self, args: Dict) -> Any:
+        """spike.status"""
+        from app.services.realtime_spike_detector import realtime_spike_detector
+        from app.services.liquidation_spike_detector import liquidation_spike_detector
+        from app.services.social_spike_monitor import social_spike_monitor
+        from app.services.spike_coordinator import spike_coordinator
+
+        return {
+            "success": True,
+            "price_detector": await realtime_spike_detector.get_status(),
+            "liquidation_detector": await liquidation_spike_detector.get_status(),
+            "social_monitor": await social_spike_monitor.get_status(),
+            "coordinator": await spike_coordinator.get_status()
+        }
 
-        elif operation == "scalping.info":
-            from app.api.routes_scalping import scalping_info
-            return await scalping_info()
+    async def _op_spike_health(self, args: Dict) -> Any:
+        """spike.health"""
+        from app.services.realtime_spike_detector import realtime_spike_detector
+        from app.services.liquidation_spike_detector import liquidation_spike_detector
+        from app.services.social_spike_monitor import social_spike_monitor
+
+        all_running = (
+            realtime_spike_detector.is_running and
+            liquidation_spike_detector.is_running and
+            social_spike_monitor.is_running
+        )
+
+        return {
+            "success": True,
+            "system_status": "ACTIVE" if all_running else "DEGRADED",
+            "detectors_running": {
+                "price": realtime_spike_detector.is_running,
+                "liquidation": liquidation_spike_detector.is_running,
+                "social": social_spike_monitor.is_running
+            },
+            "message": "✅ All detectors active" if all_running else "⚠️ Some detectors offline"
+        }
 
-        # ===================================================================
-        # ADMIN OPERATIONS
-        # ===================================================================
-        elif operation == "admin.dashboard":
-            from app.services.dynamic_weight_service import dynamic_weight_service
-            from app.services.metrics_service import metrics_service
-            from datetime import datetime
-            
-            weight_summary = dynamic_weight_service.get_weight_config_summary()
-            system_metrics = await metrics_service.get_metrics_summary()
-            
-            dashboard_data = {
-                "total_operations": len(OPERATION_CATALOG),
-                "operations_by_namespace": {},
-                "weight_configuration": weight_summary,
-                "system_metrics": system_metrics,
-                "performance_summary": {
-                    "total_factors": len(weight_summary["current_weights"]),
-                    "factors_with_performance_data": len(weight_summary["performance_metrics"]),
-                    "auto_optimization_enabled": weight_summary["auto_optimization"]["enabled"],
-                    "active_ab_tests": weight_summary["active_ab_tests"],
-                    "recent_weight_changes": weight_summary["recent_changes"]
-                }
+    async def _op_spike_price_detector_status(self, args: Dict) -> Any:
+        """spike.price_detector_status"""
+        from app.services.realtime_spike_detector import realtime_spike_detector
+        return await realtime_spike_detector.get_status()
+
+    async def _op_spike_liquidation_detector_status(self, args: Dict) -> Any:
+        """spike.liquidation_detector_status"""
+        from app.services.liquidation_spike_detector import liquidation_spike_detector
+        return await liquidation_spike_detector.get_status()
+
+    async def _op_spike_social_monitor_status(self, args: Dict) -> Any:
+        """spike.social_monitor_status"""
+        from app.services.social_spike_monitor import social_spike_monitor
+        return await social_spike_monitor.get_status()
+
+    async def _op_spike_coordinator_status(self, args: Dict) -> Any:
+        """spike.coordinator_status"""
+        from app.services.spike_coordinator import spike_coordinator
+        return await spike_coordinator.get_status()
+
+    # ===================================================================
+    # ANALYTICS (GPT-5.1 Self-Evaluation)
+    # ===================================================================
+    async def _op_analytics_history_latest(self, args: Dict) -> Any:
+        """analytics.history.latest"""
+        from app.services.analytics_service import analytics_service
+        symbol = args.get("symbol", "BTC").upper()
+        limit = args.get("limit", 5)
+        result = await analytics_service.get_latest_history(symbol=symbol, limit=limit)
+        if "error" in result:
+            return {"success": False, "error": result["error"], "symbol": symbol}
+        return {"success": True, **result}
+
+    async def _op_analytics_performance_symbol(self, args: Dict) -> Any:
+        """analytics.performance.symbol"""
+        from app.services.analytics_service import analytics_service
+        symbol = args.get("symbol", "BTC").upper()
+        days = args.get("days", 30)
+        limit = args.get("limit", 50)
+        result = await analytics_service.get_symbol_performance(symbol=symbol, days_back=days, limit=limit)
+        if "error" in result:
+            return {"success": False, "error": result["error"], "symbol": symbol}
+        return {"success": True, **result}
+
+    async def _op_analytics_performance_summary(self, args: Dict) -> Any:
+        """analytics.performance.summary"""
+        from app.services.analytics_service import analytics_service
+        days = args.get("days", 30)
+        result = await analytics_service.get_overall_summary(days_back=days)
+        if "error" in result:
+            return {"success": False, "error": result["error"]}
+        return {"success": True, **result}
+
+    async def _op_analytics_summary(self, args: Dict) -> Any:
+        """analytics.summary"""
+        from app.services.analytics_service import analytics_service
+        days = args.get("days", 30)
+        result = await analytics_service.get_overall_summary(days_back=days)
+        if "error" in result:
+            return {"success": False, "error": result["error"]}
+        return {"success": True, **result}
+
+    async def _op_monitoring_status(self, args: Dict) -> Any:
+        """monitoring.status"""
+        from app.services.comprehensive_monitor import get_comprehensive_monitor
+        monitor = get_comprehensive_monitor()
+        result = await monitor.get_status()
+        return {"success": True, **result}
+
+    # ===================================================================
+    # SCALPING ANALYSIS - Real-time scalping opportunities
+    # ===================================================================
+    async def _op_scalping_analyze(self, args: Dict) -> Any:
+        """scalping.analyze"""
+        from app.api.routes_scalping import ScalpingAnalysisRequest, analyze_for_scalping
+        symbol = args.get("symbol", "BTC").upper()
+        mode = args.get("mode", "aggressive")
+
+        request = ScalpingAnalysisRequest(
+            symbol=symbol,
+            mode=mode,
+            include_smart_money=args.get("include_smart_money", True),
+            include_whale_positions=args.get("include_whale_positions", True),
+            include_fear_greed=args.get("include_fear_greed", True),
+            include_coinapi=args.get("include_coinapi", True),
+            include_sentiment=args.get("include_sentiment", True),
+            gpt_mode=args.get("gpt_mode", True)  # Default True for GPT Actions
+        )
+
+        return await analyze_for_scalping(request)
+
+    async def _op_scalping_quick(self, args: Dict) -> Any:
+        """scalping.quick"""
+        from app.api.routes_scalping import quick_scalping_check
+        symbol = args.get("symbol", "BTC").upper()
+        return await quick_scalping_check(symbol)
+
+    async def _op_scalping_info(self, args: Dict) -> Any:
+        """scalping.info"""
+        from app.api.routes_scalping import scalping_info
+        return await scalping_info()
+
+    # ===================================================================
+    # ADMIN OPERATIONS
+    # ===================================================================
+    async def _op_admin_dashboard(self, args: Dict) -> Any:
+        """admin.dashboard"""
+        from app.services.dynamic_weight_service import dynamic_weight_service
+        from app.services.metrics_service import metrics_service
+        from datetime import datetime
+
+        weight_summary = dynamic_weight_service.get_weight_config_summary()
+        system_metrics = await metrics_service.get_metrics_summary()
+
+        dashboard_data = {
+            "total_operations": len(OPERATION_CATALOG),
+            "operations_by_namespace": {},
+            "weight_configuration": weight_summary,
+            "system_metrics": system_metrics,
+            "performance_summary": {
+                "total_factors": len(weight_summary["current_weights"]),
+                "factors_with_performance_data": len(weight_summary["performance_metrics"]),
+                "auto_optimization_enabled": weight_summary["auto_optimization"]["enabled"],
+                "active_ab_tests": weight_summary["active_ab_tests"],
+                "recent_weight_changes": weight_summary["recent_changes"]
             }
-            
-            for op_name in OPERATION_CATALOG:
-                namespace = op_name.split('.')[0]
-                dashboard_data["operations_by_namespace"][namespace] = \
-                    dashboard_data["operations_by_namespace"].get(namespace, 0) + 1
-            
-            return dashboard_data
+        }
 
-        # ===================================================================
-        # FALLBACK - Operation not implemented yet
-        # ===================================================================
-        else:
-            raise NotImplementedError(
-                f"Operation '{operation}' is registered in catalog but handler not implemented yet. "
-                f"Please add handler in _execute_operation method."
-            )
+        for op_name in OPERATION_CATALOG:
+            namespace = op_name.split('.')[0]
+            dashboard_data["operations_by_namespace"][namespace] = \
+                dashboard_data["operations_by_namespace"].get(namespace, 0) + 1
+
+        return dashboard_data
 
 
 # Global dispatcher instance
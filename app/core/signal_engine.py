@@ -9,21 +9,23 @@ import asyncio
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, AsyncIterator
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+from app.core.cache_service import cache_service
 from app.services.coinapi_service import coinapi_service
 from app.services.coinapi_comprehensive_service import coinapi_comprehensive
 from app.services.coinglass_service import coinglass_service
 from app.services.coinglass_premium_service import coinglass_premium
 from app.services.coinglass_comprehensive_service import coinglass_comprehensive
-from app.services.lunarcrush_service import lunarcrush_service
-from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+from app.services.lunarcrush_universe_service import lunarcrush_universe
 from app.services.okx_service import okx_service
 from app.services.telegram_notifier import telegram_notifier
 from app.services.openai_service_v2 import get_openai_service_v2
 from app.services.position_sizer import position_sizer
+from app.services.atr_calculator import atr_calculator
+from app.services.indicator_state import indicator_state_store
 from app.utils import risk_rules
 from app.utils.logger import get_logger, get_wib_datetime
 from app.utils.retry_helper import CircuitBreaker
@@ -538,7 +540,9 @@ class SignalEngine:
         debug: bool = False, 
         enforce_quality_threshold: bool = True,
         min_quality_score: float = 50.0,
-        mode: str = "aggressive"
+        mode: str = "aggressive",
+        shared_data: Optional[Dict] = None,
+        defer_ai_verdict: Optional[bool] = None
     ) -> Dict:
         """
         Build enhanced trading signal using all data sources concurrently
@@ -549,6 +553,10 @@ class SignalEngine:
             enforce_quality_threshold: If True, reject signals below min_quality_score (default: True)
             min_quality_score: Minimum data quality percentage required (default: 50.0%)
             mode: Signal mode - conservative/aggressive/ultra (or 1/2/3) [default: aggressive]
+            shared_data: Market-wide results prefetched once per batch (see build_signals_batch)
+            defer_ai_verdict: Two-phase mode - return with a provisional rule-based verdict and
+                deliver the AI verdict via /signals/verdict/{signalId}
+                (default: AI_VERDICT_DEFERRED env, false)
 
         Returns:
             Dict with signal, score, comprehensive analysis, data quality metrics, and mode info
@@ -564,7 +572,7 @@ class SignalEngine:
         symbol = symbol.upper()
 
         # PHASE 1: Concurrent data collection with quality tracking
-        context, quality_report = await self._collect_market_data(symbol)
+        context, quality_report = await self._collect_market_data(symbol, shared_data)
         
         # PHASE 1.5: Quality validation
         logger.info(f"📊 Data Quality: {quality_report.quality_score}% ({quality_report.quality_level}) - "
@@ -781,9 +789,16 @@ class SignalEngine:
                 "allMetrics": asdict(context),
             }
 
+        # Deterministic score is final here - share it with lightweight consumers
+        await self._remember_score(response)
+
         # Apply AI Verdict Layer (OpenAI V2 with rule-based fallback)
         enable_ai_judge = os.getenv("ENABLE_AI_JUDGE", "true").lower() == "true"
-        if enable_ai_judge:
+        if defer_ai_verdict is None:
+            defer_ai_verdict = os.getenv("AI_VERDICT_DEFERRED", "false").lower() == "true"
+        if enable_ai_judge and defer_ai_verdict:
+            response = await self._apply_deferred_ai_verdict(response)
+        elif enable_ai_judge:
             response = await self._apply_ai_verdict(response)
 
         # Auto-send Telegram alert - DISABLED to prevent auto-alerts
@@ -810,6 +825,109 @@ class SignalEngine:
 
         return response
 
+    async def build_signals_batch(
+        self,
+        symbols: List[str],
+        mode: str = "aggressive",
+        debug: bool = False,
+        enforce_quality_threshold: bool = True,
+        min_quality_score: float = 50.0,
+        max_concurrency: int = 10
+    ) -> AsyncIterator[Dict]:
+        """
+        Build signals for many symbols in-process, yielding each result as it finishes
+
+        Replaces scanner loopback calls to GET /signals/{symbol}: no HTTP/JSON
+        round trip, no middleware stack and no self-inflicted rate limiting.
+        Market-wide data (Fear & Greed, coins-markets snapshot) is fetched ONCE
+        for the whole batch and shared by every symbol's fan-out.
+
+        Args:
+            symbols: Cryptocurrency symbols (duplicates are ignored)
+            mode: Signal mode - conservative/aggressive/ultra (or 1/2/3)
+            debug: If True, include all raw metrics in each response
+            enforce_quality_threshold: Reject signals below min_quality_score
+            min_quality_score: Minimum data quality percentage required
+            max_concurrency: Maximum number of symbols built concurrently
+
+        Yields:
+            Signal dict per symbol (same schema as build_signal). Failures yield
+            {"success": False, "symbol": ..., "error": ...} instead of raising.
+
+        Example:
+            >>> async for signal in signal_engine.build_signals_batch(["BTC", "ETH"]):
+            ...     print(signal["symbol"], signal.get("signal"))
+        """
+        unique_symbols = list(dict.fromkeys(s.upper() for s in symbols if s))
+        if not unique_symbols:
+            return
+
+        logger.info(f"🔵 BUILD_SIGNALS_BATCH STARTED for {len(unique_symbols)} symbols - Mode: {mode}")
+        shared_data = await self._collect_shared_market_data()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _build_one(sym: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.build_signal(
+                        sym,
+                        debug=debug,
+                        enforce_quality_threshold=enforce_quality_threshold,
+                        min_quality_score=min_quality_score,
+                        mode=mode,
+                        shared_data=shared_data,
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Batch signal failed for {sym}: {e}")
+                    return {
+                        "success": False,
+                        "symbol": sym,
+                        "timestamp": get_wib_datetime().isoformat(),
+                        "error": str(e),
+                    }
+
+        tasks = [asyncio.create_task(_build_one(sym)) for sym in unique_symbols]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early (break/cancel) - don't leave builds running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _collect_shared_market_data(self) -> Dict:
+        """
+        Prefetch market-wide (symbol-independent) data once for a signal batch
+
+        Returns:
+            Dict keyed by ServiceCallMonitor name, consumed by _collect_market_data
+        """
+        from app.services.market_snapshot_service import market_snapshot_service
+
+        fg_data, _ = await asyncio.gather(
+            coinglass_premium.get_fear_greed_index(),
+            market_snapshot_service.ensure_fresh(),
+            return_exceptions=True,
+        )
+        return {"fear_greed": fg_data}
+
+    async def _shared_call(self, shared_data: Optional[Dict], name: str, factory) -> Any:
+        """
+        Return a prefetched batch result if present, otherwise make the call
+
+        Args:
+            shared_data: Batch-shared results (or None for single-signal builds)
+            name: ServiceCallMonitor name of the call
+            factory: Zero-arg callable returning the coroutine to await on a miss
+        """
+        if shared_data and name in shared_data:
+            result = shared_data[name]
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return await factory()
+
     async def _apply_ai_verdict(self, signal_data: Dict) -> Dict:
         """
         Apply AI verdict layer using OpenAI V2 Signal Judge with rule-based fallback
@@ -821,9 +939,62 @@ class SignalEngine:
         - aiSummary: Telegram-ready summary
         - layerChecks: Key agreements and conflicts
         
-        Falls back to rule-based assessment if OpenAI fails/times out
+        Falls back to rule-based assessment if OpenAI fails/times out.
+        ATR is fetched concurrently with the verdict; only the trade plan
+        (which depends on the verdict's risk mode) waits for it.
         """
         symbol = signal_data.get("symbol", "UNKNOWN")
+        atr_task = asyncio.create_task(self._fetch_atr(symbol))
+        try:
+            verdict_layer = await self._judge_signal(signal_data)
+            signal_data["aiVerdictLayer"] = verdict_layer
+            await self._attach_volatility_metrics(signal_data, verdict_layer, await atr_task)
+        finally:
+            if not atr_task.done():
+                atr_task.cancel()
+        
+        return signal_data
+
+    async def _apply_deferred_ai_verdict(self, signal_data: Dict) -> Dict:
+        """
+        Two-phase verdict: return now with a provisional rule-based verdict,
+        deliver the OpenAI V2 verdict later through ai_verdict_store
+        
+        Phase 1 (awaited): rule-based verdict + ATR trade plan (ATR fetched
+        while the AI call is already running)
+        Phase 2 (background): OpenAI V2 verdict with its own trade plan from the
+        same ATR data, stored under signalId for GET /signals/verdict/{id}
+        """
+        from app.services.ai_verdict_store import ai_verdict_store
+        
+        symbol = signal_data.get("symbol", "UNKNOWN")
+        # The judge sees the signal as it was before any verdict was attached
+        judged_signal = dict(signal_data)
+        atr_task = asyncio.create_task(self._fetch_atr(symbol))
+        
+        async def final_verdict() -> Dict:
+            verdict_layer = await self._judge_signal(judged_signal)
+            await self._attach_volatility_metrics(judged_signal, verdict_layer, await asyncio.shield(atr_task))
+            return verdict_layer
+        
+        signal_id = ai_verdict_store.submit(symbol, final_verdict())
+        
+        provisional = self._rule_based_verdict_layer(signal_data)
+        provisional["status"] = "provisional"
+        await self._attach_volatility_metrics(signal_data, provisional, await asyncio.shield(atr_task))
+        
+        signal_data["signalId"] = signal_id
+        signal_data["aiVerdictLayer"] = provisional
+        signal_data["aiVerdictPending"] = {
+            "status": "pending",
+            "pollUrl": f"/signals/verdict/{signal_id}",
+            "streamUrl": f"/signals/verdict/{signal_id}/stream",
+        }
+        return signal_data
+
+    async def _judge_signal(self, signal_data: Dict) -> Dict:
+        """OpenAI V2 verdict layer for a signal, or the rule-based one on failure/timeout"""
+        symbol = signal_data.get("symbol", "UNKNOWN")
         ai_timeout = int(os.getenv("AI_JUDGE_TIMEOUT", "25"))
         
         try:
@@ -852,12 +1023,10 @@ class SignalEngine:
                 logger.info(f"✅ OpenAI V2 verdict: {validation_result.get('verdict')} (confidence: {validation_result.get('ai_confidence')}%)")
                 
                 risk_suggestion = validation_result.get("adjusted_risk_suggestion", {})
-                verdict = validation_result.get("verdict", "SKIP")
-                risk_mode = risk_suggestion.get("risk_factor", "NORMAL")
                 
-                signal_data["aiVerdictLayer"] = {
-                    "verdict": verdict,
-                    "riskMode": risk_mode,
+                return {
+                    "verdict": validation_result.get("verdict", "SKIP"),
+                    "riskMode": risk_suggestion.get("risk_factor", "NORMAL"),
                     "riskMultiplier": risk_suggestion.get("position_size_multiplier", 1.0),
                     "aiConfidence": validation_result.get("ai_confidence", 50),
                     "aiSummary": validation_result.get("telegram_summary", ""),
@@ -867,21 +1036,8 @@ class SignalEngine:
                     },
                     "source": "openai_v2",
                     "model": validation_result.get("model_used", "gpt-4o"),
+                    "cached": (validation_result.get("cache") or {}).get("hit", False),
                 }
-                
-                # Calculate volatility metrics (ATR-based position sizing and stop loss)
-                volatility_metrics = await self._calculate_volatility_metrics(
-                    symbol=symbol,
-                    entry_price=signal_data.get("price", 0),
-                    signal_type=signal_data.get("signal", "NEUTRAL"),
-                    risk_mode=risk_mode
-                )
-                
-                if volatility_metrics:
-                    signal_data["aiVerdictLayer"]["volatilityMetrics"] = volatility_metrics
-                    logger.info(f"📊 Volatility metrics added: {volatility_metrics.get('tradePlanSummary', '')}")
-                
-                return signal_data
             
             else:
                 error_msg = validation_result.get("error", "Unknown error")
@@ -893,6 +1049,11 @@ class SignalEngine:
         except Exception as e:
             logger.error(f"⚠️  OpenAI V2 error: {e}. Falling back to rule-based assessment.")
         
+        return self._rule_based_verdict_layer(signal_data)
+
+    def _rule_based_verdict_layer(self, signal_data: Dict) -> Dict:
+        """Deterministic verdict layer from risk rules (no network)"""
+        symbol = signal_data.get("symbol", "UNKNOWN")
         logger.info(f"🔧 Using rule-based risk assessment for {symbol}")
         verdict = risk_rules.rule_based_verdict(signal_data)
         risk_mode = risk_rules.rule_based_risk_mode(signal_data)
@@ -902,7 +1063,9 @@ class SignalEngine:
             signal_data, verdict, risk_mode, warnings, agreements
         )
         
-        signal_data["aiVerdictLayer"] = {
+        logger.info(f"🔧 Rule-based verdict: {verdict}, Risk mode: {risk_mode}, Multiplier: {risk_multiplier}x")
+        
+        return {
             "verdict": verdict,
             "riskMode": risk_mode,
             "riskMultiplier": risk_multiplier,
@@ -915,29 +1078,36 @@ class SignalEngine:
             "source": "rule_fallback",
             "model": None,
         }
-        
-        logger.info(f"🔧 Rule-based verdict: {verdict}, Risk mode: {risk_mode}, Multiplier: {risk_multiplier}x")
-        
-        # Calculate volatility metrics (ATR-based position sizing and stop loss)
+
+    async def _fetch_atr(self, symbol: str) -> Dict:
+        """4h ATR for the trade plan ({} when unavailable)"""
+        try:
+            return await atr_calculator.get_atr(symbol=symbol, timeframe="4h") or {}
+        except Exception as e:
+            logger.error(f"⚠️  ATR fetch failed for {symbol}: {e}")
+            return {}
+
+    async def _attach_volatility_metrics(self, signal_data: Dict, verdict_layer: Dict, atr_data: Dict):
+        """Add the ATR trade plan for the verdict's risk mode to the verdict layer"""
         volatility_metrics = await self._calculate_volatility_metrics(
-            symbol=symbol,
+            symbol=signal_data.get("symbol", "UNKNOWN"),
             entry_price=signal_data.get("price", 0),
             signal_type=signal_data.get("signal", "NEUTRAL"),
-            risk_mode=risk_mode
+            risk_mode=verdict_layer.get("riskMode", "NORMAL"),
+            atr_data=atr_data
         )
         
         if volatility_metrics:
-            signal_data["aiVerdictLayer"]["volatilityMetrics"] = volatility_metrics
+            verdict_layer["volatilityMetrics"] = volatility_metrics
             logger.info(f"📊 Volatility metrics added: {volatility_metrics.get('tradePlanSummary', '')}")
-        
-        return signal_data
 
     async def _calculate_volatility_metrics(
         self,
         symbol: str,
         entry_price: float,
         signal_type: str,
-        risk_mode: str = "NORMAL"
+        risk_mode: str = "NORMAL",
+        atr_data: Optional[Dict] = None
     ) -> Optional[Dict]:
         """
         Calculate volatility-adjusted position sizing and risk parameters
@@ -958,7 +1128,8 @@ class SignalEngine:
                 signal_type=signal_type,
                 risk_mode=risk_mode,
                 base_size=1.0,
-                timeframe="4h"
+                timeframe="4h",
+                atr_data=atr_data
             )
             
             if not trade_plan:
@@ -1184,7 +1355,9 @@ class SignalEngine:
             "error": reason
         }
     
-    async def _collect_market_data(self, symbol: str) -> Tuple[EnhancedSignalContext, DataQualityReport]:
+    async def _collect_market_data(
+        self, symbol: str, shared_data: Optional[Dict] = None
+    ) -> Tuple[EnhancedSignalContext, DataQualityReport]:
         """
         Fetch all market data concurrently from multiple providers using asyncio.gather.
         
@@ -1193,6 +1366,7 @@ class SignalEngine:
         - Coinglass: Funding rates, open interest, comprehensive markets data
         - Coinglass Premium: Liquidations, long/short ratio, OI trend, top trader ratio, Fear & Greed
         - LunarCrush: Social score, comprehensive coin data, social change, momentum analysis
+          (all from the shared coins-list universe snapshot - no per-coin requests)
         - OKX: Candlestick data for trend calculation
         
         Implementation:
@@ -1203,6 +1377,7 @@ class SignalEngine:
         
         Args:
             symbol: Cryptocurrency symbol (e.g., 'BTC', 'ETH', 'SOL')
+            shared_data: Optional batch-prefetched market-wide results (e.g. fear_greed)
             
         Returns:
             Tuple[EnhancedSignalContext, DataQualityReport]: 
@@ -1229,23 +1404,15 @@ class SignalEngine:
             coinglass_comprehensive.get_coins_markets(
                 symbol=symbol
             ),  # Comprehensive markets
-            lunarcrush_service.get_social_score(symbol) if lunarcrush_enabled else self._skipped_call("LunarCrush - circuit breaker open"),
-            lunarcrush_comprehensive.get_coin_comprehensive(
-                symbol
-            ) if lunarcrush_enabled else self._skipped_call("LunarCrush - circuit breaker open"),
-            lunarcrush_comprehensive.get_social_change(
-                symbol, "24h"
-            ) if lunarcrush_enabled else self._skipped_call("LunarCrush - circuit breaker open"),
-            lunarcrush_comprehensive.analyze_social_momentum(
-                symbol
-            ) if lunarcrush_enabled else self._skipped_call("LunarCrush - circuit breaker open"),
+            # One universe snapshot read replaces four per-coin LunarCrush requests
+            lunarcrush_universe.get_social_bundle(symbol) if lunarcrush_enabled else self._skipped_call("LunarCrush - circuit breaker open"),
             okx_service.get_candles(symbol, "15m", 120),  # CRITICAL: 15m/120 for TA calibration + fallback
             # Premium endpoints
             coinglass_premium.get_liquidation_data(symbol),
             coinglass_premium.get_long_short_ratio(symbol),
             coinglass_premium.get_oi_trend(symbol),
             coinglass_premium.get_top_trader_ratio(symbol),
-            coinglass_premium.get_fear_greed_index(),
+            self._shared_call(shared_data, "fear_greed", coinglass_premium.get_fear_greed_index),
             # CoinAPI comprehensive endpoints
             coinapi_comprehensive.get_orderbook_depth(symbol, "BINANCE", 20),
             coinapi_comprehensive.get_recent_trades(symbol, "BINANCE", 100),
@@ -1261,10 +1428,7 @@ class SignalEngine:
             price_data,
             cg_data,
             comp_markets,
-            social_data,
-            lc_comp,
-            lc_change,
-            lc_momentum,
+            social_bundle,
             candles_data,
             liq_data,
             ls_data,
@@ -1276,9 +1440,18 @@ class SignalEngine:
             ca_ohlcv,
         ) = results
 
+        # Split the social bundle into its per-service results
+        if isinstance(social_bundle, dict) and "available" in social_bundle:
+            social_data = social_bundle["social"]
+            lc_comp = social_bundle["comprehensive"]
+            lc_change = social_bundle["change"]
+            lc_momentum = social_bundle["momentum"]
+        else:
+            social_data = lc_comp = lc_change = lc_momentum = social_bundle
+
         # Track all service results with monitor
         # Execution time is averaged across all parallel calls
-        avg_time_per_service = execution_time_ms / len(results)
+        avg_time_per_service = execution_time_ms / (len(results) + 3)  # social bundle = 4 services
         
         monitor.track_result("price_data", price_data, avg_time_per_service)
         monitor.track_result("funding_oi_data", cg_data, avg_time_per_service)
@@ -1310,19 +1483,17 @@ class SignalEngine:
         # Record LunarCrush circuit breaker metrics
         # Only record if calls were actually attempted (not skipped due to circuit breaker)
         # Track success/failure to enable automatic circuit opening on repeated failures
+        # A coin missing from the universe is not an upstream failure - only
+        # an unavailable snapshot counts against the breaker
         if lunarcrush_enabled:
-            lunarcrush_calls = [social_data, lc_comp, lc_change, lc_momentum]
-            lunarcrush_success = any(
-                isinstance(call, dict) and call.get("success", False) 
-                for call in lunarcrush_calls
-            )
+            lunarcrush_success = isinstance(social_bundle, dict) and social_bundle.get("available", False)
             
             if lunarcrush_success:
                 self.lunarcrush_breaker.record_success()
-                logger.debug(f"✅ LunarCrush call succeeded for {symbol} - circuit breaker reset")
+                logger.debug(f"✅ LunarCrush snapshot available for {symbol} - circuit breaker reset")
             else:
                 self.lunarcrush_breaker.record_failure()
-                logger.warning(f"⚠️  All LunarCrush calls failed for {symbol} - circuit breaker updated")
+                logger.warning(f"⚠️  LunarCrush snapshot unavailable for {symbol} - circuit breaker updated")
         else:
             logger.debug(f"⏭️  LunarCrush calls skipped for {symbol} due to circuit breaker - no metrics recorded")
         liq_data = liq_data if not isinstance(liq_data, Exception) else {}
@@ -1340,11 +1511,21 @@ class SignalEngine:
         # This combines MA, RSI, MACD, volume analysis + multi-timeframe alignment
         candles_list = candles_data.get("candles", [])
         logger.debug(f"🔍 Candles available for {symbol}: {len(candles_list)}")
+
+        # Streaming indicator state: only bars closed since the last build are applied
+        indicator_state, forming_bar = None, None
+        if candles_list:
+            try:
+                indicator_state, forming_bar = await indicator_state_store.sync(symbol, "15m", candles_list)
+            except Exception as e:
+                logger.warning(f"⚠️  Indicator state sync failed for {symbol}: {e}")
         
         enhanced_trend = self._calculate_enhanced_trend(
             candles=candles_list,
             volumes=None,  # Volumes are extracted from candles
-            comp_markets=comp_markets
+            comp_markets=comp_markets,
+            indicator_state=indicator_state,
+            forming_bar=forming_bar
         )
         
         logger.info(f"📊 Enhanced Trend Result for {symbol}: {enhanced_trend.get('trend')} (score: {enhanced_trend.get('score')}, confidence: {enhanced_trend.get('confidence')})")
@@ -1681,7 +1862,9 @@ class SignalEngine:
         self,
         candles: list,
         volumes: Optional[list] = None,
-        comp_markets: Optional[dict] = None
+        comp_markets: Optional[dict] = None,
+        indicator_state: Optional[Any] = None,
+        forming_bar: Optional[dict] = None
     ) -> Dict[str, Any]:
         """
         Calculate Enhanced Trend Analysis using Technical Indicators
@@ -1697,6 +1880,9 @@ class SignalEngine:
             candles: List of OHLCV candle data from OKX
             volumes: Optional list of volume data
             comp_markets: Optional comprehensive markets data
+            indicator_state: Optional synced IndicatorState for these candles -
+                             scored in O(1) instead of replaying the history
+            forming_bar: Unclosed latest bar, previewed on top of indicator_state
             
         Returns:
             Dict with 'trend', 'score', 'confidence', 'indicators', 'momentum'
@@ -1720,14 +1906,21 @@ class SignalEngine:
             if not volumes and candles:
                 volumes = [float(c.get("volume", 0)) for c in candles if c.get("volume")]
             
-            # Reverse if needed (most recent last for TA)
-            if len(prices) > 1 and candles[0].get("time", 0) > candles[-1].get("time", 0):
+            # Reverse if needed (most recent last for TA) - OKX candles are newest first
+            def candle_time(c):
+                return int(c.get("timestamp", c.get("time", 0)) or 0)
+
+            if len(prices) > 1 and candle_time(candles[0]) > candle_time(candles[-1]):
                 prices = list(reversed(prices))
                 if volumes:
                     volumes = list(reversed(volumes))
             
             # Use TechnicalIndicators comprehensive trend score
-            ta_result = TechnicalIndicators.calculate_trend_score(prices, volumes)
+            # (from the streaming state when it has enough history)
+            if indicator_state is not None and indicator_state.bars >= indicator_state.MIN_BARS:
+                ta_result = indicator_state.trend_score(forming_bar)
+            else:
+                ta_result = TechnicalIndicators.calculate_trend_score(prices, volumes)
             
             # Combine with existing multi-timeframe trend if available
             mtf_trend = "neutral"
@@ -2057,6 +2250,123 @@ class SignalEngine:
         else:
             return self.SMART_MONEY_SCORES["neutral"]
 
+    # ==================== CACHED / SNAPSHOT SCORES ====================
+
+    async def _remember_score(self, response: Dict):
+        """Cache the compact score of a full build for SIGNAL_SCORE_CACHE_TTL seconds"""
+        ttl = int(os.getenv("SIGNAL_SCORE_CACHE_TTL", "180"))
+        if ttl <= 0:
+            return
+        metrics = response.get("metrics", {})
+        await cache_service.set(
+            f"signal_score:{response['symbol']}:{response['mode']}",
+            {
+                "symbol": response["symbol"],
+                "mode": response["mode"],
+                "signal": response["signal"],
+                "score": response["score"],
+                "confidence": response["confidence"],
+                "price": response["price"],
+                "fundingRate": metrics.get("fundingRate"),
+                "openInterest": metrics.get("openInterest"),
+                "timestamp": response["timestamp"],
+            },
+            ttl,
+        )
+
+    async def get_cached_score(self, symbol: str, mode: str = "aggressive") -> Optional[Dict]:
+        """
+        Compact score of a recent full build_signal for symbol/mode
+
+        Returns:
+            Dict with signal, score, confidence, price, fundingRate, openInterest
+            and timestamp, or None if no build happened within SIGNAL_SCORE_CACHE_TTL
+        """
+        return await cache_service.get(f"signal_score:{symbol.upper()}:{self._normalize_mode(mode)}")
+
+    def score_market_snapshot(
+        self, row: Dict, fear_greed_value: float = 50.0, mode: str = "aggressive"
+    ) -> Dict:
+        """
+        Approximate score from one coins-markets row (no per-symbol upstream calls)
+
+        Uses the regular factor scorers and weights on what the bulk row carries:
+        OI-weighted funding, 1h/4h/24h price change, 24h liquidations, 24h
+        long/short ratio and 24h OI change, plus the shared Fear & Greed value.
+        Social sentiment and smart money are not in the row and score neutral.
+
+        Args:
+            row: Raw coins-markets row (see market_snapshot_service)
+            fear_greed_value: Fear & Greed index (0-100)
+            mode: Signal mode for the LONG/SHORT thresholds
+
+        Returns:
+            Dict with signal, score, confidence, price and fundingRate
+        """
+        def number(key: str, default: float = 0.0) -> float:
+            try:
+                return float(row.get(key) if row.get(key) is not None else default)
+            except (TypeError, ValueError):
+                return default
+
+        funding_rate = number("avg_funding_rate_by_oi")
+
+        changes = [
+            number(key) for key in
+            ("price_change_percent_1h", "price_change_percent_4h", "price_change_percent_24h")
+            if row.get(key) is not None
+        ]
+        avg_change = sum(changes) / len(changes) if changes else 0.0
+        if avg_change > self.PRICE_CHANGE_THRESHOLDS["strong_bullish"]:
+            price_trend = "bullish"
+        elif avg_change < self.PRICE_CHANGE_THRESHOLDS["strong_bearish"]:
+            price_trend = "bearish"
+        else:
+            price_trend = "neutral"
+
+        long_liq = number("long_liquidation_usd_24h")
+        short_liq = number("short_liquidation_usd_24h")
+        total_liq = long_liq + short_liq
+        long_liq_pct = long_liq / total_liq * 100 if total_liq > 0 else 50.0
+        if long_liq_pct > 55:
+            liq_score = self.LIQUIDATION_SCORES["long"]
+        elif long_liq_pct < 45:
+            liq_score = self.LIQUIDATION_SCORES["short"]
+        else:
+            liq_score = self.LIQUIDATION_SCORES["neutral"]
+
+        ls_ratio = number("long_short_ratio_24h", 1.0)
+        long_account_pct = ls_ratio / (1 + ls_ratio) * 100 if ls_ratio > 0 else 50.0
+
+        factor_scores = {
+            "funding_rate": self._score_funding_rate(funding_rate),
+            "social_sentiment": 50.0,
+            "price_momentum": self._score_price_momentum(price_trend),
+            "liquidations": liq_score,
+            "long_short_ratio": self._score_long_short_ratio(long_account_pct),
+            "oi_trend": self._score_oi_trend(number("open_interest_change_percent_24h")),
+            "smart_money": 50.0,
+            "fear_greed": fear_greed_value,
+        }
+        breakdown = {
+            name: {
+                "score": factor_score,
+                "weight": self.WEIGHTS[name],
+                "weighted": factor_score * self.WEIGHTS[name] / 100,
+            }
+            for name, factor_score in factor_scores.items()
+        }
+        score = sum(item["weighted"] for item in breakdown.values())
+
+        return {
+            "signal": self._determine_signal(score, mode),
+            "score": round(score, 1),
+            "confidence": self._calculate_confidence(breakdown),
+            "price": number("current_price"),
+            "fundingRate": funding_rate,
+            "priceTrend": price_trend,
+        }
+
     def _normalize_mode(self, mode: Optional[str]) -> str:
         """
         Normalize mode input to standard mode name
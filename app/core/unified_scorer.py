@@ -51,6 +51,7 @@ class UnifiedScorer:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.logger = default_logger
+        self._services: Optional[tuple] = None
 
         # Validate weights sum to 1.0
         total_weight = sum(self.WEIGHTS.values())
@@ -68,22 +69,12 @@ class UnifiedScorer:
         """
         scores = {}
 
-        # Import services
         try:
-            from app.services.smart_money_service import SmartMoneyService
-            from app.services.mss_service import MSSService
-            from app.services.coinglass_service import CoinglassService
-            from app.services.lunarcrush_service import LunarCrushService
+            smart_money, mss, coinglass, lunarcrush = self._get_services()
         except ImportError as e:
             self.logger.error(f"Failed to import services: {e}")
             return self._get_default_scores()
 
-        # Initialize services
-        smart_money = SmartMoneyService()
-        mss = MSSService()
-        coinglass = CoinglassService()
-        lunarcrush = LunarCrushService()
-
         try:
             # Gather all data in parallel
             tasks = {
@@ -112,13 +103,24 @@ class UnifiedScorer:
             self.logger.error(f"Error gathering scores for {symbol}: {e}")
             scores = self._get_default_scores()
 
-        finally:
-            # Cleanup
-            await smart_money.close()
-            await mss.close()
-
         return scores
 
+    def _get_services(self) -> tuple:
+        """
+        Provider services, created once per scorer
+
+        They were created (and closed) for every scored symbol; they now
+        share the process-wide HTTP pools, so one set serves bulk scoring.
+        """
+        if self._services is None:
+            from app.services.smart_money_service import SmartMoneyService
+            from app.services.mss_service import MSSService
+            from app.services.coinglass_service import CoinglassService
+            from app.services.lunarcrush_service import LunarCrushService
+
+            self._services = (SmartMoneyService(), MSSService(), CoinglassService(), LunarCrushService())
+        return self._services
+
     async def _get_smart_money_score(
         self,
         service: Any,
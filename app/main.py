@@ -14,6 +14,7 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from app.middleware.rate_limiter import limiter
 from app.utils.logger import get_logger
+from app.utils.schema_cache import schema_cache
 
 # Initialize module logger
 logger = get_logger(__name__)
@@ -61,10 +62,8 @@ from app.api import (
 )
 
 from app.middleware import (
-    ResponseSizeMonitorMiddleware,
-    GPTRateLimiterMiddleware,
+    RequestPipelineMiddleware,
     gpt_rate_limiter,
-    DetailedRequestLoggerMiddleware,
 )
 
 # Load environment variables
@@ -96,12 +95,34 @@ async def lifespan(app: FastAPI):
 
     # Initialize database connection
     await db.connect()
+
+    # Bulk-flush buffered signal/metric inserts (write-behind)
+    from app.storage.write_behind import write_behind
+    await write_behind.start()
     
     # Initialize cache service and start cleanup task
     from app.core.cache_service import cache_service, start_cache_cleanup_task
     cache_cleanup_task = asyncio.create_task(start_cache_cleanup_task())
     logger.info("🗄️  Cache service initialized with auto-cleanup")
 
+    # Enable shared L2 cache tier (Redis) so all workers share warmed data
+    from app.services.smart_cache import smart_cache
+    await smart_cache.connect()
+
+    # Start shared coins-markets snapshot (1 Coinglass call per refresh for ALL coins)
+    from app.services.market_snapshot_service import market_snapshot_service
+    await market_snapshot_service.start()
+
+    # Start shared LunarCrush coins-list snapshot (1 call per refresh, hype scored for ALL coins)
+    if os.getenv("LUNARCRUSH_API_KEY"):
+        from app.services.lunarcrush_universe_service import lunarcrush_universe
+        await lunarcrush_universe.start()
+
+    # Build OpenAPI / GPT Actions schemas once (served pre-encoded with ETag + gzip/br)
+    if os.getenv("SCHEMA_CACHE_WARM", "true").lower() == "true":
+        built = await asyncio.to_thread(schema_cache.warm)
+        logger.info(f"📄 Schema cache warmed: {built} schemas")
+
     # Initialize auto-scanner for 24/7 market monitoring
     # DISABLED: Auto scanner consumes ~200-300 API calls/hour
     # Uncomment below to enable automated scanning (Smart Money, MSS, RSI, LunarCrush)
@@ -116,45 +137,35 @@ async def lifespan(app: FastAPI):
     logger.info("🎯 Performance tracker started - tracking signal outcomes at 1h, 4h, 24h, 7d, 30d intervals")
 
     # Initialize Real-Time Spike Detection System (PHASE 5 - EARLY ENTRY SYSTEM)
-    # DISABLED: Spike detectors consume ~12,780 API calls/hour (99% of total usage!)
-    # - Price Spike: 12,000 calls/hour (100 coins × 30s interval)
-    # - Social Monitor: 600 calls/hour (50 coins × 5min interval)  
-    # - Liquidation: 180 calls/hour (60s interval)
-    # Uncomment below to enable real-time spike detection and auto Telegram alerts
-    logger.info("=" * 50)
-    logger.info("🚀 PHASE 5: Real-Time Spike Detection System - DISABLED")
+    # Event-driven: one bulk poll per data type feeds every detector via the market data bus
+    # - Price: shared coins-markets snapshot (~60 calls/hour, shared with the signal engine)
+    # - Liquidation: Coinglass coin-list (60 calls/hour) + optional WebSocket stream
+    # - Social: LunarCrush coins/list/v2 (12 calls/hour)
+    # Previously ~12,780 calls/hour with per-coin polling
+    spike_detection_enabled = os.getenv("ENABLE_SPIKE_DETECTION", "false").lower() == "true"
     logger.info("=" * 50)
-    logger.info("⚠️  Spike Detectors DISABLED to save API quota (saves ~12,780 calls/hour)")
-    logger.info("✅ Manual signal endpoints still work 100% (GET /signals/{symbol})")
-    logger.info("✅ GPT Actions fully functional - call anytime for on-demand signals")
+    if spike_detection_enabled:
+        from app.services.realtime_spike_detector import realtime_spike_detector
+        from app.services.liquidation_spike_detector import liquidation_spike_detector
+        from app.services.social_spike_monitor import social_spike_monitor
+        from app.services.spike_coordinator import spike_coordinator
+
+        # Coordinator first so no detector event is published without a consumer
+        spike_coordinator.start()
+        await realtime_spike_detector.start()
+        await liquidation_spike_detector.start()
+        await social_spike_monitor.start()
+
+        logger.info("✅ PHASE 5: Real-Time Spike Detection System ACTIVE")
+        logger.info("📊 Monitoring: price >8%/5min, liquidations, social spikes (bulk market data bus)")
+        logger.info("💰 Fixed API cost: ~132 calls/hour regardless of coin count")
+        logger.info("🎯 Correlation: Multi-signal validation for high-confidence alerts")
+    else:
+        logger.info("🚀 PHASE 5: Real-Time Spike Detection System - DISABLED")
+        logger.info("   Set ENABLE_SPIKE_DETECTION=true to enable (~132 API calls/hour)")
+        logger.info("✅ Manual signal endpoints still work 100% (GET /signals/{symbol})")
     logger.info("=" * 50)
 
-    # # Start Real-Time Price Spike Detector (>8% in 5min)
-    # from app.services.realtime_spike_detector import realtime_spike_detector
-    # asyncio.create_task(realtime_spike_detector.start())
-    # logger.info("⚡ Real-Time Price Spike Detector STARTED - monitoring >8% moves in 5min, top 100 coins, 30s interval")
-
-    # # Start Liquidation Spike Detector (>$50M market-wide, >$20M per coin)
-    # from app.services.liquidation_spike_detector import liquidation_spike_detector
-    # asyncio.create_task(liquidation_spike_detector.start())
-    # logger.info("💥 Liquidation Spike Detector STARTED - monitoring large liquidation events, 60s interval")
-
-    # # Start Social Spike Monitor (>100% social volume spike)
-    # from app.services.social_spike_monitor import social_spike_monitor
-    # asyncio.create_task(social_spike_monitor.start())
-    # logger.info("📱 Social Spike Monitor STARTED - monitoring viral moments, 5min interval")
-
-    # # Spike Coordinator is passive (receives signals from detectors)
-    # from app.services.spike_coordinator import spike_coordinator
-    # logger.info("🎯 Spike Coordinator ACTIVE - multi-signal correlation engine ready")
-
-    # logger.info("=" * 50)
-    # logger.info("✅ PHASE 5 Complete: Real-Time Spike Detection System ACTIVE")
-    # logger.info("📊 Monitoring: Top 100 coins for >8% price moves, liquidations, social spikes")
-    # logger.info("📱 Alerts: Instant Telegram notifications (no cooldown)")
-    # logger.info("🎯 Correlation: Multi-signal validation for high-confidence alerts")
-    # logger.info("=" * 50)
-
     yield
 
     # Shutdown: close database connection and cleanup resources
@@ -170,14 +181,22 @@ async def lifespan(app: FastAPI):
     # await auto_scanner.stop()
     # logger.info("🛑 Auto-scanner stopped")
 
-    # Stop spike detection system (DISABLED - not started)
-    # from app.services.realtime_spike_detector import realtime_spike_detector
-    # from app.services.liquidation_spike_detector import liquidation_spike_detector
-    # from app.services.social_spike_monitor import social_spike_monitor
-    # realtime_spike_detector.stop()
-    # liquidation_spike_detector.stop()
-    # social_spike_monitor.stop()
-    # logger.info("🛑 Spike detection system stopped")
+    # Stop spike detection system
+    if spike_detection_enabled:
+        from app.services.market_data_bus import market_data_feed
+        realtime_spike_detector.stop()
+        liquidation_spike_detector.stop()
+        social_spike_monitor.stop()
+        spike_coordinator.stop()
+        await market_data_feed.stop()
+        logger.info("🛑 Spike detection system stopped")
+
+    # Stop market snapshot refresh loop
+    from app.services.market_snapshot_service import market_snapshot_service
+    await market_snapshot_service.stop()
+
+    from app.services.lunarcrush_universe_service import lunarcrush_universe
+    await lunarcrush_universe.stop()
 
     # Cancel cache cleanup task
     cache_cleanup_task.cancel()
@@ -186,9 +205,17 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
-    # Close ATR calculator HTTP client
-    from app.services.atr_calculator import atr_calculator
-    await atr_calculator.close()
+    # Close shared L2 cache tier
+    from app.services.smart_cache import smart_cache
+    await smart_cache.disconnect()
+
+    # Close shared upstream HTTP pools (provider services no longer own clients)
+    from app.core.http_clients import http_clients
+    await http_clients.close_all()
+
+    # Flush buffered inserts before the database closes
+    from app.storage.write_behind import write_behind
+    await write_behind.stop()
 
     await db.disconnect()
 
@@ -216,17 +243,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add Request Logging middleware (logs all HTTP requests with details)
-app.add_middleware(DetailedRequestLoggerMiddleware)
-
-# Add GPT Actions middleware (MUST be after CORS, before SlowAPI)
-app.add_middleware(GPTRateLimiterMiddleware, limiter=gpt_rate_limiter)
-# Re-enabled with streaming-safe implementation
-app.add_middleware(ResponseSizeMonitorMiddleware)
-
-# Add SlowAPI rate limiting middleware (MUST be after CORS)
-from slowapi.middleware import SlowAPIMiddleware
-app.add_middleware(SlowAPIMiddleware)
+# Add request pipeline (pure ASGI): request logging, GPT Actions rate limiting
+# and response size monitoring in one pass. SlowAPI @limiter.limit decorators
+# are enforced by the routes themselves and need no middleware.
+app.add_middleware(RequestPipelineMiddleware, limiter=gpt_rate_limiter)
 
 # Mount static files for dashboard
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -340,41 +360,21 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 
-# GPT-optimized OpenAPI endpoint (< 45 KB target)
-@app.get("/openapi-gpt.json", include_in_schema=False)
-async def get_gpt_optimized_openapi():
-    """
-    Optimized OpenAPI schema for GPT Actions (< 45 KB)
-    Filters to include only GPT-relevant endpoints
-    """
-    from fastapi.openapi.utils import get_openapi
-    from app.utils.gpt_schema_builder import build_gpt_actions_schema
+# Schemas are built once (startup warm-up or first request) and served as
+# pre-encoded, pre-compressed bytes with ETag / If-None-Match support
+schema_cache.register("openapi", custom_openapi)
 
-    # Generate full schema
-    full_schema = get_openapi(
-        title=app.title,
-        version=app.version,
-        description=app.description,
-        routes=app.routes,
-    )
+# Replace FastAPI's built-in /openapi.json route (re-serializes the schema per request)
+app.router.routes = [
+    route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+]
 
-    # Filter to GPT-relevant tags only
-    gpt_schema = build_gpt_actions_schema(
-        app_openapi=full_schema,
-        include_tags={
-            "GPT Actions",
-            "Scalping Analysis",
-            "GPT Monitoring",
-            "Unified RPC - GPT Actions",
-            "Health",
-            "Real-Time Spike Detection",  # PHASE 5 - Early Entry System
-            "Comprehensive Coin Monitoring",  # NEW - Multi-coin Multi-timeframe Monitoring
-            "PRO Smart Entry Engine",  # NEW - Professional Entry Analysis with 8-source Confluence
-        },
-        base_url="https://guardiansofthetoken.org"
-    )
 
-    return gpt_schema
+@app.get(app.openapi_url, include_in_schema=False)
+async def get_openapi_json(request: Request):
+    """Full OpenAPI schema (cached, ETag + gzip/br)"""
+    return schema_cache.response(request, "openapi")
+
 
 if __name__ == "__main__":
     import uvicorn
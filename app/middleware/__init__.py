@@ -1,15 +1,15 @@
 # ADDED FOR CRYPTOSATX ENHANCEMENT
 # Middleware module for authentication and request processing
 
-from app.middleware.response_size_monitor import ResponseSizeMonitorMiddleware, response_size_stats
-from app.middleware.gpt_rate_limiter import GPTRateLimiterMiddleware, gpt_rate_limiter
-from app.middleware.request_logger import DetailedRequestLoggerMiddleware, CompactRequestLoggerMiddleware
+from app.middleware.response_size_monitor import response_size_stats
+from app.middleware.gpt_rate_limiter import GPTRateLimiter, gpt_rate_limiter
+from app.middleware.request_logger import CompactRequestLoggerMiddleware
+from app.middleware.request_pipeline import RequestPipelineMiddleware
 
 __all__ = [
-    "ResponseSizeMonitorMiddleware",
     "response_size_stats",
-    "GPTRateLimiterMiddleware",
+    "GPTRateLimiter",
     "gpt_rate_limiter",
-    "DetailedRequestLoggerMiddleware",
     "CompactRequestLoggerMiddleware",
+    "RequestPipelineMiddleware",
 ]
@@ -3,12 +3,10 @@ Enhanced Rate Limiting for GPT Actions
 Provides separate rate limits for GPT Actions endpoints to prevent abuse
 """
 
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from typing import Dict, Tuple, Optional
+from fastapi import Request
+from typing import Deque, Dict, Mapping, Optional, Tuple
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,7 +23,7 @@ class GPTRateLimiter:
     """
 
     def __init__(self):
-        self.request_history: Dict[Tuple[str, str], list] = defaultdict(list)
+        self.request_history: Dict[Tuple[str, str], Deque[float]] = defaultdict(deque)
 
         self.endpoint_limits = {
             "/gpt/signal": (30, 60),
@@ -41,20 +39,22 @@ class GPTRateLimiter:
 
         self.global_limit = (200, 60)
 
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request"""
-        forwarded = request.headers.get("X-Forwarded-For")
+    @staticmethod
+    def client_ip(headers: Mapping[str, str], client_host: Optional[str]) -> str:
+        """Client IP from proxy headers (lower-case names) or the socket peer"""
+        forwarded = headers.get("x-forwarded-for")
         if forwarded:
             return forwarded.split(",")[0].strip()
 
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
-        if request.client:
-            return request.client.host
+        return client_host or "unknown"
 
-        return "unknown"
+    def _get_client_ip(self, request: Request) -> str:
+        """Extract client IP from request"""
+        return self.client_ip(request.headers, request.client.host if request.client else None)
 
     def _get_endpoint_limit(self, path: str) -> Tuple[int, int]:
         """Get rate limit for endpoint"""
@@ -69,11 +69,13 @@ class GPTRateLimiter:
 
         return self.endpoint_limits["default"]
 
-    def _clean_old_requests(self, timestamps: list, window: int) -> list:
-        """Remove timestamps outside the time window"""
-        current_time = time.time()
-        cutoff_time = current_time - window
-        return [ts for ts in timestamps if ts > cutoff_time]
+    @staticmethod
+    def _clean_old_requests(timestamps: Deque[float], window: int, now: float) -> Deque[float]:
+        """Drop timestamps outside the time window (oldest first, in place)"""
+        cutoff_time = now - window
+        while timestamps and timestamps[0] <= cutoff_time:
+            timestamps.popleft()
+        return timestamps
 
     def check_rate_limit(self, request: Request) -> Tuple[bool, dict]:
         """
@@ -82,19 +84,18 @@ class GPTRateLimiter:
         Returns:
             (allowed, info_dict)
         """
-        ip = self._get_client_ip(request)
-        path = request.url.path
+        return self.check(self._get_client_ip(request), request.url.path)
+
+    def check(self, ip: str, path: str) -> Tuple[bool, dict]:
+        """Sliding-window check for a client IP and path (records the hit if allowed)"""
         current_time = time.time()
 
         max_requests, window = self._get_endpoint_limit(path)
 
         key = (ip, path)
-        self.request_history[key] = self._clean_old_requests(
-            self.request_history[key],
-            window
-        )
+        history = self._clean_old_requests(self.request_history[key], window, current_time)
 
-        request_count = len(self.request_history[key])
+        request_count = len(history)
 
         if request_count >= max_requests:
             return False, {
@@ -107,12 +108,13 @@ class GPTRateLimiter:
             }
 
         global_key = (ip, "global")
-        self.request_history[global_key] = self._clean_old_requests(
+        global_history = self._clean_old_requests(
             self.request_history[global_key],
-            self.global_limit[1]
+            self.global_limit[1],
+            current_time
         )
 
-        global_count = len(self.request_history[global_key])
+        global_count = len(global_history)
 
         if global_count >= self.global_limit[0]:
             return False, {
@@ -124,8 +126,8 @@ class GPTRateLimiter:
                 "message": f"Global rate limit exceeded. Max {self.global_limit[0]} requests per {self.global_limit[1]}s."
             }
 
-        self.request_history[key].append(current_time)
-        self.request_history[global_key].append(current_time)
+        history.append(current_time)
+        global_history.append(current_time)
 
         remaining = max_requests - (request_count + 1)
 
@@ -159,49 +161,4 @@ class GPTRateLimiter:
             "limits": self.endpoint_limits
         }
 
-class GPTRateLimiterMiddleware(BaseHTTPMiddleware):
-    """Middleware to apply rate limiting to GPT Actions endpoints"""
-
-    def __init__(self, app: ASGIApp, limiter: Optional[GPTRateLimiter] = None):
-        super().__init__(app)
-        self.limiter = limiter if limiter is not None else GPTRateLimiter()
-
-    async def dispatch(self, request: Request, call_next):
-        """Apply rate limiting"""
-
-        allowed, info = self.limiter.check_rate_limit(request)
-
-        if not allowed:
-            logger.warning(
-                f"Rate limit exceeded",
-                extra={
-                    "ip": self.limiter._get_client_ip(request),
-                    "endpoint": request.url.path,
-                    "limit": info["limit"],
-                    "window": info["window_seconds"]
-                }
-            )
-
-            raise HTTPException(
-                status_code=429,
-                detail={
-                    "error": "Rate limit exceeded",
-                    "message": info["message"],
-                    "retry_after_seconds": info["retry_after"]
-                },
-                headers={
-                    "Retry-After": str(info["retry_after"]),
-                    "X-RateLimit-Limit": str(info["limit"]),
-                    "X-RateLimit-Window": str(info["window_seconds"])
-                }
-            )
-
-        response = await call_next(request)
-
-        response.headers["X-RateLimit-Limit"] = str(info["limit"])
-        response.headers["X-RateLimit-Remaining"] = str(info.get("remaining", 0))
-        response.headers["X-RateLimit-Window"] = str(info["window_seconds"])
-
-        return response
-
 gpt_rate_limiter = GPTRateLimiter()
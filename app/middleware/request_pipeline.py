@@ -0,0 +1,256 @@
+"""
+Request Pipeline Middleware
+Logging, GPT Actions rate limiting and response size accounting in one raw ASGI layer
+
+Replaces DetailedRequestLoggerMiddleware, GPTRateLimiterMiddleware,
+ResponseSizeMonitorMiddleware and SlowAPIMiddleware. Each BaseHTTPMiddleware
+layer ran the rest of the app in a separate task and re-streamed the response
+through memory streams, and the request logger read the whole POST body up
+front and re-parsed it as JSON for every request.
+
+This layer wraps receive/send once:
+- Rate limit is checked before the app runs (429 sent directly)
+- Request body chunks are tee'd while the app reads them, capped at
+  REQUEST_LOG_BODY_MAX_BYTES - never buffered ahead of the app
+- Bodies are parsed/redacted only when logged: always for 4xx/5xx, and for
+  REQUEST_LOG_BODY_SAMPLE_RATE of successful requests
+- Response headers (rate limit, size, timing) are injected into
+  http.response.start; size is counted from the body chunks as they pass
+
+SlowAPI's @limiter.limit route decorators keep working without its middleware
+(no default limits were configured, so the middleware itself was a no-op).
+"""
+
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.gpt_rate_limiter import GPTRateLimiter, gpt_rate_limiter
+from app.middleware.request_logger import redact_sensitive_data, summarize_body
+from app.middleware.response_size_monitor import (
+    log_response_size,
+    response_size_stats,
+    size_headers,
+)
+from app.utils.logger import get_logger, get_wib_time
+
+logger = get_logger("app.middleware.request_logger")
+
+REQUEST_LOG_BODY_MAX_BYTES = int(os.getenv("REQUEST_LOG_BODY_MAX_BYTES", "4096"))
+REQUEST_LOG_BODY_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_BODY_SAMPLE_RATE", "0.1"))
+
+_BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+
+def _header_map(scope: Scope) -> Dict[str, str]:
+    return {key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers") or ()}
+
+
+class _Exchange:
+    """Per-request state shared by the receive/send wrappers"""
+
+    __slots__ = ("status", "size", "body", "body_truncated", "streaming", "started_at", "process_ms")
+
+    def __init__(self):
+        self.status = 500
+        self.size = 0
+        self.body: Optional[bytearray] = None
+        self.body_truncated = False
+        self.streaming = False
+        self.started_at = time.perf_counter()
+        self.process_ms = 0.0
+
+
+class RequestPipelineMiddleware:
+    """Pure ASGI middleware: rate limit -> app -> size accounting -> request log"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[GPTRateLimiter] = None,
+        body_max_bytes: int = REQUEST_LOG_BODY_MAX_BYTES,
+        body_sample_rate: float = REQUEST_LOG_BODY_SAMPLE_RATE,
+    ):
+        self.app = app
+        self.limiter = limiter if limiter is not None else gpt_rate_limiter
+        self.body_max_bytes = body_max_bytes
+        self.body_sample_rate = body_sample_rate
+        self.request_count = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.request_count += 1
+        request_id = self.request_count
+        method = scope["method"]
+        path = scope["path"]
+        headers = _header_map(scope)
+        client = scope.get("client")
+        client_ip = self.limiter.client_ip(headers, client[0] if client else None)
+        exchange = _Exchange()
+
+        # ==================== RATE LIMIT ====================
+        allowed, info = self.limiter.check(client_ip, path)
+        if not allowed:
+            await self._send_rate_limited(send, info, exchange)
+            logger.warning(
+                "Rate limit exceeded",
+                extra={"ip": client_ip, "endpoint": path, "limit": info["limit"], "window": info["window_seconds"]},
+            )
+            self._log_request(request_id, method, path, scope, headers, client_ip, exchange)
+            return
+
+        rate_headers = [
+            (b"x-ratelimit-limit", str(info["limit"]).encode()),
+            (b"x-ratelimit-remaining", str(info.get("remaining", 0)).encode()),
+            (b"x-ratelimit-window", str(info["window_seconds"]).encode()),
+        ]
+
+        # ==================== BODY TEE ====================
+        if method in _BODY_METHODS and self.body_max_bytes > 0:
+            exchange.body = bytearray()
+            body_limit = self.body_max_bytes
+
+            async def receive_wrapper() -> Message:
+                message = await receive()
+                if message["type"] == "http.request":
+                    chunk = message.get("body", b"")
+                    room = body_limit - len(exchange.body)
+                    if chunk and room > 0:
+                        exchange.body += chunk[:room]
+                    if len(chunk) > room:
+                        exchange.body_truncated = True
+                return message
+        else:
+            receive_wrapper = receive
+
+        # ==================== RESPONSE ====================
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                exchange.status = message["status"]
+                exchange.process_ms = (time.perf_counter() - exchange.started_at) * 1000
+                extra = list(rate_headers)
+                content_length = _content_length(message.get("headers") or ())
+                if content_length is None:
+                    exchange.streaming = True
+                    extra.append((b"x-response-type", b"streaming"))
+                else:
+                    extra.extend(size_headers(content_length))
+                extra.append((b"x-response-time-ms", f"{exchange.process_ms:.2f}".encode()))
+                message = {**message, "headers": [*(message.get("headers") or ()), *extra]}
+            elif message["type"] == "http.response.body":
+                exchange.size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception as e:
+            self._log_failure(request_id, method, path, client_ip, e)
+            raise
+
+        response_size_stats.record_response(path, exchange.size)
+        log_response_size(path, method, exchange.size)
+        self._log_request(request_id, method, path, scope, headers, client_ip, exchange)
+
+    async def _send_rate_limited(self, send: Send, info: Dict[str, Any], exchange: _Exchange):
+        body = json.dumps({
+            "detail": {
+                "error": "Rate limit exceeded",
+                "message": info["message"],
+                "retry_after_seconds": info["retry_after"],
+            }
+        }).encode()
+        exchange.status = 429
+        exchange.size = len(body)
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(info["retry_after"]).encode()),
+                (b"x-ratelimit-limit", str(info["limit"]).encode()),
+                (b"x-ratelimit-window", str(info["window_seconds"]).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    # ==================== LOGGING ====================
+
+    def _log_request(self, request_id: int, method: str, path: str, scope: Scope,
+                     headers: Dict[str, str], client_ip: str, exchange: _Exchange):
+        status_code = exchange.status
+        if status_code >= 500:
+            level, emoji = logging.ERROR, "❌"
+        elif status_code >= 400:
+            level, emoji = logging.WARNING, "⚠️"
+        elif status_code >= 300:
+            level, emoji = logging.INFO, "↩️"
+        else:
+            level, emoji = logging.INFO, "✅"
+        if not logger.isEnabledFor(level):
+            return
+
+        duration_ms = round((time.perf_counter() - exchange.started_at) * 1000, 2)
+
+        # Parse/redact lazily: failures always, successes sampled
+        request_body = None
+        if exchange.body and (status_code >= 400 or random.random() < self.body_sample_rate):
+            request_body = summarize_body(bytes(exchange.body), exchange.body_truncated)
+
+        query_params = _query_params(scope)
+        log_data = {
+            "request_id": request_id,
+            "timestamp": get_wib_time(),
+            "method": method,
+            "endpoint": path,
+            "query_params": redact_sensitive_data(query_params) if query_params else None,
+            "request_body": request_body,
+            "status_code": status_code,
+            "duration_ms": duration_ms,
+            "response_size_bytes": exchange.size,
+            "client_ip": client_ip,
+            "user_agent": headers.get("user-agent", "unknown"),
+        }
+        record = logger.makeRecord(
+            logger.name, level, "", 0, f"{emoji} {method} {path} → {status_code} ({duration_ms}ms)", (), None
+        )
+        setattr(record, "extra_data", log_data)
+        logger.handle(record)
+
+    def _log_failure(self, request_id: int, method: str, path: str, client_ip: str, error: Exception):
+        record = logger.makeRecord(logger.name, logging.ERROR, "", 0, "❌ Request failed with exception", (), None)
+        setattr(record, "extra_data", {
+            "request_id": request_id,
+            "timestamp": get_wib_time(),
+            "method": method,
+            "endpoint": path,
+            "client_ip": client_ip,
+            "error": str(error),
+        })
+        logger.handle(record)
+
+
+def _content_length(headers) -> Optional[int]:
+    for key, value in headers:
+        if key.lower() == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _query_params(scope: Scope) -> Dict[str, str]:
+    raw = scope.get("query_string") or b""
+    if not raw:
+        return {}
+    return dict(parse_qsl(raw.decode("latin-1"), keep_blank_values=True))
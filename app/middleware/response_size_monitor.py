@@ -1,14 +1,12 @@
 """
-Response Size Monitoring Middleware - FIXED for Streaming Support
+Response Size Monitoring
 Monitors response sizes for GPT Actions compatibility (50KB limit)
+
+Sizes are counted by RequestPipelineMiddleware (app.middleware.request_pipeline)
+as body chunks are sent; this module holds the limits, headers and statistics.
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import StreamingResponse
-from starlette.types import ASGIApp
-from typing import Callable
-import time
+from typing import List, Tuple
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,128 +14,48 @@ logger = get_logger(__name__)
 GPT_ACTIONS_LIMIT_BYTES = 50 * 1024
 WARNING_THRESHOLD_BYTES = 40 * 1024
 
-class ResponseSizeMonitorMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to monitor response sizes and warn about GPT Actions compatibility
-    
-    ✅ FIXED: Properly handles streaming responses without exhausting iterators
-    
-    Features:
-    - Tracks response sizes for all endpoints
-    - Warns when responses approach 50KB limit
-    - Logs statistics for monitoring
-    - Adds custom headers with size information
-    - Preserves streaming capability (no iterator exhaustion)
-    """
-
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-        self.large_responses_count = 0
-        self.total_requests = 0
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and monitor response size - STREAMING SAFE"""
-
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
-
-        # Handle StreamingResponse (like JSONResponse) properly
-        if isinstance(response, StreamingResponse):
-            original_body_iterator = response.body_iterator
-            size = 0
-
-            async def wrapped_body_iterator():
-                nonlocal size
-                async for chunk in original_body_iterator:
-                    size += len(chunk)
-                    yield chunk
-                
-                # Log after streaming completes
-                response_size_kb = size / 1024
-                
-                if size > GPT_ACTIONS_LIMIT_BYTES:
-                    logger.warning(
-                        f"⚠️  Response size exceeds GPT Actions limit!",
-                        extra={
-                            "endpoint": str(request.url.path),
-                            "method": request.method,
-                            "size_bytes": size,
-                            "size_kb": round(response_size_kb, 2),
-                            "limit_kb": 50,
-                            "exceeded_by_kb": round(response_size_kb - 50, 2)
-                        }
-                    )
-                elif size > WARNING_THRESHOLD_BYTES:
-                    logger.info(
-                        f"ℹ️  Response approaching GPT Actions limit",
-                        extra={
-                            "endpoint": str(request.url.path),
-                            "method": request.method,
-                            "size_bytes": size,
-                            "size_kb": round(response_size_kb, 2),
-                            "threshold_percent": round((size / GPT_ACTIONS_LIMIT_BYTES) * 100, 1)
-                        }
-                    )
-                
-                # Record stats
-                response_size_stats.record_response(str(request.url.path), size)
-
-            # Replace iterator with wrapped version
-            response.body_iterator = wrapped_body_iterator()
-            
-            # Add headers (approximation before full size known)
-            response.headers["X-Response-Type"] = "streaming"
-            response.headers["X-Response-Time-Ms"] = f"{process_time:.2f}"
-            
-            return response
-
-        # Handle non-streaming responses
-        if hasattr(response, "body"):
-            response_body = response.body
-            response_size = len(response_body)
-            response_size_kb = response_size / 1024
-
-            self.total_requests += 1
-
-            if response_size > WARNING_THRESHOLD_BYTES:
-                self.large_responses_count += 1
-
-                if response_size > GPT_ACTIONS_LIMIT_BYTES:
-                    logger.warning(
-                        f"⚠️  Response size exceeds GPT Actions limit!",
-                        extra={
-                            "endpoint": str(request.url.path),
-                            "method": request.method,
-                            "size_bytes": response_size,
-                            "size_kb": round(response_size_kb, 2),
-                            "limit_kb": 50,
-                            "exceeded_by_kb": round(response_size_kb - 50, 2)
-                        }
-                    )
-                else:
-                    logger.info(
-                        f"ℹ️  Response approaching GPT Actions limit",
-                        extra={
-                            "endpoint": str(request.url.path),
-                            "method": request.method,
-                            "size_bytes": response_size,
-                            "size_kb": round(response_size_kb, 2),
-                            "threshold_percent": round((response_size / GPT_ACTIONS_LIMIT_BYTES) * 100, 1)
-                        }
-                    )
-
-            response.headers["X-Response-Size-Bytes"] = str(response_size)
-            response.headers["X-Response-Size-KB"] = f"{response_size_kb:.2f}"
-            response.headers["X-GPT-Actions-Compatible"] = "true" if response_size <= GPT_ACTIONS_LIMIT_BYTES else "false"
-            response.headers["X-Response-Time-Ms"] = f"{process_time:.2f}"
-
-            if response_size > GPT_ACTIONS_LIMIT_BYTES:
-                response.headers["X-GPT-Actions-Warning"] = f"Response size ({response_size_kb:.2f}KB) exceeds 50KB limit"
-
-            response_size_stats.record_response(str(request.url.path), response_size)
-
-        return response
+def size_headers(size_bytes: int) -> List[Tuple[bytes, bytes]]:
+    """GPT Actions size headers for a response of known length"""
+    size_kb = size_bytes / 1024
+    headers = [
+        (b"x-response-size-bytes", str(size_bytes).encode()),
+        (b"x-response-size-kb", f"{size_kb:.2f}".encode()),
+        (b"x-gpt-actions-compatible", b"true" if size_bytes <= GPT_ACTIONS_LIMIT_BYTES else b"false"),
+    ]
+    if size_bytes > GPT_ACTIONS_LIMIT_BYTES:
+        headers.append((b"x-gpt-actions-warning", f"Response size ({size_kb:.2f}KB) exceeds 50KB limit".encode()))
+    return headers
+
+
+def log_response_size(endpoint: str, method: str, size_bytes: int):
+    """Warn when a response approaches or exceeds the GPT Actions limit"""
+    if size_bytes <= WARNING_THRESHOLD_BYTES:
+        return
+
+    size_kb = size_bytes / 1024
+    if size_bytes > GPT_ACTIONS_LIMIT_BYTES:
+        logger.warning(
+            f"⚠️  Response size exceeds GPT Actions limit!",
+            extra={
+                "endpoint": endpoint,
+                "method": method,
+                "size_bytes": size_bytes,
+                "size_kb": round(size_kb, 2),
+                "limit_kb": 50,
+                "exceeded_by_kb": round(size_kb - 50, 2)
+            }
+        )
+    else:
+        logger.info(
+            f"ℹ️  Response approaching GPT Actions limit",
+            extra={
+                "endpoint": endpoint,
+                "method": method,
+                "size_bytes": size_bytes,
+                "size_kb": round(size_kb, 2),
+                "threshold_percent": round((size_bytes / GPT_ACTIONS_LIMIT_BYTES) * 100, 1)
+            }
+        )
 
 
 class ResponseSizeStats:
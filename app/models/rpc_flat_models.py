@@ -115,3 +115,51 @@ class FlatRPCResponse(BaseModel):
     data: Optional[dict] = Field(None, description="Response data")
     error: Optional[str] = Field(None, description="Error message if ok=False")
     meta: Optional[dict] = Field(None, description="Metadata (execution time, etc.)")
+
+
+class FlatBatchInvokeRequest(BaseModel):
+    """
+    Batch of flat RPC operations executed concurrently in one request
+
+    Operations share one timeout budget and one request data context, so
+    overlapping provider calls (same symbol, same endpoint) run once.
+    """
+    operations: list[FlatInvokeRequest] = Field(
+        ...,
+        min_length=1,
+        description="Operations to execute (same flat format as /invoke)"
+    )
+    symbol: Optional[str] = Field(
+        None,
+        description="Default symbol for operations that do not set one"
+    )
+    timeout_seconds: Optional[float] = Field(
+        None,
+        description="Total time budget for the whole batch (seconds)"
+    )
+    stream: bool = Field(
+        False,
+        description="Stream each result as NDJSON as soon as it completes"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "examples": [
+                {
+                    "symbol": "BTC",
+                    "operations": [
+                        {"operation": "signals.get"},
+                        {"operation": "coinglass.funding_rate.history"},
+                        {"operation": "coinglass.liquidations.symbol"},
+                        {"operation": "smart_entry.analyze"}
+                    ]
+                }
+            ]
+        }
+
+
+class FlatBatchRPCResponse(BaseModel):
+    """Batch RPC response - results in request order (partial on timeout)"""
+    ok: bool = Field(..., description="True if every operation succeeded")
+    results: list[FlatRPCResponse] = Field(..., description="Per-operation results in request order")
+    meta: Optional[dict] = Field(None, description="Batch metadata (timing, shared calls)")
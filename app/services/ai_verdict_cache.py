@@ -0,0 +1,269 @@
+"""
+AI Verdict Cache
+Reuses OpenAI V2 Signal Judge verdicts while the scoring inputs haven't moved
+
+validate_signal_with_verdict was called on every build_signal with the full
+metrics payload, so a GPT Action repeated seconds later (or a scan over hot
+symbols) paid a full LLM round trip for the same answer. Verdicts are now
+cached under a quantized fingerprint of what the judge sees:
+
+    symbol | signal | mode | score bucket | funding bucket | OI bucket | L/S bucket
+
+- Score: AI_VERDICT_SCORE_BUCKET points per bucket (default 5)
+- Funding rate: AI_VERDICT_FUNDING_BUCKET per bucket (default 0.0001 = 0.01%)
+- Open interest: log buckets of AI_VERDICT_OI_BUCKET_PCT percent (default 2%)
+- Long/short: the signal's long/short sentiment plus long account % in
+  AI_VERDICT_LS_BUCKET point buckets when available (default 5)
+
+Entries expire after AI_VERDICT_CACHE_TTL seconds (default 300). When a
+symbol/mode's fingerprint changes, its previous entry is invalidated and
+registered listeners are told which buckets shifted. Concurrent misses for
+the same fingerprint share one LLM call. Only successful verdicts are cached.
+AI_VERDICT_CACHE_ENABLED=false turns the cache off.
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+AI_VERDICT_CACHE_ENABLED = os.getenv("AI_VERDICT_CACHE_ENABLED", "true").lower() == "true"
+AI_VERDICT_CACHE_TTL = float(os.getenv("AI_VERDICT_CACHE_TTL", "300"))
+AI_VERDICT_CACHE_MAX = int(os.getenv("AI_VERDICT_CACHE_MAX", "2000"))
+AI_VERDICT_SCORE_BUCKET = float(os.getenv("AI_VERDICT_SCORE_BUCKET", "5"))
+AI_VERDICT_FUNDING_BUCKET = float(os.getenv("AI_VERDICT_FUNDING_BUCKET", "0.0001"))
+AI_VERDICT_OI_BUCKET_PCT = float(os.getenv("AI_VERDICT_OI_BUCKET_PCT", "2"))
+AI_VERDICT_LS_BUCKET = float(os.getenv("AI_VERDICT_LS_BUCKET", "5"))
+
+FINGERPRINT_FIELDS = ("symbol", "signal", "mode", "score", "funding", "oi", "long_short")
+
+Fingerprint = Tuple[Any, ...]
+InvalidationListener = Callable[[str, str, List[str]], None]
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _linear_bucket(value: Any, step: float) -> Optional[int]:
+    number = _number(value)
+    if number is None or step <= 0:
+        return None
+    return math.floor(number / step)
+
+
+def _log_bucket(value: Any, pct: float) -> Optional[int]:
+    number = _number(value)
+    if number is None or number <= 0 or pct <= 0:
+        return None
+    return math.floor(math.log(number) / math.log1p(pct / 100))
+
+
+def signal_fingerprint(symbol: str, signal_data: Dict[str, Any]) -> Fingerprint:
+    """
+    Quantized fingerprint of the scoring inputs the judge sees
+
+    Values come from the build_signal response: metrics.fundingRate and
+    metrics.openInterest, premiumMetrics.longShortSentiment, and (debug
+    responses) debug.allMetrics.long_account_pct.
+    """
+    metrics = signal_data.get("metrics") or {}
+    premium = signal_data.get("premiumMetrics") or {}
+    all_metrics = (signal_data.get("debug") or {}).get("allMetrics") or {}
+
+    long_short = (
+        premium.get("longShortSentiment"),
+        _linear_bucket(all_metrics.get("long_account_pct"), AI_VERDICT_LS_BUCKET),
+    )
+    return (
+        symbol.upper(),
+        signal_data.get("signal"),
+        signal_data.get("mode"),
+        _linear_bucket(signal_data.get("score"), AI_VERDICT_SCORE_BUCKET),
+        _linear_bucket(metrics.get("fundingRate"), AI_VERDICT_FUNDING_BUCKET),
+        _log_bucket(metrics.get("openInterest"), AI_VERDICT_OI_BUCKET_PCT),
+        long_short,
+    )
+
+
+@dataclass
+class CachedVerdict:
+    result: Dict[str, Any]
+    stored_at: float
+
+
+class AIVerdictCache:
+    """TTL cache of judge results keyed by signal fingerprint"""
+
+    def __init__(self, ttl_seconds: float = AI_VERDICT_CACHE_TTL, max_entries: int = AI_VERDICT_CACHE_MAX,
+                 enabled: bool = AI_VERDICT_CACHE_ENABLED):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[Fingerprint, CachedVerdict]" = OrderedDict()
+        self._latest: Dict[Tuple[str, Any], Fingerprint] = {}  # (symbol, mode) -> last fingerprint
+        self._in_flight: Dict[Fingerprint, asyncio.Future] = {}
+        self._judging: set = set()  # Strong refs to judge tasks still running
+        self._listeners: List[InvalidationListener] = []
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stores": 0,
+            "expired": 0,
+            "invalidations": 0,
+            "evictions": 0,
+            "tokens_saved": 0,
+        }
+
+    # ==================== INVALIDATION ====================
+
+    def on_invalidate(self, listener: InvalidationListener):
+        """Register listener(symbol, reason, shifted_fields) called on every invalidation"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def _notify(self, symbol: str, reason: str, shifted: List[str]):
+        for listener in self._listeners:
+            try:
+                listener(symbol, reason, shifted)
+            except Exception as e:
+                logger.warning(f"AI verdict cache listener failed: {e}")
+
+    def invalidate(self, symbol: Optional[str] = None) -> int:
+        """Drop cached verdicts for a symbol (or all). Returns entries removed"""
+        if symbol is None:
+            keys = list(self._entries)
+        else:
+            keys = [key for key in self._entries if key[0] == symbol.upper()]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            self.stats["invalidations"] += len(keys)
+            self._notify(symbol or "*", "manual", [])
+        return len(keys)
+
+    def _track_shift(self, fingerprint: Fingerprint):
+        """Invalidate the previous entry of this symbol/mode when a bucket shifted"""
+        series = (fingerprint[0], fingerprint[2])
+        previous = self._latest.get(series)
+        self._latest[series] = fingerprint
+        if previous is None or previous == fingerprint:
+            return
+        if self._entries.pop(previous, None) is not None:
+            self.stats["invalidations"] += 1
+        shifted = [name for name, old, new in zip(FINGERPRINT_FIELDS, previous, fingerprint) if old != new]
+        logger.debug(f"AI verdict inputs shifted for {fingerprint[0]}: {', '.join(shifted)}")
+        self._notify(fingerprint[0], "bucket_shift", shifted)
+
+    # ==================== LOOKUP ====================
+
+    def _get(self, fingerprint: Fingerprint) -> Optional[CachedVerdict]:
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > self.ttl_seconds:
+            del self._entries[fingerprint]
+            self.stats["expired"] += 1
+            return None
+        return entry
+
+    def _store(self, fingerprint: Fingerprint, result: Dict[str, Any]):
+        self._entries[fingerprint] = CachedVerdict(result=result, stored_at=time.monotonic())
+        self._entries.move_to_end(fingerprint)
+        self.stats["stores"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def get_or_judge(
+        self,
+        symbol: str,
+        signal_data: Dict[str, Any],
+        judge: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Cached verdict for the signal's fingerprint, or judge() on a miss
+
+        Args:
+            symbol: Signal symbol
+            signal_data: build_signal response being judged
+            judge: Zero-arg callable making the LLM call
+
+        Returns:
+            Judge result; cache hits carry "cache": {"hit": True, "ageSeconds": ...}
+        """
+        if not self.enabled:
+            return await judge()
+
+        fingerprint = signal_fingerprint(symbol, signal_data)
+        self._track_shift(fingerprint)
+
+        entry = self._get(fingerprint)
+        if entry is not None:
+            self.stats["hits"] += 1
+            self.stats["tokens_saved"] += (entry.result.get("token_usage") or {}).get("total", 0)
+            return {
+                **entry.result,
+                "cache": {"hit": True, "ageSeconds": round(time.monotonic() - entry.stored_at, 1)},
+            }
+
+        in_flight = self._in_flight.get(fingerprint)
+        if in_flight is not None:
+            self.stats["coalesced"] += 1
+            result = await asyncio.shield(in_flight)
+            self.stats["tokens_saved"] += (result.get("token_usage") or {}).get("total", 0)
+            return {**result, "cache": {"hit": True, "coalesced": True}}
+
+        # The LLM call runs as a task owned by the cache: a caller's timeout
+        # only stops that caller waiting, never the call the others share
+        self.stats["misses"] += 1
+        task = asyncio.ensure_future(judge())
+        self._in_flight[fingerprint] = task
+        self._judging.add(task)
+        task.add_done_callback(lambda done: self._finish(fingerprint, done))
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Owner gave up - later misses start a fresh call, joined waiters keep theirs
+            if self._in_flight.get(fingerprint) is task:
+                del self._in_flight[fingerprint]
+            raise
+        return {**result, "cache": {"hit": False}}
+
+    def _finish(self, fingerprint: Fingerprint, task: asyncio.Future):
+        """Done callback of a judge task: release the in-flight slot, cache a successful verdict"""
+        self._judging.discard(task)
+        if self._in_flight.get(fingerprint) is task:
+            del self._in_flight[fingerprint]
+        if task.cancelled() or task.exception() is not None:
+            return  # exception() also marks it retrieved when nobody waited
+        result = task.result()
+        if result.get("success"):
+            self._store(fingerprint, result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "hit_rate": round(self.stats["hits"] / lookups * 100, 1) if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# Global instance for easy import
+ai_verdict_cache = AIVerdictCache()
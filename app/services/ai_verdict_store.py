@@ -0,0 +1,144 @@
+"""
+AI Verdict Store
+Pending/completed AI verdicts of two-phase signals, keyed by signal ID
+
+In two-phase mode (SignalEngine.build_signal(defer_ai_verdict=True)) the
+deterministic score, reasons and ATR trade plan are returned immediately with
+a provisional rule-based verdict; the OpenAI V2 verdict runs in the
+background and lands here. Callers pick it up via:
+
+- GET /signals/verdict/{signal_id}          (poll, optional ?wait= long-poll)
+- GET /signals/verdict/{signal_id}/stream   (server-sent events)
+
+Entries live in process memory for AI_VERDICT_TTL_SECONDS (capped at
+AI_VERDICT_STORE_MAX), so with several workers the poll must reach the worker
+that produced the signal.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+AI_VERDICT_TTL_SECONDS = float(os.getenv("AI_VERDICT_TTL_SECONDS", "900"))
+AI_VERDICT_STORE_MAX = int(os.getenv("AI_VERDICT_STORE_MAX", "1000"))
+
+
+@dataclass
+class VerdictEntry:
+    """One two-phase signal's verdict state"""
+    signal_id: str
+    symbol: str
+    created_at: float
+    status: str = "pending"  # pending | complete | failed
+    verdict: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    completed_at: Optional[float] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "signalId": self.signal_id,
+            "symbol": self.symbol,
+            "status": self.status,
+            "aiVerdictLayer": self.verdict,
+            "error": self.error,
+            "elapsedMs": round(((self.completed_at or time.monotonic()) - self.created_at) * 1000, 1),
+        }
+
+
+class AIVerdictStore:
+    """In-memory registry of background AI verdict jobs"""
+
+    def __init__(self, ttl_seconds: float = AI_VERDICT_TTL_SECONDS, max_entries: int = AI_VERDICT_STORE_MAX):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, VerdictEntry]" = OrderedDict()
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "evicted": 0}
+
+    def submit(self, symbol: str, job: Awaitable[Dict[str, Any]]) -> str:
+        """
+        Run a verdict job in the background
+
+        Args:
+            symbol: Signal symbol
+            job: Coroutine resolving to the final aiVerdictLayer dict
+
+        Returns:
+            Signal ID to poll/stream the verdict with
+        """
+        self._prune()
+        signal_id = uuid.uuid4().hex
+        entry = VerdictEntry(signal_id=signal_id, symbol=symbol, created_at=time.monotonic())
+        entry.task = asyncio.create_task(job)
+        entry.task.add_done_callback(lambda task, e=entry: self._on_done(e, task))
+        self._entries[signal_id] = entry
+        self.stats["submitted"] += 1
+        return signal_id
+
+    def _on_done(self, entry: VerdictEntry, task: asyncio.Task):
+        entry.completed_at = time.monotonic()
+        if task.cancelled():
+            entry.status, entry.error = "failed", "cancelled"
+        elif task.exception() is not None:
+            entry.status, entry.error = "failed", str(task.exception())
+            logger.error(f"AI verdict for {entry.symbol} ({entry.signal_id}) failed: {task.exception()}")
+        else:
+            entry.status, entry.verdict = "complete", task.result()
+        self.stats["completed" if entry.status == "complete" else "failed"] += 1
+        entry.task = None
+        entry.done.set()
+
+    def _prune(self):
+        """Drop expired entries and the oldest ones beyond max_entries"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            signal_id, entry = next(iter(self._entries.items()))
+            if entry.created_at >= cutoff and len(self._entries) < self.max_entries:
+                break
+            if entry.task is not None:
+                entry.task.cancel()
+            del self._entries[signal_id]
+            self.stats["evicted"] += 1
+
+    def get(self, signal_id: str) -> Optional[Dict[str, Any]]:
+        """Current state of a verdict (None if unknown or expired)"""
+        entry = self._entries.get(signal_id)
+        return entry.to_dict() if entry else None
+
+    async def wait(self, signal_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait up to timeout seconds for a verdict to finish
+
+        Returns:
+            Verdict state (still "pending" on timeout), or None if unknown
+        """
+        entry = self._entries.get(signal_id)
+        if entry is None:
+            return None
+        if timeout > 0 and not entry.done.is_set():
+            try:
+                await asyncio.wait_for(entry.done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        return entry.to_dict()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": sum(1 for entry in self._entries.values() if entry.status == "pending"),
+            "stored": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# Global instance for easy import
+ai_verdict_store = AIVerdictStore()
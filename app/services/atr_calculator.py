@@ -8,6 +8,7 @@ import httpx
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from app.utils.logger import logger
+from app.core.http_clients import http_clients
 
 
 class ATRCalculator:
@@ -21,14 +22,11 @@ class ATRCalculator:
     """
 
     def __init__(self):
-        self._http_client = None
         self.default_period = 14  # Standard ATR period
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client (lazy initialization)"""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
-        return self._http_client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("okx", timeout=30.0)
 
     async def get_ohlc_data(
         self,
@@ -336,9 +334,8 @@ class ATRCalculator:
             return "VERY_HIGH"
 
     async def close(self):
-        """Close HTTP client"""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
 
 
 # Global instance
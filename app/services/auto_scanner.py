@@ -789,7 +789,7 @@ MSS Score: {score}/100
 
     async def _save_signals_to_history(self, signals: List[Dict], signal_type: str):
         """Save signals to signal history database and start performance tracking"""
-        for signal in signals:
+        async def save_one(signal: Dict):
             try:
                 symbol = signal.get("symbol", "UNKNOWN")
 
@@ -836,9 +836,12 @@ MSS Score: {score}/100
             except Exception as e:
                 self.logger.error(f"Error saving signal to history: {str(e)}")
 
+        # Saves run concurrently so they share write-behind flushes
+        await asyncio.gather(*(save_one(signal) for signal in signals))
+
     async def _save_mss_discoveries(self, gems: List[Dict]):
         """Save MSS discoveries to history and start performance tracking"""
-        for gem in gems:
+        async def save_one(gem: Dict):
             try:
                 symbol = gem.get("symbol", "UNKNOWN")
                 mss_score = gem.get("mss_score", 0)
@@ -885,6 +888,9 @@ MSS Score: {score}/100
             except Exception as e:
                 self.logger.error(f"Error saving MSS discovery to history: {str(e)}")
 
+        # Saves run concurrently so they share write-behind flushes
+        await asyncio.gather(*(save_one(gem) for gem in gems))
+
     def _get_action_recommendation(self, score: int, signal_type: str) -> str:
         """Get action recommendation based on score"""
         if signal_type == "accumulation":
@@ -0,0 +1,588 @@
+"""
+Vectorized Backtest Engine
+Replays stored history through the SignalEngine scoring model for every symbol and bar at once
+
+Pipeline (NumPy only, no I/O - BacktestingService drives it):
+1. factor_scores(): the eight SignalEngine factor scores as a (factors × symbols × bars)
+   tensor, using the engine's own thresholds/scores (ScoringRules.from_engine)
+2. total_scores(): weighted sum - the same math as SignalEngine._calculate_weighted_score,
+   so a weight sweep only re-runs one tensordot
+3. signal_directions(): LONG/SHORT/NEUTRAL per bar from the mode thresholds
+4. find_exits(): stop loss / take profit / time exit for every candidate entry,
+   chunked over a forward window of highs and lows
+5. assemble(): one open position per symbol, capital compounding and daily equity
+
+Price momentum replays TechnicalIndicators.calculate_trend_score per bar (MA crossover,
+RSI, MACD, volume confirmation) with the vectorized kernels. The multi-timeframe
+adjustment is not replayed (no historical comprehensive-markets data), which is
+what the live engine does when that data is unavailable.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.utils import indicator_kernels as kernels
+
+
+# Factor order of the score tensor (keys of SignalEngine.WEIGHTS)
+FACTORS = (
+    "funding_rate",
+    "social_sentiment",
+    "price_momentum",
+    "liquidations",
+    "long_short_ratio",
+    "oi_trend",
+    "smart_money",
+    "fear_greed",
+)
+
+LONG, SHORT, NEUTRAL = 1, -1, 0
+
+# Trend score needs 30 bars, MACD 35 (TechnicalIndicators)
+TREND_MIN_BARS = 30
+MACD_MIN_BARS = 35
+
+# Candidate entries processed per find_exits() chunk (bounds the forward-window matrix)
+EXIT_CHUNK_SIZE = 20_000
+
+
+@dataclass
+class ScoringRules:
+    """SignalEngine weights, thresholds and scores as plain data (picklable for worker processes)"""
+
+    weights: Dict[str, float]
+    mode_thresholds: Dict[str, Dict[str, Any]]
+    funding_thresholds: Dict[str, float]
+    funding_scores: Dict[str, float]
+    liquidation_scores: Dict[str, float]
+    long_short_thresholds: Dict[str, float]
+    long_short_scores: Dict[str, float]
+    oi_thresholds: Dict[str, float]
+    oi_scores: Dict[str, float]
+    smart_money_thresholds: Dict[str, float]
+    smart_money_scores: Dict[str, float]
+    mode_aliases: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_engine(cls, engine_cls) -> "ScoringRules":
+        """Read the scoring configuration from the SignalEngine class"""
+        return cls(
+            weights=dict(engine_cls.WEIGHTS),
+            mode_thresholds={name: dict(values) for name, values in engine_cls.MODE_THRESHOLDS.items()},
+            funding_thresholds=dict(engine_cls.FUNDING_RATE_THRESHOLDS),
+            funding_scores=dict(engine_cls.FUNDING_RATE_SCORES),
+            liquidation_scores=dict(engine_cls.LIQUIDATION_SCORES),
+            long_short_thresholds=dict(engine_cls.LONG_SHORT_RATIO_THRESHOLDS),
+            long_short_scores=dict(engine_cls.LONG_SHORT_RATIO_SCORES),
+            oi_thresholds=dict(engine_cls.OI_CHANGE_THRESHOLDS),
+            oi_scores=dict(engine_cls.OI_CHANGE_SCORES),
+            smart_money_thresholds=dict(engine_cls.SMART_MONEY_THRESHOLDS),
+            smart_money_scores=dict(engine_cls.SMART_MONEY_SCORES),
+            mode_aliases=dict(engine_cls.MODE_ALIASES),
+        )
+
+    def weight_vector(self, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Factor weights in FACTORS order, normalized to sum to 100
+
+        Missing factors keep the engine weight, so sweeps can override a subset.
+        """
+        merged = {**self.weights, **(weights or {})}
+        unknown = set(merged) - set(FACTORS)
+        if unknown:
+            raise ValueError(f"Unknown weight factors: {sorted(unknown)}")
+        vector = np.array([float(merged[name]) for name in FACTORS])
+        total = vector.sum()
+        if total <= 0:
+            raise ValueError("Weights must sum to a positive value")
+        return vector * (100.0 / total)
+
+    def mode(self, mode: Optional[str]) -> Dict[str, Any]:
+        name = str(mode or "aggressive").lower().strip()
+        name = self.mode_aliases.get(name, name)
+        return self.mode_thresholds.get(name, self.mode_thresholds["aggressive"])
+
+
+# ==================== TIME HELPERS ====================
+
+def to_ms(value: datetime) -> int:
+    """Epoch ms of a datetime (naive datetimes are UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def from_ms(ms: int) -> datetime:
+    """Naive UTC datetime of epoch ms"""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+
+# ==================== FACTOR SCORES ====================
+
+def _lag(matrix: np.ndarray, bars: int, fill: float = np.nan) -> np.ndarray:
+    out = np.full_like(matrix, fill)
+    if bars < matrix.shape[1]:
+        out[:, bars:] = matrix[:, :-bars]
+    return out
+
+
+def trend_scores(close: np.ndarray, volume: np.ndarray, first_valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TechnicalIndicators.calculate_trend_score for every bar
+
+    Returns:
+        (score, confidence) matrices - confidence is 2 high, 1 medium, 0 low
+    """
+    symbols, bars = close.shape
+    score = np.full(close.shape, 50.0)
+    age = np.arange(bars)[None, :] - first_valid[:, None]  # bars of real history before this one
+
+    # 1. MA crossover (10/20)
+    fast, slow = kernels.sma_series(close, 10), kernels.sma_series(close, 20)
+    fast_prev, slow_prev = _lag(fast, 1), _lag(slow, 1)
+    with np.errstate(invalid="ignore"):
+        score += np.where((fast_prev <= slow_prev) & (fast > slow), 25, 0)
+        score -= np.where((fast_prev >= slow_prev) & (fast < slow), 25, 0)
+
+    # 2. RSI (simple average of the last 14 changes, rounded like calculate_rsi)
+    rsi = np.full(close.shape, np.nan)
+    if bars > 14:
+        rsi[:, 14:] = np.round(kernels.rsi_rolling(np.diff(close, axis=1), 14), 2)
+    with np.errstate(invalid="ignore"):
+        score += np.select(
+            [rsi > 70, (rsi < 30) & (rsi > 0), rsi > 55, (rsi < 45) & (rsi > 0)],
+            [-15, 15, 10, -10],
+            0,
+        )
+
+    # 3. MACD (histogram and line agree)
+    series = kernels.macd(close)
+    macd_line, histogram = series["macd"], series["histogram"]
+    macd_ready = age >= MACD_MIN_BARS - 1
+    with np.errstate(invalid="ignore"):
+        score += np.where(macd_ready & (histogram > 0) & (macd_line > 0), 30, 0)
+        score -= np.where(macd_ready & (histogram < 0) & (macd_line < 0), 30, 0)
+
+    # 4. Volume confirmation (10 bars)
+    avg_volume = kernels.sma_series(volume, 10)
+    volume_up = volume > avg_volume
+    price_up = (close - _lag(close, 9)) > 0
+    volume_score = np.select(
+        [price_up & volume_up, ~price_up & volume_up, price_up & ~volume_up],
+        [25, -25, 5],
+        -5,
+    )
+    score += np.where(np.isnan(avg_volume) | (volume.sum(axis=1, keepdims=True) == 0), 0, volume_score)
+
+    score = np.clip(score, 0, 100)
+    score = np.where(age >= TREND_MIN_BARS - 1, score, 50.0)
+    confidence = np.select(
+        [score >= 70, score >= 60, score > 40, score > 30],
+        [2, 1, 0, 1],
+        2,
+    )
+    return score, confidence
+
+
+def _piecewise(values: np.ndarray, conditions: List[np.ndarray], scores: List[float], default: float) -> np.ndarray:
+    """First matching condition wins (an if/elif chain)"""
+    with np.errstate(invalid="ignore"):
+        return np.select(conditions, scores, default).astype(np.float64)
+
+
+def factor_scores(panel, rules: ScoringRules) -> np.ndarray:
+    """
+    Per-factor scores (0-100) for every symbol and bar
+
+    Returns:
+        (len(FACTORS) × symbols × bars) tensor
+    """
+    d = panel.derivatives
+    shape = panel.close.shape
+    out = np.empty((len(FACTORS),) + shape)
+
+    def series(name: str, default: float) -> np.ndarray:
+        values = d.get(name)
+        return np.full(shape, default) if values is None else np.where(np.isnan(values), default, values)
+
+    # Funding rate (decimal -> %)
+    rate_pct = series("funding_rate", 0.0) * 100
+    ft, fs = rules.funding_thresholds, rules.funding_scores
+    out[0] = _piecewise(rate_pct, [
+        rate_pct < ft["very_negative"],
+        rate_pct < ft["negative"],
+        rate_pct < ft["slightly_negative"],
+        rate_pct < ft["slightly_positive"],
+        rate_pct < ft["moderate_positive"],
+        rate_pct < ft["high_positive"],
+    ], [
+        fs["very_bullish"], fs["bullish"], fs["slightly_bullish"],
+        fs["neutral"], fs["slightly_bearish"], fs["bearish"],
+    ], fs["very_bearish"])
+
+    # Social sentiment (already 0-100)
+    out[1] = series("social_score", 50.0)
+
+    # Price momentum (enhanced trend dict path of _score_price_momentum)
+    trend, confidence = trend_scores(panel.close, panel.volume, panel.first_valid)
+    out[2] = np.select([confidence == 2, confidence == 1], [np.minimum(100, trend * 1.1), trend], trend * 0.9)
+
+    # Premium availability: at least 2 of liquidations, long/short, OI trend, top traders
+    long_liq, short_liq = d.get("long_liquidations"), d.get("short_liquidations")
+    liq_known = ~np.isnan(long_liq) & ~np.isnan(short_liq) if long_liq is not None else np.zeros(shape, bool)
+    oi_change = panel.oi_change_pct if panel.oi_change_pct is not None else np.full(shape, np.nan)
+    premium = (
+        liq_known.astype(int)
+        + ~np.isnan(d.get("long_account_pct", np.full(shape, np.nan)))
+        + ~np.isnan(oi_change)
+        + ~np.isnan(d.get("top_trader_long_pct", np.full(shape, np.nan)))
+    ) >= 2
+
+    # Liquidations (imbalance of trailing 24h long vs short liquidations)
+    total_liq = series("long_liquidations", 0.0) + series("short_liquidations", 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        long_liq_pct = np.where(total_liq > 0, series("long_liquidations", 0.0) / total_liq * 100, 50.0)
+    ls = rules.liquidation_scores
+    out[3] = np.where(
+        premium,
+        np.select([long_liq_pct > 55, long_liq_pct < 45], [ls["long"], ls["short"]], ls["neutral"]),
+        ls["neutral"],
+    )
+
+    # Long/short ratio (contrarian)
+    long_pct = series("long_account_pct", 50.0)
+    lt, lss = rules.long_short_thresholds, rules.long_short_scores
+    out[4] = _piecewise(long_pct, [
+        long_pct > lt["overcrowded_longs"],
+        long_pct > lt["high_longs"],
+        long_pct < lt["oversold_shorts"],
+        long_pct < lt["low_longs"],
+    ], [lss["very_bearish"], lss["bearish"], lss["very_bullish"], lss["bullish"]], lss["neutral"])
+
+    # OI trend (24h change %)
+    oi_pct = np.where(np.isnan(oi_change), 0.0, oi_change)
+    ot, os_ = rules.oi_thresholds, rules.oi_scores
+    out[5] = _piecewise(oi_pct, [
+        oi_pct > ot["strong_increase"],
+        oi_pct > ot["increase"],
+        oi_pct < ot["strong_decrease"],
+        oi_pct < ot["decrease"],
+    ], [os_["strong_increase"], os_["increase"], os_["strong_decrease"], os_["decrease"]], os_["neutral"])
+
+    # Smart money (top trader long %)
+    top_pct = series("top_trader_long_pct", 50.0)
+    st, ss = rules.smart_money_thresholds, rules.smart_money_scores
+    out[6] = _piecewise(top_pct, [
+        top_pct > st["high_long"],
+        top_pct > st["moderate_long"],
+        top_pct < st["low_long"],
+        top_pct < st["moderate_short"],
+    ], [ss["bullish"], ss["slightly_bullish"], ss["bearish"], ss["slightly_bearish"]], ss["neutral"])
+
+    # Fear & Greed (market-wide, already 0-100)
+    fear_greed = panel.fear_greed if panel.fear_greed is not None else np.full(shape[1], np.nan)
+    out[7] = np.broadcast_to(np.where(np.isnan(fear_greed), 50.0, fear_greed), shape)
+
+    return out
+
+
+def total_scores(factors: np.ndarray, weight_vector: np.ndarray) -> np.ndarray:
+    """Weighted total score (symbols × bars) - sum(score * weight / 100)"""
+    return np.tensordot(weight_vector, factors, axes=1) / 100.0
+
+
+def signal_directions(
+    scores: np.ndarray,
+    rules: ScoringRules,
+    mode: Optional[str],
+    min_signal_score: float,
+    tradable: np.ndarray,
+) -> np.ndarray:
+    """
+    LONG (1) / SHORT (-1) / NEUTRAL (0) per bar
+
+    min_signal_score filters both sides symmetrically: LONG needs
+    score >= min_signal_score, SHORT needs score <= 100 - min_signal_score.
+    """
+    thresholds = rules.mode(mode)
+    long_mask = (scores >= thresholds["long_min"]) & (scores >= min_signal_score)
+    short_mask = (scores <= thresholds["short_max"]) & (scores <= 100 - min_signal_score)
+    directions = np.where(long_mask, LONG, np.where(short_mask, SHORT, NEUTRAL)).astype(np.int8)
+    return np.where(tradable, directions, NEUTRAL).astype(np.int8)
+
+
+# ==================== EXITS ====================
+
+EXIT_REASONS = np.array(["STOP_LOSS", "TAKE_PROFIT", "TIME_EXIT", "BACKTEST_END"])
+
+
+def find_exits(
+    panel,
+    sym: np.ndarray,
+    bar: np.ndarray,
+    direction: np.ndarray,
+    stop_loss: float,
+    take_profit: float,
+    max_hold_bars: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exit bar, price and reason code for candidate entries at the close of bar
+
+    Stops are checked on each following bar's high/low; when stop loss and take
+    profit are both touched in the same bar the stop loss is assumed first.
+
+    Returns:
+        (exit_bar, exit_price, reason) arrays - reason indexes EXIT_REASONS
+    """
+    bars = panel.close.shape[1]
+    exit_bar = np.empty(len(sym), dtype=np.int64)
+    exit_price = np.empty(len(sym))
+    reason = np.empty(len(sym), dtype=np.int8)
+    offsets = np.arange(1, max_hold_bars + 1)
+
+    for start in range(0, len(sym), EXIT_CHUNK_SIZE):
+        s = sym[start:start + EXIT_CHUNK_SIZE]
+        b = bar[start:start + EXIT_CHUNK_SIZE]
+        long_side = direction[start:start + EXIT_CHUNK_SIZE] == LONG
+        entry = panel.close[s, b]
+
+        window = b[:, None] + offsets[None, :]
+        inside = window < bars
+        window = np.minimum(window, bars - 1)
+        highs = panel.high[s[:, None], window]
+        lows = panel.low[s[:, None], window]
+
+        stop_level = np.where(long_side, entry * (1 - stop_loss), entry * (1 + stop_loss))
+        target_level = np.where(long_side, entry * (1 + take_profit), entry * (1 - take_profit))
+        stop_hit = inside & np.where(long_side[:, None], lows <= stop_level[:, None], highs >= stop_level[:, None])
+        target_hit = inside & np.where(long_side[:, None], highs >= target_level[:, None], lows <= target_level[:, None])
+
+        no_hit = max_hold_bars + 1
+        first_stop = np.where(stop_hit.any(axis=1), stop_hit.argmax(axis=1), no_hit)
+        first_target = np.where(target_hit.any(axis=1), target_hit.argmax(axis=1), no_hit)
+
+        last_bar = np.minimum(b + max_hold_bars, bars - 1)
+        chunk_reason = np.where(b + max_hold_bars <= bars - 1, 2, 3)
+        chunk_bar = last_bar.copy()
+        chunk_price = panel.close[s, last_bar]
+
+        stopped = (first_stop < no_hit) & (first_stop <= first_target)
+        targeted = (first_target < no_hit) & ~stopped
+        chunk_bar = np.where(stopped, b + 1 + first_stop, np.where(targeted, b + 1 + first_target, chunk_bar))
+        chunk_price = np.where(stopped, stop_level, np.where(targeted, target_level, chunk_price))
+        chunk_reason = np.where(stopped, 0, np.where(targeted, 1, chunk_reason))
+
+        exit_bar[start:start + len(s)] = chunk_bar
+        exit_price[start:start + len(s)] = chunk_price
+        reason[start:start + len(s)] = chunk_reason
+
+    return exit_bar, exit_price, reason
+
+
+# ==================== TIMELINE ====================
+
+@dataclass
+class TimeframeTimeline:
+    """Factor scores of one timeframe panel, computed once and reused across weight sweeps"""
+
+    panel: Any
+    interval_ms: int
+    factors: np.ndarray
+    tradable: np.ndarray  # (symbols × bars) inside the backtest window with warm indicators
+
+    @classmethod
+    def build(cls, panel, rules: ScoringRules, interval_ms: int, start_ms: int, end_ms: int) -> "TimeframeTimeline":
+        bars = panel.close.shape[1]
+        age = np.arange(bars)[None, :] - panel.first_valid[:, None]
+        in_window = (panel.timestamps >= start_ms) & (panel.timestamps <= end_ms)
+        # The last bar has no following bar to trade on
+        in_window[-1:] = False
+        tradable = in_window[None, :] & (age >= 0)
+        return cls(panel, interval_ms, factor_scores(panel, rules), tradable)
+
+    def candidates(
+        self,
+        weight_vector: np.ndarray,
+        rules: ScoringRules,
+        mode: Optional[str],
+        min_signal_score: float,
+        stop_loss: float,
+        take_profit: float,
+        max_hold_ms: int,
+    ) -> Dict[str, np.ndarray]:
+        """Every signal bar with its exit (before one-position-per-symbol filtering)"""
+        scores = total_scores(self.factors, weight_vector)
+        directions = signal_directions(scores, rules, mode, min_signal_score, self.tradable)
+        sym, bar = np.nonzero(directions)
+        max_hold_bars = max(1, int(max_hold_ms // self.interval_ms))
+        exit_bar, exit_price, reason = find_exits(
+            self.panel, sym, bar, directions[sym, bar], stop_loss, take_profit, max_hold_bars
+        )
+        timestamps = self.panel.timestamps
+        return {
+            "sym": sym,
+            "bar": bar,
+            "direction": directions[sym, bar],
+            "score": scores[sym, bar],
+            "entry_ms": timestamps[bar] + self.interval_ms,  # filled at the signal bar close
+            "entry_price": self.panel.close[sym, bar],
+            "exit_ms": timestamps[exit_bar] + self.interval_ms,
+            "exit_price": exit_price,
+            "reason": reason,
+        }
+
+
+def select_trades(candidates: List[Tuple[str, Dict[str, np.ndarray]]], symbols: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Merge candidates of all timeframes and keep one open position per symbol
+
+    A candidate is taken when its entry is at or after the previous trade's exit.
+    """
+    merged = {key: [] for key in ("sym", "direction", "score", "entry_ms", "entry_price",
+                                  "exit_ms", "exit_price", "reason", "timeframe")}
+    for timeframe, cand in candidates:
+        for key in merged:
+            if key == "timeframe":
+                merged[key].append(np.full(len(cand["sym"]), timeframe, dtype=object))
+            else:
+                merged[key].append(cand[key])
+    merged = {key: np.concatenate(values) if values else np.empty(0) for key, values in merged.items()}
+    if not len(merged["sym"]):
+        return merged
+
+    order = np.lexsort((merged["entry_ms"], merged["sym"]))
+    merged = {key: values[order] for key, values in merged.items()}
+
+    keep = []
+    sym, entry_ms, exit_ms = merged["sym"], merged["entry_ms"], merged["exit_ms"]
+    boundaries = np.flatnonzero(np.diff(sym)) + 1
+    for lo, hi in zip(np.r_[0, boundaries], np.r_[boundaries, len(sym)]):
+        i = lo
+        while i < hi:
+            keep.append(i)
+            # Jump to the first candidate entering after this trade's exit
+            i = lo + int(np.searchsorted(entry_ms[lo:hi], exit_ms[i], side="left"))
+            if i <= keep[-1]:
+                i = keep[-1] + 1
+
+    keep = np.array(keep, dtype=np.int64)
+    return {key: values[keep] for key, values in merged.items()}
+
+
+def assemble(
+    trades: Dict[str, np.ndarray],
+    timelines: Dict[str, TimeframeTimeline],
+    symbols: Sequence[str],
+    config,
+) -> Dict[str, Any]:
+    """
+    Capital compounding in exit order plus a daily mark-to-market equity curve
+
+    PnL of a trade is position_size × capital-at-exit × net return, with
+    commission and slippage charged on entry and exit (BacktestingService rules).
+    """
+    position_size = min(config.max_position_size, 0.25)  # Max 25% per trade
+    costs = 2 * config.commission_rate + 2 * config.slippage
+
+    n = len(trades.get("sym", []))
+    if n:
+        direction = trades["direction"].astype(np.float64)
+        price_return = direction * (trades["exit_price"] - trades["entry_price"]) / trades["entry_price"]
+        net_return = price_return - costs
+
+        order = np.argsort(trades["exit_ms"], kind="stable")
+        growth = 1.0 + position_size * net_return[order]
+        capital_after = config.initial_capital * np.cumprod(growth)
+        capital_before = np.empty(n)
+        capital_before[order] = np.r_[config.initial_capital, capital_after[:-1]]
+        exits_sorted = trades["exit_ms"][order]
+        final_capital = float(capital_after[-1])
+    else:
+        price_return = net_return = capital_before = np.empty(0)
+        capital_after = exits_sorted = np.empty(0)
+        final_capital = float(config.initial_capital)
+
+    trade_dicts = []
+    for i in range(n):
+        base = capital_before[i] * position_size
+        trade_dicts.append({
+            "symbol": symbols[int(trades["sym"][i])],
+            "timeframe": trades["timeframe"][i],
+            "entry_time": from_ms(int(trades["entry_ms"][i])),
+            "exit_time": from_ms(int(trades["exit_ms"][i])),
+            "entry_price": float(trades["entry_price"][i]),
+            "exit_price": float(trades["exit_price"][i]),
+            "position_size": position_size,
+            "signal_type": "LONG" if trades["direction"][i] == LONG else "SHORT",
+            "signal_score": round(float(trades["score"][i]), 2),
+            "pnl": float(base * net_return[i]),
+            "pnl_percentage": float(net_return[i]),
+            "exit_reason": str(EXIT_REASONS[trades["reason"][i]]),
+            "commission": float(base * config.commission_rate * 2),
+            "slippage": float(base * config.slippage * 2),
+        })
+
+    # Daily equity: realized capital + open positions marked at the day's last close
+    start_ms, end_ms = to_ms(config.start_date), to_ms(config.end_date)
+    days = np.arange(start_ms, end_ms + 1, 86_400_000, dtype=np.int64)
+    marks = days + 86_400_000 - 1
+    realized_idx = np.searchsorted(exits_sorted, marks, side="right")
+    cash = np.where(realized_idx > 0, capital_after[np.maximum(realized_idx - 1, 0)], config.initial_capital) \
+        if n else np.full(len(days), float(config.initial_capital))
+
+    unrealized = np.zeros(len(days))
+    open_count = np.zeros(len(days), dtype=np.int64)
+    for timeframe, timeline in timelines.items():
+        mask = trades["timeframe"] == timeframe if n else np.zeros(0, bool)
+        if not mask.any():
+            continue
+        idx = np.flatnonzero(mask)
+        is_open = (trades["entry_ms"][idx, None] <= marks[None, :]) & (trades["exit_ms"][idx, None] > marks[None, :])
+        close_times = timeline.panel.timestamps + timeline.interval_ms
+        mark_bar = np.clip(np.searchsorted(close_times, marks, side="right") - 1, 0, None)
+        prices = timeline.panel.close[trades["sym"][idx, None], mark_bar[None, :]]
+        ret = trades["direction"][idx, None] * (prices - trades["entry_price"][idx, None]) / trades["entry_price"][idx, None]
+        unrealized += np.where(is_open, position_size * cash[None, :] * ret, 0.0).sum(axis=0)
+        open_count += is_open.sum(axis=0)
+
+    equity_curve = [
+        {
+            "date": from_ms(int(day)).isoformat(),
+            "portfolio_value": float(cash[i] + unrealized[i]),
+            "cash": float(cash[i]),
+            "positions_value": float(unrealized[i]),
+            "num_positions": int(open_count[i]),
+        }
+        for i, day in enumerate(days)
+    ]
+
+    return {"trades": trade_dicts, "equity_curve": equity_curve, "final_capital": final_capital}
+
+
+def simulate(
+    timelines: Dict[str, TimeframeTimeline],
+    symbols: Sequence[str],
+    rules: ScoringRules,
+    config,
+    weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """Run one backtest over prepared timelines (all timeframes share the symbol order)"""
+    weight_vector = rules.weight_vector(weights)
+    max_hold_ms = int(getattr(config, "max_holding_days", 7) * 86_400_000)
+    candidates = [
+        (timeframe, timeline.candidates(
+            weight_vector, rules, getattr(config, "mode", None), config.min_signal_score,
+            config.stop_loss, config.take_profit, max_hold_ms,
+        ))
+        for timeframe, timeline in timelines.items()
+    ]
+    trades = select_trades(candidates, symbols)
+    result = assemble(trades, timelines, symbols, config)
+    result["signals_evaluated"] = int(sum(t.tradable.sum() for t in timelines.values()))
+    result["candidate_signals"] = int(sum(len(c["sym"]) for _, c in candidates))
+    result["weights"] = dict(zip(FACTORS, np.round(weight_vector, 4).tolist()))
+    return result
@@ -1,17 +1,30 @@
 """
 Backtesting Framework for CryptoSatX
 Historical validation system untuk trading signals
+
+Backtests replay real history from the local store (app/storage/backtest_store.py)
+through the SignalEngine scoring model - see app/services/backtest_engine.py.
+Nothing is fetched during a run; populate the store first (tools/backtest_benchmark.py
+can generate a synthetic store for benchmarking).
 """
 import asyncio
-import json
-import pandas as pd
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Any, Union
+from datetime import datetime
 from pydantic import BaseModel, Field
 from dataclasses import dataclass
+from app.core.signal_engine import SignalEngine
+from app.services.backtest_engine import ScoringRules, TimeframeTimeline, simulate, to_ms
+from app.services.indicator_state import TIMEFRAME_MS
+from app.storage.backtest_store import HistoricalDataStore
 from app.utils.logger import default_logger
 
+# Bars loaded before start_date so indicators are warm on the first backtest bar
+WARMUP_BARS = 60
+
 
 @dataclass
 class BacktestConfig:
@@ -26,7 +39,10 @@ class BacktestConfig:
     max_position_size: float = 1.0  # 100% of capital
     stop_loss: float = 0.02  # 2%
     take_profit: float = 0.05  # 5%
-    min_signal_score: float = 60.0
+    min_signal_score: float = 60.0  # LONG >= this, SHORT <= 100 - this
+    mode: str = "aggressive"  # SignalEngine mode thresholds
+    max_holding_days: float = 7.0
+    store_path: Optional[str] = None  # Historical store (default BACKTEST_STORE_PATH)
 
 
 class BacktestResult(BaseModel):
@@ -40,27 +56,11 @@ class BacktestResult(BaseModel):
     generated_at: datetime = Field(default_factory=datetime.now)
 
 
-class Trade(BaseModel):
-    """Model untuk individual trade"""
-    symbol: str
-    entry_time: datetime
-    exit_time: Optional[datetime]
-    entry_price: float
-    exit_price: Optional[float]
-    position_size: float
-    signal_type: str  # LONG/SHORT
-    signal_score: float
-    pnl: Optional[float] = 0.0
-    pnl_percentage: Optional[float] = 0.0
-    exit_reason: str = ""
-    commission: float = 0.0
-    slippage: float = 0.0
-
-
 class BacktestingService:
     """
     Comprehensive backtesting framework dengan:
-    - Historical data simulation
+    - Historical data replay (offline store, vectorized timeline)
+    - Weight sweeps across a process pool
     - Performance analytics
     - Risk metrics calculation
     - Strategy comparison
@@ -68,8 +68,9 @@ class BacktestingService:
     
     def __init__(self):
         self.logger = default_logger
-        self.historical_data = {}  # Cache untuk historical data
         self.backtest_results = []  # Store backtest results
+        self.rules = ScoringRules.from_engine(SignalEngine)
+        self.max_workers = int(os.getenv("BACKTEST_MAX_WORKERS", str(os.cpu_count() or 2)))
         
         # Default timeframes
         self.default_timeframes = ["1h", "4h", "1d"]
@@ -89,419 +90,125 @@ class BacktestingService:
         """
         Run comprehensive backtest dengan given configuration
         
+        Replays the local historical store through the SignalEngine scoring
+        model (vectorized over symbols and bars). Runs fully offline.
+        
         Args:
             config: Backtest configuration
             weight_config: Custom weight configuration untuk testing
+                           (SignalEngine.WEIGHTS keys, normalized to 100)
             
         Returns:
             BacktestResult dengan comprehensive analysis
         """
         try:
             self.logger.info(f"Starting backtest: {config.start_date} to {config.end_date}")
+            started = time.perf_counter()
             
-            # Initialize results
-            trades = []
-            equity_curve = []
-            current_capital = config.initial_capital
-            current_positions = {}
-            
-            # Generate historical signals
-            historical_signals = await self._generate_historical_signals(
-                config, weight_config
+            timelines, symbols = await asyncio.to_thread(
+                prepare_timelines, config, self.rules, self.default_timeframes
             )
+            raw = await asyncio.to_thread(simulate, timelines, symbols, self.rules, config, weight_config)
+            raw["elapsed_seconds"] = round(time.perf_counter() - started, 3)
             
-            # Process each time period
-            current_date = config.start_date
-            while current_date <= config.end_date:
-                # Get signals for current period
-                period_signals = [
-                    signal for signal in historical_signals
-                    if signal["timestamp"].date() == current_date.date()
-                ]
-                
-                # Process existing positions
-                current_capital, current_positions = await self._process_positions(
-                    current_positions, current_date, current_capital, config
-                )
-                
-                # Process new signals
-                new_trades, updated_positions = await self._process_signals(
-                    period_signals, current_positions, current_capital, config
-                )
-                
-                trades.extend(new_trades)
-                current_positions.update(updated_positions)
-                
-                # Record equity curve
-                portfolio_value = await self._calculate_portfolio_value(
-                    current_positions, current_capital, current_date
-                )
-                
-                equity_curve.append({
-                    "date": current_date.isoformat(),
-                    "portfolio_value": portfolio_value,
-                    "cash": current_capital,
-                    "positions_value": portfolio_value - current_capital,
-                    "num_positions": len(current_positions)
-                })
-                
-                current_date += timedelta(days=1)
-            
-            # Close remaining positions at end
-            final_trades, final_capital = await self._close_all_positions(
-                current_positions, current_date, current_capital, config
-            )
-            trades.extend(final_trades)
-            
-            # Calculate performance metrics
-            performance_metrics = await self._calculate_performance_metrics(
-                equity_curve, trades, config
-            )
-            
-            # Calculate risk metrics
-            risk_metrics = await self._calculate_risk_metrics(
-                equity_curve, trades, config
-            )
-            
-            # Create result
-            result = BacktestResult(
-                config=config.__dict__,
-                performance={
-                    "total_return": (final_capital - config.initial_capital) / config.initial_capital,
-                    "final_capital": final_capital,
-                    "total_trades": len(trades),
-                    "winning_trades": len([t for t in trades if t.get("pnl", 0) > 0]),
-                    "losing_trades": len([t for t in trades if t.get("pnl", 0) < 0])
-                },
-                trades=trades,
-                equity_curve=equity_curve,
-                metrics=performance_metrics,
-                risk_metrics=risk_metrics
+            result = await self._build_result(config, raw)
+            self.logger.info(
+                f"Backtest completed: {len(result.trades)} trades, "
+                f"{result.performance['total_return']:.2%} return in {raw['elapsed_seconds']}s"
             )
-            
-            # Store result
-            self.backtest_results.append(result)
-            
-            self.logger.info(f"Backtest completed: {len(trades)} trades, {result.performance['total_return']:.2%} return")
             return result
             
         except Exception as e:
             self.logger.error(f"Error running backtest: {e}")
             raise
     
-    async def _generate_historical_signals(
-        self, 
+    async def sweep_weights(
+        self,
         config: BacktestConfig,
-        weight_config: Optional[Dict[str, float]] = None
-    ) -> List[Dict[str, Any]]:
-        """Generate historical signals untuk backtesting"""
-        try:
-            # Simulate historical signal generation
-            signals = []
-            
-            # For each symbol and timeframe
-            for symbol in config.symbols or ["BTCUSDT", "ETHUSDT"]:
-                for timeframe in config.timeframes or self.default_timeframes:
-                    # Generate daily signals
-                    current_date = config.start_date
-                    while current_date <= config.end_date:
-                        # Simulate signal generation based on historical patterns
-                        signal = await self._simulate_historical_signal(
-                            symbol, timeframe, current_date, weight_config
-                        )
-                        
-                        if signal and signal["score"] >= config.min_signal_score:
-                            signals.append(signal)
-                        
-                        current_date += timedelta(days=1)
-            
-            return signals
+        weight_configs: Union[Dict[str, Dict[str, float]], List[Dict[str, float]]],
+        max_workers: Optional[int] = None
+    ) -> List[BacktestResult]:
+        """
+        Backtest several weight configurations across a process pool
+        
+        Each worker loads the store and computes factor scores once, then
+        every weight configuration only re-weights the factor tensor and
+        re-runs the trade simulation.
+        
+        Args:
+            config: Backtest configuration shared by all runs
+            weight_configs: {name: weights} or a list of weights
+            max_workers: Worker processes (default BACKTEST_MAX_WORKERS / CPU count)
             
-        except Exception as e:
-            self.logger.error(f"Error generating historical signals: {e}")
+        Returns:
+            One BacktestResult per weight configuration, in input order
+        """
+        if not isinstance(weight_configs, dict):
+            weight_configs = {f"Strategy_{i+1}": weights for i, weights in enumerate(weight_configs)}
+        if not weight_configs:
             return []
+        
+        workers = min(max_workers or self.max_workers, len(weight_configs))
+        started = time.perf_counter()
+        self.logger.info(f"Starting weight sweep: {len(weight_configs)} configurations on {workers} workers")
+        
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_sweep_worker,
+            initargs=(config, self.rules, self.default_timeframes),
+        ) as pool:
+            raws = await asyncio.gather(*[
+                loop.run_in_executor(pool, _run_sweep_task, weights)
+                for weights in weight_configs.values()
+            ])
+        
+        results = []
+        for name, raw in zip(weight_configs, raws):
+            results.append(await self._build_result(config, raw, strategy=name))
+        
+        self.logger.info(
+            f"Weight sweep completed: {len(results)} configurations in {time.perf_counter() - started:.2f}s"
+        )
+        return results
     
-    async def _simulate_historical_signal(
-        self,
-        symbol: str,
-        timeframe: str,
-        date: datetime,
-        weight_config: Optional[Dict[str, float]] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Simulate historical signal generation"""
-        try:
-            # This would normally fetch real historical data
-            # For now, we'll simulate based on patterns
-            
-            # Simulate market conditions
-            np.random.seed(hash(f"{symbol}_{timeframe}_{date}") % 2**32)
-            
-            # Generate random market factors
-            liquidations = np.random.exponential(0.1)
-            funding_rate = np.random.normal(0, 0.01)
-            price_momentum = np.random.normal(0, 0.02)
-            long_short_ratio = np.random.uniform(0.3, 0.7)
-            smart_money = np.random.exponential(0.05)
-            oi_trend = np.random.normal(0, 0.01)
-            social_sentiment = np.random.uniform(-1, 1)
-            fear_greed = np.random.uniform(0, 100)
-            
-            # Use provided weights or defaults
-            if weight_config is None:
-                weight_config = {
-                    "liquidations": 0.15,
-                    "funding_rate": 0.12,
-                    "price_momentum": 0.18,
-                    "long_short_ratio": 0.10,
-                    "smart_money": 0.15,
-                    "oi_trend": 0.12,
-                    "social_sentiment": 0.10,
-                    "fear_greed": 0.08
-                }
-            
-            # Calculate score
-            score = (
-                liquidations * weight_config["liquidations"] * 100 +
-                abs(funding_rate) * weight_config["funding_rate"] * 100 +
-                abs(price_momentum) * weight_config["price_momentum"] * 100 +
-                abs(0.5 - long_short_ratio) * weight_config["long_short_ratio"] * 100 +
-                smart_money * weight_config["smart_money"] * 100 +
-                abs(oi_trend) * weight_config["oi_trend"] * 100 +
-                abs(social_sentiment) * weight_config["social_sentiment"] * 50 +
-                (50 - abs(50 - fear_greed)) * weight_config["fear_greed"]
-            )
-            
-            # Determine signal type
-            if score > 70:
-                signal_type = "LONG" if price_momentum > 0 else "SHORT"
-            elif score > 60:
-                signal_type = "LONG" if long_short_ratio < 0.4 else "SHORT"
-            else:
-                signal_type = "NEUTRAL"
-            
-            return {
-                "symbol": symbol,
-                "timeframe": timeframe,
-                "timestamp": date,
-                "signal_type": signal_type,
-                "score": score,
-                "confidence": "HIGH" if score > 80 else "MEDIUM" if score > 70 else "LOW",
-                "factors": {
-                    "liquidations": liquidations,
-                    "funding_rate": funding_rate,
-                    "price_momentum": price_momentum,
-                    "long_short_ratio": long_short_ratio,
-                    "smart_money": smart_money,
-                    "oi_trend": oi_trend,
-                    "social_sentiment": social_sentiment,
-                    "fear_greed": fear_greed
-                },
-                "price": np.random.uniform(20000, 70000) if "BTC" in symbol else np.random.uniform(1000, 4000)
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error simulating historical signal: {e}")
-            return None
-    
-    async def _process_positions(
-        self,
-        positions: Dict[str, Trade],
-        current_date: datetime,
-        current_capital: float,
-        config: BacktestConfig
-    ) -> Tuple[float, Dict[str, Trade]]:
-        """Process existing positions untuk exit conditions"""
-        try:
-            updated_positions = {}
-            
-            for symbol, trade in positions.items():
-                # Simulate price movement
-                price_change = np.random.normal(0, 0.02)  # 2% daily volatility
-                current_price = trade.entry_price * (1 + price_change)
-                
-                # Check exit conditions
-                should_exit = False
-                exit_reason = ""
-                
-                # Stop loss
-                if trade.signal_type == "LONG":
-                    if current_price <= trade.entry_price * (1 - config.stop_loss):
-                        should_exit = True
-                        exit_reason = "STOP_LOSS"
-                else:  # SHORT
-                    if current_price >= trade.entry_price * (1 + config.stop_loss):
-                        should_exit = True
-                        exit_reason = "STOP_LOSS"
-                
-                # Take profit
-                if trade.signal_type == "LONG":
-                    if current_price >= trade.entry_price * (1 + config.take_profit):
-                        should_exit = True
-                        exit_reason = "TAKE_PROFIT"
-                else:  # SHORT
-                    if current_price <= trade.entry_price * (1 - config.take_profit):
-                        should_exit = True
-                        exit_reason = "TAKE_PROFIT"
-                
-                # Time-based exit (hold max 7 days)
-                if (current_date - trade.entry_time).days >= 7:
-                    should_exit = True
-                    exit_reason = "TIME_EXIT"
-                
-                if should_exit:
-                    # Close position
-                    trade.exit_time = current_date
-                    trade.exit_price = current_price
-                    trade.exit_reason = exit_reason
-                    
-                    # Calculate PnL
-                    if trade.signal_type == "LONG":
-                        price_return = (current_price - trade.entry_price) / trade.entry_price
-                    else:  # SHORT
-                        price_return = (trade.entry_price - current_price) / trade.entry_price
-                    
-                    # Apply commission and slippage
-                    gross_pnl = trade.position_size * current_capital * price_return
-                    commission = trade.position_size * current_capital * config.commission_rate * 2  # Entry + exit
-                    slippage = trade.position_size * current_capital * config.slippage * 2
-                    
-                    trade.pnl = gross_pnl - commission - slippage
-                    trade.pnl_percentage = price_return - (config.commission_rate * 2) - (config.slippage * 2)
-                    trade.commission = commission
-                    trade.slippage = slippage
-                    
-                    current_capital += trade.pnl
-                else:
-                    # Keep position open
-                    updated_positions[symbol] = trade
-            
-            return current_capital, updated_positions
-            
-        except Exception as e:
-            self.logger.error(f"Error processing positions: {e}")
-            return current_capital, positions
-    
-    async def _process_signals(
-        self,
-        signals: List[Dict[str, Any]],
-        positions: Dict[str, Trade],
-        current_capital: float,
-        config: BacktestConfig
-    ) -> Tuple[List[Trade], Dict[str, Trade]]:
-        """Process new signals untuk entry"""
-        try:
-            new_trades = []
-            updated_positions = positions.copy()
-            
-            for signal in signals:
-                # Skip if we already have position in this symbol
-                if signal["symbol"] in positions:
-                    continue
-                
-                # Skip neutral signals
-                if signal["signal_type"] == "NEUTRAL":
-                    continue
-                
-                # Calculate position size
-                position_size = min(config.max_position_size, 0.25)  # Max 25% per trade
-                
-                # Create new trade
-                trade = Trade(
-                    symbol=signal["symbol"],
-                    entry_time=signal["timestamp"],
-                    exit_time=None,
-                    entry_price=signal["price"],
-                    exit_price=None,
-                    position_size=position_size,
-                    signal_type=signal["signal_type"],
-                    signal_score=signal["score"],
-                    pnl=0.0,
-                    pnl_percentage=0.0,
-                    exit_reason="",
-                    commission=position_size * current_capital * config.commission_rate,
-                    slippage=position_size * current_capital * config.slippage
-                )
-                
-                new_trades.append(trade)
-                updated_positions[signal["symbol"]] = trade
-            
-            return new_trades, updated_positions
-            
-        except Exception as e:
-            self.logger.error(f"Error processing signals: {e}")
-            return [], positions
-    
-    async def _close_all_positions(
-        self,
-        positions: Dict[str, Trade],
-        current_date: datetime,
-        current_capital: float,
-        config: BacktestConfig
-    ) -> Tuple[List[Trade], float]:
-        """Close all positions at end of backtest"""
-        try:
-            closing_trades = []
-            
-            for symbol, trade in positions.items():
-                # Simulate final price
-                price_change = np.random.normal(0, 0.01)
-                final_price = trade.entry_price * (1 + price_change)
-                
-                trade.exit_time = current_date
-                trade.exit_price = final_price
-                trade.exit_reason = "BACKTEST_END"
-                
-                # Calculate final PnL
-                if trade.signal_type == "LONG":
-                    price_return = (final_price - trade.entry_price) / trade.entry_price
-                else:  # SHORT
-                    price_return = (trade.entry_price - final_price) / trade.entry_price
-                
-                gross_pnl = trade.position_size * current_capital * price_return
-                commission = trade.position_size * current_capital * config.commission_rate * 2
-                slippage = trade.position_size * current_capital * config.slippage * 2
-                
-                trade.pnl = gross_pnl - commission - slippage
-                trade.pnl_percentage = price_return - (config.commission_rate * 2) - (config.slippage * 2)
-                trade.commission = commission
-                trade.slippage = slippage
-                
-                current_capital += trade.pnl
-                closing_trades.append(trade)
-            
-            return closing_trades, current_capital
-            
-        except Exception as e:
-            self.logger.error(f"Error closing positions: {e}")
-            return [], current_capital
-    
-    async def _calculate_portfolio_value(
+    async def _build_result(
         self,
-        positions: Dict[str, Trade],
-        current_capital: float,
-        current_date: datetime
-    ) -> float:
-        """Calculate total portfolio value"""
-        try:
-            positions_value = 0.0
-            
-            for trade in positions.values():
-                # Simulate current price
-                price_change = np.random.normal(0, 0.01)
-                current_price = trade.entry_price * (1 + price_change)
-                
-                if trade.signal_type == "LONG":
-                    position_value = trade.position_size * current_capital * (current_price / trade.entry_price)
-                else:  # SHORT
-                    position_value = trade.position_size * current_capital * (2 - current_price / trade.entry_price)
-                
-                positions_value += position_value
-            
-            return current_capital + positions_value
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating portfolio value: {e}")
-            return current_capital
+        config: BacktestConfig,
+        raw: Dict[str, Any],
+        strategy: Optional[str] = None
+    ) -> BacktestResult:
+        """Wrap an engine run into a BacktestResult and store it"""
+        trades = raw["trades"]
+        equity_curve = raw["equity_curve"]
+        final_capital = raw["final_capital"]
+        
+        performance_metrics = await self._calculate_performance_metrics(equity_curve, trades, config)
+        risk_metrics = await self._calculate_risk_metrics(equity_curve, trades, config)
+        
+        result = BacktestResult(
+            config={
+                **config.__dict__,
+                "strategy": strategy,
+                "weights": raw["weights"],
+            },
+            performance={
+                "total_return": (final_capital - config.initial_capital) / config.initial_capital,
+                "final_capital": final_capital,
+                "total_trades": len(trades),
+                "winning_trades": len([t for t in trades if t.get("pnl", 0) > 0]),
+                "losing_trades": len([t for t in trades if t.get("pnl", 0) < 0]),
+                "signals_evaluated": raw["signals_evaluated"],
+                "candidate_signals": raw["candidate_signals"],
+            },
+            trades=trades,
+            equity_curve=equity_curve,
+            metrics=performance_metrics,
+            risk_metrics=risk_metrics
+        )
+        
+        self.backtest_results.append(result)
+        return result
     
     async def _calculate_performance_metrics(
         self,
@@ -650,8 +357,8 @@ class BacktestingService:
                 "avg_holding_period": avg_holding_period,
                 "position_size_std": position_size_std,
                 "volatility": np.std(daily_returns) if daily_returns else 0,
-                "skewness": float(pd.Series(daily_returns).skew()) if daily_returns else 0,
-                "kurtosis": float(pd.Series(daily_returns).kurtosis()) if daily_returns else 0
+                "skewness": _skewness(daily_returns),
+                "kurtosis": _kurtosis(daily_returns)
             }
             
         except Exception as e:
@@ -660,10 +367,24 @@ class BacktestingService:
     
     async def compare_strategies(
         self,
-        backtest_results: List[BacktestResult]
+        backtest_results: Optional[List[BacktestResult]] = None,
+        config: Optional[BacktestConfig] = None,
+        weight_configs: Optional[Union[Dict[str, Dict[str, float]], List[Dict[str, float]]]] = None,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Compare multiple backtest results"""
+        """
+        Compare multiple backtest results
+        
+        With config + weight_configs the strategies are first backtested as a
+        weight sweep across a process pool (sweep_weights).
+        """
         try:
+            if weight_configs:
+                if config is None:
+                    raise ValueError("config is required for a weight sweep")
+                swept = await self.sweep_weights(config, weight_configs, max_workers)
+                backtest_results = list(backtest_results or []) + swept
+            
             if not backtest_results:
                 return {}
             
@@ -675,11 +396,12 @@ class BacktestingService:
             
             # Extract metrics for each strategy
             for i, result in enumerate(backtest_results):
-                strategy_name = f"Strategy_{i+1}"
+                strategy_name = result.config.get("strategy") or f"Strategy_{i+1}"
                 metrics = result.metrics
                 
                 comparison["strategies"].append({
                     "name": strategy_name,
+                    "weights": result.config.get("weights"),
                     "total_return": metrics.get("total_return", 0),
                     "sharpe_ratio": metrics.get("sharpe_ratio", 0),
                     "max_drawdown": metrics.get("max_drawdown", 0),
@@ -745,5 +467,81 @@ class BacktestingService:
             return []
 
 
+def prepare_timelines(
+    config: BacktestConfig,
+    rules: ScoringRules,
+    default_timeframes: List[str]
+) -> Tuple[Dict[str, TimeframeTimeline], List[str]]:
+    """Load every configured timeframe from the store and score it (shared symbol order)"""
+    store = HistoricalDataStore(config.store_path)
+    try:
+        timeframes = config.timeframes or default_timeframes
+        if config.symbols:
+            symbols = [symbol.upper() for symbol in config.symbols]
+        else:
+            symbols = sorted({symbol for tf in timeframes for symbol in store.list_symbols(tf)})
+        
+        start_ms, end_ms = to_ms(config.start_date), to_ms(config.end_date)
+        timelines = {}
+        for timeframe in timeframes:
+            interval_ms = TIMEFRAME_MS.get(timeframe)
+            if interval_ms is None:
+                default_logger.warning(f"Backtest: unsupported timeframe {timeframe}, skipped")
+                continue
+            try:
+                panel = store.load_panel(symbols, timeframe, start_ms, end_ms, warmup_bars=WARMUP_BARS)
+            except ValueError as e:
+                default_logger.warning(f"Backtest: {e}, timeframe skipped")
+                continue
+            timelines[timeframe] = TimeframeTimeline.build(panel, rules, interval_ms, start_ms, end_ms)
+        
+        if not timelines:
+            raise ValueError(f"No historical data in {store.path} for {timeframes}")
+        return timelines, symbols
+    finally:
+        store.close()
+
+
+# Per-process sweep state (set by the pool initializer)
+_sweep_state: Optional[Tuple[Dict[str, TimeframeTimeline], List[str], BacktestConfig, ScoringRules]] = None
+
+
+def _init_sweep_worker(config: BacktestConfig, rules: ScoringRules, default_timeframes: List[str]):
+    global _sweep_state
+    timelines, symbols = prepare_timelines(config, rules, default_timeframes)
+    _sweep_state = (timelines, symbols, config, rules)
+
+
+def _run_sweep_task(weights: Dict[str, float]) -> Dict[str, Any]:
+    timelines, symbols, config, rules = _sweep_state
+    return simulate(timelines, symbols, rules, config, weights)
+
+
+def _skewness(values: List[float]) -> float:
+    """Sample skewness (adjusted Fisher-Pearson, same as pandas)"""
+    n = len(values)
+    if n < 3:
+        return 0.0
+    x = np.asarray(values, dtype=np.float64)
+    m2 = np.mean((x - x.mean()) ** 2)
+    if m2 == 0:
+        return 0.0
+    g1 = np.mean((x - x.mean()) ** 3) / m2 ** 1.5
+    return float(g1 * np.sqrt(n * (n - 1)) / (n - 2))
+
+
+def _kurtosis(values: List[float]) -> float:
+    """Sample excess kurtosis (unbiased, same as pandas)"""
+    n = len(values)
+    if n < 4:
+        return 0.0
+    x = np.asarray(values, dtype=np.float64)
+    m2 = np.mean((x - x.mean()) ** 2)
+    if m2 == 0:
+        return 0.0
+    g2 = np.mean((x - x.mean()) ** 4) / m2 ** 2 - 3
+    return float((n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * g2 + 6))
+
+
 # Global instance
 backtesting_service = BacktestingService()
@@ -9,8 +9,11 @@ from datetime import datetime
 import asyncio
 from app.utils.symbol_normalizer import normalize_symbol, Provider
 from app.utils.logger import logger
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("binance")
 class BinanceFuturesService:
     """
     Binance USD-M Futures public API integration
@@ -19,21 +22,14 @@ class BinanceFuturesService:
     
     def __init__(self):
         self.base_url = "https://fapi.binance.com"
-        self._client: Optional[httpx.AsyncClient] = None
         
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client with connection pooling"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=15.0,
-                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
-            )
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("binance")
     
     async def close(self):
-        """Close HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
     
     # ==================== EXCHANGE INFO & SYMBOLS ====================
     
@@ -243,7 +239,9 @@ class BinanceFuturesService:
         self,
         symbol: str,
         interval: str = "15m",
-        limit: int = 100
+        limit: int = 100,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
     ) -> Dict:
         """
         Get candlestick/kline data
@@ -253,6 +251,8 @@ class BinanceFuturesService:
             symbol: Trading pair (e.g., 'BTCUSDT')
             interval: Timeframe (1m, 5m, 15m, 1h, 4h, 1d)
             limit: Number of candles (max 1500)
+            start_time: Optional window start (epoch ms, candle open time)
+            end_time: Optional window end (epoch ms)
             
         Returns:
             OHLCV candlestick data
@@ -266,6 +266,10 @@ class BinanceFuturesService:
                 "interval": interval,
                 "limit": min(limit, 1500)
             }
+            if start_time is not None:
+                params["startTime"] = int(start_time)
+            if end_time is not None:
+                params["endTime"] = int(end_time)
             
             response = await client.get(url, params=params)
             
@@ -7,6 +7,7 @@ import httpx
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import asyncio
+from app.core.http_clients import http_clients
 
 
 class BinanceListingsMonitor:
@@ -17,22 +18,15 @@ class BinanceListingsMonitor:
 
     def __init__(self):
         self.base_url = "https://fapi.binance.com"
-        self._client: Optional[httpx.AsyncClient] = None
         self._known_symbols: set = set()
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=10.0,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            )
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("binance", timeout=10.0)
 
     async def close(self):
-        """Close HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
 
     async def get_all_perpetual_symbols(self) -> Dict:
         """
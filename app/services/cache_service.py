@@ -1,10 +1,13 @@
 """
 Redis Cache Service for CryptoSatX
 Provides caching layer for API responses and computed data
+
+Also serves as the shared L2 transport for SmartCache (app/services/smart_cache.py),
+so multiple uvicorn workers share warmed provider data.
 """
 import json
 import os
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
 import redis.asyncio as redis
 from app.utils.logger import default_logger
@@ -15,6 +18,7 @@ class CacheService:
     Redis-based caching service with TTL support
     Features:
     - Automatic serialization/deserialization
+    - Raw bytes access (get_raw/set_raw) for compact binary payloads
     - TTL management
     - Cache invalidation patterns
     - Performance metrics
@@ -26,13 +30,20 @@ class CacheService:
         self.logger = default_logger
         self._connected = False
     
-    async def connect(self):
-        """Initialize Redis connection"""
+    async def connect(self, client: Optional[Any] = None):
+        """
+        Initialize Redis connection
+
+        Args:
+            client: Optional pre-built async client (e.g. fakeredis.aioredis.FakeRedis)
+        """
+        if self.is_connected():
+            return
         try:
-            self.redis_client = redis.from_url(
+            # Binary-safe client: JSON helpers decode explicitly, raw helpers keep bytes
+            self.redis_client = client or redis.from_url(
                 self.redis_url,
-                encoding="utf-8",
-                decode_responses=True
+                decode_responses=False
             )
             # Test connection
             await self.redis_client.ping()
@@ -40,6 +51,7 @@ class CacheService:
             self.logger.info("Redis cache connected successfully")
         except Exception as e:
             self.logger.error(f"Failed to connect to Redis: {e}")
+            self.redis_client = None
             self._connected = False
     
     async def disconnect(self):
@@ -97,6 +109,47 @@ class CacheService:
             self.logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Get raw bytes from cache (no deserialization)
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes or None if not found / not connected
+        """
+        if not self.is_connected():
+            return None
+
+        try:
+            return await self.redis_client.get(key)
+        except Exception as e:
+            self.logger.error(f"Cache get_raw error for key {key}: {e}")
+            return None
+
+    async def set_raw(self, key: str, value: bytes, ttl_seconds: int = 300) -> bool:
+        """
+        Set raw bytes in cache with TTL (no serialization)
+
+        Args:
+            key: Cache key
+            value: Pre-encoded payload
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_connected():
+            return False
+
+        try:
+            await self.redis_client.setex(key, max(1, int(ttl_seconds)), value)
+            return True
+        except Exception as e:
+            self.logger.error(f"Cache set_raw error for key {key}: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache
@@ -117,12 +170,13 @@ class CacheService:
             self.logger.error(f"Cache delete error for key {key}: {e}")
             return False
     
-    async def delete_pattern(self, pattern: str) -> int:
+    async def delete_pattern(self, pattern: str, exclude: Tuple[str, ...] = ()) -> int:
         """
         Delete keys matching pattern
         
         Args:
             pattern: Redis pattern (e.g., "signals:*")
+            exclude: Key prefixes to keep even if they match
             
         Returns:
             Number of keys deleted
@@ -131,10 +185,19 @@ class CacheService:
             return 0
         
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                return await self.redis_client.delete(*keys)
-            return 0
+            # SCAN in batches instead of KEYS - never blocks Redis on a large keyspace
+            deleted = 0
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                if exclude and self._as_text(key).startswith(exclude):
+                    continue
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self.redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis_client.delete(*batch)
+            return deleted
         except Exception as e:
             self.logger.error(f"Cache delete pattern error for {pattern}: {e}")
             return 0
@@ -304,8 +367,8 @@ class CacheService:
             info = await self.redis_client.info()
             return {
                 "connected": True,
-                "used_memory": info.get("used_memory_human", "N/A"),
-                "used_memory_peak": info.get("used_memory_peak_human", "N/A"),
+                "used_memory": self._as_text(info.get("used_memory_human", "N/A")),
+                "used_memory_peak": self._as_text(info.get("used_memory_peak_human", "N/A")),
                 "total_commands_processed": info.get("total_commands_processed", 0),
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
@@ -317,6 +380,11 @@ class CacheService:
             self.logger.error(f"Error getting cache stats: {e}")
             return {"connected": False, "error": str(e)}
     
+    @staticmethod
+    def _as_text(value: Any) -> Any:
+        """Decode bytes returned by the binary-safe client"""
+        return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+
     def _calculate_hit_rate(self, info: Dict) -> float:
         """Calculate cache hit rate percentage"""
         hits = info.get("keyspace_hits", 0)
@@ -156,18 +156,12 @@ class CachedDataService:
         """
         symbol = symbol.upper()
         
-        async with cache_service._lock:
-            keys_to_delete = []
-            for cache_key in list(cache_service._cache.keys()):
-                if any(prefix in cache_key for prefix in ["price:", "liq:", "social:", "ls_ratio:", "funding:"]):
-                    keys_to_delete.append(cache_key)
-            
-            for key in keys_to_delete:
-                del cache_service._cache[key]
-                cache_service.stats["evictions"] += 1
+        removed = await cache_service.delete_by_prefix(
+            "price:", "liq:", "social:", "ls_ratio:", "funding:"
+        )
         
-        logger.info(f"🗑️  Invalidated {len(keys_to_delete)} cache entries for {symbol}")
-        return len(keys_to_delete)
+        logger.info(f"🗑️  Invalidated {removed} cache entries for {symbol}")
+        return removed
     
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics untuk monitoring"""
@@ -17,8 +17,11 @@ import httpx
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from app.utils.symbol_normalizer import normalize_symbol, Provider, get_base_symbol
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("coinapi")
 class CoinAPIComprehensiveService:
     """Comprehensive CoinAPI integration with advanced endpoints"""
     
@@ -28,21 +31,14 @@ class CoinAPIComprehensiveService:
         self.headers = {
             "X-CoinAPI-Key": self.api_key
         }
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client with connection pooling"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=15.0,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            )
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("coinapi")
     
     async def close(self):
-        """Close HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
     
     def _get_symbol_id(self, symbol: str, exchange: str = "BINANCE") -> str:
         """
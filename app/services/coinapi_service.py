@@ -11,8 +11,11 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 import httpx
 from typing import Dict, Optional
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("coinapi")
 class CoinAPIService:
     """Service for interacting with CoinAPI"""
 
@@ -42,7 +45,7 @@ class CoinAPIService:
             # CoinAPI endpoint for exchange rate
             url = f"{self.base_url}/exchangerate/{symbol}/USDT"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("coinapi", timeout=10.0) as client:
                 response = await client.get(url, headers=self.headers)
                 response.raise_for_status()
 
@@ -209,7 +212,7 @@ class CoinAPIService:
             url = f"{self.base_url}/ohlcv/{normalized}/latest"
             params = {"period_id": period, "limit": limit}
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with http_clients.borrow("coinapi", timeout=15.0) as client:
                 response = await client.get(url, headers=self.headers, params=params)
                 response.raise_for_status()
                 
@@ -302,7 +305,7 @@ class CoinAPIService:
             url = f"{self.base_url}/trades/{normalized}/latest"
             params = {"limit": limit}
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with http_clients.borrow("coinapi", timeout=15.0) as client:
                 response = await client.get(url, headers=self.headers, params=params)
                 response.raise_for_status()
                 
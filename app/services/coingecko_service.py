@@ -9,8 +9,11 @@ from datetime import datetime
 import asyncio
 from app.utils.logger import logger
 from app.utils.retry_helper import retry_with_backoff, FAST_RETRY
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("coingecko")
 class CoinGeckoService:
     """
     CoinGecko API v3 integration for coin discovery
@@ -19,21 +22,14 @@ class CoinGeckoService:
     
     def __init__(self):
         self.base_url = "https://api.coingecko.com/api/v3"
-        self._client: Optional[httpx.AsyncClient] = None
         
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=15.0,
-                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
-            )
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("coingecko")
     
     async def close(self):
-        """Close HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
     
     # ==================== PRICE DATA ====================
     
@@ -8,12 +8,27 @@ OPTIMIZATION: Utilization increased from ~8% to 89% (8/9 endpoints - November 20
 NOTE: Bitcoin-specific indicators (Rainbow Chart, S2F, Bull Peak) only available for BTC
 """
 import os
+import time
 import httpx
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
+from app.storage.timeseries_store import SeriesKey, history_store
 from app.utils.logger import logger
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+# History endpoint intervals (ms) - series with these intervals go through the local store
+HISTORY_INTERVAL_MS = {
+    "1m": 60_000, "3m": 180_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "4h": 14_400_000, "6h": 21_600_000, "8h": 28_800_000,
+    "12h": 43_200_000, "1d": 86_400_000, "1w": 604_800_000,
+}
+# Params that select the window rather than the series
+HISTORY_WINDOW_PARAMS = ("interval", "limit", "start_time", "end_time")
+
+
+@coalesce_provider_calls("coinglass")
 class CoinglassComprehensiveService:
     """Comprehensive service maximizing all Coinglass Standard plan endpoints"""
     
@@ -25,7 +40,20 @@ class CoinglassComprehensiveService:
             "CG-API-KEY": self.api_key,
             "accept": "application/json"
         }
-        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Local time-series store for history endpoints
+        self.history_store_enabled = os.getenv("COINGLASS_HISTORY_STORE", "true").lower() == "true"
+        self.history_tail_ttl = float(os.getenv("COINGLASS_HISTORY_TAIL_TTL", "60"))
+        self._history_tails: Dict[SeriesKey, Tuple[float, Optional[Dict]]] = {}
+        self.history_stats = {
+            "upstream_calls": 0,
+            "upstream_rows": 0,
+            "served_rows": 0,
+            "store_only": 0,
+            "tail_fetches": 0,
+            "backfills": 0,
+            "stale_served": 0,
+        }
     
     def _normalize_symbol(self, symbol: str) -> str:
         """
@@ -37,15 +65,128 @@ class CoinglassComprehensiveService:
         return normalize_symbol(symbol, Provider.COINGLASS)
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create shared async HTTP client"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=15.0)
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("coinglass")
     
     async def close(self):
-        """Close the HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
+    
+    # ==================== HISTORY STORE ====================
+    
+    async def _request_history(self, url: str, params: Dict) -> Tuple[int, Dict]:
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers, params=params)
+        self.history_stats["upstream_calls"] += 1
+        if response.status_code != 200:
+            return response.status_code, {}
+        return 200, response.json()
+    
+    def _history_key(self, url: str, params: Dict) -> SeriesKey:
+        endpoint = url.split("/api/", 1)[-1]
+        series = ",".join(
+            f"{name}={value}" for name, value in sorted(params.items())
+            if name not in HISTORY_WINDOW_PARAMS
+        )
+        return SeriesKey("coinglass", endpoint, series, str(params.get("interval")))
+    
+    async def _get_history(self, url: str, params: Dict) -> Tuple[int, Dict]:
+        """
+        GET a history endpoint through the local time-series store
+        
+        Closed bars are appended to history_store, so a repeat call only asks
+        upstream for the bars missing since the last stored one (plus the
+        forming bar, cached for COINGLASS_HISTORY_TAIL_TTL seconds). A larger
+        limit than stored backfills the series once. Explicit start/end ranges
+        pass through (their new closed bars are still stored). If upstream
+        fails, stored bars are served.
+        
+        Returns:
+            (status_code, payload) - payload shaped like the upstream JSON
+        """
+        interval_ms = HISTORY_INTERVAL_MS.get(params.get("interval"))
+        if not self.history_store_enabled or interval_ms is None:
+            return await self._request_history(url, params)
+        
+        key = self._history_key(url, params)
+        if params.get("start_time") or params.get("end_time"):
+            status_code, data = await self._request_history(url, params)
+            if status_code == 200 and isinstance(data.get("data"), list):
+                self._store_history_rows(key, data["data"], interval_ms)
+            return status_code, data
+        
+        limit = int(params.get("limit") or 100)
+        now = time.time()
+        bounds = history_store.bounds(key)
+        stored = history_store.row_count(key)
+        tail = self._history_tails.get(key)
+        
+        covered = bounds is not None and stored >= limit - 1
+        if covered:
+            unit_ms = 1 if bounds[1] > 10 ** 12 else 1000  # upstream time in ms or seconds
+            closed_due = (now * 1000 - interval_ms) / unit_ms
+            missing = max(0, int((closed_due - bounds[1]) // (interval_ms / unit_ms)))
+            if missing == 0 and tail and now - tail[0] < self.history_tail_ttl:
+                self.history_stats["store_only"] += 1
+                return 200, self._serve_history(key, limit, tail[1])
+            fetch_params = {**params, "limit": min(limit, missing + 2)}
+            self.history_stats["tail_fetches"] += 1
+        else:
+            fetch_params = params
+        
+        status_code, data = await self._request_history(url, fetch_params)
+        rows = data.get("data") if status_code == 200 and str(data.get("code")) == "0" else None
+        if not isinstance(rows, list) or not rows:
+            if stored:
+                self.history_stats["stale_served"] += 1
+                logger.warning(f"⚠️ Coinglass history {key.endpoint} failed, serving {stored} stored bars")
+                return 200, self._serve_history(key, limit, None)
+            return status_code, data
+        if any(not isinstance(row, dict) or row.get("time") is None for row in rows):
+            return status_code, data  # Not a time-indexed series
+        
+        self.history_stats["upstream_rows"] += len(rows)
+        forming = self._store_history_rows(key, rows, interval_ms, backfill=not covered)
+        self._history_tails[key] = (now, forming)
+        return 200, self._serve_history(key, limit, forming)
+    
+    def _store_history_rows(
+        self, key: SeriesKey, rows: List[Dict], interval_ms: int, backfill: bool = False
+    ) -> Optional[Dict]:
+        """Store the closed bars of an upstream page, return the forming bar (if any)"""
+        rows = sorted(rows, key=lambda row: int(row["time"]))
+        unit_ms = 1 if int(rows[-1]["time"]) > 10 ** 12 else 1000
+        now_units = time.time() * 1000 / unit_ms
+        interval_units = interval_ms / unit_ms
+        
+        forming = rows[-1] if int(rows[-1]["time"]) + interval_units > now_units else None
+        closed = rows[:-1] if forming else rows
+        
+        bounds = history_store.bounds(key)
+        if backfill and bounds and closed and int(closed[0]["time"]) < bounds[0]:
+            # Upstream page reaches further back than the store - rewrite with the older
+            # bars, keeping stored bars newer than the page (a short page must not truncate)
+            newer = history_store.read_rows(key, start_ms=int(closed[-1]["time"]) + 1)
+            history_store.replace(key, closed + newer)
+            self.history_stats["backfills"] += 1
+        else:
+            history_store.append(key, closed)
+        return forming
+    
+    def _serve_history(self, key: SeriesKey, limit: int, forming: Optional[Dict]) -> Dict:
+        rows = history_store.read_rows(key, limit=limit - 1 if forming else limit)
+        if forming:
+            rows.append(forming)
+        self.history_stats["served_rows"] += len(rows)
+        return {"code": "0", "msg": "success", "data": rows}
+    
+    def get_history_store_stats(self) -> Dict[str, Any]:
+        """Upstream vs served history rows and store counters"""
+        return {
+            **self.history_stats,
+            "enabled": self.history_store_enabled,
+            "store": history_store.get_stats(),
+        }
     
     # ==================== MARKET DATA ENDPOINTS ====================
     
@@ -53,7 +194,10 @@ class CoinglassComprehensiveService:
         """
         Get comprehensive market data for futures coins
         Endpoint: /api/futures/coins-markets
-        
+
+        Served from the process-wide market snapshot: the endpoint always returns
+        the whole futures universe, so it is pulled once and indexed by symbol.
+
         Returns:
         - Current price
         - Market cap
@@ -63,54 +207,76 @@ class CoinglassComprehensiveService:
         - OI/Market Cap ratio
         - OI/Volume ratio
         """
+        from app.services.market_snapshot_service import market_snapshot_service
+
+        try:
+            if not await market_snapshot_service.ensure_fresh():
+                error = market_snapshot_service.stats.get("last_error") or "Snapshot unavailable"
+                return {"success": False, "error": error}
+
+            if symbol:
+                symbol_data = market_snapshot_service.lookup(symbol)
+                if symbol_data:
+                    return self.format_market_row(symbol_data, self._normalize_symbol(symbol))
+                return {"success": False, "error": f"Symbol {symbol} not found in coins-markets"}
+
+            markets = await market_snapshot_service.get_all_markets()
+            return {"success": True, "data": markets, "count": len(markets)}
+
+        except Exception as e:
+            logger.error(f"[CoinsMarkets] Error: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def format_market_row(symbol_data: Dict, symbol: str) -> Dict:
+        """Map a raw coins-markets row to the per-symbol response schema"""
+        return {
+            "success": True,
+            "symbol": symbol,
+            "price": symbol_data.get("current_price", 0),
+            "marketCap": symbol_data.get("market_cap_usd", 0),
+            "openInterestUsd": symbol_data.get("open_interest_usd", 0),
+            "openInterestQty": symbol_data.get("open_interest_quantity", 0),
+            "fundingRateByOI": symbol_data.get("avg_funding_rate_by_oi", 0),
+            "fundingRateByVol": symbol_data.get("avg_funding_rate_by_vol", 0),
+            "oiMarketCapRatio": symbol_data.get("open_interest_market_cap_ratio", 0),
+            "oiVolumeRatio": symbol_data.get("open_interest_volume_ratio", 0),
+            "priceChange5m": symbol_data.get("price_change_percent_5m", 0),
+            "priceChange15m": symbol_data.get("price_change_percent_15m", 0),
+            "priceChange30m": symbol_data.get("price_change_percent_30m", 0),
+            "priceChange1h": symbol_data.get("price_change_percent_1h", 0),
+            "priceChange4h": symbol_data.get("price_change_percent_4h", 0),
+            "priceChange12h": symbol_data.get("price_change_percent_12h", 0),
+            "priceChange24h": symbol_data.get("price_change_percent_24h", 0),
+            "source": "coinglass_markets"
+        }
+
+    async def fetch_coins_markets_raw(self) -> Dict:
+        """
+        Download the full coins-markets universe from Coinglass (no snapshot)
+        Used by MarketSnapshotService - everything else should go through the snapshot.
+        """
         try:
             client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/coins-markets"
-            
+
             response = await client.get(url, headers=self.headers)
-            
+
             if response.status_code != 200:
                 return {"success": False, "error": f"HTTP {response.status_code}"}
-            
+
             data = response.json()
-            
+
             if str(data.get("code")) == "0" and data.get("data"):
                 markets = data["data"]
-                
-                if symbol:
-                    symbol_upper = self._normalize_symbol(symbol)
-                    symbol_data = next((m for m in markets if m.get("symbol") == symbol_upper), None)
-                    
-                    if symbol_data:
-                        return {
-                            "success": True,
-                            "symbol": symbol_upper,
-                            "price": symbol_data.get("current_price", 0),
-                            "marketCap": symbol_data.get("market_cap_usd", 0),
-                            "openInterestUsd": symbol_data.get("open_interest_usd", 0),
-                            "openInterestQty": symbol_data.get("open_interest_quantity", 0),
-                            "fundingRateByOI": symbol_data.get("avg_funding_rate_by_oi", 0),
-                            "fundingRateByVol": symbol_data.get("avg_funding_rate_by_vol", 0),
-                            "oiMarketCapRatio": symbol_data.get("open_interest_market_cap_ratio", 0),
-                            "oiVolumeRatio": symbol_data.get("open_interest_volume_ratio", 0),
-                            "priceChange5m": symbol_data.get("price_change_percent_5m", 0),
-                            "priceChange15m": symbol_data.get("price_change_percent_15m", 0),
-                            "priceChange30m": symbol_data.get("price_change_percent_30m", 0),
-                            "priceChange1h": symbol_data.get("price_change_percent_1h", 0),
-                            "priceChange4h": symbol_data.get("price_change_percent_4h", 0),
-                            "priceChange12h": symbol_data.get("price_change_percent_12h", 0),
-                            "priceChange24h": symbol_data.get("price_change_percent_24h", 0),
-                            "source": "coinglass_markets"
-                        }
-                
                 return {"success": True, "data": markets, "count": len(markets)}
-            
+
             return {"success": False, "error": "Invalid response structure"}
-            
+
         except Exception as e:
             logger.error(f"[CoinsMarkets] Error: {str(e)}")
             return {"success": False, "error": str(e)}
-    
+
     async def get_perpetual_market(self, symbol: str) -> Dict:
         """
         Get perpetual futures market data for a symbol
@@ -241,7 +407,6 @@ class CoinglassComprehensiveService:
         Returns OHLCV data for charting and technical analysis
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/price/history"
             params = {
                 "exchange": exchange,
@@ -250,12 +415,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 candles = data["data"]
@@ -479,7 +642,6 @@ class CoinglassComprehensiveService:
         Returns OI OHLC (not price!) - tracks institutional positioning
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/open-interest/history"
             params = {
                 "exchange": exchange,
@@ -489,12 +651,10 @@ class CoinglassComprehensiveService:
                 "unit": unit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            status_code, data = await self._get_history(url, params)
             
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 oi_data = data["data"]
@@ -583,7 +743,6 @@ class CoinglassComprehensiveService:
         Much larger values than single exchange OI.
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/open-interest/aggregated-history"
             params = {
                 "symbol": self._normalize_symbol(symbol),
@@ -592,12 +751,10 @@ class CoinglassComprehensiveService:
                 "unit": unit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 oi_data = data["data"]
@@ -693,7 +850,6 @@ class CoinglassComprehensiveService:
         Shows actual coin-denominated positions.
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/open-interest/aggregated-stablecoin-history"
             params = {
                 "exchange_list": exchange_list,
@@ -702,12 +858,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            status_code, data = await self._get_history(url, params)
             
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 oi_data = data["data"]
@@ -798,7 +952,6 @@ class CoinglassComprehensiveService:
         Example: BTCUSD where margin is in BTC, not USDT
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/open-interest/aggregated-coin-margin-history"
             params = {
                 "exchange_list": exchange_list,
@@ -807,12 +960,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 oi_data = data["data"]
@@ -1079,7 +1230,6 @@ class CoinglassComprehensiveService:
         CRITICAL for sentiment analysis!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/funding-rate/history"
             params = {
                 "exchange": exchange,
@@ -1088,12 +1238,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 fr_data = data["data"]
@@ -1210,7 +1358,6 @@ class CoinglassComprehensiveService:
         MORE ACCURATE than per-exchange FR!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/funding-rate/oi-weight-history"
             params = {
                 "symbol": self._normalize_symbol(symbol),
@@ -1218,12 +1365,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            status_code, data = await self._get_history(url, params)
             
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 fr_data = data["data"]
@@ -1333,7 +1478,6 @@ class CoinglassComprehensiveService:
         Volume-weighted = Active trader sentiment!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/funding-rate/vol-weight-history"
             params = {
                 "symbol": self._normalize_symbol(symbol),
@@ -1341,12 +1485,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 fr_data = data["data"]
@@ -1680,7 +1822,6 @@ class CoinglassComprehensiveService:
         Track what elite traders are doing!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/top-long-short-account-ratio/history"
             params = {
                 "exchange": exchange,
@@ -1689,12 +1830,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            status_code, data = await self._get_history(url, params)
             
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 ratio_data = data["data"]
@@ -1803,7 +1942,6 @@ class CoinglassComprehensiveService:
         Shows where smart money is ACTUALLY deploying capital!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/top-long-short-position-ratio/history"
             params = {
                 "exchange": exchange,
@@ -1812,12 +1950,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 ratio_data = data["data"]
@@ -2051,7 +2187,6 @@ class CoinglassComprehensiveService:
         Track where smart money is moving!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/v2/net-position/history"
             params = {
                 "exchange": exchange,
@@ -2060,12 +2195,10 @@ class CoinglassComprehensiveService:
                 "limit": limit
             }
             
-            response = await client.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            status_code, data = await self._get_history(url, params)
             
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 position_data = data["data"]
@@ -2577,6 +2710,34 @@ class CoinglassComprehensiveService:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    async def fetch_liquidation_coin_list_raw(self, exchange: str = "Binance") -> Dict:
+        """
+        Download liquidation totals for ALL coins on an exchange (one call)
+        Endpoint: /api/futures/liquidation/coin-list
+
+        Used by the market data feed - rows carry liquidation_usd_{1h,4h,12h,24h}
+        and long_/short_ breakdowns per base symbol.
+        """
+        try:
+            client = await self._get_client()
+            url = f"{self.base_url_v4}/api/futures/liquidation/coin-list"
+
+            response = await client.get(url, headers=self.headers, params={"exchange": exchange})
+
+            if response.status_code != 200:
+                return {"success": False, "error": f"HTTP {response.status_code}"}
+
+            data = response.json()
+
+            if str(data.get("code")) == "0" and data.get("data"):
+                coin_list = data["data"]
+                return {"success": True, "exchange": exchange, "data": coin_list, "count": len(coin_list)}
+
+            return {"success": False, "error": "No data"}
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     async def get_liquidation_aggregated_history(self, exchange_list: str = "Binance", 
                                                   symbol: str = "BTC", interval: str = "1d", 
                                                   limit: int = 100,
@@ -2603,7 +2764,6 @@ class CoinglassComprehensiveService:
         Perfect for identifying LIQUIDATION CASCADES and market turning points!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/liquidation/aggregated-history"
             params = {
                 "exchange_list": exchange_list,
@@ -2617,12 +2777,10 @@ class CoinglassComprehensiveService:
             if end_time:
                 params["end_time"] = end_time
             
-            response = await client.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            status_code, data = await self._get_history(url, params)
             
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 history = data["data"]
@@ -2803,7 +2961,6 @@ class CoinglassComprehensiveService:
         Perfect for exchange-specific analysis and pair-specific strategies!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/liquidation/history"
             params = {
                 "exchange": exchange,
@@ -2817,12 +2974,10 @@ class CoinglassComprehensiveService:
             if end_time:
                 params["end_time"] = end_time
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 history = data["data"]
@@ -2999,7 +3154,6 @@ class CoinglassComprehensiveService:
         This is CRITICAL for understanding market depth and predicting price movements!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/orderbook/ask-bids-history"
             params = {
                 "exchange": exchange,
@@ -3013,12 +3167,10 @@ class CoinglassComprehensiveService:
             if end_time:
                 params["end_time"] = end_time
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 history = data["data"]
@@ -3174,7 +3326,6 @@ class CoinglassComprehensiveService:
         but for orderbook depth across multiple exchanges!
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url_v4}/api/futures/orderbook/aggregated-ask-bids-history"
             params = {
                 "exchange_list": exchange_list,
@@ -3188,12 +3339,10 @@ class CoinglassComprehensiveService:
             if end_time:
                 params["end_time"] = end_time
             
-            response = await client.get(url, headers=self.headers, params=params)
+            status_code, data = await self._get_history(url, params)
             
-            if response.status_code != 200:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-            
-            data = response.json()
+            if status_code != 200:
+                return {"success": False, "error": f"HTTP {status_code}"}
             
             if str(data.get("code")) == "0" and data.get("data"):
                 history = data["data"]
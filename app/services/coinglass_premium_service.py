@@ -12,8 +12,11 @@ logger = get_logger(__name__)
 import httpx
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("coinglass")
 class CoinglassPremiumService:
     """Service for Coinglass premium endpoints (Standard plan+)"""
     
@@ -25,18 +28,14 @@ class CoinglassPremiumService:
             "accept": "application/json"
         }
         # Shared async client for connection pooling
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create shared async HTTP client"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=15.0)
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("coinglass")
     
     async def close(self):
-        """Close the HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
     
     async def get_liquidation_data(self, symbol: str, exchange: str = "Binance") -> Dict:
         """
@@ -9,10 +9,12 @@ from app.utils.logger import get_logger
 
 # Initialize module logger
 logger = get_logger(__name__)
-import httpx
 from typing import Dict, Optional
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("coinglass")
 class CoinglassService:
     """Service for interacting with Coinglass API v4"""
 
@@ -31,7 +33,7 @@ class CoinglassService:
         try:
             url = f"{self.base_url}/api/futures/supported-coins"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("coinglass", timeout=10.0) as client:
                 response = await client.get(url, headers=self.headers)
 
                 if response.status_code != 200:
@@ -76,7 +78,7 @@ class CoinglassService:
             url = f"{self.base_url}/api/futures/funding-rates"
             params = {"symbol": symbol}
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("coinglass", timeout=10.0) as client:
                 response = await client.get(url, headers=self.headers, params=params)
                 response.raise_for_status()
 
@@ -132,7 +134,7 @@ class CoinglassService:
             url = f"{self.base_url}/api/futures/open-interest-aggregated-ohlc"
             params = {"symbol": symbol, "interval": "0"}
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("coinglass", timeout=10.0) as client:
                 response = await client.get(url, headers=self.headers, params=params)
                 response.raise_for_status()
 
@@ -188,7 +190,7 @@ class CoinglassService:
             # Use the coins-markets endpoint which provides comprehensive data
             url = f"{self.base_url}/api/futures/coins-markets"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("coinglass", timeout=10.0) as client:
                 response = await client.get(url, headers=self.headers)
 
                 if response.status_code != 200:
@@ -1,80 +1,257 @@
 """
 Coinglass WebSocket Service - Real-time Liquidation Streaming!
 Provides live liquidation data across all exchanges.
+
+Ingestion pipeline:
+    socket reader -> bounded queue (drop/coalesce policy) -> batched handler delivery
+
+- The reader never awaits the handler, so a slow consumer cannot stall the socket
+- Supervised reconnect with exponential backoff + full jitter, channels are
+  resubscribed after every reconnect
+- Per-channel throughput, drop and lag metrics (get_metrics)
+- base_url is configurable (COINGLASS_WS_URL) so the pipeline can run against
+  a local stand-in server (see tools/coinglass_ws_standin.py)
 """
 
 import asyncio
 import json
 import os
-from typing import Optional, Callable
+import random
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from app.utils.logger import logger
 import websockets
 from websockets.client import WebSocketClientProtocol
 
 
+# Queue overflow policies
+DROP_OLDEST = "drop_oldest"  # Evict the oldest queued message (freshest data wins)
+DROP_NEWEST = "drop_newest"  # Discard the incoming message
+COALESCE = "coalesce"  # Merge into the newest queued message of the same channel
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+
+class ChannelMetrics:
+    """Throughput and lag counters for one channel"""
+
+    __slots__ = (
+        "received", "delivered", "dropped", "coalesced", "handler_errors",
+        "queue_lag_ms", "source_lag_ms", "first_seen", "last_seen",
+    )
+
+    def __init__(self):
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.handler_errors = 0
+        self.queue_lag_ms = 0.0  # EWMA enqueue -> handler delivery
+        self.source_lag_ms = 0.0  # EWMA exchange event time -> handler delivery
+        self.first_seen: Optional[float] = None
+        self.last_seen: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = (self.last_seen - self.first_seen) if self.first_seen and self.last_seen else 0.0
+        return {
+            "received": self.received,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "handler_errors": self.handler_errors,
+            "messages_per_second": round(self.received / elapsed, 2) if elapsed > 0 else None,
+            "queue_lag_ms": round(self.queue_lag_ms, 2),
+            "source_lag_ms": round(self.source_lag_ms, 2),
+        }
+
+
+class BoundedMessageQueue:
+    """
+    Non-blocking bounded queue between the socket reader and the consumer
+
+    put() never waits - when full, the overflow policy decides what is lost.
+    Items are (channel, message, enqueued_at).
+    """
+
+    def __init__(self, maxsize: int, policy: str = DROP_OLDEST):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{policy}', expected one of {OVERFLOW_POLICIES}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._items: Deque[Tuple[str, Dict, float]] = deque()
+        self._not_empty = asyncio.Event()
+        self.high_watermark = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, channel: str, message: Dict, metrics: ChannelMetrics) -> None:
+        now = time.monotonic()
+
+        if len(self._items) >= self.maxsize:
+            if self.policy == DROP_NEWEST:
+                metrics.dropped += 1
+                return
+            if self.policy == COALESCE and self._coalesce(channel, message):
+                metrics.coalesced += 1
+                return
+            self._items.popleft()
+            metrics.dropped += 1
+
+        self._items.append((channel, message, now))
+        self.high_watermark = max(self.high_watermark, len(self._items))
+        self._not_empty.set()
+
+    def _coalesce(self, channel: str, message: Dict) -> bool:
+        """Merge message into the newest queued message of the same channel"""
+        for index in range(len(self._items) - 1, -1, -1):
+            queued_channel, queued, enqueued_at = self._items[index]
+            if queued_channel != channel:
+                continue
+            incoming = message.get("data")
+            existing = queued.get("data")
+            if isinstance(existing, list) and isinstance(incoming, list):
+                # Event lists (liquidationOrders): keep every event, fewer messages
+                queued["data"] = existing + incoming
+            else:
+                # Snapshot-style payloads: latest wins, keep original queue position
+                self._items[index] = (channel, message, enqueued_at)
+            return True
+        return False
+
+    async def get_batch(self, max_items: int, max_wait: float) -> List[Tuple[str, Dict, float]]:
+        """
+        Wait for at least one item, then collect up to max_items
+
+        Waits up to max_wait seconds for the batch to fill once the first
+        item has arrived.
+        """
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        if len(self._items) < max_items and max_wait > 0:
+            deadline = time.monotonic() + max_wait
+            while len(self._items) < max_items:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._not_empty.clear()
+                try:
+                    await asyncio.wait_for(self._not_empty.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+
+        count = min(max_items, len(self._items))
+        return [self._items.popleft() for _ in range(count)]
+
+
 class CoinglassWebSocketService:
     """
     Service for real-time Coinglass WebSocket connections.
     Streams live liquidation data across exchanges.
     """
-    
-    def __init__(self):
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        batch_wait: Optional[float] = None,
+    ):
         self.api_key = os.getenv("COINGLASS_API_KEY", "")
-        self.base_url = "wss://open-ws.coinglass.com/ws-api"
+        self.base_url = base_url or os.getenv("COINGLASS_WS_URL", "wss://open-ws.coinglass.com/ws-api")
         self.ws: Optional[WebSocketClientProtocol] = None
         self.ping_interval = 20
         self.reconnect_interval = 5
         self.is_connected = False
         self.subscribed_channels = set()
-    
+
+        # Reconnect backoff: uniform(0, min(max, base * 2^attempt))
+        self.backoff_base = float(os.getenv("COINGLASS_WS_BACKOFF_BASE", "1"))
+        self.backoff_max = float(os.getenv("COINGLASS_WS_BACKOFF_MAX", "60"))
+        self._attempt = 0
+
+        # Queue + batched delivery
+        self.queue = BoundedMessageQueue(
+            maxsize=queue_size or int(os.getenv("COINGLASS_WS_QUEUE_SIZE", "1000")),
+            policy=overflow_policy or os.getenv("COINGLASS_WS_OVERFLOW_POLICY", COALESCE),
+        )
+        self.batch_size = batch_size or int(os.getenv("COINGLASS_WS_BATCH_SIZE", "100"))
+        self.batch_wait = batch_wait if batch_wait is not None else float(
+            os.getenv("COINGLASS_WS_BATCH_WAIT_SECONDS", "0.05")
+        )
+
+        self._stopped = False
+        self._stop_event = asyncio.Event()
+        self.channel_metrics: Dict[str, ChannelMetrics] = {}
+        self.stats = {
+            "connects": 0,
+            "reconnects": 0,
+            "connect_failures": 0,
+            "parse_errors": 0,
+            "batches_delivered": 0,
+            "last_error": None,
+            "last_backoff_seconds": None,
+        }
+
     def get_connection_url(self) -> str:
         """Get WebSocket connection URL with API key."""
         return f"{self.base_url}?cg-api-key={self.api_key}"
-    
+
+    def _metrics_for(self, channel: str) -> ChannelMetrics:
+        metrics = self.channel_metrics.get(channel)
+        if metrics is None:
+            metrics = self.channel_metrics[channel] = ChannelMetrics()
+        return metrics
+
     async def connect(self) -> WebSocketClientProtocol:
         """Establish WebSocket connection to Coinglass."""
         try:
             self.ws = await websockets.connect(self.get_connection_url())
             self.is_connected = True
+            self.stats["connects"] += 1
             logger.info(f"✅ Connected to Coinglass WebSocket")
             return self.ws
         except Exception as e:
+            self.stats["connect_failures"] += 1
             logger.error(f"❌ WebSocket connection failed: {e}")
             raise
-    
+
     async def subscribe(self, channels: list[str]) -> None:
         """
         Subscribe to WebSocket channels.
-        
+
         Available channels:
         - liquidationOrders: Real-time liquidation data
         """
         if not self.ws or not self.is_connected:
             raise Exception("WebSocket not connected")
-        
+
         subscribe_msg = {
             "method": "subscribe",
             "channels": channels
         }
-        
+
         await self.ws.send(json.dumps(subscribe_msg))
         self.subscribed_channels.update(channels)
         logger.info(f"📡 Subscribed to channels: {channels}")
-    
+
     async def unsubscribe(self, channels: list[str]) -> None:
         """Unsubscribe from WebSocket channels."""
         if not self.ws or not self.is_connected:
             raise Exception("WebSocket not connected")
-        
+
         unsubscribe_msg = {
             "method": "unsubscribe",
             "channels": channels
         }
-        
+
         await self.ws.send(json.dumps(unsubscribe_msg))
         self.subscribed_channels.difference_update(channels)
         logger.info(f"🔕 Unsubscribed from channels: {channels}")
-    
+
     async def send_ping(self) -> None:
         """Send ping to keep connection alive."""
         if self.ws and self.is_connected:
@@ -83,72 +260,202 @@ class CoinglassWebSocketService:
             except Exception as e:
                 logger.warning(f"⚠️ Ping failed: {e}")
                 self.is_connected = False
-    
+
     async def keepalive(self) -> None:
         """Background task to keep connection alive with ping/pong."""
         while self.is_connected:
             await asyncio.sleep(self.ping_interval)
             await self.send_ping()
-    
-    async def listen(self, message_handler: Callable) -> None:
+
+    async def listen(self) -> None:
         """
-        Listen for incoming WebSocket messages.
-        
-        Args:
-            message_handler: Async function to handle received messages
+        Read messages from the socket into the bounded queue.
+
+        Never awaits a consumer - overflow is handled by the queue policy.
+        Returns when the connection closes.
         """
         if not self.ws or not self.is_connected:
             raise Exception("WebSocket not connected")
-        
+
         try:
             async for message in self.ws:
                 if message == "pong":
                     continue
-                
+
                 try:
                     data = json.loads(message)
-                    await message_handler(data)
                 except json.JSONDecodeError:
+                    self.stats["parse_errors"] += 1
                     logger.warning(f"⚠️ Failed to parse message: {message}")
+                    continue
+
+                # A message means the connection is healthy - reset backoff
+                self._attempt = 0
+
+                channel = (data.get("channel") if isinstance(data, dict) else None) or "control"
+                metrics = self._metrics_for(channel)
+                metrics.received += 1
+                now = time.monotonic()
+                metrics.first_seen = metrics.first_seen or now
+                metrics.last_seen = now
+                self.queue.put(channel, data, metrics)
         except websockets.exceptions.ConnectionClosed:
             logger.info("🔌 WebSocket connection closed")
+        finally:
             self.is_connected = False
+
+    # ==================== SUPERVISOR ====================
+
+    def _next_backoff(self) -> float:
+        """Exponential backoff with full jitter"""
+        cap = min(self.backoff_max, self.backoff_base * (2 ** self._attempt))
+        self._attempt += 1
+        return random.uniform(0, cap)
+
+    async def _run_connection(self, channels: List[str]) -> None:
+        """One connection lifetime: connect, (re)subscribe, keepalive + read"""
+        await self.connect()
+        await self.subscribe(sorted(self.subscribed_channels | set(channels)))
+
+        keepalive_task = asyncio.create_task(self.keepalive())
+        try:
+            await self.listen()
+        finally:
+            keepalive_task.cancel()
+            try:
+                await keepalive_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _supervise(self, channels: List[str]) -> None:
+        """Keep a connection up until close() - reconnect with jittered backoff"""
+        first = True
+        while not self._stopped:
+            if not first:
+                self.stats["reconnects"] += 1
+            first = False
+
+            try:
+                await self._run_connection(channels)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["last_error"] = str(e)
+                logger.error(f"❌ Stream error: {e}")
+            finally:
+                self.is_connected = False
+                if self.ws:
+                    try:
+                        await self.ws.close()
+                    except Exception:
+                        pass
+
+            if self._stopped:
+                break
+
+            delay = self._next_backoff()
+            self.stats["last_backoff_seconds"] = round(delay, 3)
+            logger.info(f"🔄 Reconnecting in {delay:.1f}s...")
+            try:
+                # close() interrupts the backoff wait
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _deliver(self, handler: Callable, batched: bool) -> None:
+        """Drain the queue in batches and hand them to the consumer"""
+        while not self._stopped:
+            batch = await self.queue.get_batch(self.batch_size, self.batch_wait)
+            delivered_at = time.monotonic()
+            wall_ms = time.time() * 1000
+
+            by_channel: Dict[str, int] = {}
+            for channel, message, enqueued_at in batch:
+                metrics = self._metrics_for(channel)
+                metrics.queue_lag_ms = _ewma(metrics.queue_lag_ms, (delivered_at - enqueued_at) * 1000)
+                event_ms = _event_time_ms(message)
+                if event_ms:
+                    metrics.source_lag_ms = _ewma(metrics.source_lag_ms, wall_ms - event_ms)
+                by_channel[channel] = by_channel.get(channel, 0) + 1
+
+            messages = [message for _, message, _ in batch]
+            if batched:
+                await self._call_handler(handler, messages, by_channel)
+            else:
+                for channel, message, _ in batch:
+                    await self._call_handler(handler, message, {channel: 1})
+
+            self.stats["batches_delivered"] += 1
+
+    async def _call_handler(self, handler: Callable, payload: Any, by_channel: Dict[str, int]) -> None:
+        try:
+            await handler(payload)
+            for channel, count in by_channel.items():
+                self._metrics_for(channel).delivered += count
         except Exception as e:
-            logger.error(f"❌ Listen error: {e}")
-            self.is_connected = False
-    
+            for channel in by_channel:
+                self._metrics_for(channel).handler_errors += 1
+            logger.error(f"❌ WebSocket message handler failed: {e}")
+
+    async def stream(self, channels: List[str], handler: Callable, batched: bool = True) -> None:
+        """
+        Run the ingestion pipeline until close() or cancellation.
+
+        Args:
+            channels: Channels to (re)subscribe on every connection
+            handler: Async consumer - receives List[dict] if batched, else one dict
+            batched: Deliver batches (up to batch_size messages) instead of single messages
+        """
+        self._stopped = False
+        self._stop_event.clear()
+        supervisor = asyncio.create_task(self._supervise(channels))
+        consumer = asyncio.create_task(self._deliver(handler, batched))
+        try:
+            await asyncio.wait({supervisor, consumer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (supervisor, consumer):
+                task.cancel()
+            await asyncio.gather(supervisor, consumer, return_exceptions=True)
+
     async def stream_liquidations(self, message_handler: Callable) -> None:
         """
         Stream real-time liquidations with auto-reconnect.
-        
+
         Args:
-            message_handler: Async function to handle liquidation data
+            message_handler: Async function to handle liquidation data (one message per call)
         """
-        while True:
-            try:
-                await self.connect()
-                
-                await self.subscribe(["liquidationOrders"])
-                
-                keepalive_task = asyncio.create_task(self.keepalive())
-                listen_task = asyncio.create_task(self.listen(message_handler))
-                
-                await asyncio.gather(keepalive_task, listen_task)
-                
-            except Exception as e:
-                logger.error(f"❌ Stream error: {e}")
-                self.is_connected = False
-                
-                if self.ws:
-                    await self.ws.close()
-                
-                logger.info(f"🔄 Reconnecting in {self.reconnect_interval}s...")
-                await asyncio.sleep(self.reconnect_interval)
-    
+        await self.stream(["liquidationOrders"], message_handler, batched=False)
+
+    async def stream_liquidation_batches(self, batch_handler: Callable) -> None:
+        """
+        Stream real-time liquidations with auto-reconnect, delivered in batches.
+
+        Args:
+            batch_handler: Async function receiving a list of liquidation messages
+        """
+        await self.stream(["liquidationOrders"], batch_handler, batched=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Connection, queue and per-channel metrics"""
+        return {
+            **self.stats,
+            "is_connected": self.is_connected,
+            "subscribed_channels": sorted(self.subscribed_channels),
+            "queue": {
+                "depth": len(self.queue),
+                "maxsize": self.queue.maxsize,
+                "high_watermark": self.queue.high_watermark,
+                "overflow_policy": self.queue.policy,
+            },
+            "channels": {name: metrics.to_dict() for name, metrics in self.channel_metrics.items()},
+        }
+
     async def close(self) -> None:
-        """Close WebSocket connection."""
+        """Close WebSocket connection and stop reconnecting."""
+        self._stopped = True
+        self._stop_event.set()
         self.is_connected = False
-        
+
         if self.ws:
             try:
                 await self.ws.close()
@@ -157,10 +464,29 @@ class CoinglassWebSocketService:
                 logger.warning(f"⚠️ Error closing WebSocket: {e}")
 
 
+def _ewma(current: float, sample: float, alpha: float = 0.2) -> float:
+    return sample if current == 0.0 else current + alpha * (sample - current)
+
+
+def _event_time_ms(message: Dict) -> Optional[float]:
+    """Latest exchange event time (ms) in a message, if it carries one"""
+    data = message.get("data")
+    if isinstance(data, list):
+        times = [item.get("time") for item in data if isinstance(item, dict) and item.get("time")]
+        return float(max(times)) if times else None
+    if isinstance(data, dict) and data.get("time"):
+        return float(data["time"])
+    return None
+
+
+# Shared instance for background consumers (market data feed)
+coinglass_websocket_service = CoinglassWebSocketService()
+
+
 async def process_liquidation(data: dict) -> None:
     """
     Example message handler for liquidation data.
-    
+
     Liquidation data format:
     {
         "channel": "liquidationOrders",
@@ -179,12 +505,12 @@ async def process_liquidation(data: dict) -> None:
     """
     if data.get("channel") == "liquidationOrders":
         liquidations = data.get("data", [])
-        
+
         for liq in liquidations:
             side = "LONG" if liq.get("side") == 1 else "SHORT"
             asset = liq.get("baseAsset", "")
             exchange = liq.get("exName", "")
             price = liq.get("price", 0)
             volume_usd = liq.get("volUsd", 0)
-            
+
             logger.info(f"🔥 {side} Liquidation: {asset} on {exchange} | ${volume_usd:,.2f} @ ${price:,.2f}")
@@ -19,6 +19,7 @@ from enum import Enum
 import json
 
 from app.storage.database import db
+from app.storage.write_behind import write_behind
 from app.services.telegram_notifier import TelegramNotifier
 from app.services.coinapi_comprehensive_service import CoinAPIComprehensiveService
 from app.services.coinglass_comprehensive_service import CoinglassComprehensiveService
@@ -26,6 +27,16 @@ from app.services.binance_futures_service import BinanceFuturesService
 
 logger = logging.getLogger(__name__)
 
+write_behind.register(
+    "monitoring_metrics",
+    "monitoring_metrics",
+    (
+        "watchlist_id", "symbol", "timeframe", "price", "volume", "funding_rate", "open_interest",
+        "liquidations_long", "liquidations_short", "social_volume", "timestamp",
+    ),
+    on_conflict="ON CONFLICT (symbol, timeframe, timestamp) DO NOTHING",
+)
+
 
 class AlertSeverity(Enum):
     """Alert severity levels"""
@@ -777,23 +788,18 @@ class ComprehensiveMonitor:
             logger.error(f"Error loading rules: {e}", exc_info=True)
 
     async def _save_metrics(self, watchlist_id: int, metrics: MarketMetrics):
-        """Save metrics to database"""
+        """Queue metrics for the next bulk insert (write-behind)"""
         try:
-            query = """
-                INSERT INTO monitoring_metrics
-                (watchlist_id, symbol, timeframe, price, volume, funding_rate, open_interest,
-                 liquidations_long, liquidations_short, social_volume, timestamp)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                ON CONFLICT (symbol, timeframe, timestamp) DO NOTHING
-            """
-            async with db.acquire() as conn:
-                await conn.execute(
-                    query,
+            await write_behind.enqueue(
+                "monitoring_metrics",
+                (
                     watchlist_id, metrics.symbol, metrics.timeframe, metrics.price,
                     metrics.volume, metrics.funding_rate, metrics.open_interest,
                     metrics.liquidations_long, metrics.liquidations_short,
                     metrics.social_volume, metrics.timestamp
-                )
+                ),
+                wait=False,
+            )
         except Exception as e:
             logger.debug(f"Error saving metrics: {e}")
 
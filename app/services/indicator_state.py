@@ -0,0 +1,435 @@
+"""
+Streaming Indicator State
+Persistent per-(symbol, timeframe) indicator state updated one bar at a time
+
+Instead of recomputing EMAs, RSI and MACD from 120 candles on every signal
+build, each (symbol, timeframe) keeps a small state object. Appending a closed
+bar updates every indicator in constant time:
+
+- EMA fast/slow (SMA-seeded, like TechnicalIndicators)
+- MACD line + signal (SMA-seeded on the first MACD values)
+- Wilder RSI and simple-average RSI (the one TechnicalIndicators scores)
+- Wilder ATR
+- Volume average and the short close/volume windows used for MA crossover
+  and volume confirmation (bounded deques)
+
+The forming (unclosed) bar is never committed - trend_score() previews it on
+a copy, so the next sync can still apply the final version of that bar.
+
+State snapshots are written to the core cache (and its L2 tier when enabled),
+so a warm restart resumes from the snapshot instead of replaying history.
+"""
+
+import copy
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.utils.logger import get_logger
+from app.utils.technical_indicators import TechnicalIndicators
+
+logger = get_logger(__name__)
+
+
+TIMEFRAME_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "1H": 3_600_000,
+    "4h": 14_400_000,
+    "4H": 14_400_000,
+    "1d": 86_400_000,
+    "1D": 86_400_000,
+}
+
+# Bump when the snapshot layout changes - older snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+
+class _SeededEMA:
+    """EMA seeded with the SMA of its first period inputs"""
+
+    __slots__ = ("period", "alpha", "value", "seed_sum", "seed_count")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value: Optional[float] = None
+        self.seed_sum = 0.0
+        self.seed_count = 0
+
+    def update(self, x: float) -> Optional[float]:
+        if self.value is None:
+            self.seed_sum += x
+            self.seed_count += 1
+            if self.seed_count == self.period:
+                self.value = self.seed_sum / self.period
+        else:
+            self.value = x * self.alpha + self.value * (1 - self.alpha)
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": self.value, "seed_sum": self.seed_sum, "seed_count": self.seed_count}
+
+    def load(self, data: Dict[str, Any]):
+        self.value = data.get("value")
+        self.seed_sum = data.get("seed_sum", 0.0)
+        self.seed_count = data.get("seed_count", 0)
+
+
+class _WilderAverage:
+    """Wilder smoothing: SMA of the first period inputs, then (avg*(n-1)+x)/n"""
+
+    __slots__ = ("period", "value", "seed_sum", "seed_count")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.value: Optional[float] = None
+        self.seed_sum = 0.0
+        self.seed_count = 0
+
+    def update(self, x: float) -> Optional[float]:
+        if self.value is None:
+            self.seed_sum += x
+            self.seed_count += 1
+            if self.seed_count == self.period:
+                self.value = self.seed_sum / self.period
+        else:
+            self.value = (self.value * (self.period - 1) + x) / self.period
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": self.value, "seed_sum": self.seed_sum, "seed_count": self.seed_count}
+
+    def load(self, data: Dict[str, Any]):
+        self.value = data.get("value")
+        self.seed_sum = data.get("seed_sum", 0.0)
+        self.seed_count = data.get("seed_count", 0)
+
+
+class IndicatorState:
+    """
+    Indicator state for one (symbol, timeframe)
+
+    Usage:
+        state = IndicatorState("BTC", "15m")
+        for bar in closed_bars:          # {"timestamp", "open", "high", "low", "close", "volume"}
+            state.update(bar)
+        state.values()
+        state.trend_score(forming_bar)
+    """
+
+    FAST_PERIOD = 12
+    SLOW_PERIOD = 26
+    SIGNAL_PERIOD = 9
+    RSI_PERIOD = 14
+    ATR_PERIOD = 14
+    VOLUME_PERIOD = 20
+    # Closes kept for MA10/MA20 crossover (current + previous bar)
+    CLOSE_WINDOW = 22
+    # Bars required before trend_score() scores (same as calculate_trend_score)
+    MIN_BARS = 30
+
+    def __init__(self, symbol: str, timeframe: str):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.last_ts: Optional[int] = None
+        self.bars = 0
+
+        self.ema_fast = _SeededEMA(self.FAST_PERIOD)
+        self.ema_slow = _SeededEMA(self.SLOW_PERIOD)
+        self.macd_signal = _SeededEMA(self.SIGNAL_PERIOD)
+        self.rsi_gain = _WilderAverage(self.RSI_PERIOD)
+        self.rsi_loss = _WilderAverage(self.RSI_PERIOD)
+        self.atr = _WilderAverage(self.ATR_PERIOD)
+
+        self.prev_close: Optional[float] = None
+        self.macd: Optional[float] = None
+        self.closes: Deque[float] = deque(maxlen=self.CLOSE_WINDOW)
+        self.volumes: Deque[float] = deque(maxlen=self.VOLUME_PERIOD)
+
+    # ==================== UPDATES ====================
+
+    def update(self, bar: Dict[str, Any]) -> bool:
+        """
+        Append one closed bar (O(1))
+
+        Returns:
+            False if the bar is not newer than the last applied bar
+        """
+        ts = int(bar["timestamp"])
+        if self.last_ts is not None and ts <= self.last_ts:
+            return False
+
+        close = float(bar["close"])
+        high = float(bar.get("high", close))
+        low = float(bar.get("low", close))
+        volume = float(bar.get("volume", 0.0))
+
+        fast = self.ema_fast.update(close)
+        slow = self.ema_slow.update(close)
+        if fast is not None and slow is not None:
+            self.macd = fast - slow
+            self.macd_signal.update(self.macd)
+
+        if self.prev_close is not None:
+            change = close - self.prev_close
+            self.rsi_gain.update(change if change > 0 else 0.0)
+            self.rsi_loss.update(-change if change < 0 else 0.0)
+            true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        else:
+            true_range = high - low
+        self.atr.update(true_range)
+
+        self.closes.append(close)
+        self.volumes.append(volume)
+        self.prev_close = close
+        self.last_ts = ts
+        self.bars += 1
+        return True
+
+    def preview(self, bar: Optional[Dict[str, Any]]) -> "IndicatorState":
+        """State as if bar were appended (self is unchanged)"""
+        if not bar:
+            return self
+        preview = copy.deepcopy(self)
+        preview.update(bar)
+        return preview
+
+    # ==================== READS ====================
+
+    @property
+    def rsi(self) -> Optional[float]:
+        """Wilder RSI"""
+        gain, loss = self.rsi_gain.value, self.rsi_loss.value
+        if gain is None or loss is None:
+            return None
+        if loss == 0:
+            return 100.0 if gain > 0 else 50.0
+        return 100 - 100 / (1 + gain / loss)
+
+    def values(self) -> Dict[str, Any]:
+        """Current indicator values"""
+        signal = self.macd_signal.value
+        closes = list(self.closes)
+        volumes = list(self.volumes)
+        rsi = self.rsi
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "bars": self.bars,
+            "last_ts": self.last_ts,
+            "ema_fast": self.ema_fast.value,
+            "ema_slow": self.ema_slow.value,
+            "macd": self.macd,
+            "macd_signal": signal,
+            "macd_histogram": (self.macd - signal) if self.macd is not None and signal is not None else None,
+            "rsi": round(rsi, 2) if rsi is not None else None,
+            "rsi_simple": TechnicalIndicators.calculate_rsi(closes, self.RSI_PERIOD),
+            "atr": self.atr.value,
+            "volume_avg": sum(volumes) / len(volumes) if volumes else None,
+        }
+
+    def _macd_reading(self) -> Optional[Dict[str, Any]]:
+        """MACD in TechnicalIndicators.calculate_macd format"""
+        signal = self.macd_signal.value
+        if self.macd is None or signal is None:
+            return None
+        histogram = self.macd - signal
+        if histogram > 0 and self.macd > 0:
+            trend = "bullish"
+        elif histogram < 0 and self.macd < 0:
+            trend = "bearish"
+        else:
+            trend = "neutral"
+        return {
+            "macd": round(self.macd, 8),
+            "signal": round(signal, 8),
+            "histogram": round(histogram, 8),
+            "trend": trend,
+        }
+
+    def trend_score(self, forming_bar: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        TechnicalIndicators trend score from state (forming bar previewed)
+
+        Same scoring as calculate_trend_score, without touching full history.
+        """
+        state = self.preview(forming_bar)
+        if state.bars < self.MIN_BARS:
+            return {"trend": "neutral", "score": 50, "confidence": "low", "signals": {}}
+
+        closes = list(state.closes)
+        volumes = list(state.volumes)
+        return TechnicalIndicators.score_indicators(
+            ma_cross=TechnicalIndicators.detect_ma_crossover(closes, 10, 20),
+            rsi=TechnicalIndicators.calculate_rsi(closes, self.RSI_PERIOD),
+            macd=state._macd_reading(),
+            volume_analysis=TechnicalIndicators.analyze_volume_trend(volumes, closes, 10) if any(volumes) else None,
+        )
+
+    # ==================== SNAPSHOTS ====================
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-safe state snapshot"""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "last_ts": self.last_ts,
+            "bars": self.bars,
+            "ema_fast": self.ema_fast.to_dict(),
+            "ema_slow": self.ema_slow.to_dict(),
+            "macd_signal": self.macd_signal.to_dict(),
+            "rsi_gain": self.rsi_gain.to_dict(),
+            "rsi_loss": self.rsi_loss.to_dict(),
+            "atr": self.atr.to_dict(),
+            "prev_close": self.prev_close,
+            "macd": self.macd,
+            "closes": list(self.closes),
+            "volumes": list(self.volumes),
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: Dict[str, Any]) -> Optional["IndicatorState"]:
+        """Restore a snapshot (None if it is from another layout version)"""
+        if not data or data.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        state = cls(data["symbol"], data["timeframe"])
+        state.last_ts = data.get("last_ts")
+        state.bars = data.get("bars", 0)
+        state.ema_fast.load(data["ema_fast"])
+        state.ema_slow.load(data["ema_slow"])
+        state.macd_signal.load(data["macd_signal"])
+        state.rsi_gain.load(data["rsi_gain"])
+        state.rsi_loss.load(data["rsi_loss"])
+        state.atr.load(data["atr"])
+        state.prev_close = data.get("prev_close")
+        state.macd = data.get("macd")
+        state.closes.extend(data.get("closes", []))
+        state.volumes.extend(data.get("volumes", []))
+        return state
+
+
+def normalize_candles(candles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Chronological bars with a numeric timestamp (OKX returns newest first)
+
+    Candles lacking "timestamp" are copied, never modified - they may be a
+    cached provider response shared with other callers.
+    """
+    bars = [
+        candle if "timestamp" in candle else {**candle, "timestamp": candle["time"]}
+        for candle in candles
+        if candle.get("close") and (candle.get("timestamp", candle.get("time")) is not None)
+    ]
+    return sorted(bars, key=lambda bar: int(bar["timestamp"]))
+
+
+class IndicatorStateStore:
+    """
+    Process-wide registry of IndicatorState objects with cache snapshots
+
+    Usage:
+        state, forming = await indicator_state_store.sync("BTC", "15m", candles)
+        ta = state.trend_score(forming)
+    """
+
+    CACHE_PREFIX = "indicator_state:"
+
+    def __init__(self, snapshot_ttl: Optional[int] = None):
+        self.snapshot_ttl = snapshot_ttl or int(os.getenv("INDICATOR_STATE_TTL_SECONDS", "21600"))
+        self._states: Dict[Tuple[str, str], IndicatorState] = {}
+        self.stats = {
+            "syncs": 0,
+            "rebuilds": 0,
+            "incremental_bars": 0,
+            "replayed_bars": 0,
+            "snapshot_restores": 0,
+            "snapshot_writes": 0,
+        }
+
+    def _cache_key(self, symbol: str, timeframe: str) -> str:
+        return f"{self.CACHE_PREFIX}{symbol}:{timeframe}"
+
+    async def get_state(self, symbol: str, timeframe: str) -> Optional[IndicatorState]:
+        """In-memory state, falling back to the cached snapshot"""
+        key = (symbol.upper(), timeframe)
+        state = self._states.get(key)
+        if state is not None:
+            return state
+
+        from app.core.cache_service import cache_service
+
+        state = IndicatorState.from_snapshot(await cache_service.get(self._cache_key(*key)))
+        if state is not None:
+            self._states[key] = state
+            self.stats["snapshot_restores"] += 1
+        return state
+
+    async def sync(
+        self,
+        symbol: str,
+        timeframe: str,
+        candles: List[Dict[str, Any]],
+        now_ms: Optional[int] = None,
+    ) -> Tuple[IndicatorState, Optional[Dict[str, Any]]]:
+        """
+        Apply the closed bars of a fresh candle list to the state
+
+        Only bars newer than the state's last bar are applied. The state is
+        rebuilt from the candles when it is missing or a gap separates it
+        from the oldest candle provided.
+
+        Returns:
+            (state, forming_bar) - forming_bar is the unclosed latest bar or None
+        """
+        self.stats["syncs"] += 1
+        symbol = symbol.upper()
+        interval = TIMEFRAME_MS.get(timeframe, TIMEFRAME_MS["15m"])
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+
+        bars = normalize_candles(candles)
+        forming = bars[-1] if bars and int(bars[-1]["timestamp"]) + interval > now_ms else None
+        closed = bars[:-1] if forming else bars
+
+        state = await self.get_state(symbol, timeframe)
+        if state is None or (
+            closed and state.last_ts is not None and state.last_ts < int(closed[0]["timestamp"]) - interval
+        ):
+            state = IndicatorState(symbol, timeframe)
+            self._states[(symbol, timeframe)] = state
+            self.stats["rebuilds"] += 1
+            rebuilding = True
+        else:
+            rebuilding = False
+
+        applied = sum(1 for bar in closed if state.update(bar))
+        self.stats["replayed_bars" if rebuilding else "incremental_bars"] += applied
+
+        if applied:
+            await self._persist(state)
+
+        return state, forming
+
+    async def _persist(self, state: IndicatorState):
+        from app.core.cache_service import cache_service
+
+        try:
+            await cache_service.set(
+                self._cache_key(state.symbol, state.timeframe), state.snapshot(), ttl_seconds=self.snapshot_ttl
+            )
+            self.stats["snapshot_writes"] += 1
+        except Exception as e:
+            logger.warning(f"Indicator state snapshot failed for {state.symbol}/{state.timeframe}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "states": len(self._states)}
+
+
+# Global instance for easy import
+indicator_state_store = IndicatorStateStore()
@@ -1,13 +1,24 @@
 """
 Liquidation Spike Detector
 Monitors liquidation data and alerts on large liquidation events
-Uses both REST API polling and WebSocket streaming for real-time detection
+
+Event-driven: consumes LiquidationTick batches from the market data bus
+- 1h totals for every coin from one Coinglass coin-list call per minute
+- Optional per-order ticks from the Coinglass liquidationOrders WebSocket,
+  aggregated here in a rolling time window
 """
 import asyncio
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
-from app.services.coinglass_comprehensive_service import CoinglassComprehensiveService
+from app.services.market_data_bus import (
+    market_data_bus,
+    market_data_feed,
+    LiquidationTick,
+    TOPIC_LIQUIDATION,
+    TOPIC_LIQUIDATION_ORDERS,
+    TOPIC_SPIKE,
+)
 from app.services.telegram_notifier import TelegramNotifier
 from app.utils.logger import default_logger as logger
 
@@ -17,26 +28,28 @@ class LiquidationSpikeDetector:
     Real-time liquidation spike detection
 
     Features:
-    - Monitors liquidations via REST API every 60 seconds
-    - Detects large liquidation events (>$50M in 5min, >$20M in 1min)
+    - Receives 1h liquidation totals for the whole market every 60 seconds
+    - Detects large liquidation events (>$50M market-wide, >$20M per coin)
+    - Rolling window over WebSocket liquidation orders when the stream is enabled
     - Tracks long/short liquidation imbalance
-    - Instant Telegram alerts for major liquidation spikes
+    - Instant Telegram alerts for major liquidation spikes (with cooldown)
     - Separate tracking for individual coins and market-wide events
     """
 
     def __init__(
         self,
-        check_interval: int = 60,  # Check every 60 seconds
-        extreme_threshold: float = 50_000_000,  # $50M in 5min = EXTREME
-        high_threshold: float = 20_000_000,  # $20M in 1min = HIGH
-        time_window_minutes: int = 5  # Track 5-minute windows
+        check_interval: int = 60,  # Feed cadence in seconds (informational)
+        extreme_threshold: float = 50_000_000,  # $50M = EXTREME (market-wide)
+        high_threshold: float = 20_000_000,  # $20M = HIGH (single coin)
+        time_window_minutes: int = 5,  # Rolling window for streamed orders
+        alert_cooldown_minutes: int = 30  # 1h totals stay high for a while
     ):
         self.check_interval = check_interval
         self.extreme_threshold = extreme_threshold
         self.high_threshold = high_threshold
         self.time_window_minutes = time_window_minutes
+        self.alert_cooldown = timedelta(minutes=alert_cooldown_minutes)
 
-        self.coinglass = CoinglassComprehensiveService()
         self.telegram = TelegramNotifier()
 
         self.is_running = False
@@ -48,6 +61,9 @@ class LiquidationSpikeDetector:
         # Track total market liquidations
         self.market_liquidation_history: deque = deque(maxlen=10)
 
+        # Streamed orders inside the rolling window: {symbol: deque[(timestamp, long_usd, short_usd)]}
+        self.order_windows: Dict[str, deque] = defaultdict(deque)
+
         # Track alert timestamps
         self.last_alert_times: Dict[str, datetime] = {}
 
@@ -59,82 +75,103 @@ class LiquidationSpikeDetector:
         )
 
     async def start(self):
-        """Start liquidation monitoring loop"""
+        """Subscribe to liquidation ticks (returns immediately)"""
         if self.is_running:
             logger.warning("Liquidation spike detector already running")
             return
 
         self.is_running = True
+        market_data_bus.subscribe(TOPIC_LIQUIDATION, self.on_liquidation_ticks)
+        market_data_bus.subscribe(TOPIC_LIQUIDATION_ORDERS, self.on_liquidation_orders)
+        await market_data_feed.start()
         logger.info("🚀 Liquidation Spike Detector STARTED - monitoring for large liquidation events")
 
-        try:
-            while self.is_running:
-                await self._check_liquidation_spikes()
-                await asyncio.sleep(self.check_interval)
-        except Exception as e:
-            logger.error(f"Liquidation spike detector crashed: {e}")
-            self.is_running = False
-
     def stop(self):
         """Stop monitoring"""
         self.is_running = False
+        market_data_bus.unsubscribe(TOPIC_LIQUIDATION, self.on_liquidation_ticks)
+        market_data_bus.unsubscribe(TOPIC_LIQUIDATION_ORDERS, self.on_liquidation_orders)
         logger.info("Liquidation Spike Detector STOPPED")
 
-    async def _check_liquidation_spikes(self):
-        """Check for liquidation spikes across the market"""
-        try:
-            current_time = datetime.utcnow()
-            self.last_check_time = current_time
-
-            logger.debug("🔍 Checking liquidation data...")
-
-            # Get recent liquidation data (24h aggregated by coin)
-            # FIXED: get_liquidation_coin_list doesn't accept time_type parameter
-            liq_data = await self.coinglass.get_liquidation_coin_list()
-
-            if not liq_data.get("success") or not liq_data.get("data"):
-                logger.warning("No liquidation data available")
-                return
-
-            liquidations = liq_data["data"]
-
-            # Calculate total market liquidations in last hour
-            total_long_liq = 0
-            total_short_liq = 0
-
-            # Track per-coin liquidations
-            for coin_data in liquidations[:50]:  # Check top 50 by liquidation volume
-                symbol = coin_data.get("symbol", "").replace("USDT", "")
-
-                if not symbol:
-                    continue
+    async def on_liquidation_ticks(self, ticks: List[LiquidationTick]):
+        """Check 1h liquidation totals for coin and market-wide spikes"""
+        if not self.is_running:
+            return
 
-                # Get 1h liquidation amounts
-                long_liq_1h = float(coin_data.get("longLiquidationUsd1h", 0))
-                short_liq_1h = float(coin_data.get("shortLiquidationUsd1h", 0))
+        current_time = datetime.utcnow()
+        self.last_check_time = current_time
 
-                total_long_liq += long_liq_1h
-                total_short_liq += short_liq_1h
+        if not ticks:
+            logger.warning("No liquidation data available")
+            return
 
-                # Add to history
-                self.liquidation_history[symbol].append((current_time, long_liq_1h, short_liq_1h))
+        total_long_liq = sum(tick.long_usd for tick in ticks)
+        total_short_liq = sum(tick.short_usd for tick in ticks)
+        self.market_liquidation_history.append((current_time, total_long_liq, total_short_liq))
+
+        # Check top 50 by liquidation volume
+        top_ticks = sorted(ticks, key=lambda tick: tick.long_usd + tick.short_usd, reverse=True)[:50]
+        events = []
+        for tick in top_ticks:
+            self.liquidation_history[tick.symbol].append((current_time, tick.long_usd, tick.short_usd))
+            event = await self._check_coin_liquidation_spike(
+                tick.symbol, tick.long_usd, tick.short_usd, current_time
+            )
+            if event:
+                events.append(event)
 
-                # Check for individual coin spikes
-                await self._check_coin_liquidation_spike(symbol, long_liq_1h, short_liq_1h, current_time)
+        event = await self._check_market_liquidation_spike(total_long_liq, total_short_liq, current_time)
+        if event:
+            events.append(event)
 
-            # Add to market history
-            self.market_liquidation_history.append((current_time, total_long_liq, total_short_liq))
+        if events:
+            await market_data_bus.publish(TOPIC_SPIKE, events)
 
-            # Check for market-wide liquidation spike
-            await self._check_market_liquidation_spike(total_long_liq, total_short_liq, current_time)
+        logger.debug(
+            f"✅ Liquidation check complete: "
+            f"${total_long_liq:,.0f} longs, ${total_short_liq:,.0f} shorts liquidated in last hour"
+        )
 
-            logger.debug(
-                f"✅ Liquidation check complete: "
-                f"${total_long_liq:,.0f} longs, ${total_short_liq:,.0f} shorts liquidated in last hour"
-            )
+    async def on_liquidation_orders(self, ticks: List[LiquidationTick]):
+        """Aggregate streamed orders over the rolling window and check touched coins"""
+        if not self.is_running:
+            return
 
-        except Exception as e:
-            logger.error(f"Error in liquidation check cycle: {e}")
+        current_time = datetime.utcnow()
+        cutoff = current_time - timedelta(minutes=self.time_window_minutes)
+
+        touched = set()
+        for tick in ticks:
+            self.order_windows[tick.symbol].append((current_time, tick.long_usd, tick.short_usd))
+            touched.add(tick.symbol)
+
+        events = []
+        for symbol in touched:
+            window = self.order_windows[symbol]
+            while window and window[0][0] < cutoff:
+                window.popleft()
+            long_liq = sum(entry[1] for entry in window)
+            short_liq = sum(entry[2] for entry in window)
+            event = await self._check_coin_liquidation_spike(symbol, long_liq, short_liq, current_time)
+            if event:
+                events.append(event)
+
+        if events:
+            await market_data_bus.publish(TOPIC_SPIKE, events)
+
+    def _in_cooldown(self, alert_key: str, current_time: datetime) -> bool:
+        last_alert = self.last_alert_times.get(alert_key)
+        return last_alert is not None and current_time - last_alert < self.alert_cooldown
+
+    @staticmethod
+    def _spike_event(symbol: str, long_liq: float, short_liq: float, dominant_side: str) -> Dict:
+        """Spike event for the coordinator (see SpikeCoordinator.on_spike_events)"""
+        return {
+            "spike_type": "liquidation_short" if dominant_side == "SHORT" else "liquidation_long",
+            "symbol": symbol,
+            "value": long_liq + short_liq,
+            "metadata": {"long_liq": long_liq, "short_liq": short_liq, "dominant_side": dominant_side},
+        }
 
     async def _check_coin_liquidation_spike(
         self,
@@ -142,13 +179,13 @@ class LiquidationSpikeDetector:
         long_liq: float,
         short_liq: float,
         current_time: datetime
-    ):
-        """Check if a specific coin has large liquidations"""
+    ) -> Optional[Dict]:
+        """Check if a specific coin has large liquidations (returns a spike event)"""
         try:
             total_liq = long_liq + short_liq
 
-            # Check for extreme liquidations (>$20M in 1 hour for single coin)
-            if total_liq > self.high_threshold:
+            # Check for extreme liquidations (>$20M for single coin)
+            if total_liq > self.high_threshold and not self._in_cooldown(f"coin_{symbol}", current_time):
                 # Calculate imbalance
                 if total_liq > 0:
                     long_ratio = long_liq / total_liq * 100
@@ -186,22 +223,25 @@ class LiquidationSpikeDetector:
                 )
 
                 self.last_alert_times[f"coin_{symbol}"] = current_time
+                return self._spike_event(symbol, long_liq, short_liq, dominant_side)
 
         except Exception as e:
             logger.error(f"Error checking coin liquidation spike for {symbol}: {e}")
 
+        return None
+
     async def _check_market_liquidation_spike(
         self,
         total_long_liq: float,
         total_short_liq: float,
         current_time: datetime
-    ):
-        """Check for market-wide liquidation spike"""
+    ) -> Optional[Dict]:
+        """Check for market-wide liquidation spike (returns a spike event)"""
         try:
             total_liq = total_long_liq + total_short_liq
 
             # Check for extreme market-wide liquidations (>$50M in 1 hour)
-            if total_liq > self.extreme_threshold:
+            if total_liq > self.extreme_threshold and not self._in_cooldown("market_wide", current_time):
                 # Calculate imbalance
                 if total_liq > 0:
                     long_ratio = total_long_liq / total_liq * 100
@@ -239,10 +279,13 @@ class LiquidationSpikeDetector:
                 )
 
                 self.last_alert_times["market_wide"] = current_time
+                return self._spike_event("MARKET", total_long_liq, total_short_liq, dominant_side)
 
         except Exception as e:
             logger.error(f"Error checking market liquidation spike: {e}")
 
+        return None
+
     async def _send_liquidation_alert(
         self,
         symbol: str,
@@ -332,8 +375,7 @@ class LiquidationSpikeDetector:
 
 ━━━━━━━━━━━━━━━━━━━━━━━
 🕐 Detected: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
-⚙️ Source: Liquidation Monitor (60s interval)
-📊 Data: Last 1 hour aggregated
+⚙️ Source: Liquidation Monitor (Coinglass coin-list / liquidation stream)
 
 #Liquidation #{symbol} #CryptoSatX #LiquidationSpike
 """
@@ -408,7 +450,9 @@ class LiquidationSpikeDetector:
             "high_threshold": self.high_threshold,
             "last_check_time": self.last_check_time.isoformat() if self.last_check_time else None,
             "coins_tracked": len(self.liquidation_history),
-            "total_alerts_sent": len(self.last_alert_times)
+            "total_alerts_sent": len(self.last_alert_times),
+            "streamed_coins": len(self.order_windows),
+            "feed": market_data_feed.get_stats()
         }
 
 
@@ -417,5 +461,6 @@ liquidation_spike_detector = LiquidationSpikeDetector(
     check_interval=60,  # Check every 60 seconds
     extreme_threshold=50_000_000,  # $50M threshold for market-wide
     high_threshold=20_000_000,  # $20M threshold for individual coins
-    time_window_minutes=5
+    time_window_minutes=5,
+    alert_cooldown_minutes=30
 )
@@ -5,10 +5,13 @@ Available features: Coin metrics, time-series, change detection, real-time disco
 """
 import os
 import httpx
+import numpy as np
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
 from math import log10
 from app.utils.symbol_normalizer import normalize_symbol, Provider
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
 def normalize(value, max_value=1_000_000, log_scale=True):
@@ -96,6 +99,49 @@ def compute_social_hype_score(
     return round(min(100, social_hype_score), 2)
 
 
+def _normalize_array(values: np.ndarray, max_value: float) -> np.ndarray:
+    """Vectorized normalize() with log scaling (non-positive values score 0)"""
+    positive = values > 0
+    scaled = np.log10(np.where(positive, values, 0) + 1) / log10(max_value + 1) * 100
+    return np.where(positive, np.minimum(100, scaled), 0)
+
+
+def compute_social_hype_scores(
+    social_volume: np.ndarray,
+    engagement: np.ndarray,
+    contributors: np.ndarray,
+    dominance: np.ndarray,
+    sentiment: np.ndarray,
+    galaxy_score: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Vectorized compute_social_hype_score over many coins at once
+    
+    Same formula and weights; each argument is an array with one entry per
+    coin. Missing values must be passed as 0 (sentiment falls back to
+    galaxy_score, then 50, exactly like the scalar version).
+    
+    Returns:
+        Array of Social Hype Scores (0-100, rounded to 2 decimals)
+    """
+    sentiment = np.asarray(sentiment, dtype=float)
+    fallback = np.full_like(sentiment, 50.0)
+    if galaxy_score is not None:
+        galaxy_score = np.asarray(galaxy_score, dtype=float)
+        fallback = np.where(galaxy_score != 0, galaxy_score, fallback)
+    sent_score = np.where(sentiment != 0, sentiment, fallback)
+    
+    social_hype_score = (
+        _normalize_array(np.asarray(social_volume, dtype=float), 5_000_000) * 0.25 +
+        _normalize_array(np.asarray(engagement, dtype=float), 200_000_000) * 0.30 +
+        _normalize_array(np.asarray(contributors, dtype=float), 100_000) * 0.20 +
+        np.minimum(100, np.asarray(dominance, dtype=float) * 10) * 0.10 +
+        sent_score * 0.15
+    )
+    
+    return np.round(np.minimum(100, social_hype_score), 2)
+
+
 def compute_platform_specific_hype(
     tweet_volume: int,
     tweet_interactions: int,
@@ -335,6 +381,7 @@ def analyze_hype_price_correlation(
     }
 
 
+@coalesce_provider_calls("lunarcrush")
 class LunarCrushComprehensiveService:
     """
     Comprehensive LunarCrush API v4 service (Builder Tier)
@@ -361,21 +408,14 @@ class LunarCrushComprehensiveService:
             "Authorization": f"Bearer {self.api_key}"
         }
         self.timeout = 15.0
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client with connection pooling"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            )
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client("lunarcrush", timeout=self.timeout)
     
     async def close(self):
-        """Close HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
     
     # ==================== COMPREHENSIVE COIN METRICS ====================
     
@@ -384,12 +424,13 @@ class LunarCrushComprehensiveService:
         Get comprehensive social + market metrics for a coin
         
         LunarCrush v4 API Strategy (Builder Tier):
-        Primary: /coins/list/v2 (filtered by symbol) - Has ALL data (market + social)
+        Primary: /coins/list/v2 row from the shared universe snapshot
+                 (lunarcrush_universe) - Has ALL data (market + social)
         Fallback: /topic/{topic}/v1 for additional platform-specific breakdown
         
         Why /coins/list/v2?
-        - Single call gets market data + social metrics + dominance
-        - Real-time data (no 1-hour cache)
+        - Single call gets market data + social metrics + dominance for every coin
+        - Downloaded once per refresh and indexed by symbol, not once per lookup
         - Includes social_volume_24h, interactions_24h, social_dominance, sentiment
         
         Returns 60+ metrics including:
@@ -401,32 +442,30 @@ class LunarCrushComprehensiveService:
         """
         try:
             import asyncio
+            from app.services.lunarcrush_universe_service import lunarcrush_universe
             
             client = await self._get_client()
             symbol = normalize_symbol(symbol, Provider.LUNARCRUSH)
             topic = symbol.lower()
             
-            list_url = f"{self.base_url}/coins/list/v2"
             topic_url = f"{self.base_url}/topic/{topic}/v1"
             
-            list_response, topic_response = await asyncio.gather(
-                client.get(list_url, headers=self.headers),
+            entry, topic_response = await asyncio.gather(
+                lunarcrush_universe.get_coin(symbol),
                 client.get(topic_url, headers=self.headers),
                 return_exceptions=True
             )
             
-            if isinstance(list_response, Exception) or list_response.status_code != 200:
-                error_msg = str(list_response) if isinstance(list_response, Exception) else f"HTTP {list_response.status_code}"
-                return {"success": False, "error": f"Coins list API: {error_msg}"}
+            if isinstance(entry, Exception):
+                return {"success": False, "error": f"Coins list API: {entry}"}
             
-            list_data_raw = list_response.json()
-            all_coins = list_data_raw.get("data", [])
-            
-            coin_data = next((c for c in all_coins if c.get("symbol", "").upper() == symbol.upper()), None)
-            
-            if not coin_data:
+            if entry is None:
+                if not lunarcrush_universe.is_available():
+                    return {"success": False, "error": f"Coins list API: {lunarcrush_universe.stats['last_error']}"}
                 return {"success": False, "error": f"Coin {symbol} not found in LunarCrush database"}
             
+            coin_data = entry.row
+            
             topic_data = {}
             has_topic_data = False
             if not isinstance(topic_response, Exception) and topic_response.status_code == 200:
@@ -445,14 +484,17 @@ class LunarCrushComprehensiveService:
             sentiment = float(coin_data.get("sentiment", 0))
             galaxy_score = float(coin_data.get("galaxy_score", 0))
             
-            social_hype = compute_social_hype_score(
-                social_volume=social_volume,
-                engagement=social_engagement,
-                contributors=social_contributors,
-                dominance=social_dominance,
-                sentiment=sentiment,
-                galaxy_score=galaxy_score
-            )
+            # Universe scores assume no contributor data - rescore when the topic has it
+            social_hype = entry.hype_score
+            if social_contributors:
+                social_hype = compute_social_hype_score(
+                    social_volume=social_volume,
+                    engagement=social_engagement,
+                    contributors=social_contributors,
+                    dominance=social_dominance,
+                    sentiment=sentiment,
+                    galaxy_score=galaxy_score
+                )
             
             platform_hype = compute_platform_specific_hype(
                 tweet_volume=types_count.get("tweet", 0),
@@ -479,8 +521,8 @@ class LunarCrushComprehensiveService:
             )
             
             galaxy_prev = float(coin_data.get("galaxy_score_previous", 0))
-            previous_hype = None
-            if galaxy_prev > 0:
+            previous_hype = entry.previous_hype_score
+            if galaxy_prev > 0 and social_contributors:
                 previous_hype = compute_social_hype_score(
                     social_volume=int(social_volume * 0.95),
                     engagement=int(social_engagement * 0.95),
@@ -553,13 +595,37 @@ class LunarCrushComprehensiveService:
                 
                 "timeFetched": datetime.utcnow().isoformat(),
                 "source": "lunarcrush_v4_comprehensive",
-                "dataStrategy": "coins_list_v2 + topic_v1 (concurrent)",
+                "dataStrategy": "coins_list_v2 snapshot + topic_v1",
+                "snapshotAgeSeconds": entry.age_seconds,
                 "hasTopicData": has_topic_data
             }
             
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    async def fetch_coins_list_raw(self) -> Dict:
+        """
+        Download the full /coins/list/v2 universe (no snapshot)
+        Used by LunarCrushUniverseService - per-symbol lookups should go through the snapshot.
+        """
+        try:
+            client = await self._get_client()
+            url = f"{self.base_url}/coins/list/v2"
+            
+            response = await client.get(url, headers=self.headers)
+            
+            if response.status_code != 200:
+                return {"success": False, "error": f"HTTP {response.status_code}"}
+            
+            coins = response.json().get("data") or []
+            if not coins:
+                return {"success": False, "error": "No coins data"}
+            
+            return {"success": True, "data": coins, "count": len(coins)}
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
     # ==================== REAL-TIME COIN DISCOVERY (V2 - NO CACHE!) ====================
     
     async def get_coins_realtime(
@@ -772,6 +838,15 @@ class LunarCrushComprehensiveService:
             # Fetch comprehensive data which includes percent_change fields
             coin_data = await self.get_coin_comprehensive(symbol)
             
+            return self.build_social_change(symbol, interval, coin_data)
+            
+        except Exception as e:
+            return {"success": False, "symbol": symbol, "error": str(e)}
+    
+    @staticmethod
+    def build_social_change(symbol: str, interval: str, coin_data: Dict) -> Dict:
+        """get_social_change result from already fetched coin data (interval must be supported)"""
+        try:
             if not coin_data.get("success"):
                 return {
                     "success": False,
@@ -865,6 +940,17 @@ class LunarCrushComprehensiveService:
             change_24h = change_24h if not isinstance(change_24h, Exception) else {}
             time_series = time_series if not isinstance(time_series, Exception) else {}
             
+            return self.build_social_momentum(symbol, current_data, change_24h, time_series)
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    @staticmethod
+    def build_social_momentum(symbol: str, current_data: Dict, change_24h: Dict,
+                              time_series: Optional[Dict] = None) -> Dict:
+        """analyze_social_momentum result from already fetched coin/change/time-series data"""
+        time_series = time_series or {}
+        try:
             if not current_data.get("success"):
                 return {"success": False, "error": "Failed to fetch current data"}
             
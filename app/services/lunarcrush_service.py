@@ -7,8 +7,11 @@ import os
 import httpx
 from typing import Dict, Optional
 from app.utils.logger import logger
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("lunarcrush")
 class LunarCrushService:
     """Service for interacting with LunarCrush API"""
 
@@ -35,7 +38,7 @@ class LunarCrushService:
             # Note: Individual coin endpoint only has /v1 (v2 only exists for /list)
             url = f"{self.base_url}/coins/{symbol}/v1"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("lunarcrush", timeout=10.0) as client:
                 response = await client.get(url, headers=self.headers)
                 response.raise_for_status()
 
@@ -165,7 +168,7 @@ class LunarCrushService:
                 "sort": sort,
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_clients.borrow("lunarcrush", timeout=30.0) as client:
                 response = await client.get(url, headers=self.headers, params=params)
                 response.raise_for_status()
                 
@@ -263,7 +266,7 @@ class LunarCrushService:
             
             url = f"{self.base_url}/topic/{topic}/v1"
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with http_clients.borrow("lunarcrush", timeout=15.0) as client:
                 response = await client.get(url, headers=self.headers)
                 response.raise_for_status()
                 
@@ -324,7 +327,7 @@ class LunarCrushService:
         try:
             url = f"{self.base_url}/topics/list/v1"
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with http_clients.borrow("lunarcrush", timeout=15.0) as client:
                 response = await client.get(url, headers=self.headers)
                 response.raise_for_status()
                 
@@ -0,0 +1,380 @@
+"""
+LunarCrush Universe Service
+Process-wide snapshot of LunarCrush /coins/list/v2, indexed by symbol
+
+/coins/list/v2 returns social + market metrics for the whole universe, yet it
+was downloaded on every get_coin_comprehensive call and linear-scanned for one
+symbol - and the signal engine fired four LunarCrush requests per coin
+(social score, comprehensive, change, momentum), enough to trip the LunarCrush
+circuit breaker during scans. This service pulls the list once per refresh:
+
+- O(1) lookups by symbol (BTC, BTCUSDT, ...)
+- Social Hype Score for every coin in one vectorized pass at refresh time
+  (compute_social_hype_scores), so lookups never score
+- get_social_bundle() serves all of the signal engine's LunarCrush inputs
+  from memory
+- Scheduled background refresh + lazy refresh on stale reads, single-flight
+  refresh lock, last good snapshot served up to max staleness (same contract
+  as MarketSnapshotService)
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.utils.logger import get_logger
+from app.utils.symbol_normalizer import normalize_symbol, Provider
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class UniverseCoin:
+    """One /coins/list/v2 row with its precomputed hype scores"""
+    symbol: str
+    row: Dict[str, Any]
+    hype_score: float
+    previous_hype_score: Optional[float]  # None when galaxy_score_previous is missing
+    updated_at: float  # time.monotonic() of the snapshot
+
+    @property
+    def age_seconds(self) -> float:
+        return round(time.monotonic() - self.updated_at, 1)
+
+
+def _column(rows: List[Dict], field_name: str) -> np.ndarray:
+    """Float column of a list of rows (missing/invalid values -> 0)"""
+    values = np.empty(len(rows), dtype=float)
+    for i, row in enumerate(rows):
+        try:
+            values[i] = float(row.get(field_name) or 0)
+        except (TypeError, ValueError):
+            values[i] = 0.0
+    return values
+
+
+class LunarCrushUniverseService:
+    """
+    Shared, periodically refreshed LunarCrush coins list
+
+    Usage:
+        coin = await lunarcrush_universe.get_coin("BTC")
+        bundle = await lunarcrush_universe.get_social_bundle("BTC")
+    """
+
+    def __init__(
+        self,
+        refresh_interval: Optional[float] = None,
+        max_staleness: Optional[float] = None,
+    ):
+        self.refresh_interval = refresh_interval or float(
+            os.getenv("LUNARCRUSH_UNIVERSE_REFRESH_SECONDS", "300")
+        )
+        self.max_staleness = max_staleness or float(
+            os.getenv("LUNARCRUSH_UNIVERSE_MAX_STALENESS_SECONDS", "1800")
+        )
+        # After a failed refresh, lazy readers wait this long before retrying
+        self.retry_after = min(self.refresh_interval, 30.0)
+
+        self._coins: Dict[str, UniverseCoin] = {}
+        self._updated_at: float = 0.0
+        self._failed_at: float = 0.0
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.running = False
+
+        self.stats = {
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "lookups": 0,
+            "lookup_misses": 0,
+            "last_refresh_ms": 0.0,
+            "last_error": None,
+        }
+
+    # ==================== LIFECYCLE ====================
+
+    async def start(self):
+        """Start background refresh loop"""
+        if self.running:
+            logger.warning("LunarCrush universe service already running")
+            return
+
+        self.running = True
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.info(
+            f"🌙 LunarCrush universe snapshot started (refresh every {self.refresh_interval:.0f}s)"
+        )
+
+    async def stop(self):
+        """Stop background refresh loop"""
+        self.running = False
+
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+        logger.info("🌙 LunarCrush universe snapshot stopped")
+
+    async def _refresh_loop(self):
+        """Refresh snapshot on a fixed schedule"""
+        while self.running:
+            try:
+                async with self._refresh_lock:
+                    await self.refresh()
+                await asyncio.sleep(self.refresh_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in LunarCrush universe loop: {e}")
+                await asyncio.sleep(self.retry_after)
+
+    # ==================== REFRESH ====================
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        """Age of current snapshot in seconds (None if never loaded)"""
+        if not self._updated_at:
+            return None
+        return time.monotonic() - self._updated_at
+
+    def is_fresh(self) -> bool:
+        """True if snapshot is loaded and younger than refresh_interval"""
+        age = self.age_seconds
+        return age is not None and age < self.refresh_interval
+
+    def is_available(self) -> bool:
+        """True if snapshot is loaded and not older than max_staleness"""
+        age = self.age_seconds
+        return age is not None and age < self.max_staleness
+
+    async def refresh(self) -> bool:
+        """
+        Pull /coins/list/v2 once, score every coin and rebuild the symbol index
+
+        Returns:
+            True if the snapshot was refreshed successfully
+        """
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+
+        started = time.perf_counter()
+        result = await lunarcrush_comprehensive.fetch_coins_list_raw()
+
+        if not result.get("success"):
+            self._failed_at = time.monotonic()
+            self.stats["refresh_failures"] += 1
+            self.stats["last_error"] = result.get("error")
+            logger.warning(f"⚠️  LunarCrush universe refresh failed: {result.get('error')}")
+            return False
+
+        rows = [row for row in result.get("data", []) if row.get("symbol")]
+        updated_at = time.monotonic()
+        self._coins = self._build_index(rows, updated_at)
+        self._updated_at = updated_at
+        self.stats["refreshes"] += 1
+        self.stats["last_refresh_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self.stats["last_error"] = None
+
+        logger.debug(f"🌙 LunarCrush universe refreshed: {len(rows)} coins scored")
+        return True
+
+    @staticmethod
+    def _build_index(rows: List[Dict], updated_at: float) -> Dict[str, UniverseCoin]:
+        """
+        Score all rows in one vectorized pass and index them by symbol
+
+        Mirrors get_coin_comprehensive's per-coin scoring: contributors are
+        unknown from the list (0), previous hype uses 95% of current volume and
+        engagement with galaxy_score_previous, and only exists when that is > 0.
+        """
+        from app.services.lunarcrush_comprehensive_service import compute_social_hype_scores
+
+        if not rows:
+            return {}
+
+        social_volume = np.trunc(_column(rows, "social_volume_24h"))
+        engagement = np.trunc(_column(rows, "interactions_24h"))
+        dominance = _column(rows, "social_dominance")
+        sentiment = _column(rows, "sentiment")
+        galaxy = _column(rows, "galaxy_score")
+        galaxy_prev = _column(rows, "galaxy_score_previous")
+        no_contributors = np.zeros(len(rows))
+
+        hype = compute_social_hype_scores(
+            social_volume, engagement, no_contributors, dominance, sentiment, galaxy
+        )
+        previous_hype = compute_social_hype_scores(
+            np.trunc(social_volume * 0.95), np.trunc(engagement * 0.95),
+            no_contributors, dominance, sentiment, galaxy_prev
+        )
+
+        index: Dict[str, UniverseCoin] = {}
+        for i, row in enumerate(rows):
+            symbol = str(row["symbol"]).upper()
+            # First row wins, like the linear scan it replaces
+            if symbol in index:
+                continue
+            index[symbol] = UniverseCoin(
+                symbol=symbol,
+                row=row,
+                hype_score=float(hype[i]),
+                previous_hype_score=float(previous_hype[i]) if galaxy_prev[i] > 0 else None,
+                updated_at=updated_at,
+            )
+        return index
+
+    async def ensure_fresh(self) -> bool:
+        """
+        Refresh snapshot if stale (single-flight - one refresh for all waiters)
+
+        Returns:
+            True if a servable snapshot is available
+        """
+        if self.is_fresh():
+            return True
+
+        async with self._refresh_lock:
+            # Another waiter may have refreshed (or just failed) while we waited
+            recently_failed = time.monotonic() - self._failed_at < self.retry_after
+            if not self.is_fresh() and not recently_failed:
+                await self.refresh()
+
+        return self.is_available()
+
+    # ==================== LOOKUPS ====================
+
+    def lookup(self, symbol: str) -> Optional[UniverseCoin]:
+        """Synchronous O(1) lookup against the current snapshot (no refresh)"""
+        self.stats["lookups"] += 1
+        coin = self._coins.get(normalize_symbol(symbol, Provider.LUNARCRUSH).upper())
+        if coin is None:
+            self.stats["lookup_misses"] += 1
+        return coin
+
+    async def get_coin(self, symbol: str) -> Optional[UniverseCoin]:
+        """
+        Get a coin's snapshot entry
+
+        Returns:
+            UniverseCoin, or None if the coin is unknown or no snapshot is available
+        """
+        if not await self.ensure_fresh():
+            return None
+        return self.lookup(symbol)
+
+    async def get_all_coins(self) -> List[UniverseCoin]:
+        """All coins of the snapshot"""
+        if not await self.ensure_fresh():
+            return []
+        return list(self._coins.values())
+
+    async def get_social_bundle(self, symbol: str) -> Dict[str, Any]:
+        """
+        The signal engine's LunarCrush inputs for one coin, served from memory
+
+        Replaces get_social_score + get_coin_comprehensive + get_social_change
+        + analyze_social_momentum (four upstream requests). The comprehensive
+        part carries the coins-list metrics only (no topic/platform breakdown)
+        and momentum has no 7-day time series.
+
+        Returns:
+            {"available": snapshot usable, "social": ..., "comprehensive": ...,
+             "change": ..., "momentum": ...}
+        """
+        from app.services.lunarcrush_comprehensive_service import LunarCrushComprehensiveService
+
+        available = await self.ensure_fresh()
+        coin = self.lookup(symbol) if available else None
+
+        if coin is None:
+            error = (
+                f"Coin {symbol} not found in LunarCrush database" if available
+                else f"Coins list API: {self.stats['last_error'] or 'snapshot unavailable'}"
+            )
+            failed = {"success": False, "symbol": symbol, "error": error}
+            return {
+                "available": available,
+                "social": {**failed, "socialScore": 50.0, "source": "lunarcrush"},
+                "comprehensive": failed,
+                "change": failed,
+                "momentum": failed,
+            }
+
+        comprehensive = self._coin_metrics(coin)
+        change = LunarCrushComprehensiveService.build_social_change(coin.symbol, "24h", comprehensive)
+        momentum = LunarCrushComprehensiveService.build_social_momentum(coin.symbol, comprehensive, change)
+        return {
+            "available": True,
+            "social": {
+                "symbol": coin.symbol,
+                "socialScore": comprehensive["galaxyScore"],
+                "source": "lunarcrush",
+                "success": True,
+            },
+            "comprehensive": comprehensive,
+            "change": change,
+            "momentum": momentum,
+        }
+
+    @staticmethod
+    def _coin_metrics(coin: UniverseCoin) -> Dict[str, Any]:
+        """get_coin_comprehensive-shaped metrics from the coins-list row"""
+        row = coin.row
+
+        def number(field_name: str) -> float:
+            try:
+                return float(row.get(field_name) or 0)
+            except (TypeError, ValueError):
+                return 0.0
+
+        sentiment = number("sentiment")
+        return {
+            "success": True,
+            "symbol": coin.symbol,
+            "name": row.get("name", ""),
+            "galaxyScore": number("galaxy_score"),
+            "altRank": int(number("alt_rank")),
+            "socialVolume": int(number("social_volume_24h")),
+            "socialEngagement": int(number("interactions_24h")),
+            "socialDominance": number("social_dominance"),
+            "socialContributors": 0,
+            "socialHypeScore": coin.hype_score,
+            "averageSentiment": sentiment,
+            "sentimentAbsolute": sentiment,
+            "price": number("price"),
+            "priceUsd": number("price"),
+            "volume24h": number("volume_24h"),
+            "marketCap": number("market_cap"),
+            "percentChange24h": number("percent_change_24h"),
+            "percentChange7d": number("percent_change_7d"),
+            "percentChange1h": number("percent_change_1h"),
+            "timeFetched": datetime.utcnow().isoformat(),
+            "source": "lunarcrush_universe_snapshot",
+            "snapshotAgeSeconds": coin.age_seconds,
+            "hasTopicData": False,
+        }
+
+    def get_stats(self) -> Dict:
+        """Get snapshot statistics"""
+        age = self.age_seconds
+        return {
+            **self.stats,
+            "running": self.running,
+            "coins": len(self._coins),
+            "age_seconds": round(age, 1) if age is not None else None,
+            "refresh_interval": self.refresh_interval,
+            "fresh": self.is_fresh(),
+        }
+
+
+# Global instance for easy import
+lunarcrush_universe = LunarCrushUniverseService()
@@ -0,0 +1,415 @@
+"""
+Market Data Bus - bulk market ticks for the spike detection system
+One bulk poll per data type feeds every subscriber (pub/sub)
+
+Before: each detector polled its own provider per coin
+- Price: 100 coins × CoinAPI every 30s (~12,000 calls/hour)
+- Social: 50 coins × LunarCrush every 5min (~600 calls/hour)
+
+Now: MarketDataFeed publishes universe-wide tick batches on MarketDataBus
+- price:       coins-markets snapshot (shared MarketSnapshotService, ~60 calls/hour)
+- liquidation: Coinglass liquidation coin-list (1 call/min) and, optionally,
+               the Coinglass WebSocket liquidationOrders stream
+- social:      LunarCrush coins/list/v2 (1 call per 5min)
+- spike:       SpikeSignal events published by detectors (consumed by SpikeCoordinator)
+
+Subscribers receive a whole batch per publish, so detectors scan the full
+universe in memory without any per-coin API calls.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.utils.logger import default_logger as logger
+
+
+# Bus topics
+TOPIC_PRICE = "price"
+TOPIC_LIQUIDATION = "liquidation"
+TOPIC_LIQUIDATION_ORDERS = "liquidation_orders"
+TOPIC_SOCIAL = "social"
+TOPIC_SPIKE = "spike"
+
+Handler = Callable[[Any], Awaitable[None]]
+
+
+@dataclass
+class PriceTick:
+    """Price state for one coin from the coins-markets snapshot"""
+    symbol: str
+    price: float
+    market_cap_usd: float
+    open_interest_usd: float
+    change_pct: Dict[str, float]  # {"5m": 1.2, "15m": ..., "1h": ..., "24h": ...}
+    timestamp: datetime
+
+
+@dataclass
+class LiquidationTick:
+    """Rolling liquidation totals for one coin (USD)"""
+    symbol: str
+    long_usd: float
+    short_usd: float
+    window: str  # "1h" for coin-list polls, "order" for single stream orders
+    timestamp: datetime
+    exchange: Optional[str] = None
+
+
+@dataclass
+class SocialTick:
+    """Social metrics for one coin from LunarCrush coins/list/v2"""
+    symbol: str
+    social_volume: float
+    sentiment: float
+    galaxy_score: float
+    price: float
+    timestamp: datetime
+    metadata: Dict = field(default_factory=dict)
+
+
+class MarketDataBus:
+    """
+    In-process async pub/sub bus
+
+    Usage:
+        market_data_bus.subscribe(TOPIC_PRICE, detector.on_price_ticks)
+        await market_data_bus.publish(TOPIC_PRICE, ticks)
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Handler]] = {}
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def subscribe(self, topic: str, handler: Handler):
+        """Register an async handler for a topic (idempotent)"""
+        handlers = self._subscribers.setdefault(topic, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unsubscribe(self, topic: str, handler: Handler):
+        """Remove a handler from a topic"""
+        handlers = self._subscribers.get(topic, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def has_subscribers(self, topic: str) -> bool:
+        return bool(self._subscribers.get(topic))
+
+    async def publish(self, topic: str, payload: Any) -> int:
+        """
+        Deliver payload to every subscriber of topic concurrently
+
+        A failing subscriber never affects the others.
+
+        Returns:
+            Number of handlers invoked
+        """
+        handlers = list(self._subscribers.get(topic, ()))
+        stats = self.stats.setdefault(
+            topic, {"published": 0, "delivered": 0, "errors": 0, "last_published": None}
+        )
+        stats["published"] += 1
+        stats["last_published"] = datetime.utcnow().isoformat()
+
+        if not handlers:
+            return 0
+
+        results = await asyncio.gather(
+            *(handler(payload) for handler in handlers), return_exceptions=True
+        )
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                stats["errors"] += 1
+                logger.error(f"Market bus handler {getattr(handler, '__qualname__', handler)} failed on {topic}: {result}")
+            else:
+                stats["delivered"] += 1
+
+        return len(handlers)
+
+    def get_stats(self) -> Dict:
+        return {
+            "topics": {
+                topic: {**self.stats.get(topic, {}), "subscribers": len(handlers)}
+                for topic, handlers in self._subscribers.items()
+            }
+        }
+
+
+# Global bus instance
+market_data_bus = MarketDataBus()
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class MarketDataFeed:
+    """
+    Bulk pollers that publish tick batches on the market data bus
+
+    Each poller only runs while its topic has subscribers, so an idle
+    detector costs nothing.
+    """
+
+    PRICE_CHANGE_FIELDS = {
+        "5m": "price_change_percent_5m",
+        "15m": "price_change_percent_15m",
+        "30m": "price_change_percent_30m",
+        "1h": "price_change_percent_1h",
+        "4h": "price_change_percent_4h",
+        "24h": "price_change_percent_24h",
+    }
+
+    def __init__(
+        self,
+        bus: MarketDataBus,
+        price_interval: Optional[float] = None,
+        liquidation_interval: Optional[float] = None,
+        social_interval: Optional[float] = None,
+    ):
+        self.bus = bus
+        self.price_interval = price_interval or float(os.getenv("SPIKE_PRICE_INTERVAL_SECONDS", "30"))
+        self.liquidation_interval = liquidation_interval or float(
+            os.getenv("SPIKE_LIQUIDATION_INTERVAL_SECONDS", "60")
+        )
+        self.social_interval = social_interval or float(os.getenv("SPIKE_SOCIAL_INTERVAL_SECONDS", "300"))
+        self.liquidation_exchange = os.getenv("SPIKE_LIQUIDATION_EXCHANGE", "Binance")
+        self.social_universe = int(os.getenv("SPIKE_SOCIAL_UNIVERSE", "200"))
+        self.use_liquidation_stream = os.getenv("SPIKE_LIQUIDATION_STREAM", "false").lower() == "true"
+
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._last_snapshot_published: float = 0.0
+        self.running = False
+
+        self.stats = {
+            "price_polls": 0,
+            "liquidation_polls": 0,
+            "social_polls": 0,
+            "stream_batches": 0,
+            "poll_errors": 0,
+        }
+
+    # ==================== LIFECYCLE ====================
+
+    async def start(self):
+        """Start pollers (safe to call from every detector's start())"""
+        if self.running:
+            return
+
+        self.running = True
+        self._tasks = {
+            "price": asyncio.create_task(self._poll_loop(TOPIC_PRICE, self.price_interval, self.poll_prices)),
+            "liquidation": asyncio.create_task(
+                self._poll_loop(TOPIC_LIQUIDATION, self.liquidation_interval, self.poll_liquidations)
+            ),
+            "social": asyncio.create_task(self._poll_loop(TOPIC_SOCIAL, self.social_interval, self.poll_social)),
+        }
+        if self.use_liquidation_stream:
+            self._tasks["liquidation_stream"] = asyncio.create_task(self._run_liquidation_stream())
+
+        logger.info(
+            f"📡 Market data feed started (price {self.price_interval:.0f}s, "
+            f"liquidation {self.liquidation_interval:.0f}s, social {self.social_interval:.0f}s, "
+            f"liquidation stream {'on' if self.use_liquidation_stream else 'off'})"
+        )
+
+    async def stop(self):
+        """Stop all pollers"""
+        self.running = False
+        for task in self._tasks.values():
+            task.cancel()
+        for task in self._tasks.values():
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._tasks = {}
+
+        if self.use_liquidation_stream:
+            from app.services.coinglass_websocket_service import coinglass_websocket_service
+            await coinglass_websocket_service.close()
+
+        logger.info("📡 Market data feed stopped")
+
+    async def _poll_loop(self, topic: str, interval: float, poll: Callable[[], Awaitable[int]]):
+        """Run poll() every interval while the topic has subscribers"""
+        while self.running:
+            try:
+                if self.bus.has_subscribers(topic):
+                    await poll()
+                await asyncio.sleep(interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["poll_errors"] += 1
+                logger.error(f"Market data feed error ({topic}): {e}")
+                await asyncio.sleep(interval)
+
+    # ==================== POLLERS ====================
+
+    async def poll_prices(self) -> int:
+        """Publish one PriceTick per coin from the shared coins-markets snapshot"""
+        from app.services.market_snapshot_service import market_snapshot_service
+
+        # Shares the snapshot (and its refresh lock) with the signal engine
+        if not await market_snapshot_service.ensure_fresh():
+            return 0
+
+        updated_at = market_snapshot_service._updated_at
+        if not updated_at or updated_at == self._last_snapshot_published:
+            return 0  # Nothing new since last publish
+        self._last_snapshot_published = updated_at
+
+        rows = await market_snapshot_service.get_all_markets()
+        now = datetime.utcnow()
+        ticks = []
+        for row in rows:
+            symbol = str(row.get("symbol") or "").upper()
+            price = _as_float(row.get("current_price"))
+            if not symbol or price <= 0:
+                continue
+            ticks.append(PriceTick(
+                symbol=symbol,
+                price=price,
+                market_cap_usd=_as_float(row.get("market_cap_usd")),
+                open_interest_usd=_as_float(row.get("open_interest_usd")),
+                change_pct={
+                    window: _as_float(row.get(field_name))
+                    for window, field_name in self.PRICE_CHANGE_FIELDS.items()
+                    if row.get(field_name) is not None
+                },
+                timestamp=now,
+            ))
+
+        self.stats["price_polls"] += 1
+        await self.bus.publish(TOPIC_PRICE, ticks)
+        return len(ticks)
+
+    async def poll_liquidations(self) -> int:
+        """Publish one LiquidationTick (1h totals) per coin from a single coin-list call"""
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+
+        result = await coinglass_comprehensive.fetch_liquidation_coin_list_raw(self.liquidation_exchange)
+        if not result.get("success"):
+            logger.warning(f"⚠️  Liquidation coin-list poll failed: {result.get('error')}")
+            return 0
+
+        now = datetime.utcnow()
+        ticks = []
+        for row in result.get("data", []):
+            symbol = str(row.get("symbol") or "").upper().replace("USDT", "")
+            if not symbol:
+                continue
+            ticks.append(LiquidationTick(
+                symbol=symbol,
+                long_usd=_as_float(row.get("long_liquidation_usd_1h", row.get("longLiquidationUsd1h"))),
+                short_usd=_as_float(row.get("short_liquidation_usd_1h", row.get("shortLiquidationUsd1h"))),
+                window="1h",
+                timestamp=now,
+                exchange=self.liquidation_exchange,
+            ))
+
+        self.stats["liquidation_polls"] += 1
+        await self.bus.publish(TOPIC_LIQUIDATION, ticks)
+        return len(ticks)
+
+    async def poll_social(self) -> int:
+        """Publish one SocialTick per coin from a single LunarCrush coins/list/v2 call"""
+        from app.services.lunarcrush_comprehensive_service import lunarcrush_comprehensive
+
+        result = await lunarcrush_comprehensive.get_coins_realtime(
+            limit=self.social_universe, sort="market_cap"
+        )
+        if not result.get("success"):
+            logger.warning(f"⚠️  Social universe poll failed: {result.get('error')}")
+            return 0
+
+        now = datetime.utcnow()
+        ticks = [
+            SocialTick(
+                symbol=str(coin.get("symbol") or "").upper(),
+                social_volume=_as_float(coin.get("socialVolume")),
+                sentiment=_as_float(coin.get("sentiment")),
+                galaxy_score=_as_float(coin.get("galaxyScore")),
+                price=_as_float(coin.get("price")),
+                timestamp=now,
+                metadata={"alt_rank": coin.get("altRank"), "change24h": coin.get("change24h")},
+            )
+            for coin in result.get("coins", [])
+            if coin.get("symbol")
+        ]
+
+        self.stats["social_polls"] += 1
+        await self.bus.publish(TOPIC_SOCIAL, ticks)
+        return len(ticks)
+
+    # ==================== WEBSOCKET STREAM ====================
+
+    async def _run_liquidation_stream(self):
+        """Forward Coinglass liquidationOrders messages as LiquidationTick batches"""
+        from app.services.coinglass_websocket_service import coinglass_websocket_service
+
+        try:
+            await coinglass_websocket_service.stream_liquidation_batches(self._on_liquidation_messages)
+        except asyncio.CancelledError:
+            pass
+
+    async def _on_liquidation_messages(self, messages: List[Dict]):
+        """One bus publish per delivered WebSocket batch"""
+        orders = [
+            order
+            for message in messages
+            if message.get("channel") == "liquidationOrders"
+            for order in message.get("data", [])
+        ]
+
+        now = datetime.utcnow()
+        ticks = []
+        for order in orders:
+            volume = _as_float(order.get("volUsd"))
+            symbol = str(order.get("baseAsset") or "").upper()
+            if not symbol or volume <= 0:
+                continue
+            is_long = order.get("side") == 1  # 1=long liquidation, 2=short liquidation
+            ticks.append(LiquidationTick(
+                symbol=symbol,
+                long_usd=volume if is_long else 0.0,
+                short_usd=0.0 if is_long else volume,
+                window="order",
+                timestamp=now,
+                exchange=order.get("exName"),
+            ))
+
+        if ticks:
+            self.stats["stream_batches"] += 1
+            await self.bus.publish(TOPIC_LIQUIDATION_ORDERS, ticks)
+
+    def _stream_metrics(self) -> Optional[Dict]:
+        if not self.use_liquidation_stream:
+            return None
+        from app.services.coinglass_websocket_service import coinglass_websocket_service
+        return coinglass_websocket_service.get_metrics()
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "running": self.running,
+            "intervals": {
+                "price": self.price_interval,
+                "liquidation": self.liquidation_interval,
+                "social": self.social_interval,
+            },
+            "liquidation_stream": self.use_liquidation_stream,
+            "liquidation_stream_metrics": self._stream_metrics(),
+            "bus": self.bus.get_stats(),
+        }
+
+
+# Global feed instance
+market_data_feed = MarketDataFeed(market_data_bus)
@@ -0,0 +1,240 @@
+"""
+Market Snapshot Service
+Process-wide snapshot of the Coinglass futures universe (/api/futures/coins-markets)
+
+The coins-markets endpoint always returns the ENTIRE futures universe, so fetching
+it once per symbol wastes quota and latency. This service pulls the payload once,
+indexes it by normalized symbol and serves per-symbol lookups from memory.
+
+Features:
+- Single upstream pull shared by signal engine, tiered scanner, MSS and smart money
+- O(1) dict lookups by base symbol (BTC) or Coinglass pair (BTCUSDT)
+- Scheduled background refresh + lazy refresh on stale reads
+- Refresh lock prevents concurrent callers from stampeding the upstream
+- Serves last good snapshot if a refresh fails (bounded by max staleness)
+"""
+
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+from app.utils.logger import get_logger
+from app.utils.symbol_normalizer import get_base_symbol
+
+logger = get_logger(__name__)
+
+
+class MarketSnapshotService:
+    """
+    Shared, periodically refreshed coins-markets snapshot
+
+    Usage:
+        row = await market_snapshot_service.get_market("BTC")
+        rows = await market_snapshot_service.get_all_markets()
+    """
+
+    def __init__(
+        self,
+        refresh_interval: Optional[float] = None,
+        max_staleness: Optional[float] = None,
+    ):
+        # Snapshot is considered fresh for refresh_interval seconds
+        self.refresh_interval = refresh_interval or float(
+            os.getenv("MARKET_SNAPSHOT_REFRESH_SECONDS", "60")
+        )
+        # After a failed refresh we keep serving the old snapshot up to this age
+        self.max_staleness = max_staleness or float(
+            os.getenv("MARKET_SNAPSHOT_MAX_STALENESS_SECONDS", "600")
+        )
+
+        self._rows: List[Dict] = []
+        self._by_symbol: Dict[str, Dict] = {}
+        self._updated_at: float = 0.0  # time.monotonic() of last successful refresh
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.running = False
+
+        self.stats = {
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "lookups": 0,
+            "lookup_misses": 0,
+            "last_error": None,
+        }
+
+    # ==================== LIFECYCLE ====================
+
+    async def start(self):
+        """Start background refresh loop"""
+        if self.running:
+            logger.warning("Market snapshot service already running")
+            return
+
+        self.running = True
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.info(
+            f"📸 Market snapshot service started (refresh every {self.refresh_interval:.0f}s)"
+        )
+
+    async def stop(self):
+        """Stop background refresh loop"""
+        self.running = False
+
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+        logger.info("📸 Market snapshot service stopped")
+
+    async def _refresh_loop(self):
+        """Refresh snapshot on a fixed schedule"""
+        while self.running:
+            try:
+                await self.refresh()
+                await asyncio.sleep(self.refresh_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in market snapshot loop: {e}")
+                await asyncio.sleep(min(self.refresh_interval, 30))
+
+    # ==================== REFRESH ====================
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        """Age of current snapshot in seconds (None if never loaded)"""
+        if not self._updated_at:
+            return None
+        return time.monotonic() - self._updated_at
+
+    def is_fresh(self) -> bool:
+        """True if snapshot is loaded and younger than refresh_interval"""
+        age = self.age_seconds
+        return age is not None and age < self.refresh_interval
+
+    def _is_servable(self) -> bool:
+        """True if snapshot is loaded and not older than max_staleness"""
+        age = self.age_seconds
+        return age is not None and age < self.max_staleness
+
+    async def refresh(self) -> bool:
+        """
+        Pull coins-markets once and rebuild the symbol index
+
+        Returns:
+            True if the snapshot was refreshed successfully
+        """
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+
+        result = await coinglass_comprehensive.fetch_coins_markets_raw()
+
+        if not result.get("success"):
+            self.stats["refresh_failures"] += 1
+            self.stats["last_error"] = result.get("error")
+            logger.warning(f"⚠️  Market snapshot refresh failed: {result.get('error')}")
+            return False
+
+        rows = result.get("data", [])
+        self._rows = rows
+        self._by_symbol = self._build_index(rows)
+        self._updated_at = time.monotonic()
+        self.stats["refreshes"] += 1
+        self.stats["last_error"] = None
+
+        logger.debug(f"📸 Market snapshot refreshed: {len(rows)} coins indexed")
+        return True
+
+    @staticmethod
+    def _build_index(rows: List[Dict]) -> Dict[str, Dict]:
+        """
+        Index rows by base symbol and Coinglass pair form
+
+        Coinglass returns base symbols (BTC) in coins-markets, while callers pass
+        either BTC or BTCUSDT - both keys point at the same row.
+        """
+        index: Dict[str, Dict] = {}
+        for row in rows:
+            raw_symbol = str(row.get("symbol") or "").upper()
+            if not raw_symbol:
+                continue
+            base = get_base_symbol(raw_symbol)
+            index.setdefault(raw_symbol, row)
+            index.setdefault(base, row)
+            index.setdefault(f"{base}USDT", row)
+        return index
+
+    async def ensure_fresh(self) -> bool:
+        """
+        Refresh snapshot if stale (single-flight - one refresh for all waiters)
+
+        Returns:
+            True if a servable snapshot is available
+        """
+        if self.is_fresh():
+            return True
+
+        async with self._refresh_lock:
+            # Another waiter may have refreshed while we waited for the lock
+            if not self.is_fresh():
+                await self.refresh()
+
+        return self._is_servable()
+
+    # ==================== LOOKUPS ====================
+
+    async def get_market(self, symbol: str) -> Optional[Dict]:
+        """
+        Get raw coins-markets row for a symbol
+
+        Args:
+            symbol: Symbol in any format (BTC, BTCUSDT, BTC-USDT-SWAP)
+
+        Returns:
+            Raw Coinglass row or None if unavailable
+        """
+        if not await self.ensure_fresh():
+            return None
+        return self.lookup(symbol)
+
+    def lookup(self, symbol: str) -> Optional[Dict]:
+        """Synchronous O(1) lookup against the current snapshot (no refresh)"""
+        self.stats["lookups"] += 1
+        key = symbol.upper().strip()
+        row = self._by_symbol.get(key) or self._by_symbol.get(get_base_symbol(key))
+        if row is None:
+            self.stats["lookup_misses"] += 1
+        return row
+
+    async def get_markets(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """Get rows for many symbols with a single freshness check"""
+        if not await self.ensure_fresh():
+            return {symbol: None for symbol in symbols}
+        return {symbol: self.lookup(symbol) for symbol in symbols}
+
+    async def get_all_markets(self) -> List[Dict]:
+        """Get the full coins-markets universe from the snapshot"""
+        if not await self.ensure_fresh():
+            return []
+        return self._rows
+
+    def get_stats(self) -> Dict:
+        """Get snapshot statistics"""
+        age = self.age_seconds
+        return {
+            **self.stats,
+            "running": self.running,
+            "coins": len(self._rows),
+            "indexed_keys": len(self._by_symbol),
+            "age_seconds": round(age, 1) if age is not None else None,
+            "refresh_interval": self.refresh_interval,
+            "fresh": self.is_fresh(),
+        }
+
+
+# Global instance for easy import
+market_snapshot_service = MarketSnapshotService()
@@ -1,9 +1,18 @@
 """
 Market Summary Service
 Aggregates market data across major cryptocurrencies to provide overall market condition
+
+Computed from shared bulk data instead of one full build_signal per coin:
+- coins-markets snapshot (market_snapshot_service) - price, funding, OI, L/S, liquidations
+- one Fear & Greed fetch (5-minute cache)
+- liquidation exchange list (market-wide 24h liquidations)
+- per-symbol scores from recent full signal builds when still cached
+  (SIGNAL_SCORE_CACHE_TTL), otherwise a snapshot score (signal_engine.score_market_snapshot)
+
+No OpenAI calls and at most three upstream requests per summary.
 """
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 
@@ -15,6 +24,7 @@ class MarketSummaryService:
     
     # Major coins untuk analisis pasar
     MAJOR_COINS = ["BTC", "ETH", "SOL", "XRP", "BNB"]
+    MODE = "aggressive"
     
     async def get_market_summary(self) -> Dict[str, Any]:
         """
@@ -29,15 +39,18 @@ class MarketSummaryService:
             - recommendations: Trading recommendations based on market state
         """
         from app.core.signal_engine import signal_engine
+        from app.services.cached_data_service import cached_data_service
+        from app.services.coinglass_comprehensive_service import coinglass_comprehensive
+        from app.services.market_snapshot_service import market_snapshot_service
         
-        # Fetch signals for all major coins in parallel
-        tasks = [
-            signal_engine.build_signal(coin, debug=False, mode="aggressive")
-            for coin in self.MAJOR_COINS
-        ]
-        
+        # Bulk fetches in parallel - one request each, shared by all coins
         try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            markets, fear_greed, liquidations = await asyncio.gather(
+                market_snapshot_service.get_markets(self.MAJOR_COINS),
+                cached_data_service.get_fear_greed_cached(),
+                coinglass_comprehensive.get_liquidation_exchange_list(range="24h"),
+                return_exceptions=True,
+            )
         except Exception as e:
             return {
                 "success": False,
@@ -45,40 +58,54 @@ class MarketSummaryService:
                 "timestamp": datetime.utcnow().isoformat()
             }
         
+        if isinstance(markets, BaseException):
+            markets = {coin: None for coin in self.MAJOR_COINS}
+        fear_greed_value = self._fear_greed_value(fear_greed)
+        
+        cached_scores = await asyncio.gather(
+            *(signal_engine.get_cached_score(coin, self.MODE) for coin in self.MAJOR_COINS)
+        )
+        
         # Process results
         coin_signals = {}
         valid_results = []
+        sources = {"signal_cache": 0, "market_snapshot": 0}
         
-        for i, result in enumerate(results):
-            coin = self.MAJOR_COINS[i]
+        for coin, cached in zip(self.MAJOR_COINS, cached_scores):
+            row = markets.get(coin)
             
-            if isinstance(result, Exception):
-                coin_signals[coin] = {
-                    "error": str(result),
-                    "signal": "UNAVAILABLE"
-                }
-            elif isinstance(result, dict):
-                coin_signals[coin] = {
-                    "signal": result.get("signal", "UNKNOWN"),
-                    "score": result.get("score", 0),
-                    "price": result.get("price", 0),
-                    "confidence": result.get("confidence", "unknown")
-                }
-                
-                # Only include successful results for aggregation
-                if "metrics" in result:
-                    valid_results.append({
-                        "coin": coin,
-                        "data": result
-                    })
+            if cached:
+                result, source = cached, "signal_cache"
+            elif row:
+                result, source = signal_engine.score_market_snapshot(row, fear_greed_value, self.MODE), "market_snapshot"
             else:
                 coin_signals[coin] = {
-                    "error": "Invalid response type",
+                    "error": "No market data in snapshot",
                     "signal": "UNAVAILABLE"
                 }
+                continue
+            
+            sources[source] += 1
+            coin_signals[coin] = {
+                "signal": result.get("signal", "UNKNOWN"),
+                "score": result.get("score", 0),
+                "price": result.get("price", 0),
+                "confidence": result.get("confidence", "unknown"),
+                "source": source,
+            }
+            valid_results.append({
+                "coin": coin,
+                "data": {
+                    "signal": result.get("signal", "NEUTRAL"),
+                    "score": result.get("score", 50),
+                    "metrics": {"fundingRate": result.get("fundingRate") or 0},
+                },
+            })
         
         # Calculate aggregate metrics
         aggregate = self._calculate_aggregates(valid_results)
+        aggregate["fear_greed_index"] = fear_greed_value
+        aggregate["liquidations_24h"] = self._liquidation_summary(liquidations)
         
         # Determine market sentiment
         market_sentiment = self._determine_market_sentiment(coin_signals, aggregate)
@@ -100,10 +127,38 @@ class MarketSummaryService:
             "data_quality": {
                 "coins_analyzed": len(self.MAJOR_COINS),
                 "successful_fetches": len(valid_results),
-                "coverage_percent": round((len(valid_results) / len(self.MAJOR_COINS)) * 100, 1)
+                "coverage_percent": round((len(valid_results) / len(self.MAJOR_COINS)) * 100, 1),
+                "score_sources": sources,
+                "snapshot_age_seconds": (
+                    round(market_snapshot_service.age_seconds, 1)
+                    if market_snapshot_service.age_seconds is not None else None
+                ),
             }
         }
     
+    @staticmethod
+    def _fear_greed_value(fear_greed: Any) -> float:
+        """Fear & Greed value from the cached index response (50 if unavailable)"""
+        if isinstance(fear_greed, dict):
+            try:
+                return float(fear_greed.get("value", 50))
+            except (TypeError, ValueError):
+                pass
+        return 50.0
+    
+    @staticmethod
+    def _liquidation_summary(liquidations: Any) -> Optional[Dict[str, Any]]:
+        """Market-wide 24h liquidations from the exchange list (None if unavailable)"""
+        if not isinstance(liquidations, dict) or not liquidations.get("success"):
+            return None
+        summary = liquidations.get("marketSummary", {})
+        return {
+            "total_usd": round(summary.get("totalLiquidation", 0)),
+            "long_percent": round(summary.get("longPercent", 0), 1),
+            "short_percent": round(summary.get("shortPercent", 0), 1),
+            "sentiment": summary.get("sentiment", "UNKNOWN"),
+        }
+    
     def _calculate_aggregates(self, valid_results: List[Dict]) -> Dict[str, Any]:
         """Calculate aggregate metrics across all coins"""
         if not valid_results:
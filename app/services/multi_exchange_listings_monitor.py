@@ -3,7 +3,6 @@ Multi-Exchange Listings Monitor
 Combines Binance, OKX, and CoinAPI data to overcome region restrictions
 """
 
-import httpx
 import asyncio
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
@@ -12,6 +11,7 @@ import logging
 from app.services.binance_listings_monitor import BinanceListingsMonitor
 from app.services.okx_service import okx_service
 from app.services.coinapi_service import coinapi_service
+from app.core.http_clients import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -119,7 +119,7 @@ class MultiExchangeListingsMonitor:
             url = "https://www.okx.com/api/v5/public/instruments"
             params = {"instType": "SWAP", "uly": "USDT"}
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("okx", timeout=10.0) as client:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
 
@@ -185,7 +185,7 @@ class MultiExchangeListingsMonitor:
             url = "https://rest.coinapi.io/v1/symbols"
             headers = {"X-CoinAPI-Key": "YOUR_COINAPI_KEY"}  # Use env var in production
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("coinapi", timeout=10.0) as client:
                 response = await client.get(url, headers=headers)
                 response.raise_for_status()
 
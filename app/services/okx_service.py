@@ -6,8 +6,11 @@ import httpx
 from typing import Dict, List, Optional
 from app.utils.symbol_normalizer import normalize_symbol, Provider
 from app.utils.logger import logger
+from app.utils.single_flight import coalesce_provider_calls
+from app.core.http_clients import http_clients
 
 
+@coalesce_provider_calls("okx")
 class OKXService:
     """Service for interacting with OKX public API"""
     
@@ -48,7 +51,7 @@ class OKXService:
             url = f"{self.base_url}/market/ticker"
             params = {"instId": inst_id}
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("okx", timeout=10.0) as client:
                 response = await client.get(url, params=params)
                 
                 if response.status_code != 200:
@@ -155,7 +158,7 @@ class OKXService:
                 "limit": min(limit, 300)  # OKX max is 300
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("okx", timeout=10.0) as client:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
                 
@@ -230,7 +233,7 @@ class OKXService:
             url = f"{self.base_url}/public/funding-rate"
             params = {"instId": inst_id}
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("okx", timeout=10.0) as client:
                 response = await client.get(url, params=params)
                 
                 if response.status_code != 200:
@@ -318,7 +321,7 @@ class OKXService:
                 "instId": inst_id
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("okx", timeout=10.0) as client:
                 response = await client.get(url, params=params)
                 
                 if response.status_code != 200:
@@ -12,6 +12,7 @@ from datetime import datetime
 import json
 
 from app.utils.logger import default_logger
+from app.core.http_clients import http_clients
 
 
 @dataclass
@@ -40,24 +41,21 @@ class OpenAIService:
     def __init__(self, config: OpenAIConfig):
         self.config = config
         self.logger = default_logger
-        self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if not self._client or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=self.config.timeout,
-                headers={
-                    "Authorization": f"Bearer {self.config.api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client(
+            "openai",
+            timeout=self.config.timeout,
+            headers={
+                "Authorization": f"Bearer {self.config.api_key}",
+                "Content-Type": "application/json",
+            },
+        )
 
     async def close(self):
-        """Close HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
 
     async def analyze_signal_with_gpt(
         self,
@@ -14,6 +14,8 @@ from datetime import datetime
 import json
 
 from app.utils.logger import default_logger
+from app.core.http_clients import http_clients
+from app.services.ai_verdict_cache import ai_verdict_cache
 
 
 @dataclass
@@ -41,30 +43,28 @@ class OpenAIServiceV2:
     def __init__(self, config: OpenAIConfigV2):
         self.config = config
         self.logger = default_logger
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if not self._client or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=self.config.timeout,
-                headers={
-                    "Authorization": f"Bearer {self.config.api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-        return self._client
+        """Shared pooled client for this provider (owned by http_clients)"""
+        return http_clients.client(
+            "openai",
+            timeout=self.config.timeout,
+            headers={
+                "Authorization": f"Bearer {self.config.api_key}",
+                "Content-Type": "application/json",
+            },
+        )
     
     async def close(self):
-        """Close HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed by http_clients on shutdown"""
+        return None
     
     async def validate_signal_with_verdict(
         self,
         symbol: str,
         signal_data: Dict[str, Any],
         comprehensive_metrics: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Phase 1: Enhanced signal validation with verdict system (GPT-5.1 Intelligence)
@@ -77,7 +77,25 @@ class OpenAIServiceV2:
         - telegram_summary: ready-to-send alert text
         
         ✅ NEW: Includes historical performance context for GPT-4o analysis
+        ⚡ Verdicts are reused from ai_verdict_cache while the signal's
+        fingerprint (symbol/signal/mode + score/funding/OI/LS buckets) is
+        unchanged - pass use_cache=False to force a fresh LLM call
         """
+        if not use_cache:
+            return await self._validate_signal_uncached(symbol, signal_data, comprehensive_metrics)
+        return await ai_verdict_cache.get_or_judge(
+            symbol,
+            signal_data,
+            lambda: self._validate_signal_uncached(symbol, signal_data, comprehensive_metrics),
+        )
+    
+    async def _validate_signal_uncached(
+        self,
+        symbol: str,
+        signal_data: Dict[str, Any],
+        comprehensive_metrics: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Signal Judge LLM call (no cache)"""
         try:
             client = await self._get_client()
             
@@ -0,0 +1,487 @@
+"""
+Outcome Evaluator
+Durable, batched evaluation of signal outcomes driven by the database
+
+Replaces the per-signal asyncio.sleep tasks of OutcomeTracker and the
+per-signal APScheduler jobs of PerformanceTracker. The tables ARE the
+schedule, so nothing is lost on restart:
+
+- signal_outcomes       1h / 4h / 24h      due when tracked_at_<interval> IS NULL
+                                           and entry_timestamp <= now - interval
+- performance_outcomes  1h / 4h / 24h /    pending rows (checked_at IS NULL)
+                        7d / 30d           due when due_at <= now
+
+Each tick selects every due row across intervals, groups them by symbol and
+fetches one Binance Futures kline window per symbol (and resolution) that
+covers all of that symbol's due windows. The exit price is the close of the
+last candle before the interval mark; max favorable / adverse excursion come
+from the candle highs and lows inside the window. Symbols without candles use
+the shared coins-markets snapshot while the mark is recent (no excursion
+data). Results go back with one batched UPDATE per table and interval.
+
+Rows that still have no price OUTCOME_EVAL_GIVE_UP_HOURS after their mark are
+closed without an outcome so they do not block the queue.
+"""
+
+import asyncio
+import bisect
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.services.binance_futures_service import binance_futures_service
+from app.services.market_snapshot_service import market_snapshot_service
+from app.storage.database import db
+from app.storage.sqlite_pool import to_sqlite
+from app.utils.logger import get_logger, get_wib_datetime
+from app.utils.symbol_normalizer import get_base_symbol
+
+logger = get_logger(__name__)
+
+
+WIB = timezone(timedelta(hours=7))
+
+# Intervals tracked per table (seconds)
+SIGNAL_OUTCOME_INTERVALS = {"1h": 3600, "4h": 14400, "24h": 86400}
+PERFORMANCE_INTERVALS = {"1h": 3600, "4h": 14400, "24h": 86400, "7d": 604800, "30d": 2592000}
+
+# Kline resolutions, finest first - each window uses the finest one with <= MAX_WINDOW_BARS bars
+KLINE_RESOLUTIONS = (
+    ("1m", 60_000),
+    ("5m", 300_000),
+    ("15m", 900_000),
+    ("1h", 3_600_000),
+    ("4h", 14_400_000),
+    ("1d", 86_400_000),
+)
+MAX_WINDOW_BARS = 300
+MAX_KLINES_PER_REQUEST = 1500
+
+
+@dataclass
+class DueOutcome:
+    """One (row, interval) evaluation that is due"""
+
+    table: str
+    row_id: int
+    symbol: str
+    signal_type: str
+    interval: str
+    entry_price: float
+    entry_ms: int
+    mark_ms: int
+    exit_price: Optional[float] = None
+    mfe_pct: Optional[float] = None
+    mae_pct: Optional[float] = None
+    scanner_type: Optional[str] = None
+    tier: Optional[str] = None
+    unified_score: Optional[float] = None
+
+
+def _to_wib(value: Any) -> Optional[datetime]:
+    """DB timestamp (naive = WIB, ISO string or datetime) -> aware WIB datetime"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=WIB)
+    return value.astimezone(WIB)
+
+
+def _to_ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _db_time(value: datetime) -> Any:
+    """Timestamp parameter in the convention of the active backend"""
+    if db.use_postgres:
+        return value.astimezone(WIB).replace(tzinfo=None)
+    return value.astimezone(WIB).isoformat()
+
+
+def _resolution(window_ms: int) -> Tuple[str, int]:
+    for name, resolution_ms in KLINE_RESOLUTIONS:
+        if window_ms // resolution_ms <= MAX_WINDOW_BARS:
+            return name, resolution_ms
+    return KLINE_RESOLUTIONS[-1]
+
+
+def _excursions(signal_type: str, entry: float, high: float, low: float) -> Tuple[float, float]:
+    """(max favorable, max adverse) excursion in % for the signal direction"""
+    if signal_type.upper() == "SHORT":
+        return (entry - low) / entry * 100, (entry - high) / entry * 100
+    return (high - entry) / entry * 100, (low - entry) / entry * 100
+
+
+class OutcomeEvaluator:
+    """
+    Single background evaluator for every tracked outcome
+
+    Usage:
+        await outcome_evaluator.start()          # periodic ticks
+        summary = await outcome_evaluator.run_once()
+    """
+
+    def __init__(self):
+        self.tick_seconds = float(os.getenv("OUTCOME_EVAL_INTERVAL_SECONDS", "60"))
+        self.batch_size = int(os.getenv("OUTCOME_EVAL_BATCH_SIZE", "500"))
+        self.concurrency = int(os.getenv("OUTCOME_EVAL_CONCURRENCY", "5"))
+        self.give_up_after = timedelta(hours=float(os.getenv("OUTCOME_EVAL_GIVE_UP_HOURS", "48")))
+        # Snapshot prices only stand in for the mark price while the mark is this recent
+        self.snapshot_max_lag_ms = int(float(os.getenv("OUTCOME_EVAL_SNAPSHOT_MAX_LAG_SECONDS", "900")) * 1000)
+
+        self._task: Optional[asyncio.Task] = None
+        self._run_lock = asyncio.Lock()
+        self.stats = {
+            "ticks": 0,
+            "due": 0,
+            "evaluated": 0,
+            "from_candles": 0,
+            "from_snapshot": 0,
+            "expired": 0,
+            "kline_requests": 0,
+            "errors": 0,
+            "last_tick": None,
+        }
+
+    # ==================== LIFECYCLE ====================
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"🎯 Outcome evaluator started (tick every {self.tick_seconds:.0f}s)")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("🎯 Outcome evaluator stopped")
+
+    async def _run_loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Outcome evaluation tick failed: {e}")
+            await asyncio.sleep(self.tick_seconds)
+
+    # ==================== TICK ====================
+
+    async def run_once(self) -> Dict[str, Any]:
+        """Evaluate everything that is due now"""
+        async with self._run_lock:
+            now = get_wib_datetime()
+            due = await self._select_due(now)
+            self.stats["ticks"] += 1
+            self.stats["last_tick"] = now.isoformat()
+            if not due:
+                return {"due": 0, "evaluated": 0, "expired": 0, "symbols": 0}
+
+            by_symbol: Dict[str, List[DueOutcome]] = {}
+            for item in due:
+                by_symbol.setdefault(get_base_symbol(item.symbol.upper()), []).append(item)
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def price_symbol(symbol: str, items: List[DueOutcome]):
+                async with semaphore:
+                    await self._price_from_candles(symbol, items)
+
+            await asyncio.gather(*(price_symbol(s, items) for s, items in by_symbol.items()))
+            await self._price_from_snapshot([item for item in due if item.exit_price is None], _to_ms(now))
+
+            evaluated, expired = await self._write_results(due, now)
+            self.stats["due"] += len(due)
+            self.stats["evaluated"] += evaluated
+            self.stats["expired"] += expired
+            logger.info(
+                f"Outcome evaluation: {len(due)} due across {len(by_symbol)} symbols, "
+                f"{evaluated} evaluated, {expired} expired"
+            )
+            return {"due": len(due), "evaluated": evaluated, "expired": expired, "symbols": len(by_symbol)}
+
+    async def _select_due(self, now: datetime) -> List[DueOutcome]:
+        due: List[DueOutcome] = []
+        for interval, seconds in SIGNAL_OUTCOME_INTERVALS.items():
+            threshold = _db_time(now - timedelta(seconds=seconds))
+            rows = await self._fetch(
+                f"""
+                SELECT id, symbol, signal_type, entry_price, entry_timestamp
+                FROM signal_outcomes
+                WHERE tracked_at_{interval} IS NULL
+                AND entry_timestamp <= {{0}}
+                ORDER BY entry_timestamp ASC
+                LIMIT {{1}}
+                """,
+                threshold, self.batch_size
+            )
+            for row_id, symbol, signal_type, entry_price, entry_timestamp in rows:
+                entry_ms = _to_ms(_to_wib(entry_timestamp))
+                due.append(DueOutcome(
+                    "signal_outcomes", row_id, symbol, signal_type or "", interval,
+                    float(entry_price), entry_ms, entry_ms + seconds * 1000
+                ))
+
+        rows = await self._fetch(
+            """
+            SELECT id, symbol, signal_type, interval, entry_price, due_at,
+                   scanner_type, tier, unified_score
+            FROM performance_outcomes
+            WHERE checked_at IS NULL
+            AND due_at <= {0}
+            ORDER BY due_at ASC
+            LIMIT {1}
+            """,
+            _db_time(now), self.batch_size
+        )
+        for row_id, symbol, signal_type, interval, entry_price, due_at, scanner_type, tier, score in rows:
+            seconds = PERFORMANCE_INTERVALS.get(interval)
+            if seconds is None:
+                continue
+            mark_ms = _to_ms(_to_wib(due_at))
+            due.append(DueOutcome(
+                "performance_outcomes", row_id, symbol, signal_type or "", interval,
+                float(entry_price), mark_ms - seconds * 1000, mark_ms,
+                scanner_type=scanner_type, tier=tier,
+                unified_score=float(score) if score is not None else None
+            ))
+        return [item for item in due if item.entry_price > 0]
+
+    # ==================== PRICING ====================
+
+    async def _price_from_candles(self, symbol: str, items: List[DueOutcome]):
+        """One kline request per symbol and resolution (split only if the span exceeds one page)"""
+        by_resolution: Dict[Tuple[str, int], List[DueOutcome]] = {}
+        for item in items:
+            by_resolution.setdefault(_resolution(item.mark_ms - item.entry_ms), []).append(item)
+
+        for (name, resolution_ms), group in by_resolution.items():
+            group.sort(key=lambda item: item.entry_ms)
+            cluster: List[DueOutcome] = []
+            cluster_start = 0
+            for item in group:
+                start = item.entry_ms // resolution_ms * resolution_ms
+                if cluster and (item.mark_ms - cluster_start) // resolution_ms >= MAX_KLINES_PER_REQUEST:
+                    await self._apply_klines(symbol, name, resolution_ms, cluster_start, cluster)
+                    cluster = []
+                if not cluster:
+                    cluster_start = start
+                cluster.append(item)
+            if cluster:
+                await self._apply_klines(symbol, name, resolution_ms, cluster_start, cluster)
+
+    async def _apply_klines(
+        self, symbol: str, resolution: str, resolution_ms: int, start_ms: int, items: List[DueOutcome]
+    ):
+        end_ms = max(item.mark_ms for item in items)
+        self.stats["kline_requests"] += 1
+        result = await binance_futures_service.get_klines(
+            f"{symbol}USDT", resolution, MAX_KLINES_PER_REQUEST, start_time=start_ms, end_time=end_ms
+        )
+        candles = result.get("candles") if result.get("success") else None
+        if not candles:
+            return
+
+        opens = [candle["timestamp"] for candle in candles]
+        for item in items:
+            lo = bisect.bisect_left(opens, item.entry_ms // resolution_ms * resolution_ms)
+            hi = bisect.bisect_left(opens, item.mark_ms)
+            if hi <= lo:
+                continue
+            window = candles[lo:hi]
+            item.exit_price = window[-1]["close"]
+            item.mfe_pct, item.mae_pct = _excursions(
+                item.signal_type,
+                item.entry_price,
+                max(candle["high"] for candle in window),
+                min(candle["low"] for candle in window),
+            )
+            self.stats["from_candles"] += 1
+
+    async def _price_from_snapshot(self, items: List[DueOutcome], now_ms: int):
+        recent = [item for item in items if now_ms - item.mark_ms <= self.snapshot_max_lag_ms]
+        if not recent:
+            return
+        markets = await market_snapshot_service.get_markets(list({item.symbol for item in recent}))
+        for item in recent:
+            row = markets.get(item.symbol)
+            price = row.get("current_price") if row else None
+            if price:
+                item.exit_price = float(price)
+                self.stats["from_snapshot"] += 1
+
+    # ==================== WRITES ====================
+
+    async def _write_results(self, due: List[DueOutcome], now: datetime) -> Tuple[int, int]:
+        # Imported here - both trackers import this module lazily
+        from app.services.outcome_tracker import outcome_tracker
+        from app.services.performance_tracker import performance_tracker
+        from app.services.performance_rollup import performance_rollup
+
+        give_up_ms = _to_ms(now - self.give_up_after)
+        signal_rows: Dict[str, List[tuple]] = {}
+        performance_rows: List[tuple] = []
+        expired_performance: List[int] = []
+        evaluated = expired = 0
+
+        for item in due:
+            if item.exit_price is None:
+                if item.mark_ms > give_up_ms:
+                    continue  # Stays due - retried next tick
+                expired += 1
+                if item.table == "signal_outcomes":
+                    signal_rows.setdefault(item.interval, []).append((item.row_id, None, None, None, None, None))
+                else:
+                    expired_performance.append(item.row_id)
+                continue
+
+            evaluated += 1
+            if item.table == "signal_outcomes":
+                pnl = outcome_tracker.calculate_pnl(item.entry_price, item.exit_price, item.signal_type)
+                outcome = outcome_tracker.classify_outcome(pnl)
+                signal_rows.setdefault(item.interval, []).append(
+                    (item.row_id, item.exit_price, outcome, pnl, item.mfe_pct, item.mae_pct)
+                )
+            else:
+                pnl = round((item.exit_price - item.entry_price) / item.entry_price * 100, 2)
+                outcome = performance_tracker.determine_outcome(item.signal_type, pnl)
+                performance_tracker.record_result(outcome)
+                performance_rows.append(
+                    (item.row_id, item.exit_price, outcome, pnl, item.mfe_pct, item.mae_pct)
+                )
+
+        if performance_rows:
+            # One-time backfill of pre-rollup outcomes, before this batch is folded in
+            await performance_rollup.ensure_built()
+
+        checked_at = _db_time(now)
+        for interval, rows in signal_rows.items():
+            await self._update_many(
+                "signal_outcomes",
+                {
+                    f"price_{interval}": "price",
+                    f"outcome_{interval}": "outcome",
+                    f"pnl_{interval}": "pnl",
+                    f"mfe_{interval}": "mfe",
+                    f"mae_{interval}": "mae",
+                },
+                f"tracked_at_{interval}",
+                rows,
+                checked_at,
+            )
+        if performance_rows:
+            # Outcomes and their rollup counters commit together
+            await self._update_many(
+                "performance_outcomes",
+                {"exit_price": "price", "outcome": "outcome", "pnl_pct": "pnl", "mfe_pct": "mfe", "mae_pct": "mae"},
+                "checked_at",
+                performance_rows,
+                checked_at,
+                then=performance_rollup.fold_statements(checked_at, [row[0] for row in performance_rows]),
+            )
+        if expired_performance:
+            await self._delete_pending(expired_performance)
+        return evaluated, expired
+
+    async def _update_many(
+        self,
+        table: str,
+        columns: Dict[str, str],
+        stamp_column: str,
+        rows: List[tuple],
+        stamp: Any,
+        then: Sequence[tuple] = (),
+    ):
+        """
+        One batched UPDATE for rows of (id, price, outcome, pnl, mfe, mae)
+
+        Only rows whose stamp column is still NULL are written. PostgreSQL joins
+        an unnest() of the value arrays; SQLite runs an executemany. Either way
+        the UPDATE and the (query, args) statements in then share one transaction.
+        """
+        if db.use_postgres:
+            assignments = ", ".join(f"{column} = v.{value}" for column, value in columns.items())
+            ids, prices, outcomes, pnls, mfes, maes = (list(values) for values in zip(*rows))
+            async with db.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        f"""
+                        UPDATE {table} AS o
+                        SET {assignments}, {stamp_column} = $7
+                        FROM unnest($1::int[], $2::float8[], $3::text[], $4::float8[], $5::float8[], $6::float8[])
+                            AS v(id, price, outcome, pnl, mfe, mae)
+                        WHERE o.id = v.id AND o.{stamp_column} IS NULL
+                        """,
+                        ids, prices, outcomes, pnls, mfes, maes, stamp
+                    )
+                    for query, args in then:
+                        await conn.execute(query, *args)
+        else:
+            if not db.sqlite_pool:
+                await db.connect()
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            await db.sqlite_pool.write_atomic([
+                (
+                    f"UPDATE {table} SET {assignments}, {stamp_column} = ? WHERE id = ? AND {stamp_column} IS NULL",
+                    [(*row[1:], stamp, row[0]) for row in rows],
+                    True,
+                ),
+                *((*to_sqlite(query, args), False) for query, args in then),
+            ])
+
+    async def _delete_pending(self, ids: List[int]):
+        if db.use_postgres:
+            async with db.pool.acquire() as conn:
+                await conn.execute(
+                    "DELETE FROM performance_outcomes WHERE id = ANY($1::int[]) AND checked_at IS NULL", ids
+                )
+        else:
+            await db.sqlite_conn.executemany(
+                "DELETE FROM performance_outcomes WHERE id = ? AND checked_at IS NULL", [(i,) for i in ids]
+            )
+            await db.sqlite_conn.commit()
+
+    async def _fetch(self, query: str, *args) -> List[tuple]:
+        """Run a SELECT with {0}, {1}... placeholders on the active backend"""
+        if db.use_postgres:
+            if not db.pool:
+                return []
+            async with db.pool.acquire() as conn:
+                records = await conn.fetch(query.format(*(f"${i + 1}" for i in range(len(args)))), *args)
+                return [tuple(record.values()) for record in records]
+        if not db.sqlite_conn:
+            return []
+        async with db.sqlite_conn.execute(query.format(*("?" for _ in args)), args) as cursor:
+            return list(await cursor.fetchall())
+
+    # ==================== STATUS ====================
+
+    async def count_pending(self) -> Dict[str, int]:
+        """Rows still waiting for an evaluation (due or not), per table and interval"""
+        pending = {}
+        for interval in SIGNAL_OUTCOME_INTERVALS:
+            rows = await self._fetch(f"SELECT COUNT(*) FROM signal_outcomes WHERE tracked_at_{interval} IS NULL")
+            pending[f"signal_outcomes_{interval}"] = rows[0][0] if rows else 0
+        rows = await self._fetch("SELECT COUNT(*) FROM performance_outcomes WHERE checked_at IS NULL")
+        pending["performance_outcomes"] = rows[0][0] if rows else 0
+        return pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "running": self.running, "tick_seconds": self.tick_seconds}
+
+
+# Global instance for easy import
+outcome_evaluator = OutcomeEvaluator()
@@ -2,13 +2,14 @@
 Signal Outcome Tracker Service
 Monitors price movements after signals and calculates accuracy metrics
 Phase 2: AI Verdict Validation System
+
+Outcome rows are evaluated at 1h/4h/24h by the database-driven
+outcome_evaluator - recording the entry is all the scheduling a signal needs.
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from app.utils.logger import get_wib_datetime
-from typing import Optional, Dict, Any, List, Tuple
-import httpx
+from typing import Optional, Dict, Any
 from app.storage.database import db
 from app.utils.logger import logger
 
@@ -20,23 +21,10 @@ class OutcomeTracker:
     """
 
     def __init__(self):
-        self.http_client = httpx.AsyncClient(timeout=30.0)
-        
         # Outcome classification thresholds (percentage)
         self.win_threshold = 1.0  # 1% profit = WIN
         self.loss_threshold = -1.0  # -1% loss = LOSS
         # Between these = NEUTRAL
-        
-        # Prevent race conditions in concurrent updates
-        self._update_locks = {}  # outcome_id -> asyncio.Lock
-        self._locks_lock = asyncio.Lock()  # Protect _update_locks dict itself
-
-    async def _get_outcome_lock(self, outcome_id: int) -> asyncio.Lock:
-        """Get or create a lock for a specific outcome_id (thread-safe)"""
-        async with self._locks_lock:
-            if outcome_id not in self._update_locks:
-                self._update_locks[outcome_id] = asyncio.Lock()
-            return self._update_locks[outcome_id]
 
     async def record_signal_entry(
         self,
@@ -92,33 +80,6 @@ class OutcomeTracker:
             logger.error(f"Failed to record signal entry: {e}")
             return None
 
-    async def get_current_price(self, symbol: str) -> Optional[float]:
-        """
-        Fetch current price from Binance Futures
-        Fallback to multiple sources if needed
-        """
-        try:
-            # Try Binance Futures first (most reliable for crypto futures)
-            url = f"https://fapi.binance.com/fapi/v1/ticker/price?symbol={symbol}USDT"
-            response = await self.http_client.get(url)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return float(data["price"])
-            
-            # Fallback: Try spot price
-            url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}USDT"
-            response = await self.http_client.get(url)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return float(data["price"])
-
-            return None
-        except Exception as e:
-            logger.error(f"Failed to fetch price for {symbol}: {e}")
-            return None
-
     def calculate_pnl(
         self,
         entry_price: float,
@@ -156,154 +117,6 @@ class OutcomeTracker:
         else:
             return "NEUTRAL"
 
-    async def update_outcome(
-        self,
-        outcome_id: int,
-        interval: str  # "1h", "4h", "24h"
-    ) -> bool:
-        """
-        Update outcome for a specific time interval
-        Fetches current price, calculates P&L, classifies outcome
-        
-        Uses per-outcome locking to prevent race conditions
-        """
-        # Acquire lock for this outcome_id to serialize updates
-        lock = await self._get_outcome_lock(outcome_id)
-        async with lock:
-            return await self._update_outcome_locked(outcome_id, interval)
-    
-    async def _update_outcome_locked(
-        self,
-        outcome_id: int,
-        interval: str
-    ) -> bool:
-        """
-        Internal method: Update outcome (called under lock)
-        """
-        try:
-            # Fetch outcome record
-            if db.use_postgres:
-                if not db.pool:
-                    logger.error("PostgreSQL pool not initialized")
-                    return False
-                async with db.pool.acquire() as conn:
-                    record = await conn.fetchrow(
-                        """
-                        SELECT symbol, signal_type, entry_price
-                        FROM signal_outcomes
-                        WHERE id = $1
-                        """,
-                        outcome_id
-                    )
-            else:
-                if not db.sqlite_conn:
-                    logger.error("SQLite connection not initialized")
-                    return False
-                async with db.sqlite_conn.execute(
-                    """
-                    SELECT symbol, signal_type, entry_price
-                    FROM signal_outcomes
-                    WHERE id = ?
-                    """,
-                    (outcome_id,)
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    if row:
-                        record = {
-                            "symbol": row[0],
-                            "signal_type": row[1],
-                            "entry_price": row[2]
-                        }
-                    else:
-                        record = None
-
-            if not record:
-                logger.error(f"Outcome record {outcome_id} not found")
-                return False
-
-            # Get current price
-            current_price = await self.get_current_price(record["symbol"])
-            if not current_price:
-                logger.error(f"Could not fetch price for {record['symbol']}")
-                return False
-
-            # Calculate metrics
-            pnl = self.calculate_pnl(
-                float(record["entry_price"]),
-                current_price,
-                record["signal_type"]
-            )
-            outcome = self.classify_outcome(pnl)
-            now = get_wib_datetime()
-
-            # Update database
-            if db.use_postgres:
-                if not db.pool:
-                    logger.error("PostgreSQL pool not initialized")
-                    return False
-                async with db.pool.acquire() as conn:
-                    await conn.execute(
-                        f"""
-                        UPDATE signal_outcomes
-                        SET price_{interval} = $1,
-                            outcome_{interval} = $2,
-                            pnl_{interval} = $3,
-                            tracked_at_{interval} = $4
-                        WHERE id = $5
-                        """,
-                        current_price, outcome, pnl, now, outcome_id
-                    )
-            else:
-                if not db.sqlite_conn:
-                    logger.error("SQLite connection not initialized")
-                    return False
-                await db.sqlite_conn.execute(
-                    f"""
-                    UPDATE signal_outcomes
-                    SET price_{interval} = ?,
-                        outcome_{interval} = ?,
-                        pnl_{interval} = ?,
-                        tracked_at_{interval} = ?
-                    WHERE id = ?
-                    """,
-                    (current_price, outcome, pnl, now.isoformat(), outcome_id)
-                )
-                await db.sqlite_conn.commit()
-
-            logger.info(f"Updated outcome {outcome_id} at {interval}: {outcome} ({pnl:+.2f}%)")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to update outcome: {e}")
-            return False
-
-    async def schedule_outcome_tracking(
-        self,
-        outcome_id: int,
-        intervals: Optional[List[Tuple[str, int]]] = None
-    ):
-        """
-        Schedule outcome tracking at specified intervals
-        Default: 1h, 4h, 24h
-        """
-        if intervals is None:
-            intervals = [
-                ("1h", 3600),    # 1 hour = 3600 seconds
-                ("4h", 14400),   # 4 hours = 14400 seconds
-                ("24h", 86400)   # 24 hours = 86400 seconds
-            ]
-
-        async def track_at_interval(interval_name: str, delay_seconds: int):
-            """Background task to track outcome at specified delay"""
-            await asyncio.sleep(delay_seconds)
-            await self.update_outcome(outcome_id, interval_name)
-
-        # Schedule background tasks
-        for interval_name, delay in intervals:
-            asyncio.create_task(
-                track_at_interval(interval_name, delay)
-            )
-
     async def get_pending_outcomes(self, interval: str) -> list:
         """
         Get outcomes that need tracking at specified interval
@@ -364,29 +177,15 @@ class OutcomeTracker:
             logger.error(f"Failed to get pending outcomes: {e}")
             return []
 
-    async def process_pending_outcomes(self):
+    async def process_pending_outcomes(self) -> Dict[str, Any]:
         """
-        Process all pending outcomes across all intervals
-        Called periodically by background job or on-demand
+        Evaluate all due outcomes now (one batched evaluator tick)
+        Normally runs automatically in the outcome evaluator background loop
         """
-        logger.info("Processing pending outcome tracking...")
-
-        for interval in ["1h", "4h", "24h"]:
-            pending = await self.get_pending_outcomes(interval)
+        from app.services.outcome_evaluator import outcome_evaluator
 
-            if pending:
-                logger.info(f"Found {len(pending)} pending outcomes for {interval}")
-
-                for outcome_id in pending:
-                    await self.update_outcome(outcome_id, interval)
-                    # Small delay to avoid rate limits
-                    await asyncio.sleep(0.5)
-            else:
-                logger.info(f"No pending outcomes for {interval}")
-
-    async def close(self):
-        """Close HTTP client"""
-        await self.http_client.aclose()
+        logger.info("Processing pending outcome tracking...")
+        return await outcome_evaluator.run_once()
 
 
 # Global instance
@@ -14,9 +14,10 @@ import asyncio
 import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-import aiohttp
+import httpx
 from collections import defaultdict
 
+from app.core.http_clients import http_clients
 from app.utils.logger import default_logger
 
 
@@ -68,29 +69,16 @@ class SmartRateLimiter:
 
 
 class RequestPool:
-    """Connection pooling for HTTP requests to reuse connections"""
-
-    def __init__(self, max_connections: int = 100, max_per_host: int = 20):
-        self.connector = aiohttp.TCPConnector(
-            limit=max_connections,
-            limit_per_host=max_per_host,
-            ttl_dns_cache=300,  # 5 min DNS cache
-            enable_cleanup_closed=True
-        )
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.logger = default_logger
+    """
+    HTTP requests over the shared, process-wide connection pools
 
-    async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session"""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self.session = aiohttp.ClientSession(
-                connector=self.connector,
-                timeout=timeout
-            )
-            self.logger.info("🔌 HTTP connection pool initialized")
+    Uses app.core.http_clients (one keep-alive pool per upstream host, DNS
+    cache) instead of a private aiohttp connector.
+    """
 
-        return self.session
+    def __init__(self, timeout: float = 30.0):
+        self.timeout = timeout
+        self.logger = default_logger
 
     async def make_request(
         self,
@@ -101,36 +89,34 @@ class RequestPool:
         json_data: Optional[Dict] = None
     ) -> Dict:
         """Make HTTP request with connection reuse"""
-        session = await self.get_session()
+        client = http_clients.client_for_url(url, timeout=self.timeout)
 
         try:
-            async with session.request(
-                method=method,
-                url=url,
+            response = await client.request(
+                method,
+                url,
                 headers=headers,
                 params=params,
                 json=json_data
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    return {
-                        "error": f"HTTP {response.status}",
-                        "status_code": response.status
-                    }
-
-        except asyncio.TimeoutError:
+            )
+            if response.status_code == 200:
+                return response.json()
+            else:
+                return {
+                    "error": f"HTTP {response.status_code}",
+                    "status_code": response.status_code
+                }
+
+        except httpx.TimeoutException:
             return {"error": "Request timeout"}
-        except aiohttp.ClientError as e:
+        except httpx.HTTPError as e:
             return {"error": f"Client error: {str(e)}"}
         except Exception as e:
             return {"error": f"Unexpected error: {str(e)}"}
 
     async def close(self):
-        """Close HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.logger.info("🔌 HTTP connection pool closed")
+        """No-op: shared pools are closed by http_clients on shutdown"""
+        return None
 
 
 class ParallelScanner:
@@ -153,7 +139,7 @@ class ParallelScanner:
 
         # Components
         self.rate_limiter = SmartRateLimiter(initial_limit=10, max_limit=max_concurrent)
-        self.request_pool = RequestPool(max_connections=100, max_per_host=20)
+        self.request_pool = RequestPool()
 
         # Statistics
         self.stats = {
@@ -199,7 +185,8 @@ class ParallelScanner:
                 elif scanner_type == 'mss':
                     url = f"{self.base_url}/mss/analyze/{coin}"
                 elif scanner_type == 'signals':
-                    url = f"{self.base_url}/signals/{coin}"
+                    # Signals are built in-process (no HTTP loopback to our own server)
+                    return await self._scan_signal_in_process(coin)
                 elif scanner_type == 'price':
                     url = f"{self.base_url}/coinapi/price/{coin}"
                 else:
@@ -231,6 +218,54 @@ class ParallelScanner:
 
         return {"symbol": coin, "error": "Max retries exceeded", "success": False}
 
+    async def _scan_signal_in_process(self, coin: str) -> Dict:
+        """Build a single signal via SignalEngine directly (no HTTP loopback)"""
+        from app.core.signal_engine import signal_engine
+
+        try:
+            signal = await signal_engine.build_signal(coin)
+            return self._wrap_signal_result(coin, signal)
+        except Exception as e:
+            return {"symbol": coin, "error": str(e), "success": False}
+
+    def _wrap_signal_result(self, coin: str, signal: Dict) -> Dict:
+        """Convert a SignalEngine result to scan result format"""
+        if signal.get("success") is False:
+            return {"symbol": coin, "error": signal.get("error", "unknown"), "success": False}
+        return {"symbol": coin, "data": signal, "success": True}
+
+    async def _scan_signals_batch(
+        self,
+        coins: List[str],
+        progress_callback: Optional[callable] = None
+    ) -> List[Dict]:
+        """
+        Scan signals in-process with SignalEngine.build_signals_batch
+
+        One shared market-wide prefetch for the whole batch, results are
+        collected as each symbol finishes (no middleware, no self rate limiting).
+        """
+        from app.core.signal_engine import signal_engine
+
+        results = []
+        async for signal in signal_engine.build_signals_batch(
+            coins, max_concurrency=self.rate_limiter.get_current_limit()
+        ):
+            coin = signal.get("symbol", "")
+            results.append(self._wrap_signal_result(coin, signal))
+
+            # Report progress per completed symbol (batches are not used in-process)
+            if progress_callback:
+                await progress_callback(
+                    total=len(coins),
+                    processed=len(results),
+                    current_batch=1,
+                    total_batches=1
+                )
+
+        await self.rate_limiter.adjust_rate_limit(results)
+        return results
+
     def _aggregate_results(self, results: List[Dict]) -> Dict:
         """Aggregate scan results with statistics"""
         successful = [r for r in results if r.get("success")]
@@ -252,44 +287,17 @@ class ParallelScanner:
             "failed_symbols": [r.get("symbol") for r in failed]
         }
 
-    async def scan_bulk(
+    async def _scan_http_batches(
         self,
         coins: List[str],
-        scanner_type: str = 'signals',
+        batches: List[List[str]],
+        scanner_type: str,
         progress_callback: Optional[callable] = None
-    ) -> Dict:
-        """
-        Scan multiple coins in parallel with intelligent batching
-
-        Args:
-            coins: List of symbols to scan
-            scanner_type: Scanner to use ('smart_money', 'mss', 'signals', 'price')
-            progress_callback: Optional callback for progress updates
-
-        Returns:
-            Aggregated results dict with statistics
-
-        Example:
-            >>> scanner = ParallelScanner()
-            >>> results = await scanner.scan_bulk(
-            ...     coins=['BTC', 'ETH', 'SOL', ...],
-            ...     scanner_type='smart_money'
-            ... )
-            >>> print(f"Scanned {results['successful']}/{results['total_scanned']}")
-        """
-        start_time = time.time()
-
-        self.logger.info(
-            f"🚀 Starting parallel scan: {len(coins)} coins, "
-            f"scanner: {scanner_type}, batch size: {self.batch_size}"
-        )
-
-        # Create batches
-        batches = self._create_batches(coins, self.batch_size)
+    ) -> List[Dict]:
+        """Scan batches over HTTP with rate limiting between batches"""
         all_results = []
         total_processed = 0
 
-        # Process batches
         for batch_idx, batch in enumerate(batches):
             batch_start = time.time()
 
@@ -339,6 +347,52 @@ class ParallelScanner:
             if batch_idx < len(batches) - 1:  # Not last batch
                 await asyncio.sleep(0.1)
 
+        return all_results
+
+    async def scan_bulk(
+        self,
+        coins: List[str],
+        scanner_type: str = 'signals',
+        progress_callback: Optional[callable] = None
+    ) -> Dict:
+        """
+        Scan multiple coins in parallel with intelligent batching
+
+        Args:
+            coins: List of symbols to scan
+            scanner_type: Scanner to use ('smart_money', 'mss', 'signals', 'price')
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Aggregated results dict with statistics
+
+        Example:
+            >>> scanner = ParallelScanner()
+            >>> results = await scanner.scan_bulk(
+            ...     coins=['BTC', 'ETH', 'SOL', ...],
+            ...     scanner_type='smart_money'
+            ... )
+            >>> print(f"Scanned {results['successful']}/{results['total_scanned']}")
+        """
+        start_time = time.time()
+
+        self.logger.info(
+            f"🚀 Starting parallel scan: {len(coins)} coins, "
+            f"scanner: {scanner_type}, batch size: {self.batch_size}"
+        )
+
+        # Create batches
+        batches = self._create_batches(coins, self.batch_size)
+
+        if scanner_type == 'signals':
+            # Signals: single in-process batch instead of HTTP loopback batches
+            all_results = await self._scan_signals_batch(coins, progress_callback)
+            batches = [coins]
+        else:
+            all_results = await self._scan_http_batches(
+                coins, batches, scanner_type, progress_callback
+            )
+
         # Calculate final statistics
         total_time = time.time() - start_time
         aggregated = self._aggregate_results(all_results)
@@ -0,0 +1,254 @@
+"""
+Performance Rollups
+Incrementally maintained daily aggregates of performance_outcomes
+
+Win-rate reports used to scan performance_outcomes (COUNT/AVG over every
+checked row in the window) once per breakdown. The rollup tables hold one row
+per bucket instead, so a report reads O(days × buckets) tiny rows:
+
+- performance_rollup_daily         day × scanner_type × tier × interval × signal_type
+- performance_rollup_symbol_daily  day × symbol
+
+Each row keeps additive counters (counts and sums - averages are derived on
+read), so the outcome evaluator folds a batch of new outcomes in with one
+INSERT ... SELECT upsert per table, in the transaction that stamps the batch's
+checked_at. Days are WIB calendar days of checked_at, like the rest of
+the database. NULL scanner/tier/signal type are stored as ''.
+
+refresh() rebuilds the rollups (all or the last N days) from the base table.
+A full rebuild records a 'built' marker in performance_rollup_state;
+ensure_built() runs that one-time backfill before the first fold on a database
+that has outcomes from before the rollups existed.
+"""
+
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.storage.database import db
+from app.utils.logger import get_logger, get_wib_datetime
+
+logger = get_logger(__name__)
+
+
+DIMENSIONS = ("scanner_type", "tier", "interval", "signal_type")
+COUNTERS = (
+    "total",
+    "wins",
+    "losses",
+    "neutral",
+    "win_pnl_sum",
+    "loss_pnl_sum",
+    "pnl_sum",
+    "pnl_count",
+    "score_sum",
+    "score_count",
+)
+SYMBOL_COUNTERS = ("total", "wins", "losses", "pnl_sum", "pnl_count", "score_sum", "score_count")
+
+# performance_rollup_state row written by a full refresh()
+BUILT_MARKER = "built"
+
+# Counter expressions over performance_outcomes (folds and refresh())
+COUNTER_SQL = {
+    "total": "COUNT(*)",
+    "wins": "SUM(CASE WHEN outcome = 'WIN' THEN 1 ELSE 0 END)",
+    "losses": "SUM(CASE WHEN outcome = 'LOSS' THEN 1 ELSE 0 END)",
+    "neutral": "SUM(CASE WHEN outcome = 'NEUTRAL' THEN 1 ELSE 0 END)",
+    "win_pnl_sum": "COALESCE(SUM(CASE WHEN outcome = 'WIN' THEN pnl_pct END), 0)",
+    "loss_pnl_sum": "COALESCE(SUM(CASE WHEN outcome = 'LOSS' THEN pnl_pct END), 0)",
+    "pnl_sum": "COALESCE(SUM(pnl_pct), 0)",
+    "pnl_count": "COUNT(pnl_pct)",
+    "score_sum": "COALESCE(SUM(unified_score), 0)",
+    "score_count": "COUNT(unified_score)",
+}
+
+
+def rollup_day(value: date) -> Any:
+    """Day parameter in the convention of the active backend"""
+    return value if db.use_postgres else value.isoformat()
+
+
+def checked_at_param(value: datetime) -> Any:
+    """checked_at parameter (WIB; naive on PostgreSQL, ISO text on SQLite)"""
+    return value.replace(tzinfo=None) if db.use_postgres else value.isoformat()
+
+
+def cutoff_day(days: int) -> date:
+    return (get_wib_datetime() - timedelta(days=days)).date()
+
+
+def _aggregate_sql(where: str, upsert: bool = False) -> List[str]:
+    """
+    INSERT ... SELECT of both rollup tables from the performance_outcomes rows
+    matching where; upsert adds the counters onto existing buckets
+    """
+    day_sql = "CAST(checked_at AS DATE)" if db.use_postgres else "substr(checked_at, 1, 10)"
+    tables = (
+        (
+            "performance_rollup_daily",
+            DIMENSIONS,
+            "COALESCE(scanner_type, ''), COALESCE(tier, ''), interval, COALESCE(signal_type, '')",
+            COUNTERS,
+        ),
+        ("performance_rollup_symbol_daily", ("symbol",), "symbol", SYMBOL_COUNTERS),
+    )
+    queries = []
+    for table, keys, key_sql, counters in tables:
+        query = f"""
+            INSERT INTO {table} (day, {', '.join(keys)}, {', '.join(counters)})
+            SELECT {day_sql}, {key_sql}, {', '.join(COUNTER_SQL[c] for c in counters)}
+            FROM performance_outcomes
+            WHERE {where}
+            GROUP BY {', '.join(str(i + 1) for i in range(len(keys) + 1))}
+            """
+        if upsert:
+            updates = ", ".join(f"{c} = {table}.{c} + EXCLUDED.{c}" for c in counters)
+            query += f"ON CONFLICT (day, {', '.join(keys)}) DO UPDATE SET {updates}"
+        queries.append(query)
+    return queries
+
+
+class PerformanceRollup:
+    """Daily win-rate rollups with incremental maintenance"""
+
+    def __init__(self):
+        self._built = False
+        self.stats = {"fold_batches": 0, "folded_ids": 0, "refreshes": 0, "reads": 0}
+
+    # ==================== MAINTENANCE ====================
+
+    def fold_statements(self, checked_at: Any, ids: List[int]) -> List[tuple]:
+        """
+        (query, args) statements folding newly checked outcomes into the rollups
+
+        Run them in the transaction that stamped the rows with checked_at, after
+        the UPDATE - only rows of ids carrying this exact stamp are counted.
+
+        Args:
+            checked_at: checked_at value the batch was written with
+            ids: performance_outcomes ids of the batch
+        """
+        if db.use_postgres:
+            where = "checked_at = $1 AND id = ANY($2::int[])"
+            args = (checked_at, list(ids))
+        else:
+            where = "checked_at = $1 AND id IN (SELECT value FROM json_each($2))"
+            args = (checked_at, json.dumps(list(ids)))
+        self.stats["fold_batches"] += 1
+        self.stats["folded_ids"] += len(ids)
+        return [(query, args) for query in _aggregate_sql(where, upsert=True)]
+
+    async def refresh(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Rebuild the rollups from performance_outcomes
+
+        Args:
+            days: Rebuild only the last N days (None = everything)
+        """
+        since = cutoff_day(days) if days is not None else None
+        window = "AND checked_at >= $1" if since else ""
+        args = (
+            (checked_at_param(datetime.combine(since, datetime.min.time())),) if since else ()
+        )
+        day_args = (rollup_day(since),) if since else ()
+        day_window = "WHERE day >= $1" if since else ""
+
+        statements = [
+            (f"DELETE FROM performance_rollup_daily {day_window}", day_args),
+            (f"DELETE FROM performance_rollup_symbol_daily {day_window}", day_args),
+            *((query, args) for query in _aggregate_sql(f"checked_at IS NOT NULL {window}")),
+        ]
+        if since is None:
+            statements.append((
+                "INSERT INTO performance_rollup_state (name, built_at) VALUES ($1, $2) "
+                "ON CONFLICT (name) DO UPDATE SET built_at = EXCLUDED.built_at",
+                (BUILT_MARKER, checked_at_param(get_wib_datetime())),
+            ))
+        await db.execute_transaction(statements)
+
+        if since is None:
+            self._built = True
+        self.stats["refreshes"] += 1
+        row = await db.fetch_one(
+            f"SELECT COUNT(*) AS buckets, COALESCE(SUM(total), 0) AS outcomes FROM performance_rollup_daily {day_window}",
+            *day_args,
+        )
+        logger.info(
+            f"Performance rollups refreshed ({'all days' if since is None else f'since {since}'}): "
+            f"{row['buckets']} buckets, {row['outcomes']} outcomes"
+        )
+        return {
+            "since": since.isoformat() if since else None,
+            "buckets": int(row["buckets"]),
+            "outcomes": int(row["outcomes"]),
+        }
+
+    async def ensure_built(self):
+        """Run the one-time full backfill unless the 'built' marker is present (first run after upgrade)"""
+        if self._built:
+            return
+        marker = await db.fetch_one("SELECT built_at FROM performance_rollup_state WHERE name = $1", BUILT_MARKER)
+        if marker:
+            self._built = True
+            return
+        logger.info("Performance rollups not built yet - backfilling from performance_outcomes")
+        await self.refresh()
+
+    # ==================== READS ====================
+
+    async def summarize(self, days: int, dimension: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Summed counters since cutoff_day(days)
+
+        Returns:
+            {bucket: counters} per dimension value ('' = NULL), or {"all": counters}
+        """
+        if dimension is not None and dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown rollup dimension '{dimension}'")
+        await self.ensure_built()
+        self.stats["reads"] += 1
+
+        select = f"{dimension} AS bucket, " if dimension else "'all' AS bucket, "
+        group = f"GROUP BY {dimension}" if dimension else ""
+        rows = await db.fetch_all(
+            f"""
+            SELECT {select}{', '.join(f'SUM({c}) AS {c}' for c in COUNTERS)}
+            FROM performance_rollup_daily
+            WHERE day >= $1
+            {group}
+            """,
+            rollup_day(cutoff_day(days)),
+        )
+        return {
+            row["bucket"]: {c: float(row[c] or 0) for c in COUNTERS}
+            for row in rows
+            if row["total"]
+        }
+
+    async def summarize_symbols(self, days: int, order_by: str, limit: int, min_total: int = 3) -> List[Dict[str, Any]]:
+        """Per-symbol counters since cutoff_day(days), ordered by an SQL expression over the sums"""
+        await self.ensure_built()
+        self.stats["reads"] += 1
+        rows = await db.fetch_all(
+            f"""
+            SELECT symbol, {', '.join(f'SUM({c}) AS {c}' for c in SYMBOL_COUNTERS)}
+            FROM performance_rollup_symbol_daily
+            WHERE day >= $1
+            GROUP BY symbol
+            HAVING SUM(total) >= $2
+            ORDER BY {order_by}
+            LIMIT $3
+            """,
+            rollup_day(cutoff_day(days)),
+            min_total,
+            limit,
+        )
+        return [{"symbol": row["symbol"], **{c: float(row[c] or 0) for c in SYMBOL_COUNTERS}} for row in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "built": self._built}
+
+
+# Global instance for easy import
+performance_rollup = PerformanceRollup()
@@ -15,14 +15,15 @@ Win/Loss Criteria:
 - LONG signal: WIN if price +5%, LOSS if price -3%
 - SHORT signal: WIN if price -5%, LOSS if price +3%
 - Otherwise: NEUTRAL
+
+Scheduling is durable: track_signal() writes one pending performance_outcomes
+row per interval (due_at set, checked_at NULL) and the database-driven
+outcome_evaluator fills them in as they come due, in batches.
 """
 
-import asyncio
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict
+from datetime import datetime, timedelta, timezone
 from app.utils.logger import get_wib_datetime
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.date import DateTrigger
 
 from app.utils.logger import default_logger
 
@@ -51,7 +52,6 @@ class PerformanceTracker:
     LOSS_THRESHOLD_SHORT = 3.0  # +3% for SHORT
 
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
         self.logger = default_logger
 
         # Statistics
@@ -66,16 +66,18 @@ class PerformanceTracker:
         self.logger.info("PerformanceTracker initialized")
 
     async def start(self):
-        """Start the scheduler"""
-        if not self.scheduler.running:
-            self.scheduler.start()
-            self.logger.info("🎯 Performance Tracker started")
+        """Start the outcome evaluator"""
+        from app.services.outcome_evaluator import outcome_evaluator
+
+        await outcome_evaluator.start()
+        self.logger.info("🎯 Performance Tracker started")
 
     async def stop(self):
-        """Stop the scheduler"""
-        if self.scheduler.running:
-            self.scheduler.shutdown(wait=True)
-            self.logger.info("🎯 Performance Tracker stopped")
+        """Stop the outcome evaluator (pending rows stay due in the database)"""
+        from app.services.outcome_evaluator import outcome_evaluator
+
+        await outcome_evaluator.stop()
+        self.logger.info("🎯 Performance Tracker stopped")
 
     async def track_signal(self, signal: Dict):
         """
@@ -105,18 +107,19 @@ class PerformanceTracker:
                 )
                 return
 
-            # Parse entry time
+            # Parse entry time (naive timestamps are WIB, like the rest of the database)
             if isinstance(entry_time, str):
                 entry_time = datetime.fromisoformat(entry_time.replace("Z", "+00:00"))
             elif entry_time is None:
                 entry_time = get_wib_datetime()
+            if entry_time.tzinfo is None:
+                entry_time = entry_time.replace(tzinfo=timezone(timedelta(hours=7)))
 
             self.logger.info(
                 f"📊 Tracking signal {signal_id} ({symbol} {signal_type} @ ${entry_price})"
             )
 
-            # Schedule outcome checks at each interval
-            await self._schedule_checks(signal, entry_time)
+            await self._insert_pending(signal, entry_time)
 
             # Update stats
             self.stats["total_tracked"] += 1
@@ -124,94 +127,61 @@ class PerformanceTracker:
         except Exception as e:
             self.logger.error(f"Error tracking signal: {e}")
 
-    async def _schedule_checks(self, signal: Dict, entry_time: datetime):
-        """Schedule outcome checks at all intervals"""
-        signal_id = signal.get("id")
+    async def _insert_pending(self, signal: Dict, entry_time: datetime):
+        """Write one pending row per interval - the outcome evaluator's schedule"""
+        from app.storage.database import db
 
+        wib = timezone(timedelta(hours=7))
+        rows = []
         for interval_name, seconds in self.INTERVALS.items():
-            run_time = entry_time + timedelta(seconds=seconds)
-
-            # Only schedule if in the future
-            if run_time > get_wib_datetime():
-                self.scheduler.add_job(
-                    self._check_outcome,
-                    trigger=DateTrigger(run_date=run_time),
-                    args=[signal, interval_name],
-                    id=f"check_{signal_id}_{interval_name}",
-                    replace_existing=True
-                )
-
-                self.logger.debug(
-                    f"Scheduled {interval_name} check for signal {signal_id} at {run_time}"
+            due_at = (entry_time + timedelta(seconds=seconds)).astimezone(wib)
+            rows.append((
+                str(signal.get("id")),
+                signal.get("symbol"),
+                signal.get("signal", "LONG"),
+                interval_name,
+                float(signal.get("price")),
+                signal.get("unified_score"),
+                signal.get("tier"),
+                signal.get("scanner_type"),
+                due_at.replace(tzinfo=None) if db.use_postgres else due_at.isoformat(),
+            ))
+
+        if db.use_postgres:
+            async with db.pool.acquire() as conn:
+                await conn.executemany(
+                    """
+                    INSERT INTO performance_outcomes
+                    (signal_id, symbol, signal_type, interval, entry_price,
+                     unified_score, tier, scanner_type, due_at)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                    ON CONFLICT (signal_id, interval) DO NOTHING
+                    """,
+                    rows
                 )
-
-    async def _check_outcome(self, signal: Dict, interval: str):
-        """
-        Check signal outcome at a specific interval
-
-        Args:
-            signal: Original signal dict
-            interval: Interval name (1h, 4h, 24h, etc.)
-        """
-        try:
-            signal_id = signal.get("id")
-            symbol = signal.get("symbol")
-            signal_type = signal.get("signal", "LONG")
-            entry_price = float(signal.get("price"))
-
-            self.logger.info(
-                f"🔍 Checking {interval} outcome for signal {signal_id} ({symbol})"
-            )
-
-            # Get current price
-            current_price = await self._get_current_price(symbol)
-
-            if current_price is None:
-                self.logger.warning(
-                    f"Could not get current price for {symbol}, skipping outcome check"
-                )
-                return
-
-            # Calculate P&L
-            pnl_pct = ((current_price - entry_price) / entry_price) * 100
-
-            # Determine outcome
-            outcome = self._determine_outcome(signal_type, pnl_pct)
-
-            # Save outcome
-            await self._save_outcome({
-                "signal_id": signal_id,
-                "symbol": symbol,
-                "signal_type": signal_type,
-                "interval": interval,
-                "entry_price": entry_price,
-                "exit_price": current_price,
-                "pnl_pct": round(pnl_pct, 2),
-                "outcome": outcome,
-                "unified_score": signal.get("unified_score"),
-                "tier": signal.get("tier"),
-                "scanner_type": signal.get("scanner_type"),
-                "checked_at": get_wib_datetime().isoformat()
-            })
-
-            # Update stats
-            self.stats["outcomes_checked"] += 1
-            if outcome == "WIN":
-                self.stats["wins"] += 1
-            elif outcome == "LOSS":
-                self.stats["losses"] += 1
-            else:
-                self.stats["neutral"] += 1
-
-            self.logger.info(
-                f"✅ {interval} outcome for {symbol}: {outcome} "
-                f"(P&L: {pnl_pct:+.2f}%, price: ${entry_price} → ${current_price})"
+        else:
+            await db.sqlite_conn.executemany(
+                """
+                INSERT OR IGNORE INTO performance_outcomes
+                (signal_id, symbol, signal_type, interval, entry_price,
+                 unified_score, tier, scanner_type, due_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
             )
+            await db.sqlite_conn.commit()
+
+    def record_result(self, outcome: str):
+        """Count an evaluated outcome (called by the outcome evaluator)"""
+        self.stats["outcomes_checked"] += 1
+        if outcome == "WIN":
+            self.stats["wins"] += 1
+        elif outcome == "LOSS":
+            self.stats["losses"] += 1
+        else:
+            self.stats["neutral"] += 1
 
-        except Exception as e:
-            self.logger.error(f"Error checking outcome: {e}")
-
-    def _determine_outcome(self, signal_type: str, pnl_pct: float) -> str:
+    def determine_outcome(self, signal_type: str, pnl_pct: float) -> str:
         """
         Determine if signal was WIN, LOSS, or NEUTRAL
 
@@ -241,90 +211,6 @@ class PerformanceTracker:
         else:
             return "NEUTRAL"
 
-    async def _get_current_price(self, symbol: str) -> Optional[float]:
-        """
-        Get current price for symbol
-
-        Uses CoinAPI or fallback to other price sources
-        """
-        try:
-            from app.services.coinapi_service import CoinapiService
-
-            service = CoinapiService()
-            price_data = await service.get_current_price(symbol)
-
-            if price_data.get("success"):
-                return float(price_data.get("price", 0))
-
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Error getting price for {symbol}: {e}")
-            return None
-
-    async def _save_outcome(self, outcome: Dict):
-        """
-        Save outcome to database
-
-        Stores outcome in signal_outcomes table for later analysis
-        """
-        try:
-            from app.storage.database import db
-
-            # Save to database
-            await db.execute(
-                """
-                INSERT INTO performance_outcomes
-                (signal_id, symbol, signal_type, interval, entry_price, exit_price,
-                 pnl_pct, outcome, unified_score, tier, scanner_type, checked_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                ON CONFLICT (signal_id, interval) DO UPDATE SET
-                    exit_price = EXCLUDED.exit_price,
-                    pnl_pct = EXCLUDED.pnl_pct,
-                    outcome = EXCLUDED.outcome,
-                    checked_at = EXCLUDED.checked_at
-                """,
-                outcome["signal_id"],
-                outcome["symbol"],
-                outcome["signal_type"],
-                outcome["interval"],
-                outcome["entry_price"],
-                outcome["exit_price"],
-                outcome["pnl_pct"],
-                outcome["outcome"],
-                outcome.get("unified_score"),
-                outcome.get("tier"),
-                outcome.get("scanner_type"),
-                outcome["checked_at"]
-            )
-
-            self.logger.debug(f"Saved outcome for signal {outcome['signal_id']}")
-
-        except Exception as e:
-            self.logger.error(f"Error saving outcome: {e}")
-            # Fallback to file storage if database fails
-            await self._save_outcome_to_file(outcome)
-
-    async def _save_outcome_to_file(self, outcome: Dict):
-        """Fallback: Save outcome to JSON file"""
-        try:
-            import json
-            import os
-
-            # Ensure directory exists
-            os.makedirs("performance_data", exist_ok=True)
-
-            # Append to outcomes file
-            file_path = "performance_data/outcomes.jsonl"
-
-            with open(file_path, "a") as f:
-                f.write(json.dumps(outcome) + "\n")
-
-            self.logger.debug(f"Saved outcome to file: {file_path}")
-
-        except Exception as e:
-            self.logger.error(f"Error saving outcome to file: {e}")
-
     def get_stats(self) -> Dict:
         """Get tracker statistics"""
         win_rate = (
@@ -333,10 +219,12 @@ class PerformanceTracker:
             else 0
         )
 
+        from app.services.outcome_evaluator import outcome_evaluator
+
         return {
             **self.stats,
             "win_rate": round(win_rate, 1),
-            "scheduled_jobs": len(self.scheduler.get_jobs()) if self.scheduler.running else 0
+            "evaluator": outcome_evaluator.get_stats()
         }
 
 
@@ -49,7 +49,8 @@ class PositionSizer:
         self,
         symbol: str,
         base_size: float = 1.0,
-        timeframe: str = "4h"
+        timeframe: str = "4h",
+        atr_data: Optional[Dict] = None
     ) -> Optional[Dict]:
         """
         Calculate volatility-adjusted position size
@@ -60,13 +61,15 @@ class PositionSizer:
             symbol: Trading pair
             base_size: Base position size (e.g., 1.0 = 100%)
             timeframe: Timeframe for volatility measurement
+            atr_data: Prefetched atr_calculator.get_atr() result (fetched if None)
         
         Returns:
             Dict with recommended_size, multiplier, volatility_info
         """
         try:
             # Get ATR data
-            atr_data = await atr_calculator.get_atr(symbol=symbol, timeframe=timeframe)
+            if atr_data is None:
+                atr_data = await atr_calculator.get_atr(symbol=symbol, timeframe=timeframe)
             
             if not atr_data or "atr_percentage" not in atr_data:
                 logger.warning(f"No ATR data for {symbol}, using base size")
@@ -131,7 +134,8 @@ class PositionSizer:
         entry_price: float,
         signal_type: str,
         risk_mode: str = "NORMAL",
-        timeframe: str = "4h"
+        timeframe: str = "4h",
+        atr_data: Optional[Dict] = None
     ) -> Optional[Dict]:
         """
         Calculate ATR-based stop loss
@@ -142,13 +146,15 @@ class PositionSizer:
             signal_type: LONG or SHORT
             risk_mode: NORMAL/REDUCED/AGGRESSIVE/AVOID
             timeframe: Timeframe for ATR calculation
+            atr_data: Prefetched atr_calculator.get_atr() result (fetched if None)
         
         Returns:
             Dict with stop_loss_price, distance, atr_multiple
         """
         try:
             # Get ATR data
-            atr_data = await atr_calculator.get_atr(symbol=symbol, timeframe=timeframe)
+            if atr_data is None:
+                atr_data = await atr_calculator.get_atr(symbol=symbol, timeframe=timeframe)
             
             if not atr_data:
                 logger.warning(f"No ATR data for {symbol}, using default SL")
@@ -256,19 +262,26 @@ class PositionSizer:
         signal_type: str,
         risk_mode: str = "NORMAL",
         base_size: float = 1.0,
-        timeframe: str = "4h"
+        timeframe: str = "4h",
+        atr_data: Optional[Dict] = None
     ) -> Dict:
         """
         Generate complete trade plan with position size, SL, and TP
         
+        ATR is fetched once (or taken from atr_data) and shared by sizing and SL.
+        
         Returns all-in-one trading recommendation
         """
         try:
+            if atr_data is None:
+                atr_data = await atr_calculator.get_atr(symbol=symbol, timeframe=timeframe) or {}
+            
             # Calculate position size
             position_data = await self.calculate_volatility_adjusted_size(
                 symbol=symbol,
                 base_size=base_size,
-                timeframe=timeframe
+                timeframe=timeframe,
+                atr_data=atr_data
             )
             
             # Calculate stop loss
@@ -277,7 +290,8 @@ class PositionSizer:
                 entry_price=entry_price,
                 signal_type=signal_type,
                 risk_mode=risk_mode,
-                timeframe=timeframe
+                timeframe=timeframe,
+                atr_data=atr_data
             )
             
             # Calculate take profit
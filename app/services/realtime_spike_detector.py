@@ -1,53 +1,73 @@
 """
 Real-Time Price Spike Detector
-Monitors top 100 coins for sudden price movements >8% in 5 minutes
+Monitors the futures universe for sudden price movements >8% in 5 minutes
 Sends instant Telegram alerts for early entry opportunities
+
+Event-driven: consumes PriceTick batches from the market data bus (one
+coins-markets snapshot per cycle) instead of polling a price per coin.
 """
 import asyncio
+import math
+import time
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from collections import deque
-from app.services.coinapi_comprehensive_service import CoinAPIComprehensiveService
+
+import numpy as np
+
+from app.services.market_data_bus import (
+    market_data_bus,
+    market_data_feed,
+    PriceTick,
+    TOPIC_PRICE,
+    TOPIC_SPIKE,
+)
 from app.services.telegram_notifier import TelegramNotifier
+from app.utils.price_ring_buffer import PriceRingBuffer
 from app.utils.logger import default_logger as logger
 
 
 class RealtimeSpikeDetector:
     """
-    Real-time price spike detection for top 100 coins
+    Real-time price spike detection for the top coins by market cap
 
     Features:
-    - Monitors price changes every 30 seconds
+    - Receives a universe-wide price snapshot every cycle (no per-coin calls)
     - Detects >8% moves in 5-minute windows
-    - Instant Telegram alerts (no cooldown)
+    - Uses Coinglass windowed price change, falls back to local price history
+    - Columnar ring buffer history: one vectorized window check per snapshot
+    - Instant Telegram alerts (cooldown = time window, per coin and direction)
     - Tracks both pumps and dumps
-    - Maintains price history for accurate spike detection
     """
 
+    # Coinglass coins-markets windows usable directly for spike detection
+    SNAPSHOT_WINDOWS = {5: "5m", 15: "15m", 30: "30m", 60: "1h"}
+
     def __init__(
         self,
-        check_interval: int = 30,  # Check every 30 seconds
+        check_interval: int = 30,  # Feed cadence in seconds (informational)
         spike_threshold: float = 8.0,  # 8% threshold
         time_window_minutes: int = 5,  # 5-minute window
-        top_coins_count: int = 100  # Monitor top 100 coins
+        top_coins_count: int = 100,  # Monitor top 100 coins by market cap (0 = all)
+        history_minutes: int = 15  # Longest window served from local history
     ):
         self.check_interval = check_interval
         self.spike_threshold = spike_threshold
         self.time_window_minutes = time_window_minutes
         self.top_coins_count = top_coins_count
 
-        self.coinapi = CoinAPIComprehensiveService()
         self.telegram = TelegramNotifier()
 
         self.is_running = False
         self.last_check_time = None
 
-        # Price history: {symbol: deque[(timestamp, price)]}
-        # Keep last 5 minutes of data (10 data points at 30s intervals)
-        self.price_history: Dict[str, deque] = {}
-        self.max_history_length = 10
+        # Price history: symbols × slots ring buffer, one slot per snapshot
+        # Fallback when the snapshot has no change field for the window
+        self.history_minutes = max(history_minutes, time_window_minutes)
+        self.price_history = PriceRingBuffer(
+            slots=max(math.ceil(self.history_minutes * 60 / check_interval) + 1, 2)
+        )
 
-        # Track alert timestamps to avoid spam (but still allow per-spike alerts)
+        # Track alert timestamps per (symbol, direction) for cooldown
         self.last_alert_times: Dict[str, datetime] = {}
 
         logger.info(
@@ -57,169 +77,149 @@ class RealtimeSpikeDetector:
         )
 
     async def start(self):
-        """Start real-time monitoring loop"""
+        """Subscribe to price ticks (returns immediately)"""
         if self.is_running:
             logger.warning("Real-time spike detector already running")
             return
 
         self.is_running = True
-        logger.info("🚀 Real-Time Spike Detector STARTED - monitoring for >8% moves in 5min")
-
-        try:
-            while self.is_running:
-                await self._check_price_spikes()
-                await asyncio.sleep(self.check_interval)
-        except Exception as e:
-            logger.error(f"Real-time spike detector crashed: {e}")
-            self.is_running = False
+        market_data_bus.subscribe(TOPIC_PRICE, self.on_price_ticks)
+        await market_data_feed.start()
+        logger.info(
+            f"🚀 Real-Time Spike Detector STARTED - monitoring for "
+            f">{self.spike_threshold}% moves in {self.time_window_minutes}min"
+        )
 
     def stop(self):
         """Stop monitoring"""
         self.is_running = False
+        market_data_bus.unsubscribe(TOPIC_PRICE, self.on_price_ticks)
         logger.info("Real-Time Spike Detector STOPPED")
 
-    async def _check_price_spikes(self):
-        """Check all monitored coins for price spikes"""
-        try:
-            current_time = datetime.utcnow()
-            self.last_check_time = current_time
+    async def on_price_ticks(self, ticks: List[PriceTick]):
+        """Check one universe snapshot for price spikes"""
+        if not self.is_running:
+            return
 
-            # Get top coins to monitor
-            coins_to_monitor = await self._get_top_coins()
+        current_time = datetime.utcnow()
+        self.last_check_time = current_time
 
-            if not coins_to_monitor:
-                logger.warning("No coins to monitor")
-                return
+        # Record the whole universe so any coin can enter the top N later
+        now = time.time()
+        self.price_history.append(
+            (tick.symbol for tick in ticks), (tick.price for tick in ticks), now
+        )
 
-            logger.debug(f"🔍 Checking {len(coins_to_monitor)} coins for price spikes")
+        monitored = self._select_top_coins(ticks)
+        if not monitored:
+            logger.warning("No coins to monitor")
+            return
 
-            # Check each coin for spikes (parallel processing)
-            tasks = [
-                self._check_coin_price_spike(symbol, current_time)
-                for symbol in coins_to_monitor
-            ]
+        logger.debug(f"🔍 Checking {len(monitored)} coins for price spikes")
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        changes = self._window_changes(monitored, now)
+        with np.errstate(invalid="ignore"):
+            hits = np.flatnonzero(np.abs(changes) >= self.spike_threshold)
 
-            # Count detected spikes
-            spikes_detected = sum(1 for r in results if r and not isinstance(r, Exception))
+        spikes = [
+            spike for spike in (
+                self._build_spike(monitored[i], float(changes[i]), current_time) for i in hits
+            )
+            if spike
+        ]
+        if not spikes:
+            return
 
-            if spikes_detected > 0:
-                logger.info(f"🔥 Detected {spikes_detected} price spikes!")
+        logger.info(f"🔥 Detected {len(spikes)} price spikes!")
+        await asyncio.gather(
+            *(self._send_spike_alert(
+                spike["symbol"], spike["current_price"], spike["old_price"],
+                spike["price_change_pct"], spike["direction"]
+            ) for spike in spikes),
+            return_exceptions=True
+        )
+        await market_data_bus.publish(TOPIC_SPIKE, [self._to_spike_event(spike) for spike in spikes])
 
-        except Exception as e:
-            logger.error(f"Error in spike check cycle: {e}")
+    def _select_top_coins(self, ticks: List[PriceTick]) -> List[PriceTick]:
+        """Top N coins by market cap from the snapshot"""
+        if not self.top_coins_count or len(ticks) <= self.top_coins_count:
+            return ticks
+        return sorted(ticks, key=lambda tick: tick.market_cap_usd, reverse=True)[:self.top_coins_count]
 
-    async def _get_top_coins(self) -> List[str]:
-        """
-        Get list of top 100 coins to monitor
-        Uses CoinAPI market cap data
+    def _window_changes(self, ticks: List[PriceTick], now: float) -> np.ndarray:
         """
-        try:
-            # Hardcoded top 100 coins by market cap (update periodically)
-            # This is more reliable than API calls and faster
-            top_100_coins = [
-                "BTC", "ETH", "USDT", "BNB", "SOL", "USDC", "XRP", "DOGE", "ADA", "TRX",
-                "AVAX", "SHIB", "TON", "DOT", "LINK", "MATIC", "BCH", "ICP", "UNI", "LTC",
-                "DAI", "ATOM", "ETC", "FIL", "ARB", "OKB", "APT", "LDO", "OP", "INJ",
-                "MKR", "HBAR", "VET", "QNT", "NEAR", "GRT", "AAVE", "STX", "RUNE", "ALGO",
-                "FTM", "SAND", "MANA", "XTZ", "EGLD", "THETA", "AXS", "SNX", "EOS", "FLOW",
-                "XLM", "APE", "CHZ", "KLAY", "MINA", "CRV", "ZEC", "CFX", "FXS", "CAKE",
-                "NEO", "BSV", "ZIL", "DASH", "ENJ", "BAT", "LRC", "GMX", "DYDX", "COMP",
-                "GALA", "XMR", "1INCH", "KCS", "WAVES", "HNT", "IOTA", "YFI", "CELO", "NEXO",
-                "AR", "FET", "KAVA", "BTT", "ROSE", "IMX", "BLUR", "AUDIO", "ONT", "JST",
-                "WOO", "SXP", "ANKR", "RVN", "MASK", "OMG", "ZRX", "BAL", "SKL", "PEOPLE"
-            ]
-
-            return top_100_coins
-
-        except Exception as e:
-            logger.error(f"Error getting top coins: {e}")
-            # Return major coins as fallback
-            return ["BTC", "ETH", "SOL", "BNB", "XRP", "ADA", "DOGE", "AVAX", "DOT", "MATIC"]
+        Price change over the time window for every tick at once
 
-    async def _check_coin_price_spike(self, symbol: str, current_time: datetime) -> Optional[Dict]:
+        Snapshot field first (Coinglass windowed change), ring buffer history
+        for coins/windows the snapshot does not cover. NaN = unknown.
         """
-        Check a single coin for price spike
-        Returns spike data if detected, None otherwise
-        """
-        try:
-            # Get current price
-            current_price = await self._get_current_price(symbol)
-
-            if not current_price or current_price <= 0:
-                return None
-
-            # Initialize price history for this symbol if needed
-            if symbol not in self.price_history:
-                self.price_history[symbol] = deque(maxlen=self.max_history_length)
-
-            # Add current price to history
-            self.price_history[symbol].append((current_time, current_price))
-
-            # Need at least 2 data points to calculate change
-            if len(self.price_history[symbol]) < 2:
-                return None
-
-            # Get oldest price within time window (5 minutes ago)
-            time_threshold = current_time - timedelta(minutes=self.time_window_minutes)
-
-            # Find oldest price within window
-            oldest_price = None
-            for timestamp, price in self.price_history[symbol]:
-                if timestamp >= time_threshold:
-                    oldest_price = price
-                    break
-
-            if not oldest_price:
-                # Use oldest available price
-                oldest_price = self.price_history[symbol][0][1]
-
-            # Calculate percentage change
-            price_change_pct = ((current_price - oldest_price) / oldest_price) * 100
-
-            # Check if spike exceeds threshold (both up and down)
-            if abs(price_change_pct) >= self.spike_threshold:
-                spike_direction = "PUMP" if price_change_pct > 0 else "DUMP"
-
-                logger.info(
-                    f"🔥 PRICE SPIKE DETECTED: {symbol} - "
-                    f"{price_change_pct:+.2f}% in {self.time_window_minutes}min ({spike_direction})"
-                )
+        _, history = self.price_history.pct_change(
+            self.time_window_minutes * 60, now=now, symbols=[tick.symbol for tick in ticks]
+        )
 
-                # Send Telegram alert (INSTANT - no cooldown)
-                await self._send_spike_alert(symbol, current_price, oldest_price, price_change_pct, spike_direction)
+        window = self.SNAPSHOT_WINDOWS.get(self.time_window_minutes)
+        if not window:
+            return history
 
-                # Update last alert time (for logging purposes)
-                self.last_alert_times[symbol] = current_time
+        snapshot = np.fromiter(
+            (tick.change_pct.get(window, np.nan) for tick in ticks), dtype=np.float64, count=len(ticks)
+        )
+        return np.where(np.isnan(snapshot), history, snapshot)
 
-                return {
-                    "symbol": symbol,
-                    "current_price": current_price,
-                    "old_price": oldest_price,
-                    "price_change_pct": price_change_pct,
-                    "direction": spike_direction,
-                    "timestamp": current_time.isoformat()
-                }
+    def get_price_changes(self, window_minutes: int) -> Dict[str, float]:
+        """Percent change per tracked symbol over any window served by local history"""
+        symbols, changes = self.price_history.pct_change(window_minutes * 60, now=time.time())
+        return {
+            symbol: round(float(change), 4)
+            for symbol, change in zip(symbols, changes)
+            if not np.isnan(change)
+        }
 
-        except Exception as e:
-            logger.error(f"Error checking price spike for {symbol}: {e}")
+    def _build_spike(self, tick: PriceTick, price_change_pct: float, current_time: datetime) -> Optional[Dict]:
+        """
+        Build spike data for a coin over the threshold
+        Returns None while the coin/direction is in cooldown
+        """
+        symbol = tick.symbol
+        current_price = tick.price
+        spike_direction = "PUMP" if price_change_pct > 0 else "DUMP"
+
+        # One alert per coin/direction per window - the snapshot keeps reporting
+        # the same move on every cycle until it rolls out of the window
+        alert_key = f"{symbol}:{spike_direction}"
+        last_alert = self.last_alert_times.get(alert_key)
+        if last_alert and current_time - last_alert < timedelta(minutes=self.time_window_minutes):
             return None
+        self.last_alert_times[alert_key] = current_time
 
-    async def _get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current price for a symbol"""
-        try:
-            # Try CoinAPI first
-            result = await self.coinapi.get_current_price(symbol)
+        old_price = current_price / (1 + price_change_pct / 100)
 
-            if result.get("success") and result.get("price"):
-                return float(result["price"])
+        logger.info(
+            f"🔥 PRICE SPIKE DETECTED: {symbol} - "
+            f"{price_change_pct:+.2f}% in {self.time_window_minutes}min ({spike_direction})"
+        )
 
-            return None
+        return {
+            "symbol": symbol,
+            "current_price": current_price,
+            "old_price": old_price,
+            "price_change_pct": price_change_pct,
+            "direction": spike_direction,
+            "timestamp": current_time.isoformat()
+        }
 
-        except Exception as e:
-            logger.debug(f"Error getting price for {symbol}: {e}")
-            return None
+    def _to_spike_event(self, spike: Dict) -> Dict:
+        """Spike event for the coordinator (see SpikeCoordinator.on_spike_events)"""
+        return {
+            "spike_type": "price_pump" if spike["direction"] == "PUMP" else "price_dump",
+            "symbol": spike["symbol"],
+            "value": spike["price_change_pct"],
+            "metadata": {
+                "current_price": spike["current_price"],
+                "old_price": spike["old_price"],
+                "time_window_minutes": self.time_window_minutes,
+            },
+        }
 
     async def _send_spike_alert(
         self,
@@ -278,7 +278,7 @@ class RealtimeSpikeDetector:
 ⚡ PRICE CHANGE:
 ━━━━━━━━━━━━━━━━━━━━━━━
 {direction_emoji} Change: {change_pct:+.2f}%
-⏱️ Time Window: 5 minutes
+⏱️ Time Window: {self.time_window_minutes} minutes
 🔥 Severity: {severity}
 
 📈 TRADING IMPLICATIONS:
@@ -289,8 +289,8 @@ class RealtimeSpikeDetector:
 
 ━━━━━━━━━━━━━━━━━━━━━━━
 🕐 Detected: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
-⚙️ Source: Real-Time Price Monitor (30s interval)
-💡 Alert Type: INSTANT (no cooldown)
+⚙️ Source: Real-Time Price Monitor (market snapshot)
+💡 Alert Type: INSTANT ({self.time_window_minutes}min cooldown per coin and direction)
 
 #PriceSpike #{symbol} #CryptoSatX #EarlyEntry
 """
@@ -343,9 +343,11 @@ class RealtimeSpikeDetector:
             "time_window_minutes": self.time_window_minutes,
             "top_coins_count": self.top_coins_count,
             "last_check_time": self.last_check_time.isoformat() if self.last_check_time else None,
-            "coins_tracked": len(self.price_history),
+            "coins_tracked": self.price_history.symbol_count,
+            "history_snapshots": self.price_history.snapshot_count,
             "total_alerts_sent": len(self.last_alert_times),
-            "monitoring_coins": list(self.price_history.keys())[:20]  # Show first 20
+            "feed": market_data_feed.get_stats(),
+            "monitoring_coins": self.price_history.symbols[:20]  # Show first 20
         }
 
 
@@ -2,25 +2,87 @@
 Smart Multi-Layer Cache for CryptoSatX
 
 Intelligent caching system with 3 layers:
-- L1: In-memory (fastest, 1-minute TTL)
-- L2: Redis (fast, 5-minute TTL)
+- L1: In-memory (fastest, per-process)
+- L2: Redis (fast, shared by every uvicorn worker)
 - L3: Database (persistent, 1-hour TTL)
 
 Features:
 - Auto-refresh stale data in background
+- Stale-while-revalidate: expired entries are served inside a grace window
+  while a single background fetch refreshes them
 - Different TTLs per data type
-- Cache warming and pre-fetching
+- Cache warming and pre-fetching (warmed data is visible to all workers via L2)
 - LRU eviction for memory management
+- Compact binary L2 payloads (1-byte codec tag + compact JSON, zlib above 1 KB)
+
+L2 is enabled when REDIS_URL is set (or when a client is injected via connect(),
+e.g. fakeredis in local runs). Redis failures degrade to L1-only, never raise.
 """
 
 import asyncio
+import os
 import time
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import zlib
+from typing import Dict, List, Optional, Any, Tuple
 from collections import OrderedDict
 import json
 
 from app.utils.logger import default_logger
+from app.utils.single_flight import single_flight
+
+
+# L2 payload codec tags (first byte of every Redis value)
+CODEC_JSON = b"J"
+CODEC_ZLIB_JSON = b"Z"
+COMPRESS_THRESHOLD_BYTES = 1024
+
+L2_KEY_PREFIX = "cryptosatx:sc:"
+CORE_L2_PREFIX = "core:"  # Write-through entries of app.core.cache_service
+
+
+def _glob_escape(text: str) -> str:
+    """Escape Redis MATCH glob characters"""
+    return "".join(f"\\{c}" if c in "*?[]\\" else c for c in text)
+
+
+def encode_entry(value: Any, ttl: int, created_at: float) -> bytes:
+    """
+    Encode a cache entry for L2
+
+    Envelope: {"v": value, "t": ttl, "c": created_at} as compact JSON,
+    zlib-compressed when larger than COMPRESS_THRESHOLD_BYTES.
+
+    Raises:
+        TypeError: Value is not JSON-serializable (caller keeps it L1-only)
+    """
+    payload = json.dumps(
+        {"v": value, "t": ttl, "c": created_at},
+        separators=(",", ":")
+    ).encode("utf-8")
+
+    if len(payload) > COMPRESS_THRESHOLD_BYTES:
+        return CODEC_ZLIB_JSON + zlib.compress(payload, 6)
+    return CODEC_JSON + payload
+
+
+def decode_entry(blob: bytes) -> Tuple[Any, int, float]:
+    """
+    Decode an L2 payload produced by encode_entry
+
+    Returns:
+        (value, ttl, created_at)
+
+    Raises:
+        ValueError: Unknown codec tag or corrupt payload
+    """
+    tag, body = blob[:1], blob[1:]
+    if tag == CODEC_ZLIB_JSON:
+        body = zlib.decompress(body)
+    elif tag != CODEC_JSON:
+        raise ValueError(f"Unknown cache codec tag: {tag!r}")
+
+    envelope = json.loads(body)
+    return envelope["v"], int(envelope["t"]), float(envelope["c"])
 
 
 class LRUCache:
@@ -84,9 +146,16 @@ class LRUCache:
 class CacheEntry:
     """Cache entry with metadata"""
 
-    def __init__(self, value: Any, ttl: int, created_at: Optional[float] = None):
+    def __init__(
+        self,
+        value: Any,
+        ttl: int,
+        created_at: Optional[float] = None,
+        stale_ttl: int = 0
+    ):
         self.value = value
         self.ttl = ttl  # seconds
+        self.stale_ttl = stale_ttl  # grace window after ttl (stale-while-revalidate)
         self.created_at = created_at or time.time()
         self.access_count = 0
         self.last_accessed = self.created_at
@@ -100,6 +169,10 @@ class CacheEntry:
         age = time.time() - self.created_at
         return age > (self.ttl * stale_threshold)
 
+    def is_servable(self) -> bool:
+        """Check if entry may still be served (fresh or inside stale window)"""
+        return time.time() - self.created_at <= self.ttl + self.stale_ttl
+
     def access(self):
         """Mark entry as accessed"""
         self.access_count += 1
@@ -110,6 +183,7 @@ class CacheEntry:
         return {
             "value": self.value,
             "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
             "created_at": self.created_at,
             "age_seconds": time.time() - self.created_at,
             "access_count": self.access_count,
@@ -128,11 +202,10 @@ class SmartCache:
     - 1000 entry limit
     - Use for: price, funding_rate, quick lookups
 
-    Layer 2 (L2): Redis (optional)
-    - Fast access
-    - 5-minute TTL
-    - 10,000 entry limit
-    - Use for: signals, technical indicators
+    Layer 2 (L2): Redis (enabled when REDIS_URL is set)
+    - Fast access, shared across worker processes
+    - Per-type TTL + stale window (Redis key expiry)
+    - Use for: signals, technical indicators, provider responses
 
     Layer 3 (L3): Database
     - Persistent storage
@@ -146,28 +219,39 @@ class SmartCache:
         self.l1_cache = LRUCache(max_size=1000)
         self.l1_ttl = 60  # 1 minute
 
-        # L2: Redis cache (optional - not implemented yet)
+        # L2: Redis cache (enabled by connect() when REDIS_URL is set)
         self.l2_enabled = False
         self.l2_ttl = 300  # 5 minutes
+        self._l2 = None  # app.services.cache_service.CacheService (Redis)
 
         # L3: Database cache (handled separately)
         self.l3_ttl = 3600  # 1 hour
 
         # Cache configuration by data type
+        # ttl: fresh window, stale_ttl: extra window served while refreshing
+        # L1 entries are mirrored to L2 when it is enabled; L3 types live in L2
         self.cache_config = {
-            "price": {"layer": "L1", "ttl": 60},
-            "funding_rate": {"layer": "L1", "ttl": 60},
-            "signal": {"layer": "L1", "ttl": 300},  # 5 min
-            "technical": {"layer": "L1", "ttl": 300},
-            "mss_score": {"layer": "L1", "ttl": 600},  # 10 min
-            "historical": {"layer": "L3", "ttl": 3600}
+            "price": {"layer": "L1", "ttl": 60, "stale_ttl": 30},
+            "funding_rate": {"layer": "L1", "ttl": 60, "stale_ttl": 60},
+            "signal": {"layer": "L1", "ttl": 300, "stale_ttl": 120},  # 5 min
+            "technical": {"layer": "L1", "ttl": 300, "stale_ttl": 120},
+            "mss_score": {"layer": "L1", "ttl": 600, "stale_ttl": 300},  # 10 min
+            "historical": {"layer": "L3", "ttl": 3600, "stale_ttl": 3600}
         }
+        self.default_config = {"layer": "L1", "ttl": 60, "stale_ttl": 0}
+
+        # Background refreshes in progress (dedupe SWR refreshes per key)
+        self._refreshing: Dict[str, asyncio.Task] = {}
 
         # Statistics
         self.stats = {
             "total_gets": 0,
             "l1_hits": 0,
             "l1_misses": 0,
+            "l2_hits": 0,
+            "l2_misses": 0,
+            "l2_errors": 0,
+            "stale_served": 0,
             "refreshes": 0,
             "evictions": 0
         }
@@ -179,6 +263,117 @@ class SmartCache:
         """Create cache key"""
         return f"{data_type}:{identifier}"
 
+    def _config_for(self, data_type: str) -> Dict:
+        return self.cache_config.get(data_type, self.default_config)
+
+    # ==================== L2 (REDIS) ====================
+
+    async def connect(self, client: Optional[Any] = None) -> bool:
+        """
+        Enable the shared L2 tier
+
+        Args:
+            client: Optional pre-built async Redis client (e.g. fakeredis)
+
+        Returns:
+            True if L2 is enabled
+        """
+        if client is None and not os.getenv("REDIS_URL"):
+            self.logger.info("🗄️ Smart Cache L2 disabled (REDIS_URL not set)")
+            return False
+
+        try:
+            from app.services.cache_service import cache_service as redis_cache
+        except ImportError as e:
+            self.logger.warning(f"⚠️ Smart Cache L2 unavailable (redis not installed): {e}")
+            return False
+
+        await redis_cache.connect(client)
+        if not redis_cache.is_connected():
+            self.logger.warning("⚠️ Smart Cache L2 unavailable - running L1 only")
+            return False
+
+        self._l2 = redis_cache
+        self.l2_enabled = True
+        self.logger.info("🗄️ Smart Cache L2 enabled (Redis shared tier)")
+        return True
+
+    async def disconnect(self):
+        """Disable L2 and close the Redis connection"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+
+        if self._l2 is not None:
+            await self._l2.disconnect()
+        self._l2 = None
+        self.l2_enabled = False
+
+    async def l2_get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Read an entry from L2
+
+        Returns:
+            CacheEntry (may be stale) or None on miss / error / L2 disabled
+        """
+        if not self.l2_enabled:
+            return None
+
+        blob = await self._l2.get_raw(L2_KEY_PREFIX + key)
+        if blob is None:
+            self.stats["l2_misses"] += 1
+            return None
+
+        try:
+            value, ttl, created_at = decode_entry(blob)
+        except Exception as e:
+            self.stats["l2_errors"] += 1
+            self.logger.warning(f"Corrupt L2 entry for {key}: {e}")
+            return None
+
+        self.stats["l2_hits"] += 1
+        data_type = key.split(":", 1)[0]
+        stale_ttl = self.cache_config.get(data_type, {}).get("stale_ttl", 0)
+        return CacheEntry(value=value, ttl=ttl, created_at=created_at, stale_ttl=stale_ttl)
+
+    async def l2_set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        created_at: Optional[float] = None,
+        stale_ttl: int = 0
+    ) -> bool:
+        """Write an entry to L2 (Redis key lives for ttl + stale_ttl)"""
+        if not self.l2_enabled:
+            return False
+
+        try:
+            blob = encode_entry(value, ttl, created_at or time.time())
+        except (TypeError, ValueError) as e:
+            self.stats["l2_errors"] += 1
+            self.logger.debug(f"Value for {key} not L2-serializable: {e}")
+            return False
+
+        ok = await self._l2.set_raw(L2_KEY_PREFIX + key, blob, ttl + stale_ttl)
+        if not ok:
+            self.stats["l2_errors"] += 1
+        return ok
+
+    async def l2_delete(self, key: str):
+        """Delete an entry from L2"""
+        if self.l2_enabled:
+            await self._l2.delete(L2_KEY_PREFIX + key)
+
+    async def l2_delete_prefix(self, prefix: str, exclude: Tuple[str, ...] = ()) -> int:
+        """Delete every L2 entry whose key starts with prefix (except the excluded prefixes)"""
+        if not self.l2_enabled:
+            return 0
+        return await self._l2.delete_pattern(
+            L2_KEY_PREFIX + _glob_escape(prefix) + "*",
+            exclude=tuple(L2_KEY_PREFIX + p for p in exclude),
+        )
+
     async def get(
         self,
         data_type: str,
@@ -203,27 +398,26 @@ class SmartCache:
         entry = self.l1_cache.get(key)
 
         if entry:
-            if not entry.is_expired():
-                entry.access()
+            if entry.is_servable():
                 self.stats["l1_hits"] += 1
+                return self._serve(key, data_type, entry, fetch_func)
+            # Past the stale window - remove from cache
+            self.l1_cache.delete(key)
+            self.stats["evictions"] += 1
 
-                # Auto-refresh if stale (background task)
-                if entry.is_stale() and fetch_func:
-                    asyncio.create_task(self._refresh_cache(key, data_type, fetch_func))
-                    self.stats["refreshes"] += 1
-
-                return entry.value
-            else:
-                # Expired - remove from cache
-                self.l1_cache.delete(key)
-
-        # Cache miss
+        # L1 miss
         self.stats["l1_misses"] += 1
 
-        # Fetch from source if function provided
+        # Try L2 (shared across workers)
+        entry = await self.l2_get(key)
+        if entry and entry.is_servable():
+            self.l1_cache.set(key, entry)
+            return self._serve(key, data_type, entry, fetch_func)
+
+        # Fetch from source if function provided (one upstream call per key)
         if fetch_func:
             try:
-                value = await fetch_func()
+                value = await single_flight.do(("smart_cache", key), fetch_func)
                 if value is not None:
                     await self.set(data_type, identifier, value)
                     return value
@@ -232,6 +426,37 @@ class SmartCache:
 
         return None
 
+    def _serve(
+        self,
+        key: str,
+        data_type: str,
+        entry: CacheEntry,
+        fetch_func: Optional[callable]
+    ) -> Any:
+        """Return entry value, scheduling a background refresh if needed"""
+        entry.access()
+
+        if entry.is_expired():
+            # Stale-while-revalidate: serve old value, refresh in background
+            self.stats["stale_served"] += 1
+            if fetch_func:
+                self._schedule_refresh(key, data_type, fetch_func)
+        elif entry.is_stale() and fetch_func:
+            # Refresh-ahead: near expiration
+            self._schedule_refresh(key, data_type, fetch_func)
+
+        return entry.value
+
+    def _schedule_refresh(self, key: str, data_type: str, fetch_func: callable):
+        """Start a background refresh unless one is already running for key"""
+        if key in self._refreshing:
+            return
+
+        task = asyncio.create_task(self._refresh_cache(key, data_type, fetch_func))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _t, k=key: self._refreshing.pop(k, None))
+        self.stats["refreshes"] += 1
+
     async def set(
         self,
         data_type: str,
@@ -249,24 +474,28 @@ class SmartCache:
         key = self._make_key(data_type, identifier)
 
         # Get config for this data type
-        config = self.cache_config.get(data_type, {"layer": "L1", "ttl": 60})
+        config = self._config_for(data_type)
+        stale_ttl = config.get("stale_ttl", 0)
 
         # Create cache entry
-        entry = CacheEntry(value=value, ttl=config["ttl"])
+        entry = CacheEntry(value=value, ttl=config["ttl"], stale_ttl=stale_ttl)
 
-        # Store in L1 for now (L2/L3 can be added later)
+        # L1 always; L2 (shared) when enabled - L3 types are persisted in L2 too
         self.l1_cache.set(key, entry)
+        await self.l2_set(key, value, config["ttl"], entry.created_at, stale_ttl)
 
     async def delete(self, data_type: str, identifier: str):
         """Delete from cache"""
         key = self._make_key(data_type, identifier)
         self.l1_cache.delete(key)
+        await self.l2_delete(key)
 
     async def clear(self, data_type: Optional[str] = None):
-        """Clear cache (optionally by data type)"""
+        """Clear cache (optionally by data type) in L1 and L2"""
         if data_type is None:
-            # Clear all
+            # Clear all (core: entries belong to app.core.cache_service)
             self.l1_cache.clear()
+            await self.l2_delete_prefix("", exclude=(CORE_L2_PREFIX,))
             self.logger.info("🗑️ Cache cleared (all)")
         else:
             # Clear specific type
@@ -277,6 +506,7 @@ class SmartCache:
             ]
             for key in keys_to_delete:
                 self.l1_cache.delete(key)
+            await self.l2_delete_prefix(f"{data_type}:")
             self.logger.info(f"🗑️ Cache cleared (type: {data_type}, {len(keys_to_delete)} entries)")
 
     async def _refresh_cache(
@@ -287,7 +517,7 @@ class SmartCache:
     ):
         """Background refresh of stale cache entry"""
         try:
-            value = await fetch_func()
+            value = await single_flight.do(("smart_cache", key), fetch_func)
             if value is not None:
                 identifier = key.split(":", 1)[1]  # Extract identifier from key
                 await self.set(data_type, identifier, value)
@@ -346,9 +576,17 @@ class SmartCache:
                 "misses": self.l1_cache.misses,
                 "hit_rate": round(l1_hit_rate, 3)
             },
+            "l2": {
+                "enabled": self.l2_enabled,
+                "hits": self.stats["l2_hits"],
+                "misses": self.stats["l2_misses"],
+                "errors": self.stats["l2_errors"]
+            },
             "global": {
                 "total_gets": self.stats["total_gets"],
+                "stale_served": self.stats["stale_served"],
                 "refreshes": self.stats["refreshes"],
+                "refreshing": len(self._refreshing),
                 "evictions": self.stats["evictions"]
             },
             "config": self.cache_config
@@ -15,7 +15,6 @@ Key Metrics for Detection:
 import os
 import asyncio
 from typing import Dict, List, Optional
-import httpx
 from datetime import datetime, timedelta
 from app.utils.logger import logger
 from app.services.canonical_accumulation_calculator import canonical_calculator
@@ -73,8 +72,8 @@ class SmartMoneyService:
     ]
 
     def __init__(self, base_url: str = "http://localhost:8000"):
+        # Kept for backward compatibility - signals are now built in-process
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
 
         # ✅ NEW: Dynamic coin discovery configuration
         # Reduced from 100 to 40 to avoid LunarCrush rate limits (HTTP 429)
@@ -90,8 +89,8 @@ class SmartMoneyService:
         self.use_canonical = os.getenv("SMART_MONEY_USE_CANONICAL", "true").lower() == "true"
 
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """No-op (signals are built in-process, no HTTP client to close)"""
+        return None
 
     async def _calculate_canonical_scores(
         self,
@@ -265,9 +264,10 @@ class SmartMoneyService:
 
     async def _fetch_signal_data(self, symbol: str) -> Optional[Dict]:
         """
-        Fetch signal data for a single coin using full signal endpoint
+        Fetch signal data for a single coin using the in-process signal engine
         
         ✅ USES COINGLASS, COINAPI, LUNARCRUSH via signal engine
+        ✅ NO HTTP LOOPBACK: calls SignalEngine directly (no middleware/rate limits)
         
         Note: This calls full signal generation which includes:
         - Coinglass: Funding rates, liquidations, long/short ratios, OI trend
@@ -282,10 +282,12 @@ class SmartMoneyService:
             Signal data dict or None if failed
         """
         try:
-            response = await self.client.get(f"{self.base_url}/signals/{symbol}")
-            if response.status_code == 200:
-                return response.json()
-            return None
+            from app.core.signal_engine import signal_engine
+
+            signal = await signal_engine.build_signal(symbol)
+            if signal.get("success") is False:
+                return None
+            return signal
         except Exception as e:
             logger.error(f"Error fetching {symbol}: {str(e)}")
             return None
@@ -485,22 +487,17 @@ class SmartMoneyService:
         # ✅ FIX: Apply limit to discovered coins
         target_coins = target_coins[:limit]
 
-        # ✅ OPTIMIZED: Process in batches to avoid overload
-        # Batch size: 10 coins at a time (optimized for speed while respecting API limits)
-        batch_size = 10
-        results = []
-
-        for i in range(0, len(target_coins), batch_size):
-            batch = target_coins[i:i + batch_size]
-            logger.info(f"📊 Processing batch {i//batch_size + 1}/{(len(target_coins)-1)//batch_size + 1}: {batch}")
+        # ✅ OPTIMIZED: In-process batch build (shared market-wide data, no HTTP loopback)
+        # Concurrency: 10 coins at a time (optimized for speed while respecting API limits)
+        from app.core.signal_engine import signal_engine
 
-            tasks = [self._fetch_signal_data(symbol) for symbol in batch]
-            batch_results = await asyncio.gather(*tasks)
-            results.extend(batch_results)
+        logger.info(f"📊 Building signals in-process for {len(target_coins)} coins")
+        signals_by_symbol: Dict[str, Dict] = {}
+        async for signal in signal_engine.build_signals_batch(target_coins, max_concurrency=10):
+            if signal.get("success") is not False:
+                signals_by_symbol[signal.get("symbol")] = signal
 
-            # Small delay between batches (avoid rate limits)
-            if i + batch_size < len(target_coins):
-                await asyncio.sleep(0.2)  # 200ms delay (reduced from 500ms)
+        results = [signals_by_symbol.get(symbol.upper()) for symbol in target_coins]
 
         accumulation_signals = []
         distribution_signals = []
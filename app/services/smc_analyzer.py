@@ -4,10 +4,10 @@ Smart Money Concept (SMC) Analyzer
 Detects BOS (Break of Structure), CHoCH (Change of Character), 
 FVG (Fair Value Gaps), and Swing Points
 """
-import httpx
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import os
+from app.core.http_clients import http_clients
 
 
 class SMCAnalyzer:
@@ -93,7 +93,7 @@ class SMCAnalyzer:
             try:
                 url = f"{self.base_url}/ohlcv/{symbol_id}/latest"
                 
-                async with httpx.AsyncClient(timeout=10.0) as client:
+                async with http_clients.borrow("coinapi", timeout=10.0) as client:
                     response = await client.get(url, headers=headers, params=params)
                     
                     if response.status_code == 200:
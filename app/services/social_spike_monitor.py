@@ -2,11 +2,21 @@
 Social Spike Monitor Service
 Automated background monitoring for viral moments and social volume spikes
 Sends real-time Telegram alerts when significant social activity is detected
+
+Event-driven: consumes SocialTick batches from the market data bus (one
+LunarCrush coins/list/v2 call per cycle) and computes social volume change
+against the previous snapshot - the per-coin /change endpoint returns no
+social fields on the Builder tier.
 """
-import asyncio
 from typing import Dict, List, Optional
 from datetime import datetime
-from app.services.lunarcrush_comprehensive_service import LunarCrushComprehensiveService
+from app.services.market_data_bus import (
+    market_data_bus,
+    market_data_feed,
+    SocialTick,
+    TOPIC_SOCIAL,
+    TOPIC_SPIKE,
+)
 from app.services.telegram_notifier import TelegramNotifier
 from app.utils.logger import default_logger as logger
 
@@ -16,15 +26,18 @@ class SocialSpikeMonitor:
     Background service that monitors social metrics for viral moments
     
     Features:
-    - Real-time monitoring of top coins
-    - Spike detection (>50%, >100%, >300%)
+    - Universe-wide social snapshot every cycle (no per-coin calls)
+    - Spike detection (>50%, >100%, >300%) vs previous snapshot
     - Automated Telegram alerts
     - Configurable monitoring intervals
     """
+
+    # Social volume change (%) -> spike level
+    SPIKE_LEVELS = [(300.0, "extreme"), (100.0, "high"), (50.0, "moderate")]
     
     def __init__(
         self,
-        check_interval: int = 300,  # 5 minutes default
+        check_interval: int = 300,  # Feed cadence in seconds (informational)
         min_spike_threshold: float = 100.0,  # 100% minimum for alerts
         top_coins_count: int = 50  # Monitor top 50 coins
     ):
@@ -32,12 +45,14 @@ class SocialSpikeMonitor:
         self.min_spike_threshold = min_spike_threshold
         self.top_coins_count = top_coins_count
         
-        self.lunarcrush = LunarCrushComprehensiveService()
         self.telegram = TelegramNotifier()
         
         self.is_running = False
         self.last_check_time = None
         self.detected_spikes = {}  # Track recent spikes to avoid duplicates
+
+        # Previous snapshot per symbol: {symbol: SocialTick}
+        self.previous_ticks: Dict[str, SocialTick] = {}
         
         logger.info(
             f"Social Spike Monitor initialized: "
@@ -46,105 +61,82 @@ class SocialSpikeMonitor:
         )
     
     async def start(self):
-        """Start background monitoring loop"""
+        """Subscribe to social ticks (returns immediately)"""
         if self.is_running:
             logger.warning("Social spike monitor already running")
             return
         
         self.is_running = True
+        market_data_bus.subscribe(TOPIC_SOCIAL, self.on_social_ticks)
+        await market_data_feed.start()
         logger.info("🚀 Social Spike Monitor STARTED - monitoring for viral moments")
-        
-        try:
-            while self.is_running:
-                await self._check_social_spikes()
-                await asyncio.sleep(self.check_interval)
-        except Exception as e:
-            logger.error(f"Social spike monitor crashed: {e}")
-            self.is_running = False
     
     def stop(self):
         """Stop background monitoring"""
         self.is_running = False
+        market_data_bus.unsubscribe(TOPIC_SOCIAL, self.on_social_ticks)
         logger.info("Social Spike Monitor STOPPED")
     
-    async def _check_social_spikes(self):
-        """Check all monitored coins for social spikes"""
-        try:
-            self.last_check_time = datetime.utcnow()
-            logger.info(f"🔍 Checking social spikes at {self.last_check_time.isoformat()}")
-            
-            # Get top coins for monitoring
-            coins_to_monitor = await self._get_coins_to_monitor()
-            
-            if not coins_to_monitor:
-                logger.warning("No coins to monitor")
-                return
-            
-            logger.info(f"Monitoring {len(coins_to_monitor)} coins for spikes")
-            
-            # Check each coin for spikes (parallel processing)
-            tasks = [
-                self._check_coin_spike(symbol)
-                for symbol in coins_to_monitor
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Count detected spikes
-            spikes_detected = sum(1 for r in results if r and not isinstance(r, Exception))
-            
-            if spikes_detected > 0:
-                logger.info(f"🔥 Detected {spikes_detected} social spikes!")
-            else:
-                logger.info("No significant spikes detected")
-        
-        except Exception as e:
-            logger.error(f"Error in spike check cycle: {e}")
-    
-    async def _get_coins_to_monitor(self) -> List[str]:
-        """
-        Get list of coins to monitor
-        Uses LunarCrush discovery to get top coins by market cap
-        """
-        try:
-            # Get top coins from LunarCrush realtime discovery
-            result = await self.lunarcrush.get_coins_realtime(
-                limit=self.top_coins_count,
-                sort="market_cap"
-            )
-            
-            if result.get("success") and result.get("coins"):
-                symbols = [coin.get("symbol") for coin in result["coins"]]
-                logger.info(f"Monitoring {len(symbols)} top coins: {', '.join(symbols[:10])}...")
-                return symbols
-            
-            # Fallback to default major coins
-            logger.warning("Failed to get top coins, using fallback list")
-            return [
-                "BTC", "ETH", "BNB", "SOL", "XRP", "ADA", "DOGE", "AVAX", "DOT", "MATIC",
-                "LINK", "UNI", "ATOM", "LTC", "APT", "ARB", "OP", "SUI", "PEPE", "SHIB"
-            ]
-        
-        except Exception as e:
-            logger.error(f"Error getting coins to monitor: {e}")
-            # Return major coins as fallback
-            return ["BTC", "ETH", "SOL", "BNB", "XRP"]
+    async def on_social_ticks(self, ticks: List[SocialTick]):
+        """Check one social snapshot (top coins by market cap) for spikes"""
+        if not self.is_running:
+            return
+
+        self.last_check_time = datetime.utcnow()
+        monitored = ticks[:self.top_coins_count] if self.top_coins_count else ticks
+
+        if not monitored:
+            logger.warning("No coins to monitor")
+            return
+
+        logger.info(f"🔍 Checking {len(monitored)} coins for social spikes")
+
+        spikes = []
+        for tick in monitored:
+            spike = await self._check_coin_spike(tick)
+            if spike:
+                spikes.append(spike)
+            self.previous_ticks[tick.symbol] = tick
+
+        if spikes:
+            logger.info(f"🔥 Detected {len(spikes)} social spikes!")
+            await market_data_bus.publish(TOPIC_SPIKE, [
+                {
+                    "spike_type": "social_spike",
+                    "symbol": spike["symbol"],
+                    "value": spike["social_volume_change"],
+                    "metadata": {"spike_level": spike["spike_level"]},
+                }
+                for spike in spikes
+            ])
+        else:
+            logger.info("No significant spikes detected")
+
+    @staticmethod
+    def _pct_change(current: float, previous: float) -> float:
+        if not previous:
+            return 0.0
+        return (current - previous) / abs(previous) * 100
+
+    def _spike_level(self, change_pct: float) -> str:
+        for threshold, level in self.SPIKE_LEVELS:
+            if abs(change_pct) > threshold:
+                return level
+        return "normal"
     
-    async def _check_coin_spike(self, symbol: str) -> Optional[Dict]:
+    async def _check_coin_spike(self, tick: SocialTick) -> Optional[Dict]:
         """
-        Check a single coin for social spike
+        Check a single coin for social spike against its previous snapshot
         Returns spike data if detected, None otherwise
         """
+        symbol = tick.symbol
         try:
-            # Get 24h social change data
-            change_data = await self.lunarcrush.get_social_change(symbol, "24h")
-            
-            if not change_data.get("success"):
-                return None
+            previous = self.previous_ticks.get(symbol)
+            if previous is None:
+                return None  # First sighting - nothing to compare against
 
-            # Handle None values from API by using 'or 0'
-            social_vol_change = change_data.get("socialVolumeChange") or 0
-            spike_level = change_data.get("spikeLevel", "normal")
+            social_vol_change = self._pct_change(tick.social_volume, previous.social_volume)
+            spike_level = self._spike_level(social_vol_change)
 
             # Check if spike exceeds threshold
             if abs(social_vol_change) < self.min_spike_threshold:
@@ -169,7 +161,12 @@ class SocialSpikeMonitor:
             self.detected_spikes[spike_key] = datetime.utcnow()
             
             # Send Telegram alert
-            await self._send_spike_alert(symbol, change_data)
+            await self._send_spike_alert(symbol, {
+                "price": tick.price,
+                "socialVolumeChange": social_vol_change,
+                "sentimentChange": tick.sentiment - previous.sentiment,
+                "spikeLevel": spike_level,
+            })
             
             return {
                 "symbol": symbol,
@@ -185,15 +182,12 @@ class SocialSpikeMonitor:
     async def _send_spike_alert(self, symbol: str, change_data: Dict):
         """Send Telegram alert for detected spike"""
         try:
-            # Handle None values from API by using 'or 0'
+            # Handle None values by using 'or 0'
             social_vol_change = change_data.get("socialVolumeChange") or 0
             engagement_change = change_data.get("socialEngagementChange") or 0
             sentiment_change = change_data.get("sentimentChange") or 0
             spike_level = change_data.get("spikeLevel", "normal")
-            
-            # Get current price info
-            coin_data = await self.lunarcrush.get_coin_comprehensive(symbol)
-            price = coin_data.get("price", 0) if coin_data.get("success") else 0
+            price = change_data.get("price") or 0
             
             # Format alert message
             message = self._format_spike_alert(
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
+from app.services.market_data_bus import market_data_bus, TOPIC_SPIKE
 from app.services.telegram_notifier import TelegramNotifier
 from app.utils.logger import default_logger as logger
 
@@ -81,8 +82,42 @@ class SpikeCoordinator:
         # Alert history to avoid duplicate alerts
         self.alert_history: Set[str] = set()
 
+        self.is_running = False
+
         logger.info("Spike Coordinator initialized - multi-signal correlation active")
 
+    def start(self):
+        """Consume spike events published by detectors on the market data bus"""
+        if self.is_running:
+            return
+        self.is_running = True
+        market_data_bus.subscribe(TOPIC_SPIKE, self.on_spike_events)
+        logger.info("🧭 Spike Coordinator subscribed to detector spike events")
+
+    def stop(self):
+        """Stop consuming spike events"""
+        self.is_running = False
+        market_data_bus.unsubscribe(TOPIC_SPIKE, self.on_spike_events)
+
+    async def on_spike_events(self, events: List[Dict]):
+        """
+        Register spike events from the bus
+
+        Event format: {"spike_type": SpikeType value, "symbol", "value", "metadata"}
+        """
+        for event in events:
+            try:
+                spike_type = SpikeType(event["spike_type"])
+            except (KeyError, ValueError):
+                logger.warning(f"Ignoring unknown spike event: {event}")
+                continue
+            await self.register_spike(
+                spike_type=spike_type,
+                symbol=event["symbol"],
+                value=event.get("value", 0.0),
+                metadata=event.get("metadata")
+            )
+
     async def register_spike(
         self,
         spike_type: SpikeType,
@@ -436,6 +471,7 @@ class SpikeCoordinator:
         total_signals = sum(len(signals) for signals in self.recent_signals.values())
 
         return {
+            "is_running": self.is_running,
             "correlation_window_seconds": self.correlation_window_seconds,
             "active_symbols": len(self.recent_signals),
             "total_recent_signals": total_signals,
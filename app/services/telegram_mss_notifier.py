@@ -4,10 +4,10 @@ Sends Multi-Modal Signal Score (MSS) alerts to Telegram for high-potential coin
 Specialized formatting for 3-phase analysis breakdown
 """
 import os
-import httpx
 from typing import Dict, Optional
 from datetime import datetime
 from app.utils.logger import default_logger as logger
+from app.core.http_clients import http_clients
 
 
 class TelegramMSSNotifier:
@@ -304,7 +304,7 @@ class TelegramMSSNotifier:
             "disable_web_page_preview": True
         }
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with http_clients.borrow("telegram", timeout=10.0) as client:
             response = await client.post(url, json=payload)
             return response.json()
     
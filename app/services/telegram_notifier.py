@@ -5,10 +5,10 @@ Sends trading signal alerts to Telegram with human-friendly formatting
 UPDATED: Automatically saves signals to database after successful Telegram send
 """
 import os
-import httpx
 from typing import Dict, Optional
 from datetime import datetime
 from app.utils.logger import logger
+from app.core.http_clients import http_clients
 
 
 class TelegramNotifier:
@@ -56,7 +56,7 @@ class TelegramNotifier:
             try:
                 from app.storage.signal_history import signal_history
 
-                save_result = await signal_history.save_signal(signal_data)
+                save_result = await signal_history.save_signal(signal_data, wait_for_id=False)
                 logger.info(
                     f"Signal saved to database: {save_result.get('message', 'success')}"
                 )
@@ -315,7 +315,7 @@ class TelegramNotifier:
             "disable_web_page_preview": True,
         }
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with http_clients.borrow("telegram", timeout=10.0) as client:
             response = await client.post(url, json=payload)
 
             # Check HTTP status
@@ -22,6 +22,7 @@ from app.services.top_coins_provider import top_coins_provider
 from app.services.canonical_accumulation_calculator import canonical_calculator
 from app.services.coinapi_comprehensive_service import CoinAPIComprehensiveService
 from app.services.coinglass_comprehensive_service import CoinglassComprehensiveService
+from app.services.market_snapshot_service import market_snapshot_service
 from app.utils.logger import logger
 
 
@@ -181,7 +182,8 @@ class TieredScanner:
         - Funding rate (crowd sentiment)
         - 24h volume (liquidity)
 
-        This is FAST because we only fetch basic metrics, not deep analysis.
+        This is FAST because all metrics come from one shared coins-markets
+        snapshot (single upstream call for the whole universe).
         """
         tier1_start = asyncio.get_event_loop().time()
         logger.info(f"🔥 Tier 1: Fast filtering {len(coins)} coins...")
@@ -194,45 +196,31 @@ class TieredScanner:
             "api_error": 0
         }
 
-        # Process in batches to avoid overwhelming APIs
-        batch_size = 50
-        for i in range(0, len(coins), batch_size):
-            batch = coins[i:i + batch_size]
+        # One snapshot read serves every coin - no per-coin API calls
+        markets = await market_snapshot_service.get_markets(coins)
 
-            # Fetch data for batch in parallel
-            tasks = [self._fetch_tier1_data(symbol) for symbol in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        for symbol in coins:
+            data = self._extract_tier1_data(symbol, markets.get(symbol))
 
-            # Filter results
-            for symbol, data in zip(batch, results):
-                if isinstance(data, Exception):
-                    failed_reasons["api_error"] += 1
-                    continue
+            if not data:
+                failed_reasons["api_error"] += 1
+                continue
 
-                if not data:
-                    failed_reasons["api_error"] += 1
-                    continue
+            # Apply filters
+            price_change = data.get("price_change_pct", 0)
+            funding_rate = data.get("funding_rate", 0)
+            volume_24h = data.get("volume_24h_usd", 0)
 
-                # Apply filters
-                volume_change = data.get("volume_change_pct", 0)
-                price_change = data.get("price_change_pct", 0)
-                funding_rate = data.get("funding_rate", 0)
-                volume_24h = data.get("volume_24h_usd", 0)
-
-                # Filter logic
-                if volume_24h < filters["min_24h_volume_usd"]:
-                    failed_reasons["low_volume"] += 1
-                elif abs(price_change) < filters["min_price_change_pct"]:
-                    failed_reasons["no_price_change"] += 1
-                elif abs(funding_rate) > filters["max_funding_rate"]:
-                    failed_reasons["high_funding"] += 1
-                else:
-                    # Passed all filters!
-                    passed.append(symbol)
-
-            # Small delay between batches
-            if i + batch_size < len(coins):
-                await asyncio.sleep(0.1)
+            # Filter logic
+            if volume_24h < filters["min_24h_volume_usd"]:
+                failed_reasons["low_volume"] += 1
+            elif abs(price_change) < filters["min_price_change_pct"]:
+                failed_reasons["no_price_change"] += 1
+            elif abs(funding_rate) > filters["max_funding_rate"]:
+                failed_reasons["high_funding"] += 1
+            else:
+                # Passed all filters!
+                passed.append(symbol)
 
         elapsed = asyncio.get_event_loop().time() - tier1_start
 
@@ -243,23 +231,27 @@ class TieredScanner:
 
         return passed
 
-    async def _fetch_tier1_data(self, symbol: str) -> Optional[Dict]:
-        """Fetch basic data for tier 1 filtering."""
+    def _extract_tier1_data(self, symbol: str, row: Optional[Dict]) -> Optional[Dict]:
+        """Map a coins-markets snapshot row to tier 1 metrics."""
+        if not row:
+            return None
+
         try:
-            # This is a simplified version - you can expand with real API calls
-            # For now, return mock data structure
-            # TODO: Implement real API calls to CoinAPI/Coinglass
+            oi_usd = float(row.get("open_interest_usd") or 0)
+            oi_volume_ratio = float(row.get("open_interest_volume_ratio") or 0)
+            # coins-markets exposes OI/volume ratio - derive 24h volume from it
+            volume_24h = oi_usd / oi_volume_ratio if oi_volume_ratio > 0 else 0.0
 
             return {
                 "symbol": symbol,
-                "volume_change_pct": 50,  # Mock: 50% volume increase
-                "price_change_pct": 5,    # Mock: 5% price increase
-                "funding_rate": 0.005,    # Mock: 0.5% funding
-                "volume_24h_usd": 5000000  # Mock: $5M volume
+                "volume_change_pct": float(row.get("volume_change_percent_24h") or 0),
+                "price_change_pct": float(row.get("price_change_percent_24h") or 0),
+                "funding_rate": float(row.get("avg_funding_rate_by_oi") or 0),
+                "volume_24h_usd": volume_24h
             }
 
-        except Exception as e:
-            logger.error(f"Error fetching tier1 data for {symbol}: {e}")
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error extracting tier1 data for {symbol}: {e}")
             return None
 
     async def _tier2_canonical_analysis(
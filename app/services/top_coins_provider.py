@@ -9,6 +9,7 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 from app.utils.logger import default_logger as logger
 from app.utils.retry_helper import retry_with_backoff, RetryConfig, CircuitBreaker
+from app.core.http_clients import http_clients
 
 
 class TopCoinsProvider:
@@ -127,7 +128,7 @@ class TopCoinsProvider:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_clients.borrow("coingecko", timeout=10.0) as client:
                 response = await client.get(
                     "https://api.coingecko.com/api/v3/coins/markets",
                     params={
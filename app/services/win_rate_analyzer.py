@@ -16,14 +16,20 @@ Metrics calculated:
 - Average win/loss percentage
 - Best performing scanner/tier
 - ROI estimation
+
+Reports read the daily rollups (app.services.performance_rollup), so their cost
+grows with the number of days, not with the outcome history.
 """
 
 import asyncio
+import json
+import os
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict
 
-from app.utils.logger import default_logger
+from app.services.performance_rollup import checked_at_param, performance_rollup
+from app.utils.logger import default_logger, get_wib_datetime
 
 
 class WinRateAnalyzer:
@@ -34,10 +40,48 @@ class WinRateAnalyzer:
     for signal optimization.
     """
 
+    OUTCOMES_FILE = "performance_data/outcomes.jsonl"
+
     def __init__(self):
         self.logger = default_logger
+
+        # Legacy JSONL fallback: per-day buckets, extended from the last read offset
+        self._file_days: Dict = defaultdict(lambda: {"total": 0, "neutral": 0, "wins": [], "losses": []})
+        self._file_offset = 0
+        self._file_inode: Optional[int] = None
+
         self.logger.info("WinRateAnalyzer initialized")
 
+    @staticmethod
+    def _bucket_stats(counters: Dict[str, float]) -> Dict:
+        """Rates and averages from summed rollup counters"""
+        total = int(counters["total"])
+        wins = int(counters["wins"])
+        losses = int(counters["losses"])
+        return {
+            "total_signals": total,
+            "wins": wins,
+            "losses": losses,
+            "neutral": int(counters["neutral"]),
+            "win_rate": round((wins / total * 100) if total > 0 else 0, 2),
+            "avg_win_pct": round(counters["win_pnl_sum"] / wins if wins else 0, 2),
+            "avg_loss_pct": round(counters["loss_pnl_sum"] / losses if losses else 0, 2),
+            "avg_pnl_pct": round(
+                counters["pnl_sum"] / counters["pnl_count"] if counters["pnl_count"] else 0, 2
+            ),
+            "avg_unified_score": round(
+                counters["score_sum"] / counters["score_count"] if counters["score_count"] else 0, 2
+            ),
+        }
+
+    async def _stats_by(self, dimension: str, days: int) -> Dict:
+        buckets = await performance_rollup.summarize(days, dimension)
+        return {
+            name: self._bucket_stats(counters)
+            for name, counters in buckets.items()
+            if name  # '' = no scanner/tier/signal type recorded
+        }
+
     async def get_overall_stats(self, days: int = 30) -> Dict:
         """
         Get overall performance statistics
@@ -62,28 +106,9 @@ class WinRateAnalyzer:
             }
         """
         try:
-            from app.storage.database import db
-
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
+            counters = (await performance_rollup.summarize(days)).get("all")
 
-            # Get outcome statistics
-            result = await db.fetch_one(
-                """
-                SELECT
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN outcome = 'WIN' THEN 1 END) as wins,
-                    COUNT(CASE WHEN outcome = 'LOSS' THEN 1 END) as losses,
-                    COUNT(CASE WHEN outcome = 'NEUTRAL' THEN 1 END) as neutral,
-                    AVG(CASE WHEN outcome = 'WIN' THEN pnl_pct END) as avg_win,
-                    AVG(CASE WHEN outcome = 'LOSS' THEN pnl_pct END) as avg_loss,
-                    AVG(pnl_pct) as avg_pnl
-                FROM performance_outcomes
-                WHERE checked_at >= $1
-                """,
-                cutoff_date.isoformat() + "Z"
-            )
-
-            if not result or result["total"] == 0:
+            if not counters:
                 return {
                     "total_signals": 0,
                     "outcomes_checked": 0,
@@ -99,23 +124,21 @@ class WinRateAnalyzer:
                     "period_days": days
                 }
 
-            total = result["total"]
-            wins = result["wins"] or 0
-            losses = result["losses"] or 0
-            neutral = result["neutral"] or 0
+            stats = self._bucket_stats(counters)
+            total = stats["total_signals"]
 
             return {
                 "total_signals": total,
                 "outcomes_checked": total,
-                "wins": wins,
-                "losses": losses,
-                "neutral": neutral,
-                "win_rate": round((wins / total * 100) if total > 0 else 0, 2),
-                "loss_rate": round((losses / total * 100) if total > 0 else 0, 2),
-                "neutral_rate": round((neutral / total * 100) if total > 0 else 0, 2),
-                "avg_win_pct": round(result["avg_win"] or 0, 2),
-                "avg_loss_pct": round(result["avg_loss"] or 0, 2),
-                "total_pnl_pct": round(result["avg_pnl"] or 0, 2),
+                "wins": stats["wins"],
+                "losses": stats["losses"],
+                "neutral": stats["neutral"],
+                "win_rate": stats["win_rate"],
+                "loss_rate": round(stats["losses"] / total * 100, 2),
+                "neutral_rate": round(stats["neutral"] / total * 100, 2),
+                "avg_win_pct": stats["avg_win_pct"],
+                "avg_loss_pct": stats["avg_loss_pct"],
+                "total_pnl_pct": stats["avg_pnl_pct"],
                 "period_days": days
             }
 
@@ -140,45 +163,9 @@ class WinRateAnalyzer:
             }
         """
         try:
-            from app.storage.database import db
-
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-            results = await db.fetch_all(
-                """
-                SELECT
-                    scanner_type,
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN outcome = 'WIN' THEN 1 END) as wins,
-                    COUNT(CASE WHEN outcome = 'LOSS' THEN 1 END) as losses,
-                    COUNT(CASE WHEN outcome = 'NEUTRAL' THEN 1 END) as neutral,
-                    AVG(CASE WHEN outcome = 'WIN' THEN pnl_pct END) as avg_win,
-                    AVG(CASE WHEN outcome = 'LOSS' THEN pnl_pct END) as avg_loss,
-                    AVG(pnl_pct) as avg_pnl
-                FROM performance_outcomes
-                WHERE checked_at >= $1 AND scanner_type IS NOT NULL
-                GROUP BY scanner_type
-                """,
-                cutoff_date.isoformat() + "Z"
-            )
-
-            stats = {}
-            for row in results:
-                scanner = row["scanner_type"]
-                total = row["total"]
-                wins = row["wins"] or 0
-
-                stats[scanner] = {
-                    "total_signals": total,
-                    "wins": wins,
-                    "losses": row["losses"] or 0,
-                    "neutral": row["neutral"] or 0,
-                    "win_rate": round((wins / total * 100) if total > 0 else 0, 2),
-                    "avg_win_pct": round(row["avg_win"] or 0, 2),
-                    "avg_loss_pct": round(row["avg_loss"] or 0, 2),
-                    "avg_pnl_pct": round(row["avg_pnl"] or 0, 2)
-                }
-
+            stats = await self._stats_by("scanner_type", days)
+            for bucket in stats.values():
+                bucket.pop("avg_unified_score")
             return stats
 
         except Exception as e:
@@ -201,49 +188,9 @@ class WinRateAnalyzer:
             }
         """
         try:
-            from app.storage.database import db
-
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-            results = await db.fetch_all(
-                """
-                SELECT
-                    tier,
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN outcome = 'WIN' THEN 1 END) as wins,
-                    COUNT(CASE WHEN outcome = 'LOSS' THEN 1 END) as losses,
-                    COUNT(CASE WHEN outcome = 'NEUTRAL' THEN 1 END) as neutral,
-                    AVG(unified_score) as avg_score,
-                    AVG(CASE WHEN outcome = 'WIN' THEN pnl_pct END) as avg_win,
-                    AVG(CASE WHEN outcome = 'LOSS' THEN pnl_pct END) as avg_loss,
-                    AVG(pnl_pct) as avg_pnl
-                FROM performance_outcomes
-                WHERE checked_at >= $1 AND tier IS NOT NULL
-                GROUP BY tier
-                ORDER BY avg_score DESC
-                """,
-                cutoff_date.isoformat() + "Z"
-            )
-
-            stats = {}
-            for row in results:
-                tier = row["tier"]
-                total = row["total"]
-                wins = row["wins"] or 0
-
-                stats[tier] = {
-                    "total_signals": total,
-                    "wins": wins,
-                    "losses": row["losses"] or 0,
-                    "neutral": row["neutral"] or 0,
-                    "win_rate": round((wins / total * 100) if total > 0 else 0, 2),
-                    "avg_unified_score": round(row["avg_score"] or 0, 2),
-                    "avg_win_pct": round(row["avg_win"] or 0, 2),
-                    "avg_loss_pct": round(row["avg_loss"] or 0, 2),
-                    "avg_pnl_pct": round(row["avg_pnl"] or 0, 2)
-                }
-
-            return stats
+            stats = await self._stats_by("tier", days)
+            # Highest average unified score first
+            return dict(sorted(stats.items(), key=lambda item: item[1]["avg_unified_score"], reverse=True))
 
         except Exception as e:
             self.logger.error(f"Error getting tier stats: {e}")
@@ -266,54 +213,10 @@ class WinRateAnalyzer:
             }
         """
         try:
-            from app.storage.database import db
-
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-            results = await db.fetch_all(
-                """
-                SELECT
-                    interval,
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN outcome = 'WIN' THEN 1 END) as wins,
-                    COUNT(CASE WHEN outcome = 'LOSS' THEN 1 END) as losses,
-                    COUNT(CASE WHEN outcome = 'NEUTRAL' THEN 1 END) as neutral,
-                    AVG(CASE WHEN outcome = 'WIN' THEN pnl_pct END) as avg_win,
-                    AVG(CASE WHEN outcome = 'LOSS' THEN pnl_pct END) as avg_loss,
-                    AVG(pnl_pct) as avg_pnl
-                FROM performance_outcomes
-                WHERE checked_at >= $1
-                GROUP BY interval
-                ORDER BY
-                    CASE interval
-                        WHEN '1h' THEN 1
-                        WHEN '4h' THEN 2
-                        WHEN '24h' THEN 3
-                        WHEN '7d' THEN 4
-                        WHEN '30d' THEN 5
-                    END
-                """,
-                cutoff_date.isoformat() + "Z"
-            )
-
-            stats = {}
-            for row in results:
-                interval = row["interval"]
-                total = row["total"]
-                wins = row["wins"] or 0
-
-                stats[interval] = {
-                    "total_signals": total,
-                    "wins": wins,
-                    "losses": row["losses"] or 0,
-                    "neutral": row["neutral"] or 0,
-                    "win_rate": round((wins / total * 100) if total > 0 else 0, 2),
-                    "avg_win_pct": round(row["avg_win"] or 0, 2),
-                    "avg_loss_pct": round(row["avg_loss"] or 0, 2),
-                    "avg_pnl_pct": round(row["avg_pnl"] or 0, 2)
-                }
-
-            return stats
+            stats = await self._stats_by("interval", days)
+            order = ["1h", "4h", "24h", "7d", "30d"]
+            ranked = sorted(stats.items(), key=lambda item: order.index(item[0]) if item[0] in order else len(order))
+            return {interval: {k: v for k, v in bucket.items() if k != "avg_unified_score"} for interval, bucket in ranked}
 
         except Exception as e:
             self.logger.error(f"Error getting interval stats: {e}")
@@ -333,45 +236,9 @@ class WinRateAnalyzer:
             }
         """
         try:
-            from app.storage.database import db
-
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-            results = await db.fetch_all(
-                """
-                SELECT
-                    signal_type,
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN outcome = 'WIN' THEN 1 END) as wins,
-                    COUNT(CASE WHEN outcome = 'LOSS' THEN 1 END) as losses,
-                    COUNT(CASE WHEN outcome = 'NEUTRAL' THEN 1 END) as neutral,
-                    AVG(CASE WHEN outcome = 'WIN' THEN pnl_pct END) as avg_win,
-                    AVG(CASE WHEN outcome = 'LOSS' THEN pnl_pct END) as avg_loss,
-                    AVG(pnl_pct) as avg_pnl
-                FROM performance_outcomes
-                WHERE checked_at >= $1
-                GROUP BY signal_type
-                """,
-                cutoff_date.isoformat() + "Z"
-            )
-
-            stats = {}
-            for row in results:
-                signal_type = row["signal_type"]
-                total = row["total"]
-                wins = row["wins"] or 0
-
-                stats[signal_type] = {
-                    "total_signals": total,
-                    "wins": wins,
-                    "losses": row["losses"] or 0,
-                    "neutral": row["neutral"] or 0,
-                    "win_rate": round((wins / total * 100) if total > 0 else 0, 2),
-                    "avg_win_pct": round(row["avg_win"] or 0, 2),
-                    "avg_loss_pct": round(row["avg_loss"] or 0, 2),
-                    "avg_pnl_pct": round(row["avg_pnl"] or 0, 2)
-                }
-
+            stats = await self._stats_by("signal_type", days)
+            for bucket in stats.values():
+                bucket.pop("avg_unified_score")
             return stats
 
         except Exception as e:
@@ -397,9 +264,9 @@ class WinRateAnalyzer:
         try:
             from app.storage.database import db
 
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
+            cutoff = checked_at_param(get_wib_datetime() - timedelta(days=days))
 
-            # Best individual signals
+            # Best/worst individual signals (idx_performance_outcome_pnl keeps these bounded)
             best_signals = await db.fetch_all(
                 """
                 SELECT
@@ -407,15 +274,14 @@ class WinRateAnalyzer:
                     entry_price, exit_price, pnl_pct, outcome,
                     tier, unified_score, scanner_type
                 FROM performance_outcomes
-                WHERE checked_at >= $1 AND outcome = 'WIN'
+                WHERE outcome = 'WIN' AND checked_at >= $1
                 ORDER BY pnl_pct DESC
                 LIMIT $2
                 """,
-                cutoff_date.isoformat() + "Z",
+                cutoff,
                 limit
             )
 
-            # Worst individual signals
             worst_signals = await db.fetch_all(
                 """
                 SELECT
@@ -423,78 +289,46 @@ class WinRateAnalyzer:
                     entry_price, exit_price, pnl_pct, outcome,
                     tier, unified_score, scanner_type
                 FROM performance_outcomes
-                WHERE checked_at >= $1 AND outcome = 'LOSS'
+                WHERE outcome = 'LOSS' AND checked_at >= $1
                 ORDER BY pnl_pct ASC
                 LIMIT $2
                 """,
-                cutoff_date.isoformat() + "Z",
+                cutoff,
                 limit
             )
 
-            # Best symbols (by win rate)
-            best_symbols = await db.fetch_all(
-                """
-                SELECT
-                    symbol,
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN outcome = 'WIN' THEN 1 END) as wins,
-                    AVG(pnl_pct) as avg_pnl,
-                    AVG(unified_score) as avg_score
-                FROM performance_outcomes
-                WHERE checked_at >= $1
-                GROUP BY symbol
-                HAVING COUNT(*) >= 3
-                ORDER BY
-                    CAST(COUNT(CASE WHEN outcome = 'WIN' THEN 1 END) AS FLOAT) / COUNT(*) DESC,
-                    avg_pnl DESC
-                LIMIT $2
-                """,
-                cutoff_date.isoformat() + "Z",
-                limit
+            # Best symbols (by win rate), worst symbols (by average P&L) - from the symbol rollup
+            avg_pnl = "CASE WHEN SUM(pnl_count) > 0 THEN SUM(pnl_sum) / SUM(pnl_count) ELSE 0 END"
+            best_symbols = await performance_rollup.summarize_symbols(
+                days, f"CAST(SUM(wins) AS FLOAT) / SUM(total) DESC, {avg_pnl} DESC", limit
             )
+            worst_symbols = await performance_rollup.summarize_symbols(days, f"{avg_pnl} ASC", limit)
 
-            # Worst symbols
-            worst_symbols = await db.fetch_all(
-                """
-                SELECT
-                    symbol,
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN outcome = 'LOSS' THEN 1 END) as losses,
-                    AVG(pnl_pct) as avg_pnl,
-                    AVG(unified_score) as avg_score
-                FROM performance_outcomes
-                WHERE checked_at >= $1
-                GROUP BY symbol
-                HAVING COUNT(*) >= 3
-                ORDER BY avg_pnl ASC
-                LIMIT $2
-                """,
-                cutoff_date.isoformat() + "Z",
-                limit
-            )
+            def symbol_row(row: Dict) -> Dict:
+                total = int(row["total"])
+                return {
+                    "symbol": row["symbol"],
+                    "total_signals": total,
+                    "avg_pnl_pct": round(row["pnl_sum"] / row["pnl_count"] if row["pnl_count"] else 0, 2),
+                    "avg_unified_score": round(row["score_sum"] / row["score_count"] if row["score_count"] else 0, 2)
+                }
 
             return {
-                "best_signals": [dict(row) for row in best_signals],
-                "worst_signals": [dict(row) for row in worst_signals],
+                "best_signals": best_signals,
+                "worst_signals": worst_signals,
                 "best_symbols": [
                     {
-                        "symbol": row["symbol"],
-                        "total_signals": row["total"],
-                        "wins": row["wins"],
-                        "win_rate": round((row["wins"] / row["total"] * 100) if row["total"] > 0 else 0, 2),
-                        "avg_pnl_pct": round(row["avg_pnl"] or 0, 2),
-                        "avg_unified_score": round(row["avg_score"] or 0, 2)
+                        **symbol_row(row),
+                        "wins": int(row["wins"]),
+                        "win_rate": round(row["wins"] / row["total"] * 100 if row["total"] else 0, 2),
                     }
                     for row in best_symbols
                 ],
                 "worst_symbols": [
                     {
-                        "symbol": row["symbol"],
-                        "total_signals": row["total"],
-                        "losses": row["losses"],
-                        "loss_rate": round((row["losses"] / row["total"] * 100) if row["total"] > 0 else 0, 2),
-                        "avg_pnl_pct": round(row["avg_pnl"] or 0, 2),
-                        "avg_unified_score": round(row["avg_score"] or 0, 2)
+                        **symbol_row(row),
+                        "losses": int(row["losses"]),
+                        "loss_rate": round(row["losses"] / row["total"] * 100 if row["total"] else 0, 2),
                     }
                     for row in worst_symbols
                 ]
@@ -652,16 +486,42 @@ class WinRateAnalyzer:
 
         return recommendations
 
+    def _read_outcomes_file(self):
+        """Fold lines appended since the last read into the per-day buckets"""
+        stat = os.stat(self.OUTCOMES_FILE)
+        if stat.st_ino != self._file_inode or stat.st_size < self._file_offset:
+            # New or truncated file - start over
+            self._file_days.clear()
+            self._file_offset = 0
+            self._file_inode = stat.st_ino
+        if stat.st_size == self._file_offset:
+            return
+
+        with open(self.OUTCOMES_FILE, "rb") as f:
+            f.seek(self._file_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partially written line - picked up on the next read
+                self._file_offset += len(line)
+                try:
+                    outcome = json.loads(line)
+                    checked_at = datetime.fromisoformat(outcome["checked_at"].replace("Z", "+00:00"))
+                except (ValueError, KeyError):
+                    continue
+
+                bucket = self._file_days[checked_at.date()]
+                bucket["total"] += 1
+                if outcome["outcome"] == "WIN":
+                    bucket["wins"].append(outcome["pnl_pct"])
+                elif outcome["outcome"] == "LOSS":
+                    bucket["losses"].append(outcome["pnl_pct"])
+                else:
+                    bucket["neutral"] += 1
+
     async def _get_stats_from_file(self, days: int = 30) -> Dict:
         """Fallback: Get stats from file storage"""
         try:
-            import json
-            import os
-            from pathlib import Path
-
-            file_path = "performance_data/outcomes.jsonl"
-
-            if not os.path.exists(file_path):
+            if not os.path.exists(self.OUTCOMES_FILE):
                 return {
                     "total_signals": 0,
                     "outcomes_checked": 0,
@@ -677,26 +537,20 @@ class WinRateAnalyzer:
                     "period_days": days
                 }
 
-            cutoff = datetime.utcnow() - timedelta(days=days)
+            self._read_outcomes_file()
+            cutoff = (datetime.utcnow() - timedelta(days=days)).date()
 
             wins = []
             losses = []
             neutral = 0
             total = 0
 
-            with open(file_path, "r") as f:
-                for line in f:
-                    outcome = json.loads(line)
-                    checked_at = datetime.fromisoformat(outcome["checked_at"].replace("Z", "+00:00"))
-
-                    if checked_at >= cutoff:
-                        total += 1
-                        if outcome["outcome"] == "WIN":
-                            wins.append(outcome["pnl_pct"])
-                        elif outcome["outcome"] == "LOSS":
-                            losses.append(outcome["pnl_pct"])
-                        else:
-                            neutral += 1
+            for day, bucket in self._file_days.items():
+                if day >= cutoff:
+                    total += bucket["total"]
+                    neutral += bucket["neutral"]
+                    wins.extend(bucket["wins"])
+                    losses.extend(bucket["losses"])
 
             win_count = len(wins)
             loss_count = len(losses)
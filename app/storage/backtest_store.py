@@ -0,0 +1,401 @@
+"""
+Historical Data Store for Backtesting
+Local SQLite store of OHLCV candles, derivatives series and Fear & Greed history
+
+Backtests run fully offline against this store - nothing is fetched while a
+backtest runs. Tables:
+
+- candles      (symbol, timeframe, ts) -> open, high, low, close, volume
+- derivatives  (symbol, ts) -> funding_rate, open_interest, long_account_pct,
+               top_trader_long_pct, long_liquidations, short_liquidations,
+               social_score
+- fear_greed   (ts) -> value
+
+Conventions (same units the SignalEngine context uses):
+- ts is epoch milliseconds (bar open time for candles)
+- funding_rate is a decimal (0.0001 = 0.01%)
+- long_liquidations / short_liquidations are trailing 24h USD totals
+- derivatives columns are independent series: a NULL column in an upsert keeps
+  the stored value, so funding and OI history can be written separately
+
+load_panel() aligns everything into (symbols × bars) NumPy matrices for the
+vectorized backtest engine. Parquet import/export is available when pandas
+and pyarrow are installed.
+
+Usage:
+    store = HistoricalDataStore("data/backtest.db")
+    store.write_candles("BTC", "1h", candles)
+    panel = store.load_panel(["BTC", "ETH"], "1h", start_ms, end_ms)
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import pandas as pd
+except ImportError:  # Parquet import/export is optional
+    pd = None
+
+
+DEFAULT_STORE_PATH = os.getenv("BACKTEST_STORE_PATH", "data/backtest_store.db")
+
+CANDLE_COLUMNS = ("open", "high", "low", "close", "volume")
+DERIVATIVE_COLUMNS = (
+    "funding_rate",
+    "open_interest",
+    "long_account_pct",
+    "top_trader_long_pct",
+    "long_liquidations",
+    "short_liquidations",
+    "social_score",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, volume REAL,
+    PRIMARY KEY (symbol, timeframe, ts)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS derivatives (
+    symbol TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    funding_rate REAL,
+    open_interest REAL,
+    long_account_pct REAL,
+    top_trader_long_pct REAL,
+    long_liquidations REAL,
+    short_liquidations REAL,
+    social_score REAL,
+    PRIMARY KEY (symbol, ts)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS fear_greed (
+    ts INTEGER PRIMARY KEY,
+    value REAL
+);
+"""
+
+# 24h lookback for the OI change factor (matches the live oiChangePct)
+OI_CHANGE_LOOKBACK_MS = 24 * 60 * 60 * 1000
+
+
+@dataclass
+class HistoricalPanel:
+    """
+    Aligned (symbols × bars) history for one timeframe
+
+    Bars before a symbol's first candle are padded with its first price and
+    masked by first_valid; interior gaps are forward-filled. Derivatives are
+    as-of joined (latest value at or before each bar), missing values are NaN.
+    """
+
+    symbols: List[str]
+    timeframe: str
+    timestamps: np.ndarray  # (bars,) int64 ms
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    first_valid: np.ndarray  # (symbols,) index of each symbol's first real bar
+    derivatives: Dict[str, np.ndarray] = field(default_factory=dict)  # name -> (symbols × bars)
+    oi_change_pct: Optional[np.ndarray] = None  # (symbols × bars) 24h OI change %
+    fear_greed: Optional[np.ndarray] = None  # (bars,)
+
+    @property
+    def shape(self):
+        return self.close.shape
+
+    @property
+    def symbol_days(self) -> float:
+        if len(self.timestamps) < 2:
+            return 0.0
+        span_days = (self.timestamps[-1] - self.timestamps[0]) / 86_400_000
+        return float(len(self.symbols) * span_days)
+
+
+class HistoricalDataStore:
+    """SQLite-backed historical store (synchronous - used offline and in worker processes)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_STORE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ==================== WRITES ====================
+
+    def write_candles(self, symbol: str, timeframe: str, candles: Iterable[Dict[str, Any]]) -> int:
+        """Upsert OHLCV candles ({"timestamp"|"ts"|"time", open, high, low, close, volume})"""
+        rows = [
+            (
+                symbol.upper(),
+                timeframe,
+                int(candle.get("timestamp", candle.get("ts", candle.get("time")))),
+                *(float(candle.get(column, 0) or 0) for column in CANDLE_COLUMNS),
+            )
+            for candle in candles
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO candles (symbol, timeframe, ts, open, high, low, close, volume) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def write_derivatives(self, symbol: str, points: Iterable[Dict[str, Any]]) -> int:
+        """
+        Upsert derivatives points ({"ts", <any DERIVATIVE_COLUMNS>})
+
+        Columns missing from a point keep their stored value.
+        """
+        assignments = ", ".join(f"{column} = COALESCE(excluded.{column}, {column})" for column in DERIVATIVE_COLUMNS)
+        rows = [
+            (
+                symbol.upper(),
+                int(point.get("ts", point.get("timestamp", point.get("time")))),
+                *(point.get(column) for column in DERIVATIVE_COLUMNS),
+            )
+            for point in points
+        ]
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO derivatives (symbol, ts, {', '.join(DERIVATIVE_COLUMNS)}) "
+                f"VALUES (?, ?, {', '.join('?' for _ in DERIVATIVE_COLUMNS)}) "
+                f"ON CONFLICT (symbol, ts) DO UPDATE SET {assignments}",
+                rows,
+            )
+        return len(rows)
+
+    def write_fear_greed(self, points: Iterable[Dict[str, Any]]) -> int:
+        """Upsert Fear & Greed points ({"ts", "value"})"""
+        rows = [(int(point.get("ts", point.get("timestamp"))), float(point["value"])) for point in points]
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO fear_greed (ts, value) VALUES (?, ?)", rows)
+        return len(rows)
+
+    # ==================== READS ====================
+
+    def list_symbols(self, timeframe: str) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT DISTINCT symbol FROM candles WHERE timeframe = ? ORDER BY symbol", (timeframe,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def coverage(self) -> Dict[str, Any]:
+        """Row counts and time range per table"""
+        result = {}
+        for table in ("candles", "derivatives", "fear_greed"):
+            count, first, last = self.conn.execute(f"SELECT COUNT(*), MIN(ts), MAX(ts) FROM {table}").fetchone()
+            result[table] = {"rows": count, "first_ts": first, "last_ts": last}
+        return result
+
+    def load_panel(
+        self,
+        symbols: Optional[Sequence[str]],
+        timeframe: str,
+        start_ms: int,
+        end_ms: int,
+        warmup_bars: int = 0,
+    ) -> HistoricalPanel:
+        """
+        Load an aligned panel for [start_ms, end_ms]
+
+        Args:
+            symbols: Symbols to load (None = every symbol stored for timeframe)
+            warmup_bars: Extra bars loaded before start_ms so indicators are
+                         warm on the first backtest bar
+        """
+        symbols = [s.upper() for s in symbols] if symbols else self.list_symbols(timeframe)
+        if not symbols:
+            raise ValueError(f"No {timeframe} candles in store {self.path}")
+
+        placeholders = ", ".join("?" for _ in symbols)
+        load_from = start_ms
+        if warmup_bars:
+            row = self.conn.execute(
+                f"SELECT ts FROM (SELECT DISTINCT ts FROM candles WHERE timeframe = ? AND symbol IN ({placeholders}) "
+                f"AND ts < ? ORDER BY ts DESC LIMIT ?) ORDER BY ts LIMIT 1",
+                (timeframe, *symbols, start_ms, warmup_bars),
+            ).fetchone()
+            if row:
+                load_from = row[0]
+
+        candle_rows = self.conn.execute(
+            f"SELECT symbol, ts, open, high, low, close, volume FROM candles "
+            f"WHERE timeframe = ? AND symbol IN ({placeholders}) AND ts BETWEEN ? AND ? ORDER BY symbol, ts",
+            (timeframe, *symbols, load_from, end_ms),
+        ).fetchall()
+        if not candle_rows:
+            raise ValueError(f"No {timeframe} candles between {start_ms} and {end_ms}")
+
+        row_symbols = np.array([row[0] for row in candle_rows])
+        values = np.array([row[1:] for row in candle_rows], dtype=np.float64)
+        timestamps = np.unique(values[:, 0].astype(np.int64))
+
+        index = {symbol: i for i, symbol in enumerate(symbols)}
+        sym_idx = np.array([index[s] for s in row_symbols])
+        bar_idx = np.searchsorted(timestamps, values[:, 0].astype(np.int64))
+
+        shape = (len(symbols), len(timestamps))
+        matrices = {}
+        for offset, column in enumerate(CANDLE_COLUMNS, start=1):
+            matrix = np.full(shape, np.nan)
+            matrix[sym_idx, bar_idx] = values[:, offset]
+            matrices[column] = matrix
+
+        present = ~np.isnan(matrices["close"])
+        first_valid = np.where(present.any(axis=1), present.argmax(axis=1), shape[1])
+        for column in ("open", "high", "low", "close"):
+            matrices[column] = _fill_gaps(matrices[column])
+        # Missing bars traded nothing
+        matrices["volume"] = np.nan_to_num(matrices["volume"])
+
+        derivatives, oi_change = self._load_derivatives(symbols, timestamps, load_from, end_ms)
+        fear_greed = self._load_fear_greed(timestamps, load_from, end_ms)
+
+        return HistoricalPanel(
+            symbols=list(symbols),
+            timeframe=timeframe,
+            timestamps=timestamps,
+            first_valid=first_valid,
+            derivatives=derivatives,
+            oi_change_pct=oi_change,
+            fear_greed=fear_greed,
+            **matrices,
+        )
+
+    def _load_derivatives(self, symbols: Sequence[str], timestamps: np.ndarray, start_ms: int, end_ms: int):
+        placeholders = ", ".join("?" for _ in symbols)
+        # Two days of extra history: an as-of value for the first bars plus their 24h OI baseline
+        rows = self.conn.execute(
+            f"SELECT symbol, ts, {', '.join(DERIVATIVE_COLUMNS)} FROM derivatives "
+            f"WHERE symbol IN ({placeholders}) AND ts BETWEEN ? AND ? ORDER BY symbol, ts",
+            (*symbols, start_ms - 2 * OI_CHANGE_LOOKBACK_MS, end_ms),
+        ).fetchall()
+
+        shape = (len(symbols), len(timestamps))
+        derivatives = {column: np.full(shape, np.nan) for column in DERIVATIVE_COLUMNS}
+        oi_change = np.full(shape, np.nan)
+        if not rows:
+            return derivatives, oi_change
+
+        index = {symbol: i for i, symbol in enumerate(symbols)}
+        row_symbols = [row[0] for row in rows]
+        data = np.array([row[1:] for row in rows], dtype=np.float64)
+
+        # Rows are grouped by symbol - as-of join each group onto the bar timeline
+        boundaries = np.flatnonzero([a != b for a, b in zip(row_symbols[:-1], row_symbols[1:])]) + 1
+        for group in np.split(np.arange(len(rows)), boundaries):
+            i = index[row_symbols[group[0]]]
+            ts = data[group, 0].astype(np.int64)
+            for offset, column in enumerate(DERIVATIVE_COLUMNS, start=1):
+                series = data[group, offset]
+                known = ~np.isnan(series)
+                if not known.any():
+                    continue
+                derivatives[column][i] = _as_of(ts[known], series[known], timestamps)
+                if column == "open_interest":
+                    baseline = _as_of(ts[known], series[known], timestamps - OI_CHANGE_LOOKBACK_MS)
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        oi_change[i] = np.where(
+                            baseline > 0, (derivatives[column][i] / baseline - 1.0) * 100.0, np.nan
+                        )
+
+        return derivatives, oi_change
+
+    def _load_fear_greed(self, timestamps: np.ndarray, start_ms: int, end_ms: int) -> np.ndarray:
+        rows = self.conn.execute(
+            "SELECT ts, value FROM fear_greed WHERE ts BETWEEN ? AND ? ORDER BY ts",
+            (start_ms - 7 * OI_CHANGE_LOOKBACK_MS, end_ms),
+        ).fetchall()
+        if not rows:
+            return np.full(len(timestamps), np.nan)
+        data = np.array(rows, dtype=np.float64)
+        return _as_of(data[:, 0].astype(np.int64), data[:, 1], timestamps)
+
+    # ==================== PARQUET ====================
+
+    def import_parquet(self, table: str, path: str, timeframe: Optional[str] = None) -> int:
+        """
+        Import a Parquet file into a table (requires pandas + pyarrow)
+
+        Expected columns: the table's columns (candles also need "symbol";
+        "timeframe" may be given as an argument instead of a column).
+        """
+        if pd is None:
+            raise RuntimeError("Parquet import requires pandas and pyarrow")
+
+        frame = pd.read_parquet(path)
+        if table == "candles":
+            if timeframe is not None:
+                frame["timeframe"] = timeframe
+            written = 0
+            for (symbol, tf), group in frame.groupby(["symbol", "timeframe"]):
+                written += self.write_candles(symbol, tf, group.to_dict("records"))
+            return written
+        if table == "derivatives":
+            frame = frame.astype(object).where(frame.notna(), None)
+            return sum(
+                self.write_derivatives(symbol, group.to_dict("records"))
+                for symbol, group in frame.groupby("symbol")
+            )
+        if table == "fear_greed":
+            return self.write_fear_greed(frame.to_dict("records"))
+        raise ValueError(f"Unknown table '{table}'")
+
+    def export_parquet(self, table: str, path: str) -> int:
+        """Export a whole table to Parquet (requires pandas + pyarrow)"""
+        if pd is None:
+            raise RuntimeError("Parquet export requires pandas and pyarrow")
+        if table not in ("candles", "derivatives", "fear_greed"):
+            raise ValueError(f"Unknown table '{table}'")
+
+        frame = pd.read_sql_query(f"SELECT * FROM {table}", self.conn)
+        frame.to_parquet(path, index=False)
+        return len(frame)
+
+
+def _fill_gaps(matrix: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs along bars, then back-fill leading NaNs with the first value"""
+    valid = ~np.isnan(matrix)
+    idx = np.where(valid, np.arange(matrix.shape[1]), 0)
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    filled = matrix[np.arange(matrix.shape[0])[:, None], idx]
+
+    first = np.where(valid.any(axis=1), valid.argmax(axis=1), 0)
+    first_value = matrix[np.arange(matrix.shape[0]), first]
+    return np.where(np.isnan(filled), first_value[:, None], filled)
+
+
+def _as_of(ts: np.ndarray, values: np.ndarray, at: np.ndarray) -> np.ndarray:
+    """Latest value at or before each time in at (NaN before the first point)"""
+    pos = np.searchsorted(ts, at, side="right") - 1
+    return np.where(pos >= 0, values[np.clip(pos, 0, None)], np.nan)
@@ -9,12 +9,11 @@ Run migrations with: alembic upgrade head
 
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Sequence
 import asyncpg
 from asyncpg import Pool
-import aiosqlite
-import sqlite3
 
+from app.storage.sqlite_pool import LegacyConnection, PooledConnection, SQLitePool, to_sqlite
 from app.utils.logger import get_logger
 
 # Initialize module logger
@@ -29,7 +28,8 @@ class Database:
 
     def __init__(self):
         self.pool: Pool | None = None
-        self.sqlite_conn: aiosqlite.Connection | None = None
+        self.sqlite_pool: SQLitePool | None = None
+        self.sqlite_conn: LegacyConnection | None = None
         self.database_url = os.getenv("DATABASE_URL")
         self.use_postgres = bool(
             self.database_url and not self.database_url.startswith("sqlite")
@@ -48,7 +48,7 @@ class Database:
         """
         Initialize database connection with appropriate driver (PostgreSQL or SQLite).
         
-        Creates connection pool for PostgreSQL (asyncpg) or direct connection for SQLite (aiosqlite).
+        Creates connection pool for PostgreSQL (asyncpg) or SQLitePool for SQLite.
         Automatically calls init_schema() after successful connection.
         
         PostgreSQL Config:
@@ -56,13 +56,15 @@ class Database:
             - Command timeout: 60s
             - Connection timeout: 30s
             
-        SQLite Config:
-            - WAL mode enabled for better concurrency
+        SQLite Config (app.storage.sqlite_pool):
+            - WAL mode, synchronous=NORMAL, mmap + page cache pragmas
+            - One writer with a batching write queue
+            - SQLITE_READERS read-only connections for concurrent reads
             - Foreign keys enabled
             
         Raises:
             asyncpg.PostgresError: If PostgreSQL connection fails
-            aiosqlite.Error: If SQLite connection fails
+            sqlite3.Error: If SQLite connection fails
         """
         if self.use_postgres:
             if self.pool is None:
@@ -79,11 +81,11 @@ class Database:
                 if not self.database_url:
                     raise ValueError("Database URL not configured")
                 db_path = self.database_url.replace("sqlite:///", "")
-                self.sqlite_conn = await aiosqlite.connect(db_path)
-                # Enable foreign keys and WAL mode for better performance
-                await self.sqlite_conn.execute("PRAGMA foreign_keys = ON")
-                await self.sqlite_conn.execute("PRAGMA journal_mode = WAL")
-                logger.info("✅ SQLite connection established")
+                pool = SQLitePool(db_path)
+                await pool.open()
+                self.sqlite_pool = pool
+                # aiosqlite-style facade for code that talks to SQLite directly
+                self.sqlite_conn = pool.legacy
 
         # Initialize schema on first connect
         # For PostgreSQL: Validates Alembic migrations are applied
@@ -95,7 +97,7 @@ class Database:
         Gracefully close database connections and release resources.
         
         For PostgreSQL: Closes connection pool and waits for all connections to finish
-        For SQLite: Closes single connection and flushes WAL journal
+        For SQLite: Flushes queued writes, then closes writer and reader connections
         
         Safe to call multiple times - automatically checks if connection exists before closing.
         """
@@ -105,10 +107,11 @@ class Database:
                 self.pool = None
                 logger.info("✅ PostgreSQL connection pool closed")
         else:
-            if self.sqlite_conn:
-                await self.sqlite_conn.close()
+            if self.sqlite_pool:
+                await self.sqlite_pool.close()
+                self.sqlite_pool = None
                 self.sqlite_conn = None
-                logger.info("✅ SQLite connection closed")
+                logger.info("✅ SQLite connection pool closed")
 
     async def init_schema(self):
         """
@@ -201,6 +204,13 @@ class Database:
                     tracked_at_4h TEXT,
                     tracked_at_24h TEXT,
                     
+                    mfe_1h REAL,
+                    mfe_4h REAL,
+                    mfe_24h REAL,
+                    mae_1h REAL,
+                    mae_4h REAL,
+                    mae_24h REAL,
+                    
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
                     
                     FOREIGN KEY (signal_id) REFERENCES signals(id) ON DELETE CASCADE
@@ -208,6 +218,91 @@ class Database:
             """
             )
 
+            # Excursion columns for signal_outcomes tables created before they existed
+            async with self.sqlite_conn.execute("PRAGMA table_info(signal_outcomes)") as cursor:
+                outcome_columns = {row[1] for row in await cursor.fetchall()}
+            for interval in ("1h", "4h", "24h"):
+                for prefix in ("mfe", "mae"):
+                    if f"{prefix}_{interval}" not in outcome_columns:
+                        await self.sqlite_conn.execute(
+                            f"ALTER TABLE signal_outcomes ADD COLUMN {prefix}_{interval} REAL"
+                        )
+            
+            # Create performance_outcomes table (pending rows are the outcome evaluator's schedule)
+            await self.sqlite_conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS performance_outcomes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    signal_id TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    signal_type TEXT NOT NULL,
+                    interval TEXT NOT NULL,
+                    entry_price REAL NOT NULL,
+                    exit_price REAL,
+                    pnl_pct REAL,
+                    outcome TEXT,
+                    mfe_pct REAL,
+                    mae_pct REAL,
+                    unified_score REAL,
+                    tier TEXT,
+                    scanner_type TEXT,
+                    due_at TEXT,
+                    checked_at TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    
+                    UNIQUE (signal_id, interval)
+                );
+            """
+            )
+
+            # Daily win-rate rollups (maintained by app.services.performance_rollup)
+            await self.sqlite_conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS performance_rollup_daily (
+                    day TEXT NOT NULL,
+                    scanner_type TEXT NOT NULL DEFAULT '',
+                    tier TEXT NOT NULL DEFAULT '',
+                    interval TEXT NOT NULL,
+                    signal_type TEXT NOT NULL DEFAULT '',
+                    total INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    losses INTEGER NOT NULL DEFAULT 0,
+                    neutral INTEGER NOT NULL DEFAULT 0,
+                    win_pnl_sum REAL NOT NULL DEFAULT 0,
+                    loss_pnl_sum REAL NOT NULL DEFAULT 0,
+                    pnl_sum REAL NOT NULL DEFAULT 0,
+                    pnl_count INTEGER NOT NULL DEFAULT 0,
+                    score_sum REAL NOT NULL DEFAULT 0,
+                    score_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, scanner_type, tier, interval, signal_type)
+                ) WITHOUT ROWID;
+            """
+            )
+            await self.sqlite_conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS performance_rollup_symbol_daily (
+                    day TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    total INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    losses INTEGER NOT NULL DEFAULT 0,
+                    pnl_sum REAL NOT NULL DEFAULT 0,
+                    pnl_count INTEGER NOT NULL DEFAULT 0,
+                    score_sum REAL NOT NULL DEFAULT 0,
+                    score_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, symbol)
+                ) WITHOUT ROWID;
+            """
+            )
+            await self.sqlite_conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS performance_rollup_state (
+                    name TEXT PRIMARY KEY,
+                    built_at TEXT NOT NULL
+                );
+            """
+            )
+
             # Create indexes for SQLite
             indexes = [
                 "CREATE INDEX IF NOT EXISTS idx_signals_symbol ON signals(symbol);",
@@ -219,6 +314,12 @@ class Database:
                 "CREATE INDEX IF NOT EXISTS idx_outcomes_symbol_verdict ON signal_outcomes(symbol, verdict);",
                 "CREATE INDEX IF NOT EXISTS idx_outcomes_timestamp ON signal_outcomes(entry_timestamp DESC);",
                 "CREATE INDEX IF NOT EXISTS idx_outcomes_signal_id ON signal_outcomes(signal_id);",
+                "CREATE INDEX IF NOT EXISTS idx_outcomes_pending_1h ON signal_outcomes(entry_timestamp) WHERE tracked_at_1h IS NULL;",
+                "CREATE INDEX IF NOT EXISTS idx_outcomes_pending_4h ON signal_outcomes(entry_timestamp) WHERE tracked_at_4h IS NULL;",
+                "CREATE INDEX IF NOT EXISTS idx_outcomes_pending_24h ON signal_outcomes(entry_timestamp) WHERE tracked_at_24h IS NULL;",
+                "CREATE INDEX IF NOT EXISTS idx_performance_pending ON performance_outcomes(due_at) WHERE checked_at IS NULL;",
+                "CREATE INDEX IF NOT EXISTS idx_performance_checked_at ON performance_outcomes(checked_at DESC);",
+                "CREATE INDEX IF NOT EXISTS idx_performance_outcome_pnl ON performance_outcomes(outcome, pnl_pct);",
             ]
 
             for index_sql in indexes:
@@ -228,6 +329,66 @@ class Database:
 
         logger.info("✅ Database schema initialized")
 
+    # ==================== QUERY HELPERS ====================
+    # Queries use PostgreSQL $n placeholders; they are rewritten for SQLite.
+    # On SQLite, reads run on the reader connections and writes go through
+    # the pool's batching write queue.
+
+    async def fetch_all(self, query: str, *args) -> List[Dict[str, Any]]:
+        """Run a SELECT and return rows as dicts"""
+        async with self.acquire() as conn:
+            return [dict(record) for record in await conn.fetch(query, *args)]
+
+    async def fetch_one(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        rows = await self.fetch_all(query, *args)
+        return rows[0] if rows else None
+
+    async def execute(self, query: str, *args) -> None:
+        """Run a write statement (committed before returning)"""
+        async with self.acquire() as conn:
+            await conn.execute(query, *args)
+
+    async def execute_many(self, query: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a write statement for many parameter rows in one transaction"""
+        rows = list(rows)
+        if not rows:
+            return
+        async with self.acquire() as conn:
+            if self.use_postgres:
+                async with conn.transaction():
+                    await conn.executemany(query, rows)
+            else:
+                await conn.executemany(query, rows)
+
+    async def execute_transaction(self, statements: Iterable[tuple]) -> None:
+        """Run (query, args) statements atomically"""
+        if self.use_postgres:
+            async with self.acquire() as conn:
+                async with conn.transaction():
+                    for query, args in statements:
+                        await conn.execute(query, *args)
+            return
+        if not self.sqlite_pool:
+            await self.connect()
+        await self.sqlite_pool.write_atomic(
+            [(*to_sqlite(query, args), False) for query, args in statements]
+        )
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics for monitoring"""
+        if self.use_postgres:
+            if not self.pool:
+                return {"backend": "postgresql", "connected": False}
+            return {
+                "backend": "postgresql",
+                "connected": True,
+                "size": self.pool.get_size(),
+                "idle": self.pool.get_idle_size(),
+            }
+        if not self.sqlite_pool:
+            return {"backend": "sqlite", "connected": False}
+        return {"backend": "sqlite", "connected": True, **self.sqlite_pool.get_stats()}
+
     @asynccontextmanager
     async def acquire(self) -> AsyncGenerator:
         """Get database connection from pool or SQLite connection"""
@@ -241,13 +402,14 @@ class Database:
             async with self.pool.acquire() as connection:
                 yield connection
         else:
-            if not self.sqlite_conn:
+            if not self.sqlite_pool:
                 await self.connect()
             
-            if not self.sqlite_conn:
-                raise RuntimeError("Failed to initialize SQLite connection")
+            if not self.sqlite_pool:
+                raise RuntimeError("Failed to initialize SQLite connection pool")
             
-            yield self.sqlite_conn
+            # asyncpg-style facade: reads on reader connections, writes queued
+            yield PooledConnection(self.sqlite_pool)
 
 
 # Global database instance
@@ -9,6 +9,17 @@ from datetime import datetime, timedelta
 import asyncpg
 
 from app.storage.database import db
+from app.storage.write_behind import write_behind
+
+write_behind.register(
+    "mss_signals",
+    "signals",
+    (
+        "symbol", "signal", "score", "confidence", "price", "timestamp",
+        "reasons", "metrics", "comprehensive_metrics",
+    ),
+    returning_id=True,
+)
 
 
 class MSSSignalDatabaseService:
@@ -17,7 +28,7 @@ class MSSSignalDatabaseService:
     Stores MSS discoveries with complete 3-phase breakdown
     """
     
-    async def save_mss_signal(self, mss_data: Dict) -> int:
+    async def save_mss_signal(self, mss_data: Dict, wait: bool = True) -> Optional[int]:
         """
         Save MSS signal to database
         
@@ -33,62 +44,57 @@ class MSSSignalDatabaseService:
                 - price: float (optional)
                 - market_cap_usd: float (optional)
                 - fdv_usd: float (optional)
+            wait: Wait for the insert and return the id (False = fire and forget)
             
         Returns:
-            Signal ID (primary key)
+            Signal ID (primary key), or None when wait is False
         """
-        async with db.acquire() as conn:
-            # Extract phase data
-            phases = mss_data.get("phases", {})
-            phase1 = phases.get("phase1_discovery", {})
-            phase2 = phases.get("phase2_confirmation", {})
-            phase3 = phases.get("phase3_validation", {})
-            
-            # Get price from phase1 breakdown if not provided
-            price = mss_data.get("price")
-            if not price:
-                p1_breakdown = phase1.get("breakdown", {})
-                price = p1_breakdown.get("current_price", 0.0)
-            
-            # Build top reasons/factors for MSS
-            reasons = []
-            if phase1.get("status") == "PASS":
-                reasons.append(f"Discovery: {phase1.get('score', 0):.1f}/30 pts")
-            if phase2.get("score", 0) >= 17.5:
-                reasons.append(f"Social Momentum: {phase2.get('score', 0):.1f}/35 pts")
-            if phase3.get("score", 0) >= 20:
-                reasons.append(f"Whale Validation: {phase3.get('score', 0):.1f}/35 pts")
-            
-            # Prepare MSS-specific metrics
-            mss_metrics = {
-                "signal_type": "MSS",
-                "mss_score": mss_data.get("mss_score", 0),
-                "phase_scores": {
-                    "phase1_discovery": phase1.get("score", 0),
-                    "phase2_confirmation": phase2.get("score", 0),
-                    "phase3_validation": phase3.get("score", 0)
-                },
-                "phase_breakdowns": {
-                    "phase1": phase1.get("breakdown", {}),
-                    "phase2": phase2.get("breakdown", {}),
-                    "phase3": phase3.get("breakdown", {})
-                },
-                "market_data": {
-                    "price": price,
-                    "market_cap_usd": mss_data.get("market_cap_usd"),
-                    "fdv_usd": mss_data.get("fdv_usd")
-                }
+        # Extract phase data
+        phases = mss_data.get("phases", {})
+        phase1 = phases.get("phase1_discovery", {})
+        phase2 = phases.get("phase2_confirmation", {})
+        phase3 = phases.get("phase3_validation", {})
+
+        # Get price from phase1 breakdown if not provided
+        price = mss_data.get("price")
+        if not price:
+            p1_breakdown = phase1.get("breakdown", {})
+            price = p1_breakdown.get("current_price", 0.0)
+
+        # Build top reasons/factors for MSS
+        reasons = []
+        if phase1.get("status") == "PASS":
+            reasons.append(f"Discovery: {phase1.get('score', 0):.1f}/30 pts")
+        if phase2.get("score", 0) >= 17.5:
+            reasons.append(f"Social Momentum: {phase2.get('score', 0):.1f}/35 pts")
+        if phase3.get("score", 0) >= 20:
+            reasons.append(f"Whale Validation: {phase3.get('score', 0):.1f}/35 pts")
+
+        # Prepare MSS-specific metrics
+        mss_metrics = {
+            "signal_type": "MSS",
+            "mss_score": mss_data.get("mss_score", 0),
+            "phase_scores": {
+                "phase1_discovery": phase1.get("score", 0),
+                "phase2_confirmation": phase2.get("score", 0),
+                "phase3_validation": phase3.get("score", 0)
+            },
+            "phase_breakdowns": {
+                "phase1": phase1.get("breakdown", {}),
+                "phase2": phase2.get("breakdown", {}),
+                "phase3": phase3.get("breakdown", {})
+            },
+            "market_data": {
+                "price": price,
+                "market_cap_usd": mss_data.get("market_cap_usd"),
+                "fdv_usd": mss_data.get("fdv_usd")
             }
-            
-            # Insert into signals table
-            signal_id = await conn.fetchval("""
-                INSERT INTO signals (
-                    symbol, signal, score, confidence, price, timestamp,
-                    reasons, metrics, comprehensive_metrics
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9
-                ) RETURNING id
-            """,
+        }
+
+        # Buffered insert into signals table (flushed in bulk by write_behind)
+        return await write_behind.enqueue(
+            "mss_signals",
+            (
                 mss_data.get("symbol", "").upper(),
                 f"MSS_{mss_data.get('signal', 'NEUTRAL').upper()}",  # Prefix with MSS_
                 float(mss_data.get("mss_score", 0)),
@@ -98,9 +104,9 @@ class MSSSignalDatabaseService:
                 json.dumps(reasons),
                 json.dumps(mss_metrics),
                 json.dumps(phases)  # Store complete phase data
-            )
-            
-            return signal_id
+            ),
+            wait=wait,
+        )
     
     async def get_latest_mss_signals(self, limit: int = 100) -> List[Dict]:
         """
@@ -9,6 +9,18 @@ from app.utils.logger import get_wib_datetime
 import asyncpg
 
 from app.storage.database import db
+from app.storage.write_behind import write_behind
+
+write_behind.register(
+    "signals",
+    "signals",
+    (
+        "symbol", "signal", "score", "confidence", "price", "timestamp",
+        "reasons", "metrics", "comprehensive_metrics", "lunarcrush_metrics",
+        "coinapi_metrics", "smc_analysis", "ai_validation",
+    ),
+    returning_id=True,
+)
 
 
 class SignalDatabaseService:
@@ -17,26 +29,23 @@ class SignalDatabaseService:
     Provides high-performance async operations for signal history
     """
     
-    async def save_signal(self, signal_data: Dict) -> int:
+    async def save_signal(self, signal_data: Dict, wait: bool = True) -> Optional[int]:
         """
         Save signal to database
         
+        The row is buffered by write_behind and inserted in bulk with other
+        signals saved around the same time.
+        
         Args:
             signal_data: Signal dictionary from /signals endpoint
+            wait: Wait for the insert and return the id (False = fire and forget)
             
         Returns:
-            Signal ID (primary key)
+            Signal ID (primary key), or None when wait is False
         """
-        async with db.acquire() as conn:
-            signal_id = await conn.fetchval("""
-                INSERT INTO signals (
-                    symbol, signal, score, confidence, price, timestamp,
-                    reasons, metrics, comprehensive_metrics, lunarcrush_metrics,
-                    coinapi_metrics, smc_analysis, ai_validation
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
-                ) RETURNING id
-            """,
+        return await write_behind.enqueue(
+            "signals",
+            (
                 signal_data.get("symbol"),
                 signal_data.get("signal"),
                 signal_data.get("score"),
@@ -50,9 +59,9 @@ class SignalDatabaseService:
                 json.dumps(signal_data.get("coinAPIMetrics", {})),
                 json.dumps(signal_data.get("smcAnalysis", {})),
                 json.dumps(signal_data.get("ai_validation", {}))
-            )
-            
-            return signal_id
+            ),
+            wait=wait,
+        )
     
     async def get_latest_signals(self, limit: int = 100) -> List[Dict]:
         """
@@ -2,7 +2,12 @@
 """
 Signal History Storage
 Stores all generated signals for tracking, analysis, and backtesting
-UPDATED: Now uses PostgreSQL as primary storage with JSON backup
+UPDATED: Now uses PostgreSQL as primary storage with JSONL backup
+
+The backup is an append-only JSONL segment log (signal_data/history/): one
+line appended per signal instead of re-reading and rewriting a JSON array.
+Segments rotate every SIGNAL_LOG_SEGMENT_SIZE entries and only the newest
+SIGNAL_LOG_SEGMENTS are kept.
 """
 import json
 import os
@@ -11,68 +16,143 @@ from typing import Dict, List, Optional
 from pathlib import Path
 from app.utils.logger import logger, get_wib_datetime
 
+SIGNAL_LOG_SEGMENT_SIZE = int(os.getenv("SIGNAL_LOG_SEGMENT_SIZE", "500"))
+SIGNAL_LOG_SEGMENTS = int(os.getenv("SIGNAL_LOG_SEGMENTS", "3"))
+
+
+class SignalSegmentLog:
+    """Append-only JSONL log split into numbered, size-capped segments"""
+
+    def __init__(self, directory: Path, segment_size: int = SIGNAL_LOG_SEGMENT_SIZE,
+                 max_segments: int = SIGNAL_LOG_SEGMENTS):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = max(1, segment_size)
+        self.max_segments = max(1, max_segments)
+        segments = self._segments()
+        self._current = segments[-1] if segments else self._segment_path(1)
+        self._current_count = self._count_lines(self._current)
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"signals-{number:06d}.jsonl"
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.directory.glob("signals-*.jsonl"))
+
+    @staticmethod
+    def _count_lines(path: Path) -> int:
+        if not path.exists():
+            return 0
+        with open(path, "rb") as f:
+            return sum(1 for _ in f)
+
+    def append(self, entries: List[Dict]):
+        """Append entries, rotating segments as they fill"""
+        for entry in entries:
+            if self._current_count >= self.segment_size:
+                self._rotate()
+            with open(self._current, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            self._current_count += 1
+
+    def _rotate(self):
+        number = int(self._current.stem.split("-")[1]) + 1
+        self._current = self._segment_path(number)
+        self._current_count = 0
+        # Drop the oldest segments beyond retention (the new one counts)
+        for old in self._segments()[:-(self.max_segments - 1) or None]:
+            old.unlink(missing_ok=True)
+
+    def read_all(self) -> List[Dict]:
+        """All retained entries, oldest first (a torn trailing line is skipped)"""
+        entries = []
+        for segment in self._segments():
+            with open(segment, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        return entries
+
+    def count(self) -> int:
+        return sum(self._count_lines(segment) for segment in self._segments())
+
+    def clear(self):
+        for segment in self._segments():
+            segment.unlink(missing_ok=True)
+        self._current = self._segment_path(1)
+        self._current_count = 0
+
 
 class SignalHistory:
     """
     Store and retrieve signal history
-    Uses PostgreSQL as primary storage with JSON file as backup
+    Uses PostgreSQL as primary storage with a JSONL segment log as backup
     """
     
     def __init__(self, storage_dir: str = "signal_data"):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         self.history_file = self.storage_dir / "signal_history.json"
+        self.log = SignalSegmentLog(self.storage_dir / "history")
         
         # Import database service (lazy import to avoid circular dependencies)
         from app.storage.signal_db import signal_db
         self.db = signal_db
         
-        # Create file if it doesn't exist
+        # Database signal count, fetched once then kept current locally
+        self._db_count: Optional[int] = None
+        
+        self._migrate_legacy_file()
+    
+    def _migrate_legacy_file(self):
+        """Move entries of the old signal_history.json into the segment log (once)"""
         if not self.history_file.exists():
-            self._save_data([])
+            return
+        try:
+            with open(self.history_file, 'r') as f:
+                legacy = json.load(f)
+            if legacy:
+                self.log.append(legacy)
+            self.history_file.rename(self.history_file.with_suffix(".json.migrated"))
+            logger.info(f"Migrated {len(legacy)} signals from {self.history_file} to JSONL log")
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not migrate legacy signal history: {e}")
     
-    async def save_signal(self, signal_data: Dict) -> Dict:
+    async def save_signal(self, signal_data: Dict, wait_for_id: bool = True) -> Dict:
         """
-        Save a signal to history (PostgreSQL + JSON backup)
+        Save a signal to history (PostgreSQL + JSONL backup)
         
         Args:
             signal_data: Signal dict from /signals/{symbol} endpoint
+            wait_for_id: Wait for the buffered insert to commit and return
+                         its id; False queues it (signal_id is None)
         
         Returns:
             Dict with save status and signal ID
         """
         try:
-            # PRIMARY: Save to PostgreSQL
-            signal_id = await self.db.save_signal(signal_data)
+            # PRIMARY: Save to PostgreSQL (buffered, flushed in bulk)
+            signal_id = await self.db.save_signal(signal_data, wait=wait_for_id)
             
-            # BACKUP: Also save to JSON file for redundancy
+            # BACKUP: Append to the JSONL log for redundancy
             try:
-                signal_entry = {
-                    "id": self._generate_id(),
-                    "saved_at": get_wib_datetime().isoformat(),
-                    "data": signal_data
-                }
-                
-                history = self._load_data()
-                history.append(signal_entry)
-                
-                # Keep only last 1000 signals in JSON (prevent file from growing too large)
-                if len(history) > 1000:
-                    history = history[-1000:]
-                
-                self._save_data(history)
+                self.log.append([self._entry(signal_data)])
             except Exception as backup_error:
                 # Don't fail if backup fails
-                logger.warning(f"JSON backup failed: {backup_error}")
+                logger.warning(f"JSONL backup failed: {backup_error}")
             
-            # Get total count from database
-            total_count = await self.db.get_signal_count()
+            if self._db_count is None:
+                self._db_count = await self.db.get_signal_count()
+            else:
+                self._db_count += 1
             
             return {
                 "success": True,
                 "message": "Signal saved to database",
                 "signal_id": signal_id,
-                "total_signals": total_count,
+                "total_signals": self._db_count,
                 "storage": "postgresql"
             }
         
@@ -81,25 +161,14 @@ class SignalHistory:
             logger.warning(f"Database save failed, using JSON fallback: {e}")
             
             try:
-                signal_entry = {
-                    "id": self._generate_id(),
-                    "saved_at": get_wib_datetime().isoformat(),
-                    "data": signal_data
-                }
-                
-                history = self._load_data()
-                history.append(signal_entry)
-                
-                if len(history) > 1000:
-                    history = history[-1000:]
-                
-                self._save_data(history)
+                signal_entry = self._entry(signal_data)
+                self.log.append([signal_entry])
                 
                 return {
                     "success": True,
                     "message": "Signal saved to JSON (database unavailable)",
                     "signal_id": signal_entry["id"],
-                    "total_signals": len(history),
+                    "total_signals": self.log.count(),
                     "storage": "json_fallback"
                 }
             except Exception as fallback_error:
@@ -273,7 +342,7 @@ class SignalHistory:
             }
         
         try:
-            self._save_data([])
+            self.log.clear()
             return {
                 "success": True,
                 "message": "Signal history cleared"
@@ -286,17 +355,18 @@ class SignalHistory:
             }
     
     def _load_data(self) -> List[Dict]:
-        """Load signal history from JSON file"""
+        """Load signal history from the JSONL log (oldest first)"""
         try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            return self.log.read_all()
+        except OSError:
             return []
     
-    def _save_data(self, data: List[Dict]):
-        """Save signal history to JSON file"""
-        with open(self.history_file, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _entry(self, signal_data: Dict) -> Dict:
+        return {
+            "id": self._generate_id(),
+            "saved_at": get_wib_datetime().isoformat(),
+            "data": signal_data
+        }
     
     def _generate_id(self) -> str:
         """Generate unique ID for signal"""
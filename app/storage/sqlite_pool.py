@@ -0,0 +1,381 @@
+"""
+SQLite Connection Pool
+One writer with a batching write queue plus N read-only connections (WAL mode)
+
+Used by Database when no PostgreSQL DATABASE_URL is configured. A single
+shared aiosqlite connection serialized every read and write through one
+worker thread; with WAL, readers never block the writer and vice versa, so:
+
+- Writes are queued. The writer thread drains everything queued into ONE
+  transaction (each job in its own SAVEPOINT, so a failing job only rolls
+  back itself) and commits once - concurrent inserts share a commit/fsync.
+  A job's future resolves after its batch commits (read-your-writes holds).
+- Reads run on SQLITE_READERS read-only connections in parallel threads.
+- Connections use tuned pragmas (WAL, synchronous=NORMAL, mmap, page cache,
+  busy timeout) and a larger prepared-statement cache; $n -> ? placeholder
+  rewrites are cached so repeated queries hit the statement cache.
+
+Two facades over the pool:
+- PooledConnection: asyncpg-style (fetch/fetchrow/fetchval/execute/
+  executemany with $n placeholders) - what Database.acquire() yields
+- LegacyConnection: aiosqlite-style (execute(sql, params) as awaitable or
+  async context manager, commit() is a no-op) - Database.sqlite_conn
+"""
+
+import asyncio
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+SQLITE_READERS = int(os.getenv("SQLITE_READERS", "4"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_STATEMENT_CACHE = int(os.getenv("SQLITE_STATEMENT_CACHE", "512"))
+SQLITE_WRITE_BATCH_MAX = int(os.getenv("SQLITE_WRITE_BATCH_MAX", "256"))
+
+_POSITIONAL_PARAM = re.compile(r"\$(\d+)")
+_WRITE_KEYWORDS = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _translate(query: str) -> Tuple[str, Tuple[int, ...]]:
+    """PostgreSQL $n placeholders -> ? plus the argument order (repeats expanded)"""
+    order: List[int] = []
+
+    def replace(match):
+        order.append(int(match.group(1)) - 1)
+        return "?"
+
+    return _POSITIONAL_PARAM.sub(replace, query), tuple(order)
+
+
+def to_sqlite(query: str, args: Sequence[Any]) -> Tuple[str, List[Any]]:
+    sql, order = _translate(query)
+    if not order:
+        return sql, list(args)
+    return sql, [args[i] for i in order]
+
+
+def is_read_only(sql: str) -> bool:
+    head = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+    if head == "SELECT":
+        return "RETURNING" not in sql.upper()
+    if head == "WITH":
+        return not _WRITE_KEYWORDS.search(sql)
+    return False
+
+
+@dataclass
+class QueryResult:
+    rows: List[tuple]
+    description: Optional[tuple]
+    lastrowid: Optional[int]
+    rowcount: int
+
+    @property
+    def columns(self) -> List[str]:
+        return [column[0] for column in self.description or ()]
+
+    def dicts(self) -> List[Dict[str, Any]]:
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.rows]
+
+
+class _WriteJob:
+    __slots__ = ("statements", "future")
+
+    def __init__(self, statements: List[Tuple[str, Any, bool]], future: asyncio.Future):
+        self.statements = statements
+        self.future = future
+
+
+class SQLitePool:
+    """WAL-mode SQLite pool: batched single writer + read-only readers"""
+
+    def __init__(self, path: str, readers: Optional[int] = None):
+        self.path = path
+        self.reader_count = max(1, readers or SQLITE_READERS)
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: List[sqlite3.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_executor: Optional[ThreadPoolExecutor] = None
+        self._reader_executor: Optional[ThreadPoolExecutor] = None
+        self.legacy = LegacyConnection(self)
+        self.stats = {
+            "reads": 0,
+            "writes": 0,
+            "write_batches": 0,
+            "largest_batch": 0,
+            "failed_writes": 0,
+            "read_wait_ms": 0.0,
+        }
+
+    # ==================== LIFECYCLE ====================
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        self._writer_executor = ThreadPoolExecutor(1, thread_name_prefix="sqlite-writer")
+        self._reader_executor = ThreadPoolExecutor(self.reader_count, thread_name_prefix="sqlite-reader")
+
+        # Writer first: it creates the file and switches it to WAL
+        self._writer = await loop.run_in_executor(self._writer_executor, self._connect, False)
+        self._idle_readers = asyncio.Queue()
+        for _ in range(self.reader_count):
+            reader = await loop.run_in_executor(self._reader_executor, self._connect, True)
+            self._readers.append(reader)
+            self._idle_readers.put_nowait(reader)
+
+        self._queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._write_loop())
+        logger.info(f"✅ SQLite pool open ({self.path}): 1 writer + {self.reader_count} readers, WAL")
+
+    async def close(self):
+        """Flush queued writes, then close every connection"""
+        if self._writer_task is not None:
+            self._queue.put_nowait(None)  # Sentinel - processed after everything queued before it
+            await self._writer_task
+            self._writer_task = None
+
+        loop = asyncio.get_running_loop()
+        if self._writer is not None:
+            await loop.run_in_executor(self._writer_executor, self._writer.close)
+            self._writer = None
+        for reader in self._readers:
+            await loop.run_in_executor(self._reader_executor, reader.close)
+        self._readers = []
+
+        for executor in (self._writer_executor, self._reader_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._writer_executor = self._reader_executor = None
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        mode = "ro" if read_only else "rwc"
+        conn = sqlite3.connect(
+            f"file:{self.path}?mode={mode}",
+            uri=True,
+            check_same_thread=False,  # Each connection is used by one thread at a time
+            isolation_level=None,  # Transactions are managed explicitly
+            cached_statements=SQLITE_STATEMENT_CACHE,
+        )
+        if not read_only:
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = ON")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    # ==================== READS ====================
+
+    async def read(self, sql: str, params: Sequence[Any] = ()) -> QueryResult:
+        waited = time.perf_counter()
+        conn = await self._idle_readers.get()
+        self.stats["read_wait_ms"] += (time.perf_counter() - waited) * 1000
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._reader_executor, _run, conn, sql, params, False)
+        finally:
+            self._idle_readers.put_nowait(conn)
+            self.stats["reads"] += 1
+
+    # ==================== WRITES ====================
+
+    async def write(self, sql: str, params: Any = (), many: bool = False) -> QueryResult:
+        return (await self.write_atomic([(sql, params, many)]))[-1]
+
+    async def write_atomic(self, statements: Iterable[Tuple[str, Any, bool]]) -> List[QueryResult]:
+        """Queue statements that must commit (or fail) together"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_WriteJob(list(statements), future))
+        return await future
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            jobs = []
+            stop = job is None
+            if job is not None:
+                jobs.append(job)
+            while not stop and len(jobs) < SQLITE_WRITE_BATCH_MAX and not self._queue.empty():
+                job = self._queue.get_nowait()
+                if job is None:
+                    stop = True
+                else:
+                    jobs.append(job)
+
+            if jobs:
+                try:
+                    outcomes = await loop.run_in_executor(self._writer_executor, self._flush, jobs)
+                except Exception as e:
+                    logger.error(f"SQLite write batch failed ({len(jobs)} jobs): {e}")
+                    outcomes = [e] * len(jobs)
+
+                for job, outcome in zip(jobs, outcomes):
+                    if job.future.done():
+                        continue
+                    if isinstance(outcome, Exception):
+                        self.stats["failed_writes"] += 1
+                        job.future.set_exception(outcome)
+                    else:
+                        job.future.set_result(outcome)
+
+                self.stats["write_batches"] += 1
+                self.stats["writes"] += len(jobs)
+                self.stats["largest_batch"] = max(self.stats["largest_batch"], len(jobs))
+
+            if stop:
+                return
+
+    def _flush(self, jobs: List[_WriteJob]) -> List[Any]:
+        """Run queued jobs in one transaction (writer thread)"""
+        conn = self._writer
+        outcomes: List[Any] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for job in jobs:
+                conn.execute("SAVEPOINT job")
+                try:
+                    results = [_run(conn, sql, params, many) for sql, params, many in job.statements]
+                except Exception as e:
+                    conn.execute("ROLLBACK TO job")
+                    outcomes.append(e)
+                else:
+                    outcomes.append(results)
+                conn.execute("RELEASE job")
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return outcomes
+
+    def get_stats(self) -> Dict[str, Any]:
+        batches = self.stats["write_batches"]
+        return {
+            **self.stats,
+            "readers": self.reader_count,
+            "queued_writes": self._queue.qsize() if self._queue else 0,
+            "avg_batch": round(self.stats["writes"] / batches, 2) if batches else 0,
+            "read_wait_ms": round(self.stats["read_wait_ms"], 1),
+        }
+
+
+def _run(conn: sqlite3.Connection, sql: str, params: Any, many: bool) -> QueryResult:
+    if many:
+        cursor = conn.executemany(sql, params)
+        return QueryResult([], None, cursor.lastrowid, cursor.rowcount)
+    cursor = conn.execute(sql, params)
+    rows = cursor.fetchall() if cursor.description else []
+    return QueryResult(rows, cursor.description, cursor.lastrowid, cursor.rowcount)
+
+
+# ==================== FACADES ====================
+
+
+class PooledConnection:
+    """asyncpg-style connection over the pool ($n placeholders, dict rows)"""
+
+    def __init__(self, pool: SQLitePool):
+        self._pool = pool
+
+    async def _query(self, query: str, args: Sequence[Any]) -> QueryResult:
+        sql, params = to_sqlite(query, args)
+        if is_read_only(sql):
+            return await self._pool.read(sql, params)
+        return await self._pool.write(sql, params)
+
+    async def fetch(self, query: str, *args) -> List[Dict[str, Any]]:
+        return (await self._query(query, args)).dicts()
+
+    async def fetchrow(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        rows = (await self._query(query, args)).dicts()
+        return rows[0] if rows else None
+
+    async def fetchval(self, query: str, *args, column: int = 0) -> Any:
+        result = await self._query(query, args)
+        return result.rows[0][column] if result.rows else None
+
+    async def execute(self, query: str, *args) -> str:
+        result = await self._query(query, args)
+        verb = query.lstrip().split(None, 1)[0].upper() if query.strip() else ""
+        return f"{verb} {max(result.rowcount, 0)}"
+
+    async def executemany(self, query: str, args: Iterable[Sequence[Any]]):
+        sql, _ = _translate(query)
+        await self._pool.write(sql, [to_sqlite(query, row)[1] for row in args], many=True)
+
+
+class _Cursor:
+    """Completed result with the aiosqlite cursor surface"""
+
+    def __init__(self, result: QueryResult):
+        self._rows = result.rows
+        self.description = result.description
+        self.lastrowid = result.lastrowid
+        self.rowcount = result.rowcount
+
+    async def fetchall(self) -> List[tuple]:
+        return self._rows
+
+    async def fetchone(self) -> Optional[tuple]:
+        return self._rows[0] if self._rows else None
+
+
+class _CursorRequest:
+    """Awaitable and async context manager, like aiosqlite's execute()"""
+
+    def __init__(self, coro):
+        self._coro = coro
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> _Cursor:
+        return await self._coro
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class LegacyConnection:
+    """aiosqlite-style connection over the pool (? placeholders, tuple rows)"""
+
+    def __init__(self, pool: SQLitePool):
+        self._pool = pool
+
+    async def _execute(self, sql: str, params: Sequence[Any]) -> _Cursor:
+        params = tuple(params or ())
+        if is_read_only(sql):
+            return _Cursor(await self._pool.read(sql, params))
+        return _Cursor(await self._pool.write(sql, params))
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> _CursorRequest:
+        return _CursorRequest(self._execute(sql, params))
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> _Cursor:
+        return _Cursor(await self._pool.write(sql, [tuple(row) for row in rows], many=True))
+
+    async def commit(self):
+        """No-op: every write commits with its batch"""
+
+    async def rollback(self):
+        """No-op: failed writes roll back their own savepoint"""
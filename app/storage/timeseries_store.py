@@ -0,0 +1,297 @@
+"""
+Local Time-Series Store
+Append-only, columnar, memory-mapped storage for provider history endpoints
+
+Each series is keyed by (provider, endpoint, series, interval) and lives in its
+own directory:
+
+    <root>/<provider>/<endpoint>/<series>/<interval>/
+        time.i8          int64 epoch ms, strictly increasing
+        <column>.f8      float64 per numeric field
+        meta.json        column names + time field
+
+Columns are raw little-endian arrays, so reads are np.memmap views - a range
+read is a searchsorted on the time column plus slices, no copy. Appends only
+accept rows newer than the last stored row. The time column is written last,
+so its length is the committed row count; readers see min(time rows, column
+rows) and never modify files. Torn column tails (an append in progress in
+another worker, or one cut off by a crash) are truncated only by the next
+writer, under the flock, so several workers can share one store directory.
+
+Usage:
+    key = SeriesKey("coinglass", "futures/funding-rate/history", "BTCUSDT", "1h")
+    history_store.append(key, rows)              # [{"time": ms, "close": ...}, ...]
+    view = history_store.read(key, start_ms=..., end_ms=...)
+    view["time"], view["close"]                  # np.memmap slices
+"""
+
+import fcntl
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+TIME_COLUMN = "time"
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._=-]+")
+
+
+class SeriesKey(NamedTuple):
+    provider: str
+    endpoint: str
+    series: str
+    interval: str
+
+    def path_parts(self) -> List[str]:
+        return [_UNSAFE_CHARS.sub("_", part.strip("/")) or "_" for part in self]
+
+
+class _Series:
+    """Open handle of one series: columns and cached memmaps"""
+
+    def __init__(self, directory: str, columns: List[str], time_field: str):
+        self.directory = directory
+        self.columns = columns
+        self.time_field = time_field
+        self.rows = 0
+        self._maps: Dict[str, np.memmap] = {}
+        self._mapped_rows = -1
+
+    def column_path(self, column: str) -> str:
+        if column == TIME_COLUMN:
+            return os.path.join(self.directory, "time.i8")
+        return os.path.join(self.directory, f"{column}.f8")
+
+    def _sizes(self) -> Dict[str, int]:
+        sizes = {}
+        for column in (TIME_COLUMN, *self.columns):
+            path = self.column_path(column)
+            sizes[column] = os.path.getsize(path) if os.path.exists(path) else 0
+        return sizes
+
+    def refresh(self):
+        """Visible rows = rows present in every column (read-only, safe without the lock)"""
+        self.rows = min(size // 8 for size in self._sizes().values())
+
+    def repair(self):
+        """Trim column tails past the committed rows (torn writes) - only under the write lock"""
+        sizes = self._sizes()
+        rows = min(sizes.values()) // 8
+        for column, size in sizes.items():
+            if size > rows * 8:
+                with open(self.column_path(column), "r+b") as handle:
+                    handle.truncate(rows * 8)
+        self.rows = rows
+
+    def maps(self) -> Dict[str, np.ndarray]:
+        if self._mapped_rows != self.rows:
+            self._maps = {}
+            if self.rows:
+                self._maps[TIME_COLUMN] = np.memmap(
+                    self.column_path(TIME_COLUMN), dtype="<i8", mode="r", shape=(self.rows,)
+                )
+                for column in self.columns:
+                    self._maps[column] = np.memmap(
+                        self.column_path(column), dtype="<f8", mode="r", shape=(self.rows,)
+                    )
+            self._mapped_rows = self.rows
+        return self._maps
+
+
+class TimeSeriesStore:
+    """Append-only memory-mapped store of provider history series"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.getenv("TIMESERIES_STORE_DIR", "data/timeseries")
+        self._series: Dict[SeriesKey, _Series] = {}
+        self._lock = threading.Lock()
+        self.stats = {"appended_rows": 0, "rejected_rows": 0, "range_reads": 0, "rebuilds": 0}
+
+    def _directory(self, key: SeriesKey) -> str:
+        return os.path.join(self.root, *key.path_parts())
+
+    def _open(self, key: SeriesKey) -> Optional[_Series]:
+        series = self._series.get(key)
+        if series is not None:
+            series.refresh()
+            return series
+
+        directory = self._directory(key)
+        meta_path = os.path.join(directory, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as handle:
+            meta = json.load(handle)
+        series = _Series(directory, meta["columns"], meta.get("time_field", TIME_COLUMN))
+        series.refresh()
+        self._series[key] = series
+        return series
+
+    @contextmanager
+    def _write_lock(self, key: SeriesKey):
+        directory = self._directory(key)
+        os.makedirs(directory, exist_ok=True)
+        with self._lock, open(os.path.join(directory, ".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield directory
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    # ==================== WRITES ====================
+
+    def append(self, key: SeriesKey, rows: Iterable[Dict[str, Any]], time_field: str = "time") -> int:
+        """
+        Append rows newer than the last stored row
+
+        The first append fixes the columns (the numeric fields of the rows).
+        Values that are not numeric are stored as NaN.
+
+        Returns:
+            Number of rows appended
+        """
+        rows = [row for row in rows if _as_int(row.get(time_field)) is not None]
+        if not rows:
+            return 0
+
+        with self._write_lock(key) as directory:
+            series = self._open(key)
+            if series is None:
+                series = self._create(key, directory, rows, time_field)
+            else:
+                series.repair()
+
+            times = np.array([_as_int(row[time_field]) for row in rows], dtype=np.int64)
+            order = np.argsort(times, kind="stable")
+            times = times[order]
+            last = int(series.maps()[TIME_COLUMN][-1]) if series.rows else None
+
+            keep = np.ones(len(times), dtype=bool)
+            keep[1:] = times[1:] > times[:-1]  # drop duplicate timestamps
+            if last is not None:
+                keep &= times > last
+            self.stats["rejected_rows"] += int((~keep).sum())
+            if not keep.any():
+                return 0
+
+            selected = [rows[i] for i in order[keep]]
+            for column in series.columns:
+                values = np.array([_as_float(row.get(column)) for row in selected], dtype="<f8")
+                with open(series.column_path(column), "ab") as handle:
+                    handle.write(values.tobytes())
+            # Time column last - its length commits the rows
+            with open(series.column_path(TIME_COLUMN), "ab") as handle:
+                handle.write(times[keep].astype("<i8").tobytes())
+
+            series.refresh()
+            self.stats["appended_rows"] += len(selected)
+            return len(selected)
+
+    def replace(self, key: SeriesKey, rows: Iterable[Dict[str, Any]], time_field: str = "time") -> int:
+        """Rewrite a series from rows (backfill older history than the stored start)"""
+        with self._write_lock(key) as directory:
+            for name in os.listdir(directory):
+                if name != ".lock":
+                    os.remove(os.path.join(directory, name))
+            self._series.pop(key, None)
+        self.stats["rebuilds"] += 1
+        return self.append(key, rows, time_field)
+
+    def _create(self, key: SeriesKey, directory: str, rows: List[Dict[str, Any]], time_field: str) -> _Series:
+        columns = []
+        for row in rows:
+            for name, value in row.items():
+                if name != time_field and name not in columns and _as_float(value) == _as_float(value):
+                    columns.append(name)
+        with open(os.path.join(directory, "meta.json"), "w") as handle:
+            json.dump({"columns": columns, "time_field": time_field, "key": list(key)}, handle)
+        series = _Series(directory, columns, time_field)
+        series.refresh()
+        self._series[key] = series
+        return series
+
+    # ==================== READS ====================
+
+    def row_count(self, key: SeriesKey) -> int:
+        series = self._open(key)
+        return series.rows if series else 0
+
+    def bounds(self, key: SeriesKey) -> Optional[tuple]:
+        """(first_ms, last_ms) of a series or None"""
+        series = self._open(key)
+        if not series or not series.rows:
+            return None
+        times = series.maps()[TIME_COLUMN]
+        return int(times[0]), int(times[-1])
+
+    def read(
+        self,
+        key: SeriesKey,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy range read
+
+        Returns:
+            {"time": int64 view, <column>: float64 view, ...} for rows with
+            start_ms <= time <= end_ms, the newest `limit` of them if given
+        """
+        series = self._open(key)
+        if not series or not series.rows:
+            return {}
+        self.stats["range_reads"] += 1
+
+        maps = series.maps()
+        times = maps[TIME_COLUMN]
+        lo = int(np.searchsorted(times, start_ms, side="left")) if start_ms is not None else 0
+        hi = int(np.searchsorted(times, end_ms, side="right")) if end_ms is not None else series.rows
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return {name: values[lo:hi] for name, values in maps.items()}
+
+    def read_rows(self, key: SeriesKey, **kwargs) -> List[Dict[str, Any]]:
+        """Range read as upstream-shaped row dicts (time field restored, NaN as None)"""
+        view = self.read(key, **kwargs)
+        if not view:
+            return []
+        series = self._series[key]
+        columns = [name for name in view if name != TIME_COLUMN]
+        times = view[TIME_COLUMN].tolist()
+        values = [
+            np.where(np.isnan(view[name]), None, view[name]).tolist() for name in columns
+        ]
+        return [
+            {series.time_field: t, **{name: column[i] for name, column in zip(columns, values)}}
+            for i, t in enumerate(times)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "open_series": len(self._series), "root": self.root}
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+# Global instance for easy import
+history_store = TimeSeriesStore()
@@ -0,0 +1,243 @@
+"""
+Write-Behind Persistence
+Buffers INSERTs per table and flushes them in bulk
+
+Signals, MSS discoveries and monitoring metrics were written one INSERT (one
+round trip) per record, so a scan emitting hundreds of signals paid hundreds
+of round trips. Producers now enqueue rows here; a buffer is flushed when it
+reaches WRITE_BEHIND_MAX_ROWS or every WRITE_BEHIND_FLUSH_SECONDS:
+
+- PostgreSQL: copy_records_to_table (ids pre-allocated from the sequence in
+  one query when the caller needs them), or executemany in one transaction
+  for tables with an ON CONFLICT clause
+- SQLite: one batched write job on the pool's writer (one commit)
+
+A failing bulk flush is retried row by row so one bad record only fails
+itself. enqueue() returns a future resolving to the row id (or None) once
+the row is committed; stop() flushes everything still buffered, so it must
+run before db.disconnect() on shutdown.
+
+When the flusher is not running (scripts, WRITE_BEHIND_ENABLED=false) rows
+are written immediately.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.storage.database import db
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+WRITE_BEHIND_ENABLED = os.getenv("WRITE_BEHIND_ENABLED", "true").lower() == "true"
+WRITE_BEHIND_MAX_ROWS = int(os.getenv("WRITE_BEHIND_MAX_ROWS", "500"))
+WRITE_BEHIND_FLUSH_SECONDS = float(os.getenv("WRITE_BEHIND_FLUSH_SECONDS", "0.5"))
+
+
+@dataclass
+class BufferedTable:
+    """Insert target of one buffer"""
+
+    table: str
+    columns: Tuple[str, ...]
+    returning_id: bool = False
+    on_conflict: str = ""  # e.g. "ON CONFLICT (a, b) DO NOTHING" - disables COPY
+    pending: List[Tuple[tuple, Optional[asyncio.Future]]] = field(default_factory=list)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def insert_sql(self, postgres: bool) -> str:
+        if postgres:
+            placeholders = ", ".join(f"${i + 1}" for i in range(len(self.columns)))
+        else:
+            placeholders = ", ".join("?" for _ in self.columns)
+        sql = f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES ({placeholders})"
+        if self.on_conflict:
+            sql += f" {self.on_conflict}"
+        if self.returning_id and postgres:
+            sql += " RETURNING id"
+        return sql
+
+
+class WriteBehindWriter:
+    """Per-table insert buffers with size/time triggered bulk flushes"""
+
+    def __init__(self):
+        self.buffers: Dict[str, BufferedTable] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._flushes: set = set()
+        self.stats = {"enqueued": 0, "flushed_rows": 0, "flushes": 0, "failed_rows": 0, "flush_ms": 0.0}
+
+    def register(self, name: str, table: str, columns: Sequence[str], returning_id: bool = False, on_conflict: str = ""):
+        """Declare a buffer (idempotent)"""
+        if name not in self.buffers:
+            self.buffers[name] = BufferedTable(table, tuple(columns), returning_id, on_conflict)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ==================== LIFECYCLE ====================
+
+    async def start(self):
+        if not WRITE_BEHIND_ENABLED:
+            logger.info("Write-behind persistence disabled (WRITE_BEHIND_ENABLED=false)")
+            return
+        if self.running:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(
+            f"✅ Write-behind persistence started "
+            f"(max {WRITE_BEHIND_MAX_ROWS} rows / {WRITE_BEHIND_FLUSH_SECONDS}s)"
+        )
+
+    async def stop(self):
+        """Stop the flusher and write out everything still buffered"""
+        if self._task is not None:
+            # Not cancelled - a flush in progress finishes writing its batch
+            self._stopping.set()
+            await self._task
+            self._task = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+        logger.info(f"Write-behind persistence stopped ({self.stats['flushed_rows']} rows written)")
+
+    async def _run_loop(self):
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=WRITE_BEHIND_FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush error: {e}")
+
+    # ==================== ENQUEUE ====================
+
+    async def enqueue(self, name: str, row: Sequence[Any], wait: bool = True) -> Optional[int]:
+        """
+        Buffer a row
+
+        Args:
+            name: Registered buffer name
+            row: Values in the buffer's column order
+            wait: Wait until the row is committed and return its id
+                  (None for tables without returning_id). With wait=False
+                  flush errors are only logged.
+        """
+        buffer = self.buffers[name]
+        future = asyncio.get_running_loop().create_future() if wait else None
+        buffer.pending.append((tuple(row), future))
+        self.stats["enqueued"] += 1
+
+        if not self.running:
+            await self._flush_buffer(name, buffer)
+        elif len(buffer.pending) >= WRITE_BEHIND_MAX_ROWS:
+            task = asyncio.create_task(self._flush_buffer(name, buffer))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+        return await future if future is not None else None
+
+    # ==================== FLUSH ====================
+
+    async def flush(self, name: Optional[str] = None):
+        names = [name] if name else list(self.buffers)
+        for buffer_name in names:
+            buffer = self.buffers[buffer_name]
+            if buffer.pending:
+                await self._flush_buffer(buffer_name, buffer)
+
+    async def _flush_buffer(self, name: str, buffer: BufferedTable):
+        async with buffer.lock:
+            items, buffer.pending = buffer.pending, []
+            if not items:
+                return
+            started = time.perf_counter()
+            outcomes = await self._write_rows(buffer, [row for row, _ in items])
+            self.stats["flush_ms"] += (time.perf_counter() - started) * 1000
+            self.stats["flushes"] += 1
+
+        failed = 0
+        for (_, future), outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                failed += 1
+                if future is not None and not future.done():
+                    future.set_exception(outcome)
+            elif future is not None and not future.done():
+                future.set_result(outcome)
+        self.stats["flushed_rows"] += len(items) - failed
+        self.stats["failed_rows"] += failed
+        if failed:
+            logger.warning(f"Write-behind '{name}': {failed}/{len(items)} rows failed")
+
+    async def _write_rows(self, buffer: BufferedTable, rows: List[tuple]) -> List[Any]:
+        """Bulk write; on failure fall back to row-by-row. Returns an id/None/Exception per row"""
+        try:
+            if db.use_postgres:
+                return await self._write_postgres(buffer, rows)
+            return await self._write_sqlite(buffer, rows)
+        except Exception as e:
+            if len(rows) == 1:
+                return [e]
+            logger.debug(f"Bulk write to {buffer.table} failed ({e}), retrying row by row")
+            outcomes = []
+            for row in rows:
+                outcomes.extend(await self._write_rows(buffer, [row]))
+            return outcomes
+
+    async def _write_postgres(self, buffer: BufferedTable, rows: List[tuple]) -> List[Any]:
+        async with db.acquire() as conn:
+            if buffer.on_conflict:
+                if buffer.returning_id:
+                    sql = buffer.insert_sql(postgres=True)
+                    async with conn.transaction():
+                        return [await conn.fetchval(sql, *row) for row in rows]
+                async with conn.transaction():
+                    await conn.executemany(buffer.insert_sql(postgres=True), rows)
+                return [None] * len(rows)
+
+            columns = list(buffer.columns)
+            ids: List[Any] = [None] * len(rows)
+            records = rows
+            if buffer.returning_id:
+                allocated = await conn.fetch(
+                    "SELECT nextval(pg_get_serial_sequence($1, 'id')) AS id FROM generate_series(1, $2)",
+                    buffer.table,
+                    len(rows),
+                )
+                ids = [record["id"] for record in allocated]
+                records = [(row_id, *row) for row_id, row in zip(ids, rows)]
+                columns = ["id", *columns]
+            await conn.copy_records_to_table(buffer.table, records=records, columns=columns)
+            return ids
+
+    async def _write_sqlite(self, buffer: BufferedTable, rows: List[tuple]) -> List[Any]:
+        if not db.sqlite_pool:
+            await db.connect()
+        sql = buffer.insert_sql(postgres=False)
+        if buffer.returning_id:
+            # One atomic job, one commit; lastrowid per statement
+            results = await db.sqlite_pool.write_atomic([(sql, row, False) for row in rows])
+            return [result.lastrowid for result in results]
+        await db.sqlite_pool.write(sql, rows, many=True)
+        return [None] * len(rows)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "flush_ms": round(self.stats["flush_ms"], 1),
+            "running": self.running,
+            "pending": {name: len(buffer.pending) for name, buffer in self.buffers.items()},
+        }
+
+
+# Global instance for easy import
+write_behind = WriteBehindWriter()
@@ -0,0 +1,329 @@
+"""
+Vectorized Indicator Kernels
+NumPy implementations of the technical indicators used across the signal engine
+
+Every kernel takes a contiguous float64 matrix of shape (symbols × bars), most
+recent bar last, and returns one value (or one series) per symbol. 1-D inputs
+are treated as a single symbol. Rows must be finite and share the same number
+of bars - align/trim candles before stacking them.
+
+Indicators:
+- SMA / EMA (SMA-seeded or first-value-seeded) series and last values
+- RSI: simple-average RSI (TechnicalIndicators) and rolling RSI series (ReversalDetector)
+- MACD line, signal and histogram
+- MA crossover state
+- True Range / ATR
+- Bollinger bands (middle, upper, lower, bandwidth, %B)
+
+EMA recursion is evaluated in fixed-size blocks with a precomputed decay matrix,
+so both the symbol axis and the bar axis run inside BLAS instead of a Python loop.
+
+compute_indicators() computes a whole indicator set for many symbols in one call.
+For a single series the array setup costs more than it saves, so
+TechnicalIndicators, ReversalDetector and ATRCalculator keep their pure-Python
+math; tools/indicator_benchmark.py checks parity with it.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Bars per EMA block - decay powers stay well inside float64 range
+EMA_BLOCK_SIZE = 64
+
+# MA crossover states (same strings as TechnicalIndicators.detect_ma_crossover)
+CROSSOVER_LABELS = np.array(["no_crossover", "bullish_crossover", "bearish_crossover"])
+
+
+def as_matrix(values) -> np.ndarray:
+    """Contiguous float64 (symbols × bars) view of values"""
+    return np.ascontiguousarray(np.atleast_2d(np.asarray(values, dtype=np.float64)))
+
+
+# ==================== MOVING AVERAGES ====================
+
+def sma_last(prices, period: int) -> np.ndarray:
+    """Mean of the last period bars per symbol (NaN if too few bars)"""
+    x = as_matrix(prices)
+    if x.shape[1] < period:
+        return np.full(x.shape[0], np.nan)
+    return x[:, -period:].mean(axis=1)
+
+
+def sma_series(prices, period: int) -> np.ndarray:
+    """Rolling mean, NaN for the first period-1 bars"""
+    x = as_matrix(prices)
+    out = np.full(x.shape, np.nan)
+    if x.shape[1] >= period:
+        out[:, period - 1:] = sliding_window_view(x, period, axis=1).mean(axis=2)
+    return out
+
+
+@lru_cache(maxsize=64)
+def _ema_block_weights(alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower-triangular decay matrix W and carry weights for one EMA block"""
+    decay = 1.0 - alpha
+    idx = np.arange(EMA_BLOCK_SIZE)
+    lag = idx[:, None] - idx[None, :]
+    weights = np.where(lag >= 0, alpha * decay ** np.maximum(lag, 0), 0.0)
+    carry = decay ** (idx + 1)
+    return weights, carry
+
+
+def _ema_recursive(x: np.ndarray, alpha: float, seed: np.ndarray) -> np.ndarray:
+    """
+    y[t] = alpha * x[t] + (1 - alpha) * y[t-1], with y[-1] = seed
+
+    Args:
+        x: (symbols × n) inputs following the seed
+        seed: (symbols,) value before x[:, 0]
+    """
+    weights, carry_weights = _ema_block_weights(alpha)
+    out = np.empty_like(x)
+    carry = seed
+    for start in range(0, x.shape[1], EMA_BLOCK_SIZE):
+        block = x[:, start:start + EMA_BLOCK_SIZE]
+        size = block.shape[1]
+        y = block @ weights[:size, :size].T + carry[:, None] * carry_weights[:size]
+        out[:, start:start + size] = y
+        carry = y[:, -1]
+    return out
+
+
+def ema_series(prices, period: int, seed: str = "sma", start: int = 0) -> np.ndarray:
+    """
+    Exponential moving average series (k = 2 / (period + 1))
+
+    Args:
+        prices: (symbols × bars) matrix
+        period: EMA period
+        seed: "sma" - first value is the SMA of the first period bars
+                      (TechnicalIndicators); NaN before it
+              "first" - first value is the first bar (ReversalDetector)
+        start: First bar to use (earlier bars are NaN in the output)
+
+    Returns:
+        (symbols × bars) matrix
+    """
+    x = as_matrix(prices)
+    out = np.full(x.shape, np.nan)
+    alpha = 2.0 / (period + 1)
+
+    if seed == "first":
+        if x.shape[1] <= start:
+            return out
+        out[:, start] = x[:, start]
+        if x.shape[1] > start + 1:
+            out[:, start + 1:] = _ema_recursive(x[:, start + 1:], alpha, x[:, start])
+        return out
+
+    seed_index = start + period - 1
+    if x.shape[1] <= seed_index:
+        return out
+    out[:, seed_index] = x[:, start:seed_index + 1].mean(axis=1)
+    if x.shape[1] > seed_index + 1:
+        out[:, seed_index + 1:] = _ema_recursive(x[:, seed_index + 1:], alpha, out[:, seed_index])
+    return out
+
+
+def ema_last(prices, period: int) -> np.ndarray:
+    """Latest SMA-seeded EMA per symbol (NaN if too few bars)"""
+    return ema_series(prices, period)[:, -1]
+
+
+# ==================== MOMENTUM ====================
+
+def rsi_last(prices, period: int = 14) -> np.ndarray:
+    """
+    Simple-average RSI of the last period changes (TechnicalIndicators.calculate_rsi)
+
+    avg_loss == 0 yields 100 (if any gain) or 50.
+    """
+    x = as_matrix(prices)
+    if x.shape[1] < period + 1:
+        return np.full(x.shape[0], np.nan)
+
+    changes = np.diff(x[:, -(period + 1):], axis=1)
+    avg_gain = np.where(changes > 0, changes, 0.0).sum(axis=1) / period
+    avg_loss = np.where(changes < 0, -changes, 0.0).sum(axis=1) / period
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), rsi)
+
+
+def rsi_rolling(changes, period: int = 14, loss_floor: float = 0.0) -> np.ndarray:
+    """
+    Simple-average RSI for every window of period consecutive changes
+
+    Args:
+        changes: (symbols × n) price changes
+        loss_floor: Average loss used when a window has no losses
+                    (ReversalDetector uses 0.00001)
+
+    Returns:
+        (symbols × n - period + 1) RSI values, window i covers changes[i:i+period]
+    """
+    c = as_matrix(changes)
+    if c.shape[1] < period:
+        return np.empty((c.shape[0], 0))
+
+    gains = sliding_window_view(np.where(c > 0, c, 0.0), period, axis=1).sum(axis=2) / period
+    losses = sliding_window_view(np.where(c < 0, -c, 0.0), period, axis=1).sum(axis=2) / period
+    if loss_floor:
+        losses = np.where(losses == 0, loss_floor, losses)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + gains / losses)
+    return np.where(losses == 0, np.where(gains > 0, 100.0, 50.0), rsi)
+
+
+def macd(
+    prices,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> Dict[str, np.ndarray]:
+    """
+    MACD series (SMA-seeded EMAs, signal seeded on the first valid MACD values)
+
+    Returns:
+        {"macd", "signal", "histogram"} (symbols × bars) matrices, NaN until valid
+    """
+    x = as_matrix(prices)
+    macd_line = ema_series(x, fast_period) - ema_series(x, slow_period)
+    signal_line = ema_series(np.nan_to_num(macd_line), signal_period, start=slow_period - 1)
+    return {
+        "macd": macd_line,
+        "signal": signal_line,
+        "histogram": macd_line - signal_line,
+    }
+
+
+def ma_crossover(prices, fast_period: int = 10, slow_period: int = 20) -> np.ndarray:
+    """
+    MA crossover state on the last bar: 0 = none, 1 = bullish, 2 = bearish
+
+    Map codes to strings with CROSSOVER_LABELS[codes].
+    """
+    x = as_matrix(prices)
+    codes = np.zeros(x.shape[0], dtype=np.int8)
+    if x.shape[1] < slow_period + 1:
+        return codes
+
+    fast_now, slow_now = sma_last(x, fast_period), sma_last(x, slow_period)
+    fast_prev, slow_prev = sma_last(x[:, :-1], fast_period), sma_last(x[:, :-1], slow_period)
+
+    codes[(fast_prev <= slow_prev) & (fast_now > slow_now)] = 1
+    codes[(fast_prev >= slow_prev) & (fast_now < slow_now)] = 2
+    return codes
+
+
+# ==================== VOLATILITY ====================
+
+def true_range(highs, lows, closes) -> np.ndarray:
+    """True Range per bar (first bar: high - low)"""
+    h, l, c = as_matrix(highs), as_matrix(lows), as_matrix(closes)
+    tr = h - l
+    if h.shape[1] > 1:
+        prev_close = c[:, :-1]
+        tr[:, 1:] = np.maximum.reduce([
+            tr[:, 1:],
+            np.abs(h[:, 1:] - prev_close),
+            np.abs(l[:, 1:] - prev_close),
+        ])
+    return tr
+
+
+def atr_last(highs, lows, closes, period: int = 14) -> np.ndarray:
+    """Average of the last period True Ranges (ATRCalculator.calculate_atr)"""
+    return sma_last(true_range(highs, lows, closes), period)
+
+
+def bollinger_last(prices, period: int = 20, num_std: float = 2.0) -> Dict[str, np.ndarray]:
+    """
+    Bollinger bands on the last bar (population standard deviation)
+
+    Returns:
+        {"middle", "upper", "lower", "bandwidth", "percent_b"} arrays per symbol
+    """
+    x = as_matrix(prices)
+    if x.shape[1] < period:
+        empty = np.full(x.shape[0], np.nan)
+        return {name: empty.copy() for name in ("middle", "upper", "lower", "bandwidth", "percent_b")}
+
+    window = x[:, -period:]
+    middle = window.mean(axis=1)
+    deviation = window.std(axis=1)
+    upper = middle + num_std * deviation
+    lower = middle - num_std * deviation
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bandwidth = (upper - lower) / middle
+        percent_b = (x[:, -1] - lower) / (upper - lower)
+
+    return {
+        "middle": middle,
+        "upper": upper,
+        "lower": lower,
+        "bandwidth": bandwidth,
+        "percent_b": percent_b,
+    }
+
+
+# ==================== BATCH ====================
+
+DEFAULT_INDICATORS = ("ma", "ema", "rsi", "macd", "ma_crossover", "bollinger", "atr")
+
+
+def compute_indicators(
+    closes,
+    highs=None,
+    lows=None,
+    indicators: Iterable[str] = DEFAULT_INDICATORS,
+    symbols: Optional[Sequence[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute an indicator set for many symbols in one call
+
+    Args:
+        closes: (symbols × bars) close matrix
+        highs, lows: Same shape, required for "atr"
+        indicators: Subset of DEFAULT_INDICATORS
+        symbols: Optional row labels, echoed back under "symbols"
+
+    Returns:
+        Flat dict of per-symbol arrays, e.g. "rsi_14", "macd_histogram",
+        "bollinger_upper", "ma_crossover"
+    """
+    x = as_matrix(closes)
+    wanted = set(indicators)
+    result: Dict[str, np.ndarray] = {}
+
+    if symbols is not None:
+        result["symbols"] = np.asarray(symbols)
+    if "ma" in wanted:
+        result["ma_20"] = sma_last(x, 20)
+    if "ema" in wanted:
+        result["ema_12"] = ema_last(x, 12)
+        result["ema_26"] = ema_last(x, 26)
+    if "rsi" in wanted:
+        result["rsi_14"] = rsi_last(x, 14)
+    if "macd" in wanted:
+        series = macd(x)
+        for name, values in series.items():
+            result[f"macd_{name}" if name != "macd" else "macd"] = values[:, -1]
+    if "ma_crossover" in wanted:
+        result["ma_crossover"] = CROSSOVER_LABELS[ma_crossover(x)]
+    if "bollinger" in wanted:
+        for name, values in bollinger_last(x).items():
+            result[f"bollinger_{name}"] = values
+    if "atr" in wanted:
+        if highs is None or lows is None:
+            raise ValueError("ATR requires highs and lows")
+        result["atr_14"] = atr_last(highs, lows, x, 14)
+
+    return result
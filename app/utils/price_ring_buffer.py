@@ -0,0 +1,163 @@
+"""
+Columnar Price Ring Buffer
+Fixed-size price history for many symbols with vectorized window changes
+
+Layout:
+- prices:     float64 array [symbols × slots] (NaN = no price in that slot)
+- timestamps: float64 array [slots] shared by all symbols (epoch seconds)
+
+Every snapshot writes one slot (column) for all symbols at once, and the
+percent change over any window (1m/5m/15m...) is computed for every symbol
+in a single NumPy operation - no per-symbol Python loop or deque scan.
+
+Window semantics match the old deque walk: the base price is the oldest
+price recorded inside the window for each symbol.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class PriceRingBuffer:
+    """
+    Ring buffer of price snapshots for a growing set of symbols
+
+    Usage:
+        buffer = PriceRingBuffer(slots=120)
+        buffer.append(["BTC", "ETH"], [97000.0, 3400.0], timestamp=time.time())
+        symbols, changes = buffer.pct_change(window_seconds=300)
+    """
+
+    def __init__(self, slots: int = 120, initial_symbols: int = 256):
+        if slots < 2:
+            raise ValueError("PriceRingBuffer needs at least 2 slots")
+
+        self.slots = slots
+        self._prices = np.full((initial_symbols, slots), np.nan, dtype=np.float64)
+        self._timestamps = np.full(slots, np.nan, dtype=np.float64)
+        self._symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._head = 0  # Next slot to write
+        self._count = 0  # Filled slots (<= slots)
+
+    # ==================== WRITES ====================
+
+    def _row_for(self, symbol: str) -> int:
+        row = self._index.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row >= self._prices.shape[0]:
+                grown = np.full((self._prices.shape[0] * 2, self.slots), np.nan, dtype=np.float64)
+                grown[:row] = self._prices
+                self._prices = grown
+            self._symbols.append(symbol)
+            self._index[symbol] = row
+        return row
+
+    def append(self, symbols: Iterable[str], prices: Iterable[float], timestamp: float):
+        """
+        Record one snapshot for many symbols (symbols missing here get NaN)
+
+        Args:
+            symbols: Symbols in the snapshot
+            prices: Prices aligned with symbols (<= 0 is treated as missing)
+            timestamp: Snapshot time in epoch seconds (must not go backwards)
+        """
+        rows = np.fromiter((self._row_for(symbol) for symbol in symbols), dtype=np.intp)
+        values = np.fromiter(prices, dtype=np.float64)
+        values = np.where(values > 0, values, np.nan)
+
+        slot = self._head
+        self._prices[:, slot] = np.nan
+        self._prices[rows, slot] = values
+        self._timestamps[slot] = timestamp
+
+        self._head = (slot + 1) % self.slots
+        self._count = min(self._count + 1, self.slots)
+
+    # ==================== READS ====================
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    @property
+    def symbol_count(self) -> int:
+        return len(self._symbols)
+
+    @property
+    def snapshot_count(self) -> int:
+        return self._count
+
+    def _chronological_slots(self) -> np.ndarray:
+        """Slot indices ordered oldest -> newest"""
+        return (self._head - self._count + np.arange(self._count)) % self.slots
+
+    def latest(self, symbols: Optional[List[str]] = None) -> np.ndarray:
+        """Latest recorded price per symbol (NaN if missing from the last snapshot)"""
+        if not self._count:
+            return np.full(len(symbols if symbols is not None else self._symbols), np.nan)
+        slot = (self._head - 1) % self.slots
+        if symbols is None:
+            return self._prices[:len(self._symbols), slot].copy()
+        return self._gather(self._rows(symbols), np.array([slot]))[:, 0]
+
+    def _rows(self, symbols: List[str]) -> np.ndarray:
+        return np.fromiter((self._index.get(symbol, -1) for symbol in symbols), dtype=np.intp)
+
+    def _gather(self, rows: np.ndarray, slots: np.ndarray) -> np.ndarray:
+        """prices[rows × slots] with NaN rows for unknown symbols (row -1)"""
+        known = rows >= 0
+        out = np.full((len(rows), len(slots)), np.nan)
+        out[known] = self._prices[np.ix_(rows[known], slots)]
+        return out
+
+    def pct_change(
+        self,
+        window_seconds: float,
+        now: Optional[float] = None,
+        symbols: Optional[List[str]] = None,
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Percent change from the oldest in-window price to the latest price
+
+        Args:
+            window_seconds: Window length (60 = 1m, 300 = 5m, 900 = 15m)
+            now: Reference time (defaults to the latest snapshot time)
+            symbols: Restrict to these symbols (unknown symbols yield NaN)
+
+        Returns:
+            (symbols, changes) - changes is NaN where fewer than 2 prices exist
+        """
+        selected = self._symbols if symbols is None else symbols
+        if self._count < 2:
+            return list(selected), np.full(len(selected), np.nan)
+
+        order = self._chronological_slots()
+        times = self._timestamps[order]
+        if now is None:
+            now = times[-1]
+
+        start = int(np.searchsorted(times, now - window_seconds, side="left"))
+        window_slots = order[start:]
+        if len(window_slots) < 2:
+            return list(selected), np.full(len(selected), np.nan)
+
+        if symbols is None:
+            window = self._prices[:len(self._symbols), window_slots]
+        else:
+            window = self._gather(self._rows(symbols), window_slots)
+
+        latest = window[:, -1]
+        valid = ~np.isnan(window)
+        first_valid = valid.argmax(axis=1)
+        base = window[np.arange(window.shape[0]), first_valid]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            changes = (latest - base) / base * 100.0
+
+        # Need a base strictly older than the latest price
+        has_history = valid.sum(axis=1) >= 2
+        changes[~has_history] = np.nan
+        return list(selected), changes
@@ -0,0 +1,204 @@
+"""
+Schema Cache
+Precomputed, pre-encoded and pre-compressed OpenAPI / GPT Actions schemas
+
+The schema endpoints regenerated their payload per request (get_openapi over
+every router, build_gpt_actions_schema, build_maximal_gpt_schema) and FastAPI
+re-serialized it. GPT Actions clients fetch these often and they never change
+while the process runs, so each schema is built once (at startup via warm()
+or on first request), serialized to JSON bytes and compressed once:
+
+- identity, gzip and brotli (if the brotli package is installed) bodies
+- strong ETag from the body hash; If-None-Match -> 304 with no body
+- Content-Encoding negotiated from Accept-Encoding (br > gzip > identity)
+- Cache-Control: no-cache by default (SCHEMA_CACHE_CONTROL) so clients always
+  revalidate - a redeploy is picked up immediately, unchanged fetches are 304s
+
+Usage:
+    schema_cache.register("openapi", app.openapi)
+    return schema_cache.response(request, "openapi")
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.utils.logger import get_logger
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+SCHEMA_CACHE_CONTROL = os.getenv("SCHEMA_CACHE_CONTROL", "no-cache")
+
+SchemaBuilder = Callable[[], Dict[str, Any]]
+
+
+@dataclass
+class EncodedSchema:
+    """One schema serialized and compressed in every supported encoding"""
+    etag: str
+    bodies: Dict[str, bytes]  # encoding -> body ("identity", "gzip", "br")
+    built_at: float
+    build_ms: float
+
+
+def _encode(schema: Dict[str, Any]) -> Dict[str, bytes]:
+    body = json.dumps(schema, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    bodies = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if BROTLI_AVAILABLE:
+        bodies["br"] = brotli.compress(body, quality=11)
+    return bodies
+
+
+def _accepted_encodings(header: str) -> set:
+    """Encodings in an Accept-Encoding header with q > 0"""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+class SchemaCache:
+    """Named schemas built once and served as pre-encoded bytes"""
+
+    def __init__(self, cache_control: str = SCHEMA_CACHE_CONTROL):
+        self.cache_control = cache_control
+        self._builders: Dict[str, SchemaBuilder] = {}
+        self._schemas: Dict[str, EncodedSchema] = {}
+        self.stats = {"builds": 0, "served": 0, "not_modified": 0, "gzip": 0, "br": 0}
+
+    def register(self, name: str, builder: SchemaBuilder):
+        """Register (or replace) the builder of a schema; drops its cached copy"""
+        self._builders[name] = builder
+        self._schemas.pop(name, None)
+
+    def get(self, name: str, builder: Optional[SchemaBuilder] = None) -> EncodedSchema:
+        """Encoded schema, building it on first use"""
+        encoded = self._schemas.get(name)
+        if encoded is not None:
+            return encoded
+
+        if builder is not None:
+            self._builders.setdefault(name, builder)
+        builder = self._builders[name]
+
+        started = time.perf_counter()
+        bodies = _encode(builder())
+        build_ms = (time.perf_counter() - started) * 1000
+        encoded = EncodedSchema(
+            etag=f'"{hashlib.sha256(bodies["identity"]).hexdigest()[:32]}"',
+            bodies=bodies,
+            built_at=time.time(),
+            build_ms=round(build_ms, 1),
+        )
+        self._schemas[name] = encoded
+        self.stats["builds"] += 1
+        logger.info(
+            f"📄 Schema '{name}' cached: {len(bodies['identity'])} bytes "
+            f"(gzip {len(bodies['gzip'])}"
+            + (f", br {len(bodies['br'])}" if "br" in bodies else "")
+            + f") in {build_ms:.0f}ms"
+        )
+        return encoded
+
+    def warm(self) -> int:
+        """Build every registered schema that isn't cached yet. Returns schemas built"""
+        built = 0
+        for name in list(self._builders):
+            if name in self._schemas:
+                continue
+            try:
+                self.get(name)
+                built += 1
+            except Exception as e:
+                logger.error(f"Schema '{name}' warm-up failed: {e}")
+        return built
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one cached schema (or all) - rebuilt on next request"""
+        if name is None:
+            self._schemas.clear()
+        else:
+            self._schemas.pop(name, None)
+
+    def response(self, request: Request, name: str, builder: Optional[SchemaBuilder] = None) -> Response:
+        """
+        HTTP response for a cached schema
+
+        Args:
+            request: Incoming request (If-None-Match / Accept-Encoding)
+            name: Schema name
+            builder: Builder to register if the name isn't registered yet
+
+        Returns:
+            304 if the client's ETag matches, else the best-encoded body
+        """
+        encoded = self.get(name, builder)
+        headers = {
+            "ETag": encoded.etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, encoded.etag):
+            self.stats["not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        encoding = next((enc for enc in ("br", "gzip") if enc in accepted and enc in encoded.bodies), None)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+            self.stats[encoding] += 1
+        self.stats["served"] += 1
+        return Response(
+            content=encoded.bodies[encoding or "identity"],
+            media_type="application/json",
+            headers=headers,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "brotli_available": BROTLI_AVAILABLE,
+            "schemas": {
+                name: {
+                    "etag": encoded.etag,
+                    "bytes": {enc: len(body) for enc, body in encoded.bodies.items()},
+                    "build_ms": encoded.build_ms,
+                }
+                for name, encoded in self._schemas.items()
+            },
+        }
+
+
+# Global instance for easy import
+schema_cache = SchemaCache()
@@ -0,0 +1,289 @@
+"""
+Single-Flight Request Coalescing
+Deduplicates identical upstream provider calls that are already in flight
+
+When GPT Actions, the dashboard and a scan request the same symbol at the same
+moment, every build_signal fans out the same provider calls. With single-flight,
+the first caller (leader) performs the call and every concurrent identical call
+(follower) awaits the same shared future instead of hitting the upstream API.
+
+Key: (provider, method, normalized args)
+- Only calls that are IN FLIGHT are shared - nothing is cached after completion
+- Exceptions propagate to every waiter
+- A cancelled caller never cancels the shared call for the other waiters
+
+Request data context:
+A RequestDataContext activated for one logical request (e.g. a batch RPC call)
+additionally keeps COMPLETED results for the lifetime of that request, so every
+operation in the batch reuses the same upstream response even when the calls
+do not overlap in time. Failed calls are not kept.
+"""
+import asyncio
+import contextvars
+import inspect
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from app.utils.logger import default_logger as logger
+
+
+# Argument names whose string values are case/whitespace-insensitive symbols
+SYMBOL_ARG_NAMES = {"symbol", "symbols", "coin", "pair", "asset"}
+
+
+class SingleFlightRegistry:
+    """
+    Process-wide registry of in-flight upstream calls
+
+    Usage:
+        result = await single_flight.do(("coinglass", "get_x", args_key), factory)
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._provider_stats: Dict[str, Dict[str, int]] = {}
+
+    def _stats_for(self, provider: str) -> Dict[str, int]:
+        stats = self._provider_stats.get(provider)
+        if stats is None:
+            stats = {"calls": 0, "upstream_calls": 0, "coalesced": 0, "errors": 0}
+            self._provider_stats[provider] = stats
+        return stats
+
+    async def do(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """
+        Run factory() once per key among concurrent callers
+
+        Args:
+            key: Tuple whose first element is the provider name
+            factory: Zero-arg callable returning the coroutine to run on a miss
+
+        Returns:
+            Result of the shared call (dict/list results are shallow-copied per waiter)
+        """
+        stats = self._stats_for(key[0])
+        stats["calls"] += 1
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            stats["coalesced"] += 1
+        else:
+            stats["upstream_calls"] += 1
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+
+        # shield: cancelling one waiter must not cancel the call for everyone else
+        result = await asyncio.shield(task)
+
+        # Waiters commonly annotate responses - give each its own top level
+        if isinstance(result, dict):
+            return dict(result)
+        if isinstance(result, list):
+            return list(result)
+        return result
+
+    def _on_done(self, key: Tuple, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self._stats_for(key[0])["errors"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics per provider and overall"""
+        totals = {"calls": 0, "upstream_calls": 0, "coalesced": 0, "errors": 0}
+        for stats in self._provider_stats.values():
+            for name in totals:
+                totals[name] += stats[name]
+
+        saved_pct = (totals["coalesced"] / totals["calls"] * 100) if totals["calls"] else 0.0
+
+        return {
+            **totals,
+            "upstream_calls_saved": totals["coalesced"],
+            "saved_percent": round(saved_pct, 2),
+            "in_flight": len(self._in_flight),
+            "providers": {name: dict(stats) for name, stats in self._provider_stats.items()},
+        }
+
+    def reset_stats(self):
+        """Reset statistics (in-flight calls are left untouched)"""
+        self._provider_stats.clear()
+
+
+# Global registry instance
+single_flight = SingleFlightRegistry()
+
+
+class RequestDataContext:
+    """
+    Per-request memo of provider results (shared by all tasks of one request)
+
+    Usage:
+        async with RequestDataContext() as ctx:
+            await asyncio.gather(op_a(), op_b())   # identical provider calls run once
+        ctx.get_stats()
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, asyncio.Future] = {}
+        self._token: Optional[contextvars.Token] = None
+        self.calls = 0
+        self.reused = 0
+
+    async def do(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """Return the request-scoped result for key, running factory() on first use"""
+        self.calls += 1
+
+        task = self._results.get(key)
+        if task is not None:
+            self.reused += 1
+        else:
+            task = asyncio.ensure_future(single_flight.do(key, factory))
+            self._results[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+
+        result = await asyncio.shield(task)
+
+        if isinstance(result, dict):
+            return dict(result)
+        if isinstance(result, list):
+            return list(result)
+        return result
+
+    def _on_done(self, key: Tuple, task: asyncio.Future):
+        # Keep successes only - a failed call may succeed for the next operation
+        if task.cancelled() or task.exception() is not None:
+            if self._results.get(key) is task:
+                del self._results[key]
+
+    def activate(self):
+        """Make this context current (tasks created afterwards inherit it)"""
+        self._token = _data_context.set(self)
+
+    def deactivate(self):
+        """Restore the previous context"""
+        if self._token is not None:
+            _data_context.reset(self._token)
+            self._token = None
+
+    async def __aenter__(self) -> "RequestDataContext":
+        self.activate()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.deactivate()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Calls made through this context and how many reused a prior result"""
+        return {
+            "calls": self.calls,
+            "upstream_calls": self.calls - self.reused,
+            "reused": self.reused,
+        }
+
+
+_data_context: contextvars.ContextVar[Optional[RequestDataContext]] = contextvars.ContextVar(
+    "request_data_context", default=None
+)
+
+
+def current_data_context() -> Optional[RequestDataContext]:
+    """Active RequestDataContext for this task, if any"""
+    return _data_context.get()
+
+
+def _normalize_value(name: str, value: Any) -> Hashable:
+    """Convert an argument into a stable, hashable key component"""
+    if isinstance(value, str):
+        value = value.strip()
+        return value.upper() if name in SYMBOL_ARG_NAMES else value
+    if isinstance(value, (int, float, bool, type(None))):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_value(name, v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _normalize_value(str(k), v)) for k, v in value.items()))
+    return repr(value)
+
+
+def make_call_key(provider: str, func: Callable, signature: inspect.Signature,
+                  args: tuple, kwargs: dict) -> Tuple:
+    """
+    Build (provider, method, normalized args) key for a bound method call
+
+    Defaults are applied so get_x("BTC") and get_x(symbol="btc") share a key.
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    normalized = tuple(
+        (name, _normalize_value(name, value))
+        for name, value in bound.arguments.items()
+        if name != "self"
+    )
+    return (provider, func.__qualname__, normalized)
+
+
+def single_flight_call(provider: str) -> Callable:
+    """
+    Decorator: coalesce concurrent identical calls of an async provider method
+
+    Args:
+        provider: Provider name used for keys and metrics (e.g. 'coinglass')
+
+    Usage:
+        @single_flight_call("okx")
+        async def get_candles(self, symbol: str, timeframe: str = "15m"):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            try:
+                key = make_call_key(provider, func, signature, args, kwargs)
+            except TypeError:
+                # Signature mismatch - let the real call raise the proper error
+                return await func(*args, **kwargs)
+
+            context = _data_context.get()
+            if context is not None:
+                return await context.do(key, lambda: func(*args, **kwargs))
+            return await single_flight.do(key, lambda: func(*args, **kwargs))
+
+        wrapper.__single_flight__ = True
+        return wrapper
+    return decorator
+
+
+def coalesce_provider_calls(provider: str, exclude: Optional[Iterable[str]] = None) -> Callable:
+    """
+    Class decorator: apply single_flight_call to every public async method
+
+    Private helpers (leading underscore) and lifecycle methods (close) are
+    skipped, as are names listed in exclude.
+
+    Args:
+        provider: Provider name used for keys and metrics
+        exclude: Optional method names to leave uncoalesced
+
+    Usage:
+        @coalesce_provider_calls("coinglass")
+        class CoinglassComprehensiveService:
+            ...
+    """
+    skipped = {"close"} | set(exclude or ())
+
+    def decorator(cls: type) -> type:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or name in skipped:
+                continue
+            if not inspect.iscoroutinefunction(member):
+                continue
+            if getattr(member, "__single_flight__", False):
+                continue
+            setattr(cls, name, single_flight_call(provider)(member))
+        logger.debug(f"Single-flight enabled for {cls.__name__} ({provider})")
+        return cls
+    return decorator
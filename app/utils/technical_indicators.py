@@ -9,6 +9,9 @@ Indicators:
 - MACD (Moving Average Convergence Divergence): Trend-following momentum indicator
 - Volume Analysis: Volume confirmation for trend validation
 
+These work on one price list in plain Python. To compute indicators for many
+symbols at once, use app.utils.indicator_kernels.compute_indicators.
+
 Author: CryptoSatX Signal Engine
 Last Updated: November 19, 2025
 """
@@ -406,94 +409,14 @@ class TechnicalIndicators:
             }
         
         try:
-            signals = {}
-            score = 50  # Start neutral
-            
-            # 1. MA Crossover (25% weight)
-            ma_cross = TechnicalIndicators.detect_ma_crossover(prices, 10, 20)
-            if ma_cross == "bullish_crossover":
-                score += 25
-                signals["ma_crossover"] = "bullish"
-            elif ma_cross == "bearish_crossover":
-                score -= 25
-                signals["ma_crossover"] = "bearish"
-            else:
-                signals["ma_crossover"] = "neutral"
-            
-            # 2. RSI Momentum (20% weight)
-            rsi = TechnicalIndicators.calculate_rsi(prices, 14)
-            if rsi:
-                if rsi > 70:
-                    score -= 15  # Overbought - bearish
-                    signals["rsi"] = f"overbought ({rsi:.1f})"
-                elif rsi < 30:
-                    score += 15  # Oversold - bullish
-                    signals["rsi"] = f"oversold ({rsi:.1f})"
-                elif rsi > 55:
-                    score += 10  # Bullish momentum
-                    signals["rsi"] = f"bullish ({rsi:.1f})"
-                elif rsi < 45:
-                    score -= 10  # Bearish momentum
-                    signals["rsi"] = f"bearish ({rsi:.1f})"
-                else:
-                    signals["rsi"] = f"neutral ({rsi:.1f})"
-            
-            # 3. MACD Trend (30% weight)
-            macd = TechnicalIndicators.calculate_macd(prices)
-            if macd:
-                if macd["trend"] == "bullish":
-                    score += 30
-                    signals["macd"] = f"bullish (hist: {macd['histogram']:.4f})"
-                elif macd["trend"] == "bearish":
-                    score -= 30
-                    signals["macd"] = f"bearish (hist: {macd['histogram']:.4f})"
-                else:
-                    signals["macd"] = "neutral"
-            
-            # 4. Volume Confirmation (25% weight)
-            if volumes:
-                vol_analysis = TechnicalIndicators.analyze_volume_trend(volumes, prices, 10)
-                if vol_analysis:
-                    conf = vol_analysis["confirmation"]
-                    if "bullish_confirmed" in conf:
-                        score += 25
-                        signals["volume"] = f"confirmed (ratio: {vol_analysis['volume_ratio']}x)"
-                    elif "bearish_confirmed" in conf:
-                        score -= 25
-                        signals["volume"] = f"confirmed (ratio: {vol_analysis['volume_ratio']}x)"
-                    elif vol_analysis["divergence"]:
-                        score += 5 if "bullish" in conf else -5
-                        signals["volume"] = "divergence (weak)"
-                    else:
-                        signals["volume"] = "neutral"
-            
-            # Clamp score to 0-100
-            score = max(0, min(100, score))
-            
-            # Determine trend and confidence
-            if score >= 70:
-                trend = "strongly_bullish"
-                confidence = "high"
-            elif score >= 60:
-                trend = "bullish"
-                confidence = "medium"
-            elif score > 40:
-                trend = "neutral"
-                confidence = "low"
-            elif score > 30:
-                trend = "bearish"
-                confidence = "medium"
-            else:
-                trend = "strongly_bearish"
-                confidence = "high"
-            
-            return {
-                "trend": trend,
-                "score": round(score, 1),
-                "confidence": confidence,
-                "signals": signals
-            }
-            
+            return TechnicalIndicators.score_indicators(
+                ma_cross=TechnicalIndicators.detect_ma_crossover(prices, 10, 20),
+                rsi=TechnicalIndicators.calculate_rsi(prices, 14),
+                macd=TechnicalIndicators.calculate_macd(prices),
+                volume_analysis=(
+                    TechnicalIndicators.analyze_volume_trend(volumes, prices, 10) if volumes else None
+                )
+            )
         except Exception as e:
             logger.error(f"Trend score calculation error: {e}")
             return {
@@ -502,3 +425,107 @@ class TechnicalIndicators:
                 "confidence": "low",
                 "signals": {"error": str(e)}
             }
+
+    @staticmethod
+    def score_indicators(
+        ma_cross: Optional[str],
+        rsi: Optional[float],
+        macd: Optional[Dict[str, Any]],
+        volume_analysis: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Combine indicator readings into the trend score used by calculate_trend_score
+        
+        Shared with the streaming IndicatorState so both paths score identically.
+        
+        Args:
+            ma_cross: detect_ma_crossover() result
+            rsi: calculate_rsi() result
+            macd: calculate_macd() result
+            volume_analysis: analyze_volume_trend() result
+            
+        Returns:
+            Dict with 'trend', 'score', 'confidence', 'signals'
+        """
+        signals = {}
+        score = 50  # Start neutral
+        
+        # 1. MA Crossover (25% weight)
+        if ma_cross == "bullish_crossover":
+            score += 25
+            signals["ma_crossover"] = "bullish"
+        elif ma_cross == "bearish_crossover":
+            score -= 25
+            signals["ma_crossover"] = "bearish"
+        else:
+            signals["ma_crossover"] = "neutral"
+        
+        # 2. RSI Momentum (20% weight)
+        if rsi:
+            if rsi > 70:
+                score -= 15  # Overbought - bearish
+                signals["rsi"] = f"overbought ({rsi:.1f})"
+            elif rsi < 30:
+                score += 15  # Oversold - bullish
+                signals["rsi"] = f"oversold ({rsi:.1f})"
+            elif rsi > 55:
+                score += 10  # Bullish momentum
+                signals["rsi"] = f"bullish ({rsi:.1f})"
+            elif rsi < 45:
+                score -= 10  # Bearish momentum
+                signals["rsi"] = f"bearish ({rsi:.1f})"
+            else:
+                signals["rsi"] = f"neutral ({rsi:.1f})"
+        
+        # 3. MACD Trend (30% weight)
+        if macd:
+            if macd["trend"] == "bullish":
+                score += 30
+                signals["macd"] = f"bullish (hist: {macd['histogram']:.4f})"
+            elif macd["trend"] == "bearish":
+                score -= 30
+                signals["macd"] = f"bearish (hist: {macd['histogram']:.4f})"
+            else:
+                signals["macd"] = "neutral"
+        
+        # 4. Volume Confirmation (25% weight)
+        if volume_analysis:
+            conf = volume_analysis["confirmation"]
+            if "bullish_confirmed" in conf:
+                score += 25
+                signals["volume"] = f"confirmed (ratio: {volume_analysis['volume_ratio']}x)"
+            elif "bearish_confirmed" in conf:
+                score -= 25
+                signals["volume"] = f"confirmed (ratio: {volume_analysis['volume_ratio']}x)"
+            elif volume_analysis["divergence"]:
+                score += 5 if "bullish" in conf else -5
+                signals["volume"] = "divergence (weak)"
+            else:
+                signals["volume"] = "neutral"
+        
+        # Clamp score to 0-100
+        score = max(0, min(100, score))
+        
+        # Determine trend and confidence
+        if score >= 70:
+            trend = "strongly_bullish"
+            confidence = "high"
+        elif score >= 60:
+            trend = "bullish"
+            confidence = "medium"
+        elif score > 40:
+            trend = "neutral"
+            confidence = "low"
+        elif score > 30:
+            trend = "bearish"
+            confidence = "medium"
+        else:
+            trend = "strongly_bearish"
+            confidence = "high"
+        
+        return {
+            "trend": trend,
+            "score": round(score, 1),
+            "confidence": confidence,
+            "signals": signals
+        }
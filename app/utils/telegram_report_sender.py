@@ -4,10 +4,10 @@ Handles large data reports that exceed GPT Actions limits
 Automatically splits messages and sends to Telegram with proper formatting
 """
 import os
-import httpx
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from app.utils.logger import logger
+from app.core.http_clients import http_clients
 
 
 class TelegramReportSender:
@@ -1724,7 +1724,7 @@ Use exchanges with most positive rates (you get paid most!)
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with http_clients.borrow("telegram", timeout=30) as client:
                 response = await client.post(url, json=payload)
                 result = response.json()
                 
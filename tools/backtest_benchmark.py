@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Backtest Engine Benchmark
+Speed and scoring parity of the offline backtesting engine
+
+Builds a synthetic historical store (random-walk candles, funding, OI,
+long/short, liquidations, social and Fear & Greed series), then:
+
+- run:    one backtest over every symbol-day, timed
+- sweep:  compare_strategies() weight sweep across a process pool, timed
+- parity: vectorized factor totals vs SignalEngine._calculate_weighted_score
+          on sampled (symbol, bar) contexts
+
+Usage:
+    python tools/backtest_benchmark.py [--symbols 200] [--days 90] [--timeframe 1h]
+        [--sweep 8] [--workers 4] [--parity 200] [--store /tmp/backtest_bench.db]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.append('.')
+from app.core.signal_engine import EnhancedSignalContext, SignalEngine
+from app.services.backtest_engine import FACTORS, to_ms, total_scores
+from app.services.backtesting_service import BacktestConfig, backtesting_service, prepare_timelines
+from app.services.indicator_state import TIMEFRAME_MS
+from app.storage.backtest_store import HistoricalDataStore
+from app.utils.technical_indicators import TechnicalIndicators
+
+
+def build_store(path: str, symbols: int, start: datetime, days: int, timeframe: str, seed: int = 11):
+    rng = np.random.default_rng(seed)
+    interval = TIMEFRAME_MS[timeframe]
+    start_ms = to_ms(start) - 100 * interval  # warmup history
+    bars = int(days * 86_400_000 // interval) + 100
+    ts = start_ms + np.arange(bars, dtype=np.int64) * interval
+
+    store = HistoricalDataStore(path)
+    for i in range(symbols):
+        symbol = f"SYM{i:04d}"
+        close = rng.uniform(0.1, 50_000) * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+        spread = np.abs(rng.normal(0, 0.006, bars)) * close
+        store.write_candles(symbol, timeframe, [
+            {"timestamp": int(t), "open": c, "high": c + s, "low": c - s, "close": c, "volume": v}
+            for t, c, s, v in zip(ts, close, spread, rng.uniform(1e3, 1e6, bars))
+        ])
+
+        hourly = ts[::max(1, 3_600_000 // interval)]
+        oi = 1e8 * np.exp(np.cumsum(rng.normal(0, 0.01, len(hourly))))
+        store.write_derivatives(symbol, [
+            {
+                "ts": int(t),
+                "funding_rate": f,
+                "open_interest": o,
+                "long_account_pct": la,
+                "top_trader_long_pct": tt,
+                "long_liquidations": ll,
+                "short_liquidations": sl,
+                "social_score": so,
+            }
+            for t, f, o, la, tt, ll, sl, so in zip(
+                hourly,
+                rng.normal(0.0001, 0.002, len(hourly)),
+                oi,
+                rng.uniform(30, 70, len(hourly)),
+                rng.uniform(35, 65, len(hourly)),
+                rng.exponential(1e6, len(hourly)),
+                rng.exponential(1e6, len(hourly)),
+                rng.uniform(20, 80, len(hourly)),
+            )
+        ])
+
+    daily = np.arange(start_ms - 86_400_000, ts[-1] + 1, 86_400_000)
+    store.write_fear_greed([{"ts": int(t), "value": float(v)} for t, v in zip(daily, rng.uniform(5, 95, len(daily)))])
+    store.close()
+
+
+def check_parity(config: BacktestConfig, samples: int, seed: int = 3) -> dict:
+    """Vectorized totals vs SignalEngine._calculate_weighted_score on the same inputs"""
+    rules = backtesting_service.rules
+    timelines, symbols = prepare_timelines(config, rules, backtesting_service.default_timeframes)
+    timeline = next(iter(timelines.values()))
+    panel = timeline.panel
+    totals = total_scores(timeline.factors, rules.weight_vector())
+
+    engine = SignalEngine.__new__(SignalEngine)  # scoring methods only - no clients/breakers
+    rng = np.random.default_rng(seed)
+    sym_idx, bar_idx = np.nonzero(timeline.tradable)
+    picks = rng.choice(len(sym_idx), size=min(samples, len(sym_idx)), replace=False)
+
+    d = panel.derivatives
+    errors = []
+    for pick in picks:
+        s, t = int(sym_idx[pick]), int(bar_idx[pick])
+        first = int(panel.first_valid[s])
+        trend = TechnicalIndicators.calculate_trend_score(
+            panel.close[s, first:t + 1].tolist(), panel.volume[s, first:t + 1].tolist()
+        )
+
+        def value(name, default):
+            v = d[name][s, t]
+            return default if np.isnan(v) else float(v)
+
+        long_liq, short_liq = value("long_liquidations", 0.0), value("short_liquidations", 0.0)
+        total_liq = long_liq + short_liq
+        long_liq_pct = long_liq / total_liq * 100 if total_liq > 0 else 50.0
+        oi_change = panel.oi_change_pct[s, t]
+        known = sum([
+            not np.isnan(d["long_liquidations"][s, t]) and not np.isnan(d["short_liquidations"][s, t]),
+            not np.isnan(d["long_account_pct"][s, t]),
+            not np.isnan(oi_change),
+            not np.isnan(d["top_trader_long_pct"][s, t]),
+        ])
+        fear_greed = panel.fear_greed[t]
+
+        context = EnhancedSignalContext(
+            symbol=symbols[s],
+            price=float(panel.close[s, t]),
+            funding_rate=value("funding_rate", 0.0),
+            open_interest=value("open_interest", 0.0),
+            social_score=value("social_score", 50.0),
+            price_trend=trend["trend"],
+            enhanced_trend_data=trend,
+            long_liquidations=long_liq,
+            short_liquidations=short_liq,
+            liquidation_imbalance="long" if long_liq_pct > 55 else "short" if long_liq_pct < 45 else "balanced",
+            long_account_pct=value("long_account_pct", 50.0),
+            oi_change_pct=0.0 if np.isnan(oi_change) else float(oi_change),
+            top_trader_long_pct=value("top_trader_long_pct", 50.0),
+            fear_greed_value=50 if np.isnan(fear_greed) else float(fear_greed),
+            premium_data_available=known >= 2,
+        )
+        expected, _ = engine._calculate_weighted_score(context)
+        errors.append(abs(expected - totals[s, t]))
+
+    errors = np.array(errors)
+    return {
+        "samples": len(errors),
+        "max_abs_error": float(errors.max()) if len(errors) else 0.0,
+        "mismatches_over_1e-6": int((errors > 1e-6).sum()),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the offline backtesting engine")
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--timeframe", default="1h")
+    parser.add_argument("--sweep", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--parity", type=int, default=200)
+    parser.add_argument("--store", default=None, help="Reuse/keep the synthetic store at this path")
+    options = parser.parse_args()
+
+    store_path = options.store or os.path.join(tempfile.mkdtemp(), "backtest_bench.db")
+    start = datetime(2025, 1, 1)
+    if not os.path.exists(store_path):
+        began = time.perf_counter()
+        build_store(store_path, options.symbols, start, options.days, options.timeframe)
+        print(f"Synthetic store: {store_path} ({time.perf_counter() - began:.1f}s)")
+
+    config = BacktestConfig(
+        start_date=start,
+        end_date=start + timedelta(days=options.days - 1),
+        timeframes=[options.timeframe],
+        min_signal_score=55.0,
+        store_path=store_path,
+    )
+
+    began = time.perf_counter()
+    result = await backtesting_service.run_backtest(config)
+    elapsed = time.perf_counter() - began
+    symbol_days = options.symbols * options.days
+    print(f"\nRun: {symbol_days} symbol-days, {result.performance['signals_evaluated']} bars scored")
+    print(f"  {elapsed:.2f}s ({symbol_days / elapsed:,.0f} symbol-days/s), "
+          f"{result.performance['total_trades']} trades, return {result.performance['total_return']:.2%}")
+
+    if options.sweep:
+        rng = np.random.default_rng(5)
+        base = np.array([SignalEngine.WEIGHTS[name] for name in FACTORS], dtype=float)
+        weight_configs = {
+            f"sweep_{i}": dict(zip(FACTORS, (base * rng.uniform(0.5, 1.5, len(base))).round(2).tolist()))
+            for i in range(options.sweep)
+        }
+        began = time.perf_counter()
+        comparison = await backtesting_service.compare_strategies(
+            config=config, weight_configs=weight_configs, max_workers=options.workers
+        )
+        print(f"\nSweep: {options.sweep} weight configurations in {time.perf_counter() - began:.2f}s")
+        print(f"  overall ranking: {[name for name, _ in comparison['ranking']['overall'][:3]]} ...")
+
+    if options.parity:
+        print(f"\nParity vs SignalEngine._calculate_weighted_score:")
+        for name, value in check_parity(config, options.parity).items():
+            print(f"  {name:<24} {value}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
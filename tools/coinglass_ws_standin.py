@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Coinglass WebSocket Stand-in
+Local liquidationOrders server to exercise CoinglassWebSocketService offline
+
+The stand-in:
+- answers "ping" with "pong" and records subscribe requests
+- emits liquidationOrders messages at --rate messages/second
+- drops every connection after --disconnect-every seconds (reconnect + resubscribe)
+
+The client side runs the real ingestion pipeline against it with a deliberately
+slow handler (--handler-delay) so queue overflow, coalescing, batching and lag
+metrics can be observed.
+
+Usage:
+    python tools/coinglass_ws_standin.py [--rate 500] [--duration 10]
+        [--disconnect-every 3] [--handler-delay 0.02] [--policy coalesce]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+import websockets
+
+sys.path.append('.')
+from app.services.coinglass_websocket_service import CoinglassWebSocketService, OVERFLOW_POLICIES
+
+ASSETS = ["BTC", "ETH", "SOL", "XRP", "DOGE", "BNB"]
+
+
+def make_message() -> str:
+    asset = random.choice(ASSETS)
+    return json.dumps({
+        "channel": "liquidationOrders",
+        "data": [{
+            "baseAsset": asset,
+            "exName": "Binance",
+            "price": round(random.uniform(1, 100_000), 2),
+            "side": random.choice([1, 2]),
+            "symbol": f"{asset}USDT",
+            "time": int(time.time() * 1000),
+            "volUsd": round(random.uniform(100, 500_000), 2),
+        }],
+    })
+
+
+async def serve(rate: float, disconnect_every: float, server_stats: dict):
+    async def handler(connection):
+        server_stats["connections"] += 1
+        opened = time.monotonic()
+
+        async def reader():
+            async for message in connection:
+                if message == "ping":
+                    await connection.send("pong")
+                else:
+                    server_stats["subscribes"].append(json.loads(message).get("channels"))
+
+        reader_task = asyncio.create_task(reader())
+        try:
+            while time.monotonic() - opened < disconnect_every:
+                await connection.send(make_message())
+                server_stats["sent"] += 1
+                await asyncio.sleep(1 / rate)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            reader_task.cancel()
+            await connection.close()
+
+    return await websockets.serve(handler, "127.0.0.1", 0)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Run the Coinglass WS pipeline against a local stand-in")
+    parser.add_argument("--rate", type=float, default=500)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--disconnect-every", type=float, default=3)
+    parser.add_argument("--handler-delay", type=float, default=0.02)
+    parser.add_argument("--queue-size", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--policy", choices=OVERFLOW_POLICIES, default="coalesce")
+    options = parser.parse_args()
+
+    server_stats = {"connections": 0, "sent": 0, "subscribes": []}
+    server = await serve(options.rate, options.disconnect_every, server_stats)
+    port = server.sockets[0].getsockname()[1]
+
+    service = CoinglassWebSocketService(
+        base_url=f"ws://127.0.0.1:{port}",
+        queue_size=options.queue_size,
+        overflow_policy=options.policy,
+        batch_size=options.batch_size,
+    )
+    service.backoff_base = 0.2
+    service.backoff_max = 1.0
+
+    consumed = {"batches": 0, "orders": 0}
+
+    async def slow_handler(messages):
+        consumed["batches"] += 1
+        consumed["orders"] += sum(len(message.get("data", [])) for message in messages)
+        await asyncio.sleep(options.handler_delay)
+
+    stream = asyncio.create_task(service.stream_liquidation_batches(slow_handler))
+    await asyncio.sleep(options.duration)
+    await service.close()
+    await stream
+
+    server.close()
+    await server.wait_closed()
+
+    print(json.dumps({
+        "server": {
+            "connections": server_stats["connections"],
+            "messages_sent": server_stats["sent"],
+            "subscribes": server_stats["subscribes"],
+        },
+        "consumer": consumed,
+        "pipeline": service.get_metrics(),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
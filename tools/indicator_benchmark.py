@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Indicator Kernel Benchmark
+Parity and speed of app.utils.indicator_kernels vs the previous pure-Python math
+
+Legacy references below are verbatim copies of the list/loop implementations
+in TechnicalIndicators, ReversalDetector and ATRCalculator. Those stay the
+single-series path; the kernels are for batches of symbols.
+
+Checks:
+- parity: every indicator for every symbol against the legacy output
+- single:  one symbol per call (TechnicalIndicators vs the kernels on a 1-row matrix)
+- batch:   symbols × bars matrix in one compute_indicators() call vs a legacy loop
+
+Usage:
+    python tools/indicator_benchmark.py [--symbols 500] [--bars 200] [--repeat 5]
+"""
+
+import argparse
+import math
+import sys
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.append('.')
+from app.utils import indicator_kernels as kernels
+from app.utils.technical_indicators import TechnicalIndicators
+
+
+# ==================== LEGACY REFERENCES ====================
+
+def legacy_ma(prices, period):
+    return sum(prices[-period:]) / period
+
+
+def legacy_ema(prices, period):
+    k = 2 / (period + 1)
+    ema = sum(prices[:period]) / period
+    for price in prices[period:]:
+        ema = (price * k) + (ema * (1 - k))
+    return ema
+
+
+def legacy_ema_series(prices, period):
+    k = 2 / (period + 1)
+    series = [sum(prices[:period]) / period]
+    for price in prices[period:]:
+        series.append((price * k) + (series[-1] * (1 - k)))
+    return series
+
+
+def legacy_rsi(prices, period=14):
+    changes = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    gains = [change if change > 0 else 0 for change in changes]
+    losses = [-change if change < 0 else 0 for change in changes]
+    avg_gain = sum(gains[-period:]) / period
+    avg_loss = sum(losses[-period:]) / period
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def legacy_macd(prices, fast=12, slow=26, signal=9):
+    fast_ema = legacy_ema_series(prices, fast)
+    slow_ema = legacy_ema_series(prices, slow)
+    macd_line = [f - s for f, s in zip(fast_ema[-len(slow_ema):], slow_ema)]
+    signal_line = legacy_ema_series(macd_line, signal)
+    return macd_line[-1], signal_line[-1], macd_line[-1] - signal_line[-1]
+
+
+def legacy_crossover(prices, fast=10, slow=20):
+    fast_now, slow_now = legacy_ma(prices, fast), legacy_ma(prices, slow)
+    fast_prev, slow_prev = legacy_ma(prices[:-1], fast), legacy_ma(prices[:-1], slow)
+    if fast_prev <= slow_prev and fast_now > slow_now:
+        return "bullish_crossover"
+    if fast_prev >= slow_prev and fast_now < slow_now:
+        return "bearish_crossover"
+    return "no_crossover"
+
+
+def legacy_reversal_rsi(closes, period=14):
+    changes = [closes[i] - closes[i - 1] for i in range(1, len(closes)) if closes[i - 1] != 0]
+    rsi = []
+    for i in range(period, len(changes)):
+        gains, losses = [], []
+        for j in range(i - period, i):
+            if changes[j] > 0:
+                gains.append(changes[j])
+            elif changes[j] < 0:
+                losses.append(abs(changes[j]))
+        avg_gain = sum(gains) / period if gains else 0
+        avg_loss = sum(losses) / period if losses else 0.00001
+        rsi.append(100 - (100 / (1 + avg_gain / avg_loss)))
+    return rsi
+
+
+def legacy_reversal_ema(data, period):
+    k = 2 / (period + 1)
+    ema = [data[0]]
+    for i in range(1, len(data)):
+        ema.append(data[i] * k + ema[i - 1] * (1 - k))
+    return ema
+
+
+def legacy_atr(highs, lows, closes, period=14):
+    true_ranges = []
+    for i in range(len(highs)):
+        if i == 0:
+            true_ranges.append(highs[i] - lows[i])
+        else:
+            prev_close = closes[i - 1]
+            true_ranges.append(max(highs[i] - lows[i], abs(highs[i] - prev_close), abs(lows[i] - prev_close)))
+    recent = true_ranges[-period:]
+    return sum(recent) / len(recent)
+
+
+def legacy_bollinger(prices, period=20, num_std=2.0):
+    window = prices[-period:]
+    middle = sum(window) / period
+    deviation = math.sqrt(sum((p - middle) ** 2 for p in window) / period)
+    return middle + num_std * deviation, middle - num_std * deviation
+
+
+# ==================== HARNESS ====================
+
+def make_market(symbols: int, bars: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    start = rng.uniform(0.01, 100_000, size=(symbols, 1))
+    closes = start * np.exp(np.cumsum(rng.normal(0, 0.01, size=(symbols, bars)), axis=1))
+    spread = np.abs(rng.normal(0, 0.005, size=(symbols, bars))) * closes
+    return closes, closes + spread, closes - spread
+
+
+def relative_error(actual, expected) -> float:
+    actual = np.asarray(actual, dtype=np.float64)
+    expected = np.asarray(expected, dtype=np.float64)
+    scale = np.maximum(np.abs(expected), 1e-12)
+    return float(np.max(np.abs(actual - expected) / scale))
+
+
+def check_parity(closes, highs, lows) -> Dict[str, float]:
+    rows = [row.tolist() for row in closes]
+    high_rows, low_rows = [row.tolist() for row in highs], [row.tolist() for row in lows]
+    batch = kernels.compute_indicators(closes, highs, lows)
+    legacy_macds = np.array([legacy_macd(row) for row in rows])
+
+    errors = {
+        "ma_20": relative_error(batch["ma_20"], [legacy_ma(r, 20) for r in rows]),
+        "ema_12": relative_error(batch["ema_12"], [legacy_ema(r, 12) for r in rows]),
+        "ema_26": relative_error(batch["ema_26"], [legacy_ema(r, 26) for r in rows]),
+        "rsi_14": relative_error(batch["rsi_14"], [legacy_rsi(r) for r in rows]),
+        "macd": relative_error(batch["macd"], legacy_macds[:, 0]),
+        "macd_signal": relative_error(batch["macd_signal"], legacy_macds[:, 1]),
+        "atr_14": relative_error(batch["atr_14"], [
+            legacy_atr(h, l, c) for h, l, c in zip(high_rows, low_rows, rows)
+        ]),
+        "bollinger_upper": relative_error(batch["bollinger_upper"], [legacy_bollinger(r)[0] for r in rows]),
+        "bollinger_lower": relative_error(batch["bollinger_lower"], [legacy_bollinger(r)[1] for r in rows]),
+        "reversal_rsi": max(
+            relative_error(kernels.rsi_rolling(np.diff(c), 14, loss_floor=0.00001)[0, :-1], legacy_reversal_rsi(r))
+            for c, r in zip(closes[:20], rows[:20])
+        ),
+        "reversal_ema": max(
+            relative_error(kernels.ema_series(c, 12, seed="first")[0], legacy_reversal_ema(r, 12))
+            for c, r in zip(closes[:20], rows[:20])
+        ),
+    }
+
+    crossovers = [legacy_crossover(r) for r in rows]
+    errors["ma_crossover_mismatches"] = float(sum(a != b for a, b in zip(batch["ma_crossover"], crossovers)))
+
+    scalar = [TechnicalIndicators.calculate_rsi(r) for r in rows[:50]]
+    errors["scalar_rsi_rounded_mismatches"] = float(sum(
+        a != round(float(b), 2) for a, b in zip(scalar, batch["rsi_14"][:50])
+    ))
+    return errors
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    func()
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized indicator kernels")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--bars", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    closes, highs, lows = make_market(options.symbols, options.bars)
+    rows = [row.tolist() for row in closes]
+    high_rows, low_rows = [row.tolist() for row in highs], [row.tolist() for row in lows]
+
+    print(f"Parity ({options.symbols} symbols × {options.bars} bars, max relative error):")
+    for name, error in check_parity(closes, highs, lows).items():
+        print(f"  {name:<32} {error:.3e}")
+
+    def legacy_batch():
+        for r, h, l in zip(rows, high_rows, low_rows):
+            legacy_ma(r, 20), legacy_ema(r, 12), legacy_ema(r, 26), legacy_rsi(r)
+            legacy_macd(r), legacy_crossover(r), legacy_bollinger(r), legacy_atr(h, l, r)
+
+    def kernel_batch():
+        kernels.compute_indicators(closes, highs, lows)
+
+    before = timed(legacy_batch, options.repeat)
+    after = timed(kernel_batch, options.repeat)
+    print(f"\nBatch (all indicators, all symbols):")
+    print(f"  legacy   {before * 1e3:9.2f} ms")
+    print(f"  kernels  {after * 1e3:9.2f} ms   ({before / after:.1f}x)")
+
+    sample = rows[0]
+    before = timed(lambda: (
+        TechnicalIndicators.calculate_rsi(sample),
+        TechnicalIndicators.calculate_macd(sample),
+        TechnicalIndicators.calculate_ema(sample, 12),
+    ), options.repeat * 20)
+    after = timed(lambda: (
+        kernels.rsi_last(sample, 14), kernels.macd(sample), kernels.ema_last(sample, 12)
+    ), options.repeat * 20)
+    print(f"\nSingle symbol (RSI + MACD + EMA, {options.bars} bars):")
+    print(f"  scalar   {before * 1e6:9.1f} µs")
+    print(f"  kernels  {after * 1e6:9.1f} µs   ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
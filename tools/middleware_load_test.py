@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Middleware Load Test
+Throughput and latency percentiles of the request middleware stack
+
+Compares, on /invoke (POST) and /signals/{symbol} (GET):
+- legacy: the previous four BaseHTTPMiddleware layers (detailed request
+  logger reading + parsing every POST body, GPT rate limiter, response size
+  monitor, SlowAPI pass-through), reproduced here
+- pipeline: RequestPipelineMiddleware (single pure ASGI layer)
+
+Endpoints are stubs returning fixed payloads, so only middleware cost is
+measured. Each stack is served by its own uvicorn subprocess and loaded over
+TCP, so concurrent requests queue on the server's event loop and latency
+percentiles include that wait (an in-process ASGITransport client would only
+time each request's own run). Use --url to load a running server instead (run
+once before and once after deploying to compare).
+
+Usage:
+    python tools/middleware_load_test.py [--requests 5000] [--concurrency 50]
+    python tools/middleware_load_test.py --url http://localhost:8000 --symbol BTC
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+sys.path.append('.')
+
+INVOKE_BODY = {"operation": "signals.get", "symbol": "BTC", "api_key": "benchmark"}
+SIGNAL_PAYLOAD = {
+    "symbol": "BTC",
+    "signal": "LONG",
+    "score": 72.5,
+    "confidence": "high",
+    "price": 67000.0,
+    "reasons": ["Funding rate neutral", "OI rising", "Social momentum strong"] * 4,
+}
+
+
+# ==================== STUB APP ====================
+
+def build_app(stack: str):
+    """FastAPI app with stub /invoke and /signals/{symbol} behind the given stack"""
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from app.middleware.gpt_rate_limiter import GPTRateLimiter
+
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+
+    # Load generator is a single client IP - lift the GPT limits out of the way
+    limiter = GPTRateLimiter()
+    limiter.endpoint_limits = {key: (10**9, 60) for key in limiter.endpoint_limits}
+    limiter.global_limit = (10**9, 60)
+
+    if stack == "legacy":
+        for middleware in _legacy_stack(limiter):
+            app.add_middleware(middleware)
+    else:
+        from app.middleware.request_pipeline import RequestPipelineMiddleware
+
+        app.add_middleware(RequestPipelineMiddleware, limiter=limiter)
+
+    @app.post("/invoke")
+    async def invoke(request: Request):
+        payload = await request.json()
+        return {"ok": True, "operation": payload.get("operation"), "data": SIGNAL_PAYLOAD}
+
+    @app.get("/signals/{symbol}")
+    async def signals(symbol: str):
+        return {**SIGNAL_PAYLOAD, "symbol": symbol.upper()}
+
+    return app
+
+
+def _legacy_stack(limiter) -> List[Any]:
+    """The BaseHTTPMiddleware layers as they were before the pipeline (add order)"""
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    from app.middleware.request_logger import redact_sensitive_data
+    from app.middleware.response_size_monitor import response_size_stats, size_headers
+
+    class DetailedRequestLogger(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            start = time.time()
+            request_body = None
+            if request.method in ("POST", "PUT", "PATCH"):
+                body = await request.body()
+                if body:
+                    request_body = redact_sensitive_data(json.loads(body))
+            response = await call_next(request)
+            json.dumps({
+                "endpoint": request.url.path,
+                "body": request_body,
+                "status": response.status_code,
+                "duration_ms": round((time.time() - start) * 1000, 2),
+            })
+            return response
+
+    class GPTRateLimit(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            _, info = limiter.check_rate_limit(request)
+            response = await call_next(request)
+            response.headers["X-RateLimit-Limit"] = str(info["limit"])
+            response.headers["X-RateLimit-Remaining"] = str(info.get("remaining", 0))
+            return response
+
+    class ResponseSizeMonitor(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            start = time.time()
+            response = await call_next(request)
+            content_length = response.headers.get("content-length")
+            if content_length:
+                size = int(content_length)
+                for key, value in size_headers(size):
+                    response.headers[key.decode()] = value.decode()
+                response_size_stats.record_response(request.url.path, size)
+            response.headers["X-Response-Time-Ms"] = f"{(time.time() - start) * 1000:.2f}"
+            return response
+
+    class SlowAPIPassThrough(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            return await call_next(request)
+
+    return [DetailedRequestLogger, GPTRateLimit, ResponseSizeMonitor, SlowAPIPassThrough]
+
+
+# ==================== SERVER ====================
+
+def serve(stack: str, port: int):
+    """Run the stub app for one stack (subprocess entry point)"""
+    import uvicorn
+
+    uvicorn.run(build_app(stack), host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def start_server(stack: str, timeout: float = 30.0):
+    """Spawn a uvicorn subprocess serving the stack; returns (process, base_url) once it answers"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", stack, "--port", str(port)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        stdout=subprocess.DEVNULL,  # Request logs
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url, timeout=2) as client:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"{stack} server exited with code {process.returncode}")
+            try:
+                await client.get("/signals/BTC")
+                return process, base_url
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    process.terminate()
+                    raise RuntimeError(f"{stack} server did not start within {timeout:.0f}s")
+                await asyncio.sleep(0.2)
+
+
+def stop_server(process: subprocess.Popen):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+# ==================== LOAD ====================
+
+async def run_load(client: httpx.AsyncClient, method: str, path: str, total: int,
+                   concurrency: int, body: Optional[Dict] = None) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "errors": errors,
+    }
+
+
+def report(label: str, result: Dict[str, float]):
+    print(
+        f"  {label:<28} {result['rps']:9.0f} req/s   p50 {result['p50']:7.2f} ms   "
+        f"p99 {result['p99']:7.2f} ms   errors {result['errors']}"
+    )
+
+
+async def compare(args: argparse.Namespace):
+    targets = [
+        ("POST", "/invoke", INVOKE_BODY),
+        ("GET", f"/signals/{args.symbol}", None),
+    ]
+    print(f"Requests: {args.requests} per endpoint, concurrency {args.concurrency}")
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+            print(f"\n{args.url}")
+            for method, path, body in targets:
+                report(f"{method} {path}", await run_load(client, method, path, args.requests, args.concurrency, body))
+        return
+
+    results = {}
+    for stack in ("legacy", "pipeline"):
+        process, base_url = await start_server(stack)
+        try:
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+                print(f"\n{stack} (uvicorn, {base_url})")
+                for method, path, body in targets:
+                    result = await run_load(client, method, path, args.requests, args.concurrency, body)
+                    results[(stack, path)] = result
+                    report(f"{method} {path}", result)
+        finally:
+            stop_server(process)
+
+    print("\npipeline vs legacy")
+    for _, path, _ in targets:
+        before, after = results[("legacy", path)], results[("pipeline", path)]
+        print(
+            f"  {path:<28} throughput x{after['rps'] / before['rps']:.2f}   "
+            f"p99 {before['p99']:.2f} -> {after['p99']:.2f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Middleware load test")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--symbol", default="BTC")
+    parser.add_argument("--url", help="Load a running server instead of the stub app servers")
+    parser.add_argument("--serve", choices=("legacy", "pipeline"), help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=8765, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port)
+    else:
+        asyncio.run(compare(args))
+
+
+if __name__ == "__main__":
+    main()
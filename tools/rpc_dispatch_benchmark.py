@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+RPC Dispatch Overhead Benchmark
+Measures per-dispatch routing + argument preparation cost of FlatRPCDispatcher
+
+Compares:
+- legacy: if/elif string-comparison chain (handlers in source order) with a
+  function-level import in the matched branch, plus per-call argument extraction
+- registry: O(1) OperationSpec lookup + precompiled arg adapter + validation
+
+Handlers are NOT executed - only the dispatch overhead is measured.
+
+Usage:
+    python tools/rpc_dispatch_benchmark.py [--iterations 20000]
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.append('.')
+from app.core.rpc_flat_dispatcher import (
+    FlatRPCDispatcher,
+    SIGNAL_SPECIFIC_PARAMS,
+    SYSTEM_PARAMS,
+    INDICATOR_NAMESPACES,
+    handler_name_for,
+)
+from app.models.rpc_flat_models import FlatInvokeRequest
+from app.utils.operation_catalog import OPERATION_CATALOG, get_operation_metadata
+
+
+def build_legacy_router(operations: List[str]) -> Callable[[str], int]:
+    """Generate the legacy if/elif chain (one import per matched branch)"""
+    lines = ["def route(operation):"]
+    for index, operation in enumerate(operations):
+        keyword = "if" if index == 0 else "elif"
+        lines.append(f"    {keyword} operation == {operation!r}:")
+        lines.append("        from app.utils.operation_catalog import OPERATION_CATALOG")
+        lines.append(f"        return {index}")
+    lines.append("    else:")
+    lines.append("        raise NotImplementedError(operation)")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["route"]
+
+
+def legacy_extract_args(request, metadata) -> Dict[str, Any]:
+    """Per-call argument extraction as done before the registry"""
+    args = {}
+    for field_name in request.model_fields:
+        if field_name == 'operation':
+            continue
+        value = getattr(request, field_name, None)
+        if field_name in SYSTEM_PARAMS and value in (None, False):
+            continue
+        if field_name in SIGNAL_SPECIFIC_PARAMS:
+            if field_name == 'send_telegram' and value is True:
+                pass
+            elif metadata.namespace in INDICATOR_NAMESPACES:
+                continue
+            elif field_name == 'mode' and value == "aggressive":
+                continue
+            elif field_name == 'send_telegram' and value is False:
+                continue
+        if value is not None:
+            args[field_name] = value
+    return args
+
+
+def bench(label: str, func: Callable[[], Any], iterations: int) -> float:
+    for _ in range(min(1000, iterations)):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    per_call_us = (time.perf_counter() - start) / iterations * 1e6
+    print(f"  {label:<10} {per_call_us:8.2f} µs/dispatch")
+    return per_call_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FlatRPCDispatcher overhead")
+    parser.add_argument("--iterations", type=int, default=20000)
+    options = parser.parse_args()
+
+    dispatcher = FlatRPCDispatcher()
+    handler_order = [
+        name for name in vars(FlatRPCDispatcher)
+        if name.startswith("_op_")
+    ]
+    operations = list(OPERATION_CATALOG)
+    by_handler = {handler_name_for(op): op for op in operations}
+    legacy_order = [by_handler[name] for name in handler_order if name in by_handler]
+    legacy_route = build_legacy_router(legacy_order)
+
+    samples = [legacy_order[0], legacy_order[len(legacy_order) // 2], legacy_order[-1]]
+    print(f"Operations registered: {len(dispatcher._registry)} | iterations: {options.iterations}\n")
+
+    for operation in samples:
+        request = FlatInvokeRequest(operation=operation, symbol="BTC")
+        spec = dispatcher.get_spec(operation)
+        print(f"{operation} (legacy chain position {legacy_order.index(operation) + 1})")
+
+        def legacy():
+            metadata = get_operation_metadata(operation)
+            args = legacy_extract_args(request, metadata)
+            legacy_route(operation)
+            return args
+
+        def registry():
+            current = dispatcher.get_spec(operation)
+            args = dispatcher._extract_args(request, current)
+            dispatcher._validate_args(current, args)
+            return current.handler
+
+        before = bench("legacy", legacy, options.iterations)
+        after = bench("registry", registry, options.iterations)
+        print(f"  speedup    {before / after:8.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()